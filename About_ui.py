@@ -8,807 +8,6 @@
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
 
-from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
-    QMetaObject, QObject, QPoint, QRect,
-    QSize, QTime, QUrl, Qt)
-from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
-    QFont, QFontDatabase, QGradient, QIcon,
-    QImage, QKeySequence, QLinearGradient, QPainter,
-    QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
-    QLabel, QSizePolicy, QVBoxLayout, QWidget)
-import resource_rc
-
-class Ui_Dialog(object):
-    def setupUi(self, Dialog):
-        if not Dialog.objectName():
-            Dialog.setObjectName(u"Dialog")
-        Dialog.resize(557, 482)
-        self.buttonBox = QDialogButtonBox(Dialog)
-        self.buttonBox.setObjectName(u"buttonBox")
-        self.buttonBox.setGeometry(QRect(350, 410, 156, 24))
-        self.buttonBox.setStandardButtons(QDialogButtonBox.StandardButton.Ok)
-        self.label = QLabel(Dialog)
-        self.label.setObjectName(u"label")
-        self.label.setGeometry(QRect(100, 60, 64, 64))
-        self.label.setMinimumSize(QSize(64, 64))
-        self.label.setMaximumSize(QSize(64, 64))
-        self.label.setPixmap(QPixmap(u":/icon.ico"))
-        self.label.setScaledContents(True)
-        self.label_4 = QLabel(Dialog)
-        self.label_4.setObjectName(u"label_4")
-        self.label_4.setGeometry(QRect(110, 170, 341, 31))
-        font = QFont()
-        font.setPointSize(12)
-        self.label_4.setFont(font)
-        self.label_5 = QLabel(Dialog)
-        self.label_5.setObjectName(u"label_5")
-        self.label_5.setGeometry(QRect(150, 290, 81, 16))
-        font1 = QFont()
-        font1.setFamilies([u"Arial"])
-        font1.setPointSize(16)
-        self.label_5.setFont(font1)
-        self.label_6 = QLabel(Dialog)
-        self.label_6.setObjectName(u"label_6")
-        self.label_6.setGeometry(QRect(230, 270, 64, 64))
-        self.label_6.setMinimumSize(QSize(64, 64))
-        self.label_6.setMaximumSize(QSize(64, 64))
-        self.label_6.setPixmap(QPixmap(u":/images/images/companylogo.png"))
-        self.label_6.setScaledContents(True)
-        self.widget = QWidget(Dialog)
-        self.widget.setObjectName(u"widget")
-        self.widget.setGeometry(QRect(190, 60, 266, 64))
-        self.verticalLayout = QVBoxLayout(self.widget)
-        self.verticalLayout.setObjectName(u"verticalLayout")
-        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
-        self.label_2 = QLabel(self.widget)
-        self.label_2.setObjectName(u"label_2")
-        font2 = QFont()
-        font2.setPointSize(16)
-        font2.setBold(True)
-        self.label_2.setFont(font2)
-
-        self.verticalLayout.addWidget(self.label_2)
-
-        self.label_3 = QLabel(self.widget)
-        self.label_3.setObjectName(u"label_3")
-        font3 = QFont()
-        font3.setPointSize(16)
-        self.label_3.setFont(font3)
-
-        self.verticalLayout.addWidget(self.label_3)
-
-
-        self.retranslateUi(Dialog)
-
-        QMetaObject.connectSlotsByName(Dialog)
-    # setupUi
-
-    def retranslateUi(self, Dialog):
-        Dialog.setWindowTitle(QCoreApplication.translate("Dialog", u"Dialog", None))
-        self.label.setText("")
-        self.label_4.setText(QCoreApplication.translate("Dialog", u"Developed By:    Payment Switch Project Team ", None))
-        self.label_5.setText(QCoreApplication.translate("Dialog", u"2024 \u00a9 ", None))
-        self.label_6.setText("")
-        self.label_2.setText(QCoreApplication.translate("Dialog", u"Card File Consolidator App", None))
-        self.label_3.setText(QCoreApplication.translate("Dialog", u"Version 1.0", None))
-    # retranslateUi
-
-# -*- coding: utf-8 -*-
-
-################################################################################
-## Form generated from reading UI file 'About.ui'
-##
-## Created by: Qt User Interface Compiler version 6.7.0
-##
-## WARNING! All changes made in this file will be lost when recompiling UI file!
-################################################################################
-
-from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
-    QMetaObject, QObject, QPoint, QRect,
-    QSize, QTime, QUrl, Qt)
-from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
-    QFont, QFontDatabase, QGradient, QIcon,
-    QImage, QKeySequence, QLinearGradient, QPainter,
-    QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
-    QLabel, QSizePolicy, QVBoxLayout, QWidget)
-import resource_rc
-
-class Ui_Dialog(object):
-    def setupUi(self, Dialog):
-        if not Dialog.objectName():
-            Dialog.setObjectName(u"Dialog")
-        Dialog.resize(557, 482)
-        self.buttonBox = QDialogButtonBox(Dialog)
-        self.buttonBox.setObjectName(u"buttonBox")
-        self.buttonBox.setGeometry(QRect(350, 410, 156, 24))
-        self.buttonBox.setStandardButtons(QDialogButtonBox.StandardButton.Cancel|QDialogButtonBox.StandardButton.Ok)
-        self.label = QLabel(Dialog)
-        self.label.setObjectName(u"label")
-        self.label.setGeometry(QRect(100, 60, 64, 64))
-        self.label.setMinimumSize(QSize(64, 64))
-        self.label.setMaximumSize(QSize(64, 64))
-        self.label.setPixmap(QPixmap(u":/icon.ico"))
-        self.label.setScaledContents(True)
-        self.label_4 = QLabel(Dialog)
-        self.label_4.setObjectName(u"label_4")
-        self.label_4.setGeometry(QRect(110, 170, 341, 31))
-        font = QFont()
-        font.setPointSize(12)
-        self.label_4.setFont(font)
-        self.label_5 = QLabel(Dialog)
-        self.label_5.setObjectName(u"label_5")
-        self.label_5.setGeometry(QRect(150, 290, 81, 16))
-        font1 = QFont()
-        font1.setFamilies([u"Arial"])
-        font1.setPointSize(16)
-        self.label_5.setFont(font1)
-        self.label_6 = QLabel(Dialog)
-        self.label_6.setObjectName(u"label_6")
-        self.label_6.setGeometry(QRect(230, 270, 64, 64))
-        self.label_6.setMinimumSize(QSize(64, 64))
-        self.label_6.setMaximumSize(QSize(64, 64))
-        self.label_6.setPixmap(QPixmap(u":/images/images/companylogo.png"))
-        self.label_6.setScaledContents(True)
-        self.widget = QWidget(Dialog)
-        self.widget.setObjectName(u"widget")
-        self.widget.setGeometry(QRect(190, 60, 266, 64))
-        self.verticalLayout = QVBoxLayout(self.widget)
-        self.verticalLayout.setObjectName(u"verticalLayout")
-        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
-        self.label_2 = QLabel(self.widget)
-        self.label_2.setObjectName(u"label_2")
-        font2 = QFont()
-        font2.setPointSize(16)
-        font2.setBold(True)
-        self.label_2.setFont(font2)
-
-        self.verticalLayout.addWidget(self.label_2)
-
-        self.label_3 = QLabel(self.widget)
-        self.label_3.setObjectName(u"label_3")
-        font3 = QFont()
-        font3.setPointSize(16)
-        self.label_3.setFont(font3)
-
-        self.verticalLayout.addWidget(self.label_3)
-
-
-        self.retranslateUi(Dialog)
-
-        QMetaObject.connectSlotsByName(Dialog)
-    # setupUi
-
-    def retranslateUi(self, Dialog):
-        Dialog.setWindowTitle(QCoreApplication.translate("Dialog", u"Dialog", None))
-        self.label.setText("")
-        self.label_4.setText(QCoreApplication.translate("Dialog", u"Developed By:    Payment Switch Project Team ", None))
-        self.label_5.setText(QCoreApplication.translate("Dialog", u"2024 \u00a9 ", None))
-        self.label_6.setText("")
-        self.label_2.setText(QCoreApplication.translate("Dialog", u"Card File Consolidator App", None))
-        self.label_3.setText(QCoreApplication.translate("Dialog", u"Version 1.0", None))
-    # retranslateUi
-
-# -*- coding: utf-8 -*-
-
-################################################################################
-## Form generated from reading UI file 'About.ui'
-##
-## Created by: Qt User Interface Compiler version 6.7.0
-##
-## WARNING! All changes made in this file will be lost when recompiling UI file!
-################################################################################
-
-from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
-    QMetaObject, QObject, QPoint, QRect,
-    QSize, QTime, QUrl, Qt)
-from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
-    QFont, QFontDatabase, QGradient, QIcon,
-    QImage, QKeySequence, QLinearGradient, QPainter,
-    QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
-    QLabel, QSizePolicy, QVBoxLayout, QWidget)
-import resource_rc
-
-class Ui_Dialog(object):
-    def setupUi(self, Dialog):
-        if not Dialog.objectName():
-            Dialog.setObjectName(u"Dialog")
-        Dialog.resize(557, 482)
-        self.buttonBox = QDialogButtonBox(Dialog)
-        self.buttonBox.setObjectName(u"buttonBox")
-        self.buttonBox.setGeometry(QRect(350, 410, 156, 24))
-        self.buttonBox.setStandardButtons(QDialogButtonBox.StandardButton.Cancel|QDialogButtonBox.StandardButton.Ok)
-        self.label = QLabel(Dialog)
-        self.label.setObjectName(u"label")
-        self.label.setGeometry(QRect(100, 60, 64, 64))
-        self.label.setMinimumSize(QSize(64, 64))
-        self.label.setMaximumSize(QSize(64, 64))
-        self.label.setPixmap(QPixmap(u":/icon.ico"))
-        self.label.setScaledContents(True)
-        self.label_4 = QLabel(Dialog)
-        self.label_4.setObjectName(u"label_4")
-        self.label_4.setGeometry(QRect(110, 170, 341, 31))
-        font = QFont()
-        font.setPointSize(12)
-        self.label_4.setFont(font)
-        self.label_5 = QLabel(Dialog)
-        self.label_5.setObjectName(u"label_5")
-        self.label_5.setGeometry(QRect(150, 290, 81, 16))
-        font1 = QFont()
-        font1.setFamilies([u"Arial"])
-        font1.setPointSize(16)
-        self.label_5.setFont(font1)
-        self.label_6 = QLabel(Dialog)
-        self.label_6.setObjectName(u"label_6")
-        self.label_6.setGeometry(QRect(230, 270, 64, 64))
-        self.label_6.setMinimumSize(QSize(64, 64))
-        self.label_6.setMaximumSize(QSize(64, 64))
-        self.label_6.setPixmap(QPixmap(u":/images/images/companylogo.png"))
-        self.label_6.setScaledContents(True)
-        self.widget = QWidget(Dialog)
-        self.widget.setObjectName(u"widget")
-        self.widget.setGeometry(QRect(190, 60, 266, 64))
-        self.verticalLayout = QVBoxLayout(self.widget)
-        self.verticalLayout.setObjectName(u"verticalLayout")
-        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
-        self.label_2 = QLabel(self.widget)
-        self.label_2.setObjectName(u"label_2")
-        font2 = QFont()
-        font2.setPointSize(16)
-        font2.setBold(True)
-        self.label_2.setFont(font2)
-
-        self.verticalLayout.addWidget(self.label_2)
-
-        self.label_3 = QLabel(self.widget)
-        self.label_3.setObjectName(u"label_3")
-        font3 = QFont()
-        font3.setPointSize(16)
-        self.label_3.setFont(font3)
-
-        self.verticalLayout.addWidget(self.label_3)
-
-
-        self.retranslateUi(Dialog)
-
-        QMetaObject.connectSlotsByName(Dialog)
-    # setupUi
-
-    def retranslateUi(self, Dialog):
-        Dialog.setWindowTitle(QCoreApplication.translate("Dialog", u"Dialog", None))
-        self.label.setText("")
-        self.label_4.setText(QCoreApplication.translate("Dialog", u"Developed By:    Payment Switch Project Team ", None))
-        self.label_5.setText(QCoreApplication.translate("Dialog", u"2024 \u00a9 ", None))
-        self.label_6.setText("")
-        self.label_2.setText(QCoreApplication.translate("Dialog", u"Card File Consolidator App", None))
-        self.label_3.setText(QCoreApplication.translate("Dialog", u"Version 1.0", None))
-    # retranslateUi
-
-# -*- coding: utf-8 -*-
-
-################################################################################
-## Form generated from reading UI file 'About.ui'
-##
-## Created by: Qt User Interface Compiler version 6.7.0
-##
-## WARNING! All changes made in this file will be lost when recompiling UI file!
-################################################################################
-
-from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
-    QMetaObject, QObject, QPoint, QRect,
-    QSize, QTime, QUrl, Qt)
-from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
-    QFont, QFontDatabase, QGradient, QIcon,
-    QImage, QKeySequence, QLinearGradient, QPainter,
-    QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
-    QLabel, QSizePolicy, QVBoxLayout, QWidget)
-import resource_rc
-
-class Ui_Dialog(object):
-    def setupUi(self, Dialog):
-        if not Dialog.objectName():
-            Dialog.setObjectName(u"Dialog")
-        Dialog.resize(362, 352)
-        self.buttonBox = QDialogButtonBox(Dialog)
-        self.buttonBox.setObjectName(u"buttonBox")
-        self.buttonBox.setGeometry(QRect(200, 250, 156, 24))
-        self.buttonBox.setStandardButtons(QDialogButtonBox.StandardButton.Cancel|QDialogButtonBox.StandardButton.Ok)
-        self.label = QLabel(Dialog)
-        self.label.setObjectName(u"label")
-        self.label.setGeometry(QRect(10, 40, 64, 64))
-        self.label.setMinimumSize(QSize(64, 64))
-        self.label.setMaximumSize(QSize(64, 64))
-        self.label.setPixmap(QPixmap(u":/icon.ico"))
-        self.label.setScaledContents(True)
-        self.label_4 = QLabel(Dialog)
-        self.label_4.setObjectName(u"label_4")
-        self.label_4.setGeometry(QRect(20, 120, 341, 31))
-        font = QFont()
-        font.setPointSize(11)
-        self.label_4.setFont(font)
-        self.label_5 = QLabel(Dialog)
-        self.label_5.setObjectName(u"label_5")
-        self.label_5.setGeometry(QRect(100, 190, 81, 16))
-        font1 = QFont()
-        font1.setFamilies([u"Arial"])
-        font1.setPointSize(16)
-        self.label_5.setFont(font1)
-        self.label_6 = QLabel(Dialog)
-        self.label_6.setObjectName(u"label_6")
-        self.label_6.setGeometry(QRect(180, 170, 64, 64))
-        self.label_6.setMinimumSize(QSize(64, 64))
-        self.label_6.setMaximumSize(QSize(64, 64))
-        font2 = QFont()
-        font2.setPointSize(16)
-        self.label_6.setFont(font2)
-        self.label_6.setPixmap(QPixmap(u":/images/images/companylogo.png"))
-        self.label_6.setScaledContents(True)
-        self.layoutWidget = QWidget(Dialog)
-        self.layoutWidget.setObjectName(u"layoutWidget")
-        self.layoutWidget.setGeometry(QRect(80, 40, 266, 64))
-        self.verticalLayout = QVBoxLayout(self.layoutWidget)
-        self.verticalLayout.setObjectName(u"verticalLayout")
-        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
-        self.label_2 = QLabel(self.layoutWidget)
-        self.label_2.setObjectName(u"label_2")
-        font3 = QFont()
-        font3.setPointSize(12)
-        font3.setBold(True)
-        self.label_2.setFont(font3)
-
-        self.verticalLayout.addWidget(self.label_2)
-
-        self.label_3 = QLabel(self.layoutWidget)
-        self.label_3.setObjectName(u"label_3")
-        self.label_3.setFont(font)
-
-        self.verticalLayout.addWidget(self.label_3)
-
-
-        self.retranslateUi(Dialog)
-
-        QMetaObject.connectSlotsByName(Dialog)
-    # setupUi
-
-    def retranslateUi(self, Dialog):
-        Dialog.setWindowTitle(QCoreApplication.translate("Dialog", u"Dialog", None))
-        self.label.setText("")
-        self.label_4.setText(QCoreApplication.translate("Dialog", u"Developed By:    Payment Switch Project Team ", None))
-        self.label_5.setText(QCoreApplication.translate("Dialog", u"2024 \u00a9 ", None))
-        self.label_6.setText("")
-        self.label_2.setText(QCoreApplication.translate("Dialog", u"Card File Consolidator App", None))
-        self.label_3.setText(QCoreApplication.translate("Dialog", u"Version 1.1.0", None))
-    # retranslateUi
-
-# -*- coding: utf-8 -*-
-
-################################################################################
-## Form generated from reading UI file 'About.ui'
-##
-## Created by: Qt User Interface Compiler version 6.7.0
-##
-## WARNING! All changes made in this file will be lost when recompiling UI file!
-################################################################################
-
-from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
-    QMetaObject, QObject, QPoint, QRect,
-    QSize, QTime, QUrl, Qt)
-from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
-    QFont, QFontDatabase, QGradient, QIcon,
-    QImage, QKeySequence, QLinearGradient, QPainter,
-    QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
-    QLabel, QSizePolicy, QVBoxLayout, QWidget)
-import resource_rc
-
-class Ui_Dialog(object):
-    def setupUi(self, Dialog):
-        if not Dialog.objectName():
-            Dialog.setObjectName(u"Dialog")
-        Dialog.resize(362, 352)
-        self.buttonBox = QDialogButtonBox(Dialog)
-        self.buttonBox.setObjectName(u"buttonBox")
-        self.buttonBox.setGeometry(QRect(190, 310, 156, 24))
-        self.buttonBox.setStandardButtons(QDialogButtonBox.StandardButton.Close)
-        self.label = QLabel(Dialog)
-        self.label.setObjectName(u"label")
-        self.label.setGeometry(QRect(10, 40, 64, 64))
-        self.label.setMinimumSize(QSize(64, 64))
-        self.label.setMaximumSize(QSize(64, 64))
-        self.label.setPixmap(QPixmap(u":/icon.ico"))
-        self.label.setScaledContents(True)
-        self.label_4 = QLabel(Dialog)
-        self.label_4.setObjectName(u"label_4")
-        self.label_4.setGeometry(QRect(20, 120, 341, 31))
-        font = QFont()
-        font.setPointSize(11)
-        self.label_4.setFont(font)
-        self.label_5 = QLabel(Dialog)
-        self.label_5.setObjectName(u"label_5")
-        self.label_5.setGeometry(QRect(100, 190, 81, 16))
-        font1 = QFont()
-        font1.setFamilies([u"Arial"])
-        font1.setPointSize(16)
-        self.label_5.setFont(font1)
-        self.label_6 = QLabel(Dialog)
-        self.label_6.setObjectName(u"label_6")
-        self.label_6.setGeometry(QRect(180, 170, 64, 64))
-        self.label_6.setMinimumSize(QSize(64, 64))
-        self.label_6.setMaximumSize(QSize(64, 64))
-        font2 = QFont()
-        font2.setPointSize(16)
-        self.label_6.setFont(font2)
-        self.label_6.setPixmap(QPixmap(u":/images/images/companylogo.png"))
-        self.label_6.setScaledContents(True)
-        self.layoutWidget = QWidget(Dialog)
-        self.layoutWidget.setObjectName(u"layoutWidget")
-        self.layoutWidget.setGeometry(QRect(80, 40, 266, 64))
-        self.verticalLayout = QVBoxLayout(self.layoutWidget)
-        self.verticalLayout.setObjectName(u"verticalLayout")
-        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
-        self.label_2 = QLabel(self.layoutWidget)
-        self.label_2.setObjectName(u"label_2")
-        font3 = QFont()
-        font3.setPointSize(12)
-        font3.setBold(True)
-        self.label_2.setFont(font3)
-
-        self.verticalLayout.addWidget(self.label_2)
-
-        self.label_3 = QLabel(self.layoutWidget)
-        self.label_3.setObjectName(u"label_3")
-        self.label_3.setFont(font)
-
-        self.verticalLayout.addWidget(self.label_3)
-
-
-        self.retranslateUi(Dialog)
-
-        QMetaObject.connectSlotsByName(Dialog)
-    # setupUi
-
-    def retranslateUi(self, Dialog):
-        Dialog.setWindowTitle(QCoreApplication.translate("Dialog", u"Dialog", None))
-        self.label.setText("")
-        self.label_4.setText(QCoreApplication.translate("Dialog", u"Developed By:    Payment Switch Project Team ", None))
-        self.label_5.setText(QCoreApplication.translate("Dialog", u"2024 \u00a9 ", None))
-        self.label_6.setText("")
-        self.label_2.setText(QCoreApplication.translate("Dialog", u"Card File Consolidator App", None))
-        self.label_3.setText(QCoreApplication.translate("Dialog", u"Version 1.1.0", None))
-    # retranslateUi
-
-# -*- coding: utf-8 -*-
-
-################################################################################
-## Form generated from reading UI file 'About.ui'
-##
-## Created by: Qt User Interface Compiler version 6.7.0
-##
-## WARNING! All changes made in this file will be lost when recompiling UI file!
-################################################################################
-
-from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
-    QMetaObject, QObject, QPoint, QRect,
-    QSize, QTime, QUrl, Qt)
-from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
-    QFont, QFontDatabase, QGradient, QIcon,
-    QImage, QKeySequence, QLinearGradient, QPainter,
-    QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
-    QLabel, QSizePolicy, QVBoxLayout, QWidget)
-import resource_rc
-
-class Ui_Dialog(object):
-    def setupUi(self, Dialog):
-        if not Dialog.objectName():
-            Dialog.setObjectName(u"Dialog")
-        Dialog.resize(500, 500)
-        Dialog.setMinimumSize(QSize(500, 500))
-        Dialog.setMaximumSize(QSize(500, 500))
-        self.buttonBox = QDialogButtonBox(Dialog)
-        self.buttonBox.setObjectName(u"buttonBox")
-        self.buttonBox.setGeometry(QRect(190, 310, 156, 24))
-        self.buttonBox.setStandardButtons(QDialogButtonBox.StandardButton.Close)
-        self.label = QLabel(Dialog)
-        self.label.setObjectName(u"label")
-        self.label.setGeometry(QRect(10, 40, 64, 64))
-        self.label.setMinimumSize(QSize(64, 64))
-        self.label.setMaximumSize(QSize(64, 64))
-        self.label.setPixmap(QPixmap(u":/icon.ico"))
-        self.label.setScaledContents(True)
-        self.label_4 = QLabel(Dialog)
-        self.label_4.setObjectName(u"label_4")
-        self.label_4.setGeometry(QRect(20, 120, 341, 31))
-        font = QFont()
-        font.setPointSize(11)
-        self.label_4.setFont(font)
-        self.label_5 = QLabel(Dialog)
-        self.label_5.setObjectName(u"label_5")
-        self.label_5.setGeometry(QRect(100, 190, 81, 16))
-        font1 = QFont()
-        font1.setFamilies([u"Arial"])
-        font1.setPointSize(16)
-        self.label_5.setFont(font1)
-        self.label_6 = QLabel(Dialog)
-        self.label_6.setObjectName(u"label_6")
-        self.label_6.setGeometry(QRect(180, 170, 64, 64))
-        self.label_6.setMinimumSize(QSize(64, 64))
-        self.label_6.setMaximumSize(QSize(64, 64))
-        font2 = QFont()
-        font2.setPointSize(16)
-        self.label_6.setFont(font2)
-        self.label_6.setPixmap(QPixmap(u":/images/images/companylogo.png"))
-        self.label_6.setScaledContents(True)
-        self.layoutWidget = QWidget(Dialog)
-        self.layoutWidget.setObjectName(u"layoutWidget")
-        self.layoutWidget.setGeometry(QRect(80, 40, 266, 64))
-        self.verticalLayout = QVBoxLayout(self.layoutWidget)
-        self.verticalLayout.setObjectName(u"verticalLayout")
-        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
-        self.label_2 = QLabel(self.layoutWidget)
-        self.label_2.setObjectName(u"label_2")
-        font3 = QFont()
-        font3.setPointSize(12)
-        font3.setBold(True)
-        self.label_2.setFont(font3)
-
-        self.verticalLayout.addWidget(self.label_2)
-
-        self.label_3 = QLabel(self.layoutWidget)
-        self.label_3.setObjectName(u"label_3")
-        self.label_3.setFont(font)
-
-        self.verticalLayout.addWidget(self.label_3)
-
-
-        self.retranslateUi(Dialog)
-
-        QMetaObject.connectSlotsByName(Dialog)
-    # setupUi
-
-    def retranslateUi(self, Dialog):
-        Dialog.setWindowTitle(QCoreApplication.translate("Dialog", u"Dialog", None))
-        self.label.setText("")
-        self.label_4.setText(QCoreApplication.translate("Dialog", u"Developed By:    Payment Switch Project Team ", None))
-        self.label_5.setText(QCoreApplication.translate("Dialog", u"2024 \u00a9 ", None))
-        self.label_6.setText("")
-        self.label_2.setText(QCoreApplication.translate("Dialog", u"Card File Consolidator App", None))
-        self.label_3.setText(QCoreApplication.translate("Dialog", u"Version 1.1.0", None))
-    # retranslateUi
-
-# -*- coding: utf-8 -*-
-
-################################################################################
-## Form generated from reading UI file 'About.ui'
-##
-## Created by: Qt User Interface Compiler version 6.7.0
-##
-## WARNING! All changes made in this file will be lost when recompiling UI file!
-################################################################################
-
-from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
-    QMetaObject, QObject, QPoint, QRect,
-    QSize, QTime, QUrl, Qt)
-from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
-    QFont, QFontDatabase, QGradient, QIcon,
-    QImage, QKeySequence, QLinearGradient, QPainter,
-    QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
-    QHBoxLayout, QLabel, QSizePolicy, QVBoxLayout,
-    QWidget)
-import resource_rc
-
-class Ui_Dialog(object):
-    def setupUi(self, Dialog):
-        if not Dialog.objectName():
-            Dialog.setObjectName(u"Dialog")
-        Dialog.resize(400, 400)
-        Dialog.setMinimumSize(QSize(400, 400))
-        Dialog.setMaximumSize(QSize(400, 400))
-        self.buttonBox = QDialogButtonBox(Dialog)
-        self.buttonBox.setObjectName(u"buttonBox")
-        self.buttonBox.setGeometry(QRect(190, 310, 156, 24))
-        self.buttonBox.setStandardButtons(QDialogButtonBox.StandardButton.Close)
-        self.label = QLabel(Dialog)
-        self.label.setObjectName(u"label")
-        self.label.setGeometry(QRect(52, 42, 64, 64))
-        self.label.setMinimumSize(QSize(64, 64))
-        self.label.setMaximumSize(QSize(64, 64))
-        self.label.setPixmap(QPixmap(u":/icon.ico"))
-        self.label.setScaledContents(True)
-        self.label_4 = QLabel(Dialog)
-        self.label_4.setObjectName(u"label_4")
-        self.label_4.setGeometry(QRect(50, 130, 309, 20))
-        font = QFont()
-        font.setPointSize(11)
-        self.label_4.setFont(font)
-        self.widget = QWidget(Dialog)
-        self.widget.setObjectName(u"widget")
-        self.widget.setGeometry(QRect(120, 180, 147, 66))
-        self.horizontalLayout_2 = QHBoxLayout(self.widget)
-        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
-        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
-        self.label_5 = QLabel(self.widget)
-        self.label_5.setObjectName(u"label_5")
-        font1 = QFont()
-        font1.setFamilies([u"Arial"])
-        font1.setPointSize(16)
-        self.label_5.setFont(font1)
-
-        self.horizontalLayout_2.addWidget(self.label_5)
-
-        self.label_6 = QLabel(self.widget)
-        self.label_6.setObjectName(u"label_6")
-        self.label_6.setMinimumSize(QSize(64, 64))
-        self.label_6.setMaximumSize(QSize(64, 64))
-        font2 = QFont()
-        font2.setPointSize(16)
-        self.label_6.setFont(font2)
-        self.label_6.setPixmap(QPixmap(u":/images/images/companylogo.png"))
-        self.label_6.setScaledContents(True)
-
-        self.horizontalLayout_2.addWidget(self.label_6)
-
-        self.widget1 = QWidget(Dialog)
-        self.widget1.setObjectName(u"widget1")
-        self.widget1.setGeometry(QRect(122, 42, 205, 49))
-        self.verticalLayout = QVBoxLayout(self.widget1)
-        self.verticalLayout.setObjectName(u"verticalLayout")
-        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
-        self.label_2 = QLabel(self.widget1)
-        self.label_2.setObjectName(u"label_2")
-        font3 = QFont()
-        font3.setPointSize(12)
-        font3.setBold(True)
-        self.label_2.setFont(font3)
-
-        self.verticalLayout.addWidget(self.label_2)
-
-        self.label_3 = QLabel(self.widget1)
-        self.label_3.setObjectName(u"label_3")
-        self.label_3.setFont(font)
-
-        self.verticalLayout.addWidget(self.label_3)
-
-
-        self.retranslateUi(Dialog)
-
-        QMetaObject.connectSlotsByName(Dialog)
-    # setupUi
-
-    def retranslateUi(self, Dialog):
-        Dialog.setWindowTitle(QCoreApplication.translate("Dialog", u"Dialog", None))
-        self.label.setText("")
-        self.label_4.setText(QCoreApplication.translate("Dialog", u"Developed By:    Payment Switch Project Team ", None))
-        self.label_5.setText(QCoreApplication.translate("Dialog", u"2024 \u00a9 ", None))
-        self.label_6.setText("")
-        self.label_2.setText(QCoreApplication.translate("Dialog", u"Card File Consolidator App", None))
-        self.label_3.setText(QCoreApplication.translate("Dialog", u"Version 1.1.0", None))
-    # retranslateUi
-
-# -*- coding: utf-8 -*-
-
-################################################################################
-## Form generated from reading UI file 'About.ui'
-##
-## Created by: Qt User Interface Compiler version 6.7.0
-##
-## WARNING! All changes made in this file will be lost when recompiling UI file!
-################################################################################
-
-from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
-    QMetaObject, QObject, QPoint, QRect,
-    QSize, QTime, QUrl, Qt)
-from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
-    QFont, QFontDatabase, QGradient, QIcon,
-    QImage, QKeySequence, QLinearGradient, QPainter,
-    QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
-    QHBoxLayout, QLabel, QSizePolicy, QVBoxLayout,
-    QWidget)
-import resource_rc
-
-class Ui_Dialog(object):
-    def setupUi(self, Dialog):
-        if not Dialog.objectName():
-            Dialog.setObjectName(u"Dialog")
-        Dialog.resize(400, 400)
-        Dialog.setMinimumSize(QSize(400, 400))
-        Dialog.setMaximumSize(QSize(400, 400))
-        self.buttonBox = QDialogButtonBox(Dialog)
-        self.buttonBox.setObjectName(u"buttonBox")
-        self.buttonBox.setGeometry(QRect(190, 310, 156, 24))
-        self.buttonBox.setStandardButtons(QDialogButtonBox.StandardButton.Close)
-        self.label = QLabel(Dialog)
-        self.label.setObjectName(u"label")
-        self.label.setGeometry(QRect(52, 42, 64, 64))
-        self.label.setMinimumSize(QSize(64, 64))
-        self.label.setMaximumSize(QSize(64, 64))
-        self.label.setPixmap(QPixmap(u":/icon.ico"))
-        self.label.setScaledContents(True)
-        self.label_4 = QLabel(Dialog)
-        self.label_4.setObjectName(u"label_4")
-        self.label_4.setGeometry(QRect(50, 130, 309, 20))
-        font = QFont()
-        font.setPointSize(11)
-        self.label_4.setFont(font)
-        self.widget = QWidget(Dialog)
-        self.widget.setObjectName(u"widget")
-        self.widget.setGeometry(QRect(120, 180, 147, 66))
-        self.horizontalLayout_2 = QHBoxLayout(self.widget)
-        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
-        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
-        self.label_5 = QLabel(self.widget)
-        self.label_5.setObjectName(u"label_5")
-        font1 = QFont()
-        font1.setFamilies([u"Arial"])
-        font1.setPointSize(16)
-        self.label_5.setFont(font1)
-
-        self.horizontalLayout_2.addWidget(self.label_5)
-
-        self.label_6 = QLabel(self.widget)
-        self.label_6.setObjectName(u"label_6")
-        self.label_6.setMinimumSize(QSize(64, 64))
-        self.label_6.setMaximumSize(QSize(64, 64))
-        font2 = QFont()
-        font2.setPointSize(16)
-        self.label_6.setFont(font2)
-        self.label_6.setPixmap(QPixmap(u":/images/images/companylogo.png"))
-        self.label_6.setScaledContents(True)
-
-        self.horizontalLayout_2.addWidget(self.label_6)
-
-        self.widget1 = QWidget(Dialog)
-        self.widget1.setObjectName(u"widget1")
-        self.widget1.setGeometry(QRect(122, 42, 205, 49))
-        self.verticalLayout = QVBoxLayout(self.widget1)
-        self.verticalLayout.setObjectName(u"verticalLayout")
-        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
-        self.label_2 = QLabel(self.widget1)
-        self.label_2.setObjectName(u"label_2")
-        font3 = QFont()
-        font3.setPointSize(12)
-        font3.setBold(True)
-        self.label_2.setFont(font3)
-
-        self.verticalLayout.addWidget(self.label_2)
-
-        self.label_3 = QLabel(self.widget1)
-        self.label_3.setObjectName(u"label_3")
-        self.label_3.setFont(font)
-
-        self.verticalLayout.addWidget(self.label_3)
-
-
-        self.retranslateUi(Dialog)
-
-        QMetaObject.connectSlotsByName(Dialog)
-    # setupUi
-
-    def retranslateUi(self, Dialog):
-        Dialog.setWindowTitle(QCoreApplication.translate("Dialog", u"Dialog", None))
-        self.label.setText("")
-        self.label_4.setText(QCoreApplication.translate("Dialog", u"Developed By:    Payment Switch Project Team ", None))
-        self.label_5.setText(QCoreApplication.translate("Dialog", u"2024 \u00a9 ", None))
-        self.label_6.setText("")
-        self.label_2.setText(QCoreApplication.translate("Dialog", u"Card File Consolidator App", None))
-        self.label_3.setText(QCoreApplication.translate("Dialog", u"Version 1.1.0", None))
-    # retranslateUi
-
-# -*- coding: utf-8 -*-
-
-################################################################################
-## Form generated from reading UI file 'About.ui'
-##
-## Created by: Qt User Interface Compiler version 6.7.0
-##
-## WARNING! All changes made in this file will be lost when recompiling UI file!
-################################################################################
-
 from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
     QMetaObject, QObject, QPoint, QRect,
     QSize, QTime, QUrl, Qt)
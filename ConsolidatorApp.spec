@@ -9,7 +9,8 @@ a = Analysis(
         ('output.csv', '.'),
         ('branches.json', '.'),
         ('branches.json', '.'),
-        ('districts.json', '.')
+        ('districts.json', '.'),
+        ('resource.rcc', '.')
     ],
     hiddenimports=[],
     hookspath=[],
@@ -19,10 +20,18 @@ a = Analysis(
     noarchive=False,
 )
 pyz = PYZ(a.pure)
+# Shown by the bootloader while the onefile build unpacks; app.py closes it once its own splash is up.
+splash = Splash(
+    'images/applogo.png',
+    binaries=a.binaries,
+    datas=a.datas,
+)
 
 exe = EXE(
     pyz,
     a.scripts,
+    splash,
+    splash.binaries,
     a.binaries,
     a.datas,
     [],
@@ -1,8 +1,45 @@
-from PySide6.QtWidgets import QMainWindow,QApplication
-from  consolidator_app import ConsolidatorApp
-from PySide6.QtGui import QIcon
-app=QApplication()
-app.setWindowIcon(QIcon(":/icon.ico"))
-window= ConsolidatorApp()
-window.show()
-app.exec()
+import time
+
+STARTED = time.perf_counter()
+
+import multiprocessing
+import sys
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    # Imported after freeze_support() so process-pool workers, which re-run this module, never load Qt.
+    from PySide6.QtWidgets import QApplication, QSplashScreen
+    from PySide6.QtGui import QIcon, QPixmap
+    from PySide6.QtCore import Qt
+
+    try:
+        # Present when the onefile build shows the bootloader splash while it unpacks.
+        import pyi_splash
+    except ImportError:
+        pyi_splash = None
+
+    app=QApplication(sys.argv)
+
+    import resource_rc  # noqa: F401  (registers the :/ resources used by the splash and the window)
+    from startup_metrics import StartupTimer
+    startup_timer = StartupTimer(STARTED)
+    startup_timer.mark('qt_ready')
+
+    splash = QSplashScreen(QPixmap(":/images/images/applogo.png"))
+    splash.showMessage("Starting Card File Consolidator...", Qt.AlignBottom | Qt.AlignHCenter)
+    splash.show()
+    if pyi_splash is not None:
+        pyi_splash.close()
+    app.processEvents()
+    startup_timer.mark('splash_shown')
+
+    from consolidator_app import ConsolidatorApp
+    startup_timer.mark('imports_done')
+    app.setWindowIcon(QIcon(":/icon.ico"))
+    window= ConsolidatorApp(startup_timer)
+    startup_timer.watch_first_paint(window)
+    window.show()
+    splash.finish(window)
+    startup_timer.mark('window_shown')
+    app.exec()
@@ -0,0 +1,47 @@
+"""Time process() with 1..N workers on one input folder and check the outputs match.
+
+Usage: python -m benchmarks.bench_parallel <input_directory> [max_workers]
+"""
+import filecmp
+import os
+import sys
+import tempfile
+import time
+
+from data_processor import DataProcessor
+
+
+def main(argv):
+    if len(argv) not in (2, 3):
+        print(__doc__)
+        return 2
+
+    input_directory = argv[1]
+    max_workers = int(argv[2]) if len(argv) == 3 else os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as work_directory:
+        baseline = None
+        baseline_elapsed = None
+        identical = True
+
+        for workers in range(1, max_workers + 1):
+            output_directory = os.path.join(work_directory, str(workers))
+            os.makedirs(output_directory)
+
+            start = time.perf_counter()
+            DataProcessor(output_directory).process(input_directory, workers=workers)
+            elapsed = time.perf_counter() - start
+
+            output_file_name = os.path.join(output_directory, 'output.csv')
+            if baseline is None:
+                baseline, baseline_elapsed = output_file_name, elapsed
+            else:
+                identical = identical and filecmp.cmp(baseline, output_file_name, shallow=False)
+            print(f"workers {workers:>3}  {elapsed:8.2f} s  speedup {baseline_elapsed / elapsed:5.2f}x")
+
+        print(f"output.csv identical across worker counts: {identical}")
+        return 0 if identical else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
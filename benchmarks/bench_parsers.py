@@ -0,0 +1,88 @@
+"""Time each parser backend on one input folder and check it yields the python backend's rows.
+
+Every backend is first compared file by file with the python backend, on the
+input folder and on a file of edge cases (blank lines, stray separators,
+CR line ends, quotes, non-ASCII whitespace). Each backend then parses the
+whole folder, best of several runs, and the rows/s are reported. A backend
+whose package is missing is reported as unavailable.
+
+Usage: python -m benchmarks.bench_parsers <input_directory> [runs]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from file_catalog import get_catalog
+from parsers import PARSERS, get_parser
+
+EDGE_CASES = (
+    " ~1234 567~ , ~5000 1111~ ,, 10/27 , NAME^ ,\r\n"
+    "\n"
+    "   \t \n"
+    ",, ,\n"
+    "~~\n"
+    "a,\"quoted, value\",'single'\r"
+    "\x0bx\x0c,\x1cy\x1f,\x85z\xa0\n"
+    "café , été　, \n"
+    "last line without a line break ,"
+)
+
+
+def identical(parser, reference, file_paths):
+    for file_path in file_paths:
+        if list(parser.parse(file_path)) != list(reference.parse(file_path)):
+            print(f"  rows differ from the python backend in '{file_path}'")
+            return False
+    return True
+
+
+def time_parser(parser, file_paths, runs):
+    best = None
+    rows = 0
+    for _ in range(runs):
+        rows = 0
+        start = time.perf_counter()
+        for file_path in file_paths:
+            for _ in parser.parse(file_path):
+                rows += 1
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return rows, best
+
+
+def main(argv):
+    if len(argv) not in (2, 3):
+        print(__doc__)
+        return 2
+
+    input_directory = argv[1]
+    runs = int(argv[2]) if len(argv) == 3 else 3
+    file_paths = [os.path.join(input_directory, name) for name in get_catalog(input_directory).names()]
+    size = sum(os.path.getsize(file_path) for file_path in file_paths)
+    reference = get_parser('python')
+    all_identical = True
+
+    with tempfile.TemporaryDirectory() as work_directory:
+        edge_case_path = os.path.join(work_directory, 'edge_cases')
+        with open(edge_case_path, 'w', newline='', encoding='utf-8') as edge_case_file:
+            edge_case_file.write(EDGE_CASES)
+
+        print(f"{len(file_paths)} files, {size / 2**20:.1f} MiB")
+        print(f"{'parser':<8} {'seconds':>9} {'rows/s':>12} {'MB/s':>8}  identical")
+        for name in PARSERS:
+            try:
+                parser = get_parser(name)
+            except ValueError as e:
+                print(f"{name:<8} unavailable ({e})")
+                continue
+            same = identical(parser, reference, [edge_case_path] + file_paths)
+            all_identical = all_identical and same
+            rows, elapsed = time_parser(parser, file_paths, runs)
+            print(f"{name:<8} {elapsed:9.3f} {rows / elapsed:12,.0f} {size / 1e6 / elapsed:8.1f}  {same}")
+
+    return 0 if all_identical else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,93 @@
+"""Measure cold import time of the headless CLI and of the GUI modules, and GUI launch time.
+
+Each module is imported in a fresh interpreter several times and the median
+wall time is reported. The generated form and resource modules are also
+compiled from source, which is what a first launch or an unpacked onefile
+build without cached bytecode pays for them. The GUI is then launched the same way with
+CONSOLIDATOR_EXIT_AFTER_STARTUP set, so it prints its startup milestones
+and quits once interactive; the median of each milestone is reported. It
+runs on Qt's offscreen platform unless QT_QPA_PLATFORM is set. Anything
+whose dependencies are missing is reported as unavailable.
+
+Usage: python -m benchmarks.bench_startup [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ['consolidator', 'consolidator_app', 'ConsolidatorApp_ui', 'About_ui', 'resource_rc']
+GENERATED_MODULES = ['ConsolidatorApp_ui', 'About_ui', 'resource_rc']
+MILESTONES = ['qt_ready', 'splash_shown', 'imports_done', 'window_shown', 'first_paint', 'interactive']
+
+
+def time_import(module, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, '-c', f'import {module}'], cwd=REPO_DIRECTORY,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        elapsed = time.perf_counter() - start
+        if completed.returncode != 0:
+            return None, completed.stderr.decode(errors='replace').strip().splitlines()[-1]
+        timings.append(elapsed)
+    return statistics.median(timings), None
+
+
+def time_compile(module, runs):
+    path = os.path.join(REPO_DIRECTORY, module + '.py')
+    with open(path, 'rb') as source_file:
+        source = source_file.read()
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        compile(source, path, 'exec')
+        timings.append(time.perf_counter() - start)
+    return len(source), statistics.median(timings)
+
+
+def time_launch(runs):
+    environment = dict(os.environ, CONSOLIDATOR_EXIT_AFTER_STARTUP='1')
+    environment.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    records = []
+    for _ in range(runs):
+        completed = subprocess.run([sys.executable, 'app.py'], cwd=REPO_DIRECTORY, env=environment,
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=120)
+        lines = completed.stdout.decode(errors='replace').strip().splitlines()
+        if completed.returncode != 0 or not lines:
+            error = completed.stderr.decode(errors='replace').strip().splitlines()
+            return None, error[-1] if error else f"exit code {completed.returncode}"
+        records.append(json.loads(lines[-1]))
+    return {milestone: statistics.median(record[milestone] for record in records)
+            for milestone in MILESTONES if all(milestone in record for record in records)}, None
+
+
+def main(argv):
+    runs = int(argv[1]) if len(argv) > 1 else 5
+    baseline, _ = time_import('sys', runs)
+    print(f"{'interpreter':<30} {baseline * 1000:8.1f} ms")
+    for module in MODULES:
+        elapsed, error = time_import(module, runs)
+        if elapsed is None:
+            print(f"{module:<30} unavailable ({error})")
+        else:
+            print(f"{module:<30} {elapsed * 1000:8.1f} ms  (+{(elapsed - baseline) * 1000:.1f} ms over interpreter)")
+
+    for module in GENERATED_MODULES:
+        size, elapsed = time_compile(module, runs)
+        print(f"{'compile ' + module:<30} {elapsed * 1000:8.1f} ms  ({size / 1024:.0f} KB source)")
+
+    milestones, error = time_launch(runs)
+    if milestones is None:
+        print(f"{'gui launch':<30} unavailable ({error})")
+    else:
+        for milestone, elapsed in milestones.items():
+            print(f"{'gui ' + milestone:<30} {elapsed * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
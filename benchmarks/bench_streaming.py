@@ -0,0 +1,99 @@
+"""Compare the original in-memory algorithm with the streaming writer on one input folder.
+
+The in-memory reference is the original process() loop inlined here: each
+file is read whole, cleaned, split and stripped, every row is collected and
+the list is written at the end. It keeps empty columns and pads rows to the
+card schema, as output.csv does now, so the two outputs can be compared byte
+for byte. The streaming run is the writer process() uses, in this process
+(one worker, so tracemalloc sees all of it) and without the manifest.
+
+Usage: python -m benchmarks.bench_streaming <input_directory>
+"""
+import csv
+import filecmp
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from card_schema import CARD_FIELDS
+from data_processor import DataProcessor
+
+
+def parse_file_in_memory(processor, file_name, input_directory, branch_data):
+    file_info = processor.parse_file_name(file_name)
+    if file_info is None:
+        return []
+
+    try:
+        with open(os.path.join(input_directory, file_name), 'r') as file:
+            data = file.read()
+    except FileNotFoundError:
+        print(f"Error: The file '{os.path.join(input_directory, file_name)}' was not found.")
+        return []
+
+    cleaned_data = data.replace('~', '').replace('^', '  ')
+    rows = cleaned_data.split('\n')
+    cleaned_rows = [row.split(',') for row in rows if row.strip()]
+
+    suffix = processor.file_suffix(file_info, branch_data)
+    width = len(CARD_FIELDS)
+    processed_rows = []
+    for row in cleaned_rows:
+        row = [column.strip() for column in row][:width]
+        row.extend([''] * (width - len(row)))
+        row.extend(suffix)
+        processed_rows.append(row)
+    return processed_rows
+
+
+def run_in_memory(processor, input_directory, output_file_name):
+    branch_data = processor.load_branch_data()
+    all_rows = []
+    for input_file_name in processor.get_input_file_names(input_directory):
+        all_rows.extend(parse_file_in_memory(processor, input_file_name, input_directory, branch_data))
+    with open(output_file_name, 'w', newline='') as csvfile:
+        csv.writer(csvfile).writerows(all_rows)
+
+
+def run_streaming(processor, input_directory, output_file_name):
+    branch_data = processor.load_branch_data()
+    input_file_names = processor.get_input_file_names(input_directory)
+    with open(output_file_name, 'w', newline='') as csvfile:
+        processor.write_output(csvfile, input_file_names, input_file_names, input_directory, branch_data, workers=1)
+
+
+def measure(label, func, processor, input_directory, output_file_name):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(processor, input_directory, output_file_name)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} {elapsed:8.2f} s  peak {peak / 2**20:8.1f} MiB")
+
+
+def main(argv):
+    if len(argv) != 2:
+        print(__doc__)
+        return 2
+
+    input_directory = argv[1]
+    with tempfile.TemporaryDirectory() as work_directory:
+        memory_output = os.path.join(work_directory, 'memory.csv')
+        stream_output = os.path.join(work_directory, 'stream.csv')
+        processor = DataProcessor(work_directory, parser='python')
+        # Compile the reference data first so neither run pays for it.
+        processor.load_branch_data()
+
+        measure('in-memory', run_in_memory, processor, input_directory, memory_output)
+        measure('streaming', run_streaming, processor, input_directory, stream_output)
+
+        identical = filecmp.cmp(memory_output, stream_output, shallow=False)
+        print(f"output.csv identical: {identical}")
+        return 0 if identical else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,172 @@
+"""Benchmark parse, process and merge at several scales on synthetic PersoFiles.
+
+Each operation runs in its own interpreter so its peak RSS is not mixed with
+the others. For every operation the suite prints rows/s, input MB/s, the
+peak RSS of the operation's own process and the largest peak RSS among the
+worker processes it started (the process-pool workers of process-parallel);
+--json prints the same numbers as one JSON document.
+
+Scales (files x rows per file):
+    1k     1,000 x 100       100k rows
+    10k    10,000 x 100      1M rows
+    100k   100,000 x 100     10M rows
+
+Usage: python -m benchmarks.bench_suite [--scale 1k,10k,100k] [--work-dir DIR] [--json]
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+
+from benchmarks.generate_persofiles import generate
+
+SCALES = {'1k': (1000, 100), '10k': (10000, 100), '100k': (100000, 100)}
+OPERATIONS = ['parse', 'process-serial', 'process-parallel', 'merge-date', 'merge-product', 'merge-range',
+              'merge-all']
+
+
+def peak_rss_bytes(children=False):
+    # With children, the largest peak among the finished child processes, 0 if there were none.
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_operation(operation, input_directory, output_directory):
+    from data_processor import DataProcessor
+
+    data_processor = DataProcessor(output_directory)
+    if operation == 'parse':
+        branch_data = data_processor.load_branch_data()
+        for file_name in data_processor.get_input_file_names(input_directory):
+            for _ in data_processor.iter_file_rows(file_name, input_directory, branch_data):
+                pass
+    elif operation == 'process-serial':
+        data_processor.process(input_directory, workers=1, incremental=False)
+    elif operation == 'process-parallel':
+        data_processor.process(input_directory, incremental=False)
+    elif operation == 'merge-date':
+        data_processor.merge_files_by_date(input_directory)
+    elif operation == 'merge-product':
+        data_processor.merge_files_by_product(input_directory)
+    elif operation == 'merge-range':
+        data_processor.merge_files_by_date_range(date(2024, 6, 1), date(2024, 6, 30), input_directory)
+    elif operation == 'merge-all':
+        data_processor.merge_files(['date', 'product', 'branch', 'district', 'product+date'], input_directory)
+
+
+def child_main(operation, input_directory, output_directory):
+    start = time.perf_counter()
+    sys.stdout = sys.stderr
+    run_operation(operation, input_directory, output_directory)
+    elapsed = time.perf_counter() - start
+    sys.stdout = sys.__stdout__
+    print(json.dumps({'seconds': elapsed, 'peak_rss_bytes': peak_rss_bytes(),
+                      'worker_peak_rss_bytes': peak_rss_bytes(children=True)}))
+
+
+def measure(operation, input_directory, work_directory):
+    output_directory = os.path.join(work_directory, operation)
+    shutil.rmtree(output_directory, ignore_errors=True)
+    os.makedirs(output_directory)
+    completed = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.bench_suite', '--child', operation, input_directory, output_directory],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+    return json.loads(completed.stdout.decode().strip().splitlines()[-1])
+
+
+def run_scale(scale, work_directory):
+    files, rows_per_file = SCALES[scale]
+    scale_directory = os.path.join(work_directory, scale)
+    input_directory = os.path.join(scale_directory, 'inputfiles')
+    info_path = os.path.join(scale_directory, 'generated.json')
+
+    try:
+        with open(info_path) as info_file:
+            info = json.load(info_file)
+    except (FileNotFoundError, ValueError):
+        info = None
+    if info is None or info['files'] != files or info['rows_per_file'] != rows_per_file:
+        shutil.rmtree(input_directory, ignore_errors=True)
+        _, rows, size = generate(input_directory, files, rows_per_file)
+        info = {'files': files, 'rows_per_file': rows_per_file, 'rows': rows, 'bytes': size}
+        with open(info_path, 'w') as info_file:
+            json.dump(info, info_file)
+
+    results = []
+    for operation in OPERATIONS:
+        stats = measure(operation, input_directory, scale_directory)
+        seconds = stats['seconds']
+        results.append({
+            'scale': scale,
+            'operation': operation,
+            'files': info['files'],
+            'rows': info['rows'],
+            'seconds': seconds,
+            'rows_per_second': info['rows'] / seconds if seconds else None,
+            'mb_per_second': info['bytes'] / 1e6 / seconds if seconds else None,
+            'peak_rss_bytes': stats['peak_rss_bytes'],
+            'worker_peak_rss_bytes': stats['worker_peak_rss_bytes'],
+        })
+    return results
+
+
+def print_table(results):
+    print(f"{'scale':<6} {'operation':<17} {'seconds':>9} {'rows/s':>12} {'MB/s':>8} {'peak RSS MiB':>13} "
+          f"{'worker MiB':>11}")
+    for result in results:
+        rss = result['peak_rss_bytes']
+        worker_rss = result['worker_peak_rss_bytes']
+        print(f"{result['scale']:<6} {result['operation']:<17} {result['seconds']:>9.2f} "
+              f"{result['rows_per_second']:>12,.0f} {result['mb_per_second']:>8.1f} "
+              f"{rss / 2**20 if rss else float('nan'):>13.1f} "
+              f"{worker_rss / 2**20 if worker_rss else float('nan'):>11.1f}")
+
+
+def main(argv):
+    if len(argv) == 5 and argv[1] == '--child':
+        child_main(argv[2], argv[3], argv[4])
+        return 0
+
+    parser = argparse.ArgumentParser(prog='bench_suite', description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', default='1k', help="comma-separated scales from: " + ', '.join(SCALES))
+    parser.add_argument('--work-dir', help="where generated input is kept between runs (default: a temporary folder)")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args(argv[1:])
+
+    scales = args.scale.split(',')
+    unknown = [scale for scale in scales if scale not in SCALES]
+    if unknown:
+        parser.error(f"unknown scale(s): {', '.join(unknown)}")
+
+    temporary = None
+    work_directory = args.work_dir
+    if work_directory is None:
+        temporary = tempfile.TemporaryDirectory()
+        work_directory = temporary.name
+
+    try:
+        results = []
+        for scale in scales:
+            results.extend(run_scale(scale, work_directory))
+    finally:
+        if temporary:
+            temporary.cleanup()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
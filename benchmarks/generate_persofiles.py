@@ -0,0 +1,73 @@
+"""Write synthetic PersoFile_ embossing files for benchmarks.
+
+File names follow PersoFile_<seq>_<PRODUCT>_<BRANCH>_<YYMMDD>.<HHMMSS> and
+use the real branch codes from branches.json. Rows use the same ~ and ^
+separators as the files produced by the card management system.
+
+Usage: python -m benchmarks.generate_persofiles <directory> [files] [rows_per_file] [seed]
+"""
+import json
+import os
+import random
+import sys
+from datetime import date, timedelta
+
+REPO_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PRODUCTS = ['GAMTA', 'HAIFB', 'DEPON']
+FIRST_NAMES = ['ABEBE', 'CHALTU', 'DAWIT', 'FAYISA', 'GEMECHU', 'HAWI', 'LENSA', 'OBSA', 'TOLERA', 'URJI']
+LAST_NAMES = ['BEKELE', 'DIRIBA', 'GUTEMA', 'KEBEDE', 'MEGERSA', 'NEGASH', 'REGASA', 'TADESSE', 'WAKO']
+
+
+def load_branch_codes():
+    with open(os.path.join(REPO_DIRECTORY, 'branches.json')) as json_file:
+        return sorted(json.load(json_file))
+
+
+def make_row(rng, branch_code):
+    pan = '5' + ''.join(rng.choice('0123456789') for _ in range(15))
+    cvv = f"{rng.randint(0, 999):03d}"
+    expiry = f"{rng.randint(1, 12):02d}/{rng.randint(26, 30)}"
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    track1 = f"B{pan}^{name.replace(' ', '/')}^{expiry[3:]}{expiry[:2]}101"
+    track2 = f"{pan}={expiry[3:]}{expiry[:2]}101{rng.randint(10**9, 10**10 - 1)}"
+    encrypted = ''.join(rng.choice('0123456789ABCDEF') for _ in range(32))
+    return (f"~{pan[-4:]} {cvv}~,~{pan[:4]} {pan[4:8]} {pan[8:12]} {pan[12:]}~,{expiry},{name}^,"
+            f"{track1},{track2},101,~{encrypted}~,{branch_code}\n")
+
+
+def generate(directory, files, rows_per_file, seed=0, start=date(2024, 6, 1), days=30):
+    """Generate the files and return (file_count, row_count, byte_count)."""
+    os.makedirs(directory, exist_ok=True)
+    rng = random.Random(seed)
+    branch_codes = load_branch_codes()
+    rows = 0
+    size = 0
+
+    for sequence in range(1, files + 1):
+        branch_code = rng.choice(branch_codes)
+        request_date = start + timedelta(days=rng.randrange(days))
+        file_name = (f"PersoFile_{sequence:05d}_{rng.choice(PRODUCTS)}_{branch_code}_"
+                     f"{request_date.strftime('%y%m%d')}.{rng.randint(8, 17):02d}{rng.randint(0, 59):02d}{rng.randint(0, 59):02d}")
+        content = ''.join(make_row(rng, branch_code) for _ in range(rows_per_file))
+        with open(os.path.join(directory, file_name), 'w', newline='') as file:
+            file.write(content)
+        rows += rows_per_file
+        size += len(content)
+
+    return files, rows, size
+
+
+def main(argv):
+    if not 2 <= len(argv) <= 5:
+        print(__doc__)
+        return 2
+    files = int(argv[2]) if len(argv) > 2 else 1000
+    rows_per_file = int(argv[3]) if len(argv) > 3 else 100
+    seed = int(argv[4]) if len(argv) > 4 else 0
+    files, rows, size = generate(argv[1], files, rows_per_file, seed)
+    print(f"Wrote {files} files, {rows} rows, {size / 2**20:.1f} MiB to '{argv[1]}'.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -1,5 +0,0 @@
-
-def get_branches():
-
-
- return  ['Head Office', 'Adama Branch', 'Asela Branch', 'Kersa Main Branch', 'Hora Arsedi Branch', 'Shashemene Branch', 'Nekemte Branch', 'Merkato Branch', 'Ambo Branch', 'Hawas Branch', 'Burayu Branch', 'Sheger Branch', 'Dire Dawa Branch', 'Seglen Ilu Branch', 'Bule Hora Branch', 'Dambi Dollo Branch', 'Robe Branch', 'Torban Obo Branch', 'Gulele Branch', 'Sebeta Ayo Branch', 'Weliso Branch', 'Bole-Nura Hera Branch', 'Sululta Branch', 'Mojo Branch', 'Arsi Negelle Branch', 'Kersa Arsi Branch', 'Bokoji Branch', 'Eteya Branch', 'Gimbi Branch', 'Hasasa Branch', 'Kuyyu Branch', 'Sendafa Bake Branch', 'Shenen Gibe Branch', 'Bedessa Branch', 'Gelan Branch', 'Kolfe Branch', 'Chiro Branch', 'Jigjiga Branch', 'Guliso Branch', 'Dilla Branch', 'Adola Branch', 'Gefersa Branch', 'Meki Branch', 'Holeta Branch', 'Afren Kelo Branch', 'Hundene Branch', 'Babile Branch', 'Oda Branch', 'Togo Wuchale Branch', 'Anger Gute Branch', 'Ginnir Branch', 'Odo Shakiso Branch', 'Chancho Branch', 'Guduru Branch', 'Tulu Bolo Branch', 'Bole Michael Branch', 'Gerji Branch', 'Gedo Branch', 'Robe Dedea Branch', 'Gidami Branch', 'Gumbichu Branch', 'Abomsa Branch', 'Sabian Branch', 'Bombtera Branch', 'Shirka Branch', 'Lega Tafo Branch', 'Hawassa Branch', 'Gelemso Branch', 'Uta Wayyu Branch', 'Karra Qallu Branch', 'Saris Branch', 'Kemise Branch', 'Bakannisa Branch', 'Haramaya Branch', 'Akaki Branch', 'Boku Shenen Branch', 'Humera Branch', 'Ginchi Branch', 'Furi Branch', 'Fiche Branch', 'Kotobe Branch', 'Kebena Branch', 'Sebeta Hawas Branch', 'Hirna Branch', 'Deder Branch', 'Mekele Branch', 'Gonder Branch', 'Bethel Branch', 'Bahir Dar Branch', 'Dessie Branch', 'Guder Branch', 'Sheno Branch', 'Hosana Branch', 'Wolayita Soddo Branch', 'Addisu Gebeya Branch', 'Gojam Berenda Branch', 'Ayer Tena Branch', 'Nedjo Branch', 'Dodola Branch', 'Hafatessa Branch', 'Kombolcha Branch', 'Erer Branch', 'Huruta Branch', 'Ijo Branch', 'Metema Branch', 'Negele Borena Branch', '22 Mazoria Branch', 'Leka Branch', 'Limu Genet Branch', 'Tirunesh Dibaba Branch', 'Aba Nefso Branch', 'Lafto Branch', 'Aba Mela Branch', 'Bedelle Branch', 'Kofele Branch', 'Agaro Branch', 'Bole Medanealem Branch', 'Churchill Branch', 'Gofa Mazoria Branch', 'Shambu Branch', 'Meskel Flower Branch', 'Chole Branch', 'Shire Branch', 'Arboye Branch', 'Mesalemia Branch', 'Gotera Branch', 'Sire Arsi Branch', 'Asko Branch', 'Moyale Branch', 'Addele Branch', 'Diksis Branch', 'Agemsa Branch', 'Yai Gulele Branch', 'Sagure Branch', 'Habe Branch', 'Fura Branch', 'Ferensay Legasiyon Br', 'Asosa Branch', 'Yayyo Branch', 'Abebie Tufa Branch', 'Gambella Branch', 'Yabello Branch', 'Bake Branch', 'Dire Hinchini Branch', 'Goba Branch', 'Adaba Branch', 'Muka Turi Branch', 'Djibruk Branch', 'Gurd Shola Branch', 'Batu Branch', 'CMC Branch', 'Bako Tibe Branch', 'Mizan Aman Branch', 'Oda Nabe Branch', 'Birbirsa Branch', 'Leman Branch', 'Derra Branch', 'Wayyu Branch', 'Tepi Branch', 'Chora Branch', 'Gida Ayana Branch', 'Wolkite Branch', 'Gasara Branch', 'Bole Atlas Branch', 'Mogor Branch', 'Jamo Branch', 'Uraga Branch', 'Adea Branch', 'Lamberet Branch', 'Dhaka Adi Branch', 'Kilole Branch', 'Siltana Branch', 'Wirtu Merkato Branch', 'Gofa Gabriel Branch', 'Dale Dembel Branch', 'Arba Minch Branch', 'Wasarbi Branch', 'Karayu Branch', 'Shenen Jida Branch', 'Haile Gebre Branch', 'Guje Branch', 'Melka Ballo Branch', 'Nonno Branch', 'Awash Sebat Kilo', 'Dolo Bidena Branch', 'Jimma Arjo Branch', 'Ejere Branch', 'Awash Melkasa Branch', 'Bosat Branch', 'Dodota Branch', 'Bote Branch', 'Awasho Branch', 'Warra Jarso Branch', 'Jahan Ameya Branch', 'Midakegni Branch', 'Bole Bulbula Branch', 'Agarfa Branch', 'Darimu Branch', 'Asandabo Branch', 'Ukke Branch', 'Chanqa Birbir Branch', 'Leka Dulacha Branch', 'Warqa Branch', 'Nunu Kumba Branch', 'Jimma Rare Branch', 'Qurqura Branch', 'Sibu Sire Branch', 'Ganji Branch', 'Mandi Branch', 'Begi Branch', 'Kiltu Karra Branch', 'Dambi Branch', 'Jiren Branch', 'Dawo Branch', 'Soddo Dachi Branch', 'Meta Walkite Branch', 'Oda Karra Branch', 'Muka Arara Branch', 'Hababo Guduru Branch', 'Ilu Gelan Branch', 'Qeto Machara Branch', 'Finfine Branch', 'Lume Branch', 'Dolo Mana Branch', 'Mulo Branch', 'Xicho Branch', 'Goro Branch', 'Mada Walabu Branch', 'Harufa Branch', 'Anfillo Branch', 'Qore Branch', 'Haro Dumal Branch', 'Harana Buluq Branch', 'Kula Branch', 'Chalchali Branch', 'Sadan Ekka Branch', 'Alge Sachi Branch', 'Shararo Branch', 'Laga Oda Branch', 'Qarcha Branch', 'Ada Barga Branch', 'Chinaksen Branch', 'Gode Branch', 'Boke Xiqo Branch', 'Badano Branch', 'Aw-Abadir Branch', 'Chalanqo Branch', 'Kali Branch', 'Sulula Garbi Branch', 'Negelle Arba Gugu Br', 'Gololcha Branch', 'Gera Branch', 'Tullu Ejersa Branch', 'Chilalo Branch', 'Aleltu Branch', 'Limu Seqqa Branch', 'Ela Bala Branch', 'Eka Abado Branch', 'Tabor Branch', 'Bale Gesgar Branch', 'Bole Lami Branch', 'Abuna Branch', 'Jaldu Branch', 'Adami Branch', 'Ajje Branch', 'Mujja Branch', 'Derartu Tullu Branch', 'Baroda Branch', 'Gara Muleta Branch', 'Sadan Soddo Branch', 'Sayo Nole Branch', 'Karra Xuxxo Branch', 'Kiramu Branch', 'Amuru Branch', 'Gore Branch', 'Melka Jebdu Branch', 'Fugnan Bira Branch', 'Wanji Branch', 'Bulbula Branch', 'Qechema Branch', 'Karamile Branch', 'Greek Camp Branch', 'Megalla Branch', 'Weltea Branch', 'Chafe Branch', 'Jarra Branch', 'Kokosa Branch', 'Heban Arsi Branch', 'Bantu Branch', 'Bokku Branch', 'Kombe Branch', 'Labu Branch', 'Karra Allo Branch', 'Mechara Branch', 'Jahan Jarso Branch', 'Shenen Dhugo Branch', 'Taji Branch', 'Yaya Gulale Branch', 'Bore Branch', 'Asgori Branch', 'Olonkomi Branch', 'Shufune Branch', 'Kutaye Branch', 'Torban Wale Branch', 'Qorke Karabu Branch', 'Ayetu Branch', 'Odo Liben Branch', 'Melka Gefersa Branch', 'Ochocha Branch', 'Butajira Branch', 'Yirgachafe Branch', 'Gafarsa Nono', 'Aba Jifar Branch', 'Mettu Branch', 'Bake Jama Branch', 'Bila Branch', 'Hawa Gelan Branch', 'Tullu Gana Branch', 'Ayira Branch', 'Liban Jawi Branch', 'Salgan Eggu Branch', 'Karra Qore Branch', 'Dhadacha Arara Branch', 'Abba Jama Branch', 'Boru Jawi Branch', 'Dabe Soloke Branch', 'Oda Bisil Branch', 'Dire Sololiya', 'Sechduna Branch', 'Hurufa Rare Branch', 'Chafe Arara Branch', 'Kuyera Branch', 'Qajela Doyo Branch', 'GeneralWakoGutu Branch', 'Ali Branch', 'Halaba Kulito Branch', 'Dolosebro Branch', 'Kobo Branch', 'Jara Abageda Branch', 'Michata Branch', 'Ahmed Imam Branch', 'Hirmata Branch', 'Merde Branch', 'Bonaya Boshe Branch', 'Gudetu Arjo Branch', 'Oda Bilbila Branch', 'Bishan Guracha Branch', 'Koka Branch', 'Burka Branch', 'Ganda Hara Branch', 'Kiltu Lume Branch', 'Warka Branch', "Abichu Nya'a Branch", 'Gawassa Branch', 'Tufa Muna Branch', 'Shabe Branch', 'Awetu Branch', 'Gachi Branch', 'Sokoru Branch', 'Omo Nada Branch', 'Goro Muti Branch', 'Makkat Al-Mukkarama', 'Tana Branch', 'Bole Arabsa Branch', 'Xadacha Branch', 'Anole Micro Branch', 'Meraro Branch', 'Burka Walabu Branch', 'Hara Kello Branch', 'Gara Baru Branch', 'Ogolcho Branch', 'Haro Adi Branch', 'Baro Korma Branch', 'JAJA BRANCH', 'Doba Branch', 'Wadessa Branch', 'Sheik Mohammed Reshad', 'Sumuda Branch', 'Wadera Branch', 'Taltale Branch', 'Ganda Wuha Branch', 'Qebe Branch', 'Debre Markos Branch', 'Boku Migra Bake Branch', 'Goro Qerensa Branch', 'Bilile Branch', 'Sigmo Branch', 'Handhura Tulama Branch', 'Aksum Branch', 'Adigrat Branch', 'Laga Bari Branch', 'Wara Ganu Branch', 'Biftu Branch', 'Bensa Daye Branch', 'Sora Lume Branch', 'Saxamma Branch', 'Elemo Qiltu Branch', 'Agamsa Migir Branch', 'Babo Gambel Branch', 'Tullu Farda', 'Harato Branch', 'Mayu Muluke', 'Dedo Branch', 'Chawaqa Branch', 'Harbu Branch', 'Shabu Ejersa Branch', 'Fedis Branch', 'Burka Tirtira Branch', 'Mufti Dawud Branch', 'Hikma Branch', 'Abubeker Al-Siddiq Br', 'Bereka Branch', 'Ansar Branch', 'Haramain Branch', 'Bilal Branch', 'Hamza Mesgid Branch', 'Halal Branch', 'Medinat Al-Munawer Br', 'Fethi Mesjid Branch', 'Baro Tumsa Branch', 'Kello Mesqela Branch', 'Debasso Branch', 'OMER IBN AL-KHATTAB Br', 'Robale Branch', 'Tulu Dimtu Branch', 'Iman Branch', 'Selam Branch', 'Haile Fida Branch', 'Ummu-Ayman Branch', 'Sheik Bekri Sapello', 'Sinqee Branch', 'Liban Chukala Branch', 'Jagema Bedhane Branch', 'TEQWA BRANCH', 'Marwa Branch', 'Salahadin Ali-Ayub', 'Beriso Dukale Micro', 'Yirgalem Branch', 'Doyo Gena Branch', 'Hadero Branch', 'Harru Maru Branch', 'Bure Branch', 'Shala Branch', 'Melba Branch', 'Bakalca Branch', 'Bishoftu Branch', 'Amana Branch', 'Qacha Branch', 'Beshale Branch', 'Bori Branch', 'Dulo Branch', 'Tiksa Jima Branch', 'Qale Branch', 'Sofomar Branch', 'Birmaji Branch', 'Burka Wayu Branch', 'Horsisa Branch', 'Halchisa Branch', 'Jate Branch', 'Lemo Branch', 'Jibat Branch', 'Dollo Ado Branch', 'Haro Wanchi Branch', 'Arefa Branch', 'Awaro Branch', 'Airport Forex Bureau', 'Serbo Branch', 'Yebu Branch', "Fincha'a Branch", 'Melka Debana Branch', 'Sedecha Branch', 'Irbu Branch', 'Digital Banking', 'Bole Airport Branch', 'Madaro Branch', 'Nagele Hasasa Branch', 'Sanate Branch', 'Ganda Qore Branch', 'Sor Micro Branch', 'Newland Micro Branch', 'Damo Dadi Branch', 'Kura Jida Branch', 'Kefira Branch', 'Imam Ahmed Mesjid Bran', 'Abdisa Aga Branch', 'Nur Branch', 'Laku Branch', 'Madha Galma Branch', 'Migira Branch', 'Bole Cargo Branch', 'Conolel Bezabih Petros', 'Durame Branch', 'Shinshicho Branch', 'Areka Branch', 'Bonosha Branch', 'Bui Branch', 'Kela Branch', 'Enseno Branch', 'Katta Branch', 'Seka Chokorsa Branch', 'Mustafa Harawe Branch', 'Bure Ilu Branch', 'Hurumu Branch', 'Bonga Branch', 'Miesso Branch', 'Ancher Branch', 'Gemechis Branch', 'Chafe Anane Branch', 'Yai Goro Branch', 'Hara Dembel Branch', 'Sinana Branch', 'Kiltu Dema Branch', 'Oda Boqota', 'Dagaga Branch', 'Burqa Jato Branch', 'Al-Rahma Branch', 'Taiwan Branch', 'Bulullo Branch', 'Oda Bultum Branch', 'Garu Hira Branch', 'Digalu Branch', 'Tijo Branch', 'Barecha Branch', 'Ego Branch', 'Shafeta Branch', 'Alamura Branch', 'Daka Branch', 'Nejashi Branch', 'Mako Bili Branch', 'Hilal Branch', 'Nesiha Branch', 'Gedeb Branch', 'Kamona Branch', 'Dhumuga Branch', 'Milqaye Branch', 'Al-Bukhari Branch', 'Rabadori Branch', 'Butta Branch', 'Gara Duba Branch', 'Wabari Branch', 'Ramadan Branch', 'Kusaye Branch', 'Axale Jatani Branch', 'Qoche Branch', 'Dhaga Bora Branch', 'Furkan Branch', 'Amal Branch', 'Guge Branch', 'Tobba Branch', 'Abebech Gobana Branch', 'Damboya Branch', 'Boditi Branch', 'Konso Branch', 'Jajura Branch', 'Hurufa Farado Branch', 'Tullo Branch', 'Lami Industrial park', 'Gara Bolo Branch', 'Itti Mako Branch', 'Mammo Mazamir Branch', 'Bekerware Branch', 'Sankura Branch', 'Gesupa Branch', 'Logia-Sultan-Ali Mirah', 'Boke Branch', 'Mina Branch', 'Hayyu Branch', 'Lega Saqo Branch', 'Darraba Bido Branch', 'Abba Sena Branch', 'Kolobo Branch', 'Homecho Branch', 'Iqra Branch', 'Fejir Branch', 'Folle Branch', 'Didimtu Branch', 'Dukem industry zone', 'Murtiguto Branch', 'Wollo Kombolcha Branch', 'Tona Branch', 'Lega Billawo Branch', 'Debre Birhan Branch', 'DERARO BRANCH', 'AL-Nasir Branch', 'Tiyo Branch', 'Asabot Branch', 'Haro Charchar Branch', 'Burqa Dhintu Branch', 'Figa Branch', 'Hidhabu Abote Branch', 'Bedhatu Branch', 'Torban Garba Branch', 'Qulubi Branch', 'Gurmu Branch', 'Abdi Qophe Branch', 'Wato Branch', 'Ilanso Hallo Branch', 'Fitala Branch', 'Catherine Hamlin', 'Dawuro Branch', 'Geja Geribo Branch', 'Lisana Branch', 'Haya Dima Branch', 'Gara Bushu Branch', 'Garba Guracha Branch', 'Lauret Tsegaye', 'Midhaga Branch', 'Kurfachale Branch', 'Dire Jitu Branch', 'Badr Branch', 'Artu Branch', 'Heraro Branch', 'Birbirsa Qaraxa Branch', 'Meja Demma Branch', 'Melka Oda Branch', 'Dida Boqe Branch', 'Dinsho Branch', 'Dambala Micro Branch', 'Mechaf Tulama Branch', 'Burqa Shobbe Branch', 'Edao Boru Branch', 'Prof. Gebissa', 'Soka Branch', 'Boru Bilo Branch', 'Maliyu Branch', 'Buludo Branch', 'Aleta Wondo Branch', 'Koromi Branch', 'Mogle Branch', 'Lugo Branch', 'Ebisa Adugna', 'Raso Branch', 'Aba Gemechis Branch', 'Abishe Gerba Branch', 'Urji Branch', 'Tunto Eco Branch', 'Hamus Gebeya Eco Bran', 'Hambecho Eco Branch', 'Dalatti Branch', 'Ali Bira Branch', 'Chuko Branch', 'Chelelektu Branch', 'Golja Branch', 'Injibara Branch', 'Melka Hurbu Branch', 'Roge Branch', 'Gara Dhanqu Branch', 'Koshe Mareko Branch', 'Tulu Kurfo Eco Branch', 'Hambiso Eco Branch', 'Dubar Eco Branch', 'Dega Gora Eco Branch', 'Arba Eco Branch', 'Defo Eco Branch', 'Lole Bulchana Eco Br', 'Halila Eco Branch', 'Samera Kolba Eco', 'Lenjiso Diga Eco', 'Godino Eco Branch', 'Tullu Jada Eco-Branch', 'Dire Eco Branch', 'Hadho Eco Branch', 'Baka Ijo Eco-Branch', 'Adadi Eco Branch', 'Kotoba Eco Branch', 'Bodda Eco Branch', 'Guddu Eco Branch', 'Warqa Qore Eco Branch', 'Maya Eco Branch', 'Dire Xiyara Eco Branch', 'Wasanu Dido Branch', 'Tulu dhertu Branch', 'Elwaye Eco-Branch', 'Dari Kidame Eco-Branch', 'Gudetu Robale Eco Bran', 'Birbirsa Kojowa Eco-Br', 'Gomole Eco-Branch', 'Oda Roba Eco Branch', 'Dinsa Eco Branch', 'Selka Bakaye Eco Br', 'Holqa Sofumer Eco Bra', 'Rayitu Branch', 'Rayan Branch', 'Lega Jidha Branch', 'Akako Branch', 'Tulu Fati Branch', 'Asgori-Suba Eco Branch', 'Uta Kaka Eco Branch', 'Serofta Eco Branch', 'Ardayta Eco Branch', 'Haqo Eco Branch', 'Negele Mexema Eco Br', 'Kuno Gebeya Eco Branch', 'Hailamariam Gamada Br', 'Aster Gano Branch', 'Chafe Muda Branch', 'Wami Biratu Branch', 'Agari Tullu Branch', 'Col Alemu Qixxeessa Br', 'Gadisa Biru Branch', 'Mari Luqe Branch', 'Yuba Branch', 'Lema Guya Branch', 'Oliqa Dingil Branch', 'Chalalaqi Branch', 'Komto Branch', 'Anno Branch', 'Ako Manoye Branch', 'Boru Joka Branch', 'Asmerom Legesse Branch', 'Raphe Branch', 'Botor Tolay Branch', 'Meti Branch', 'Melka Oboshe Branch', 'Gara Muktar Eco Branch', 'Kara Makala Eco Branch', 'Kase Hija Eco Branch', 'Hardim Eco Branch', 'Dire Dawa Free Trade', 'Falana Eco Branch', 'Fachatu Eco Branch', 'Malka Shane Branch', 'Dusta Eco Branch', 'Yukiro Kamise Eco-Bran', 'Gudattu Qarsa Eco Br', 'Soddo Garbo Eco Branch', 'Chachu Branch', 'Chafe Tuma Branch', 'Gachana Branch', 'Gebeyehu Gurmu Branch', 'Ona Jarsayu Branch', 'Badho Dachas Branch', 'Laga Jajja Branch', 'Jimma Sanbate Branch', 'Yai Malka branch', 'Golbo branch', 'Ertu Branch', 'Darge Branch', 'Gora Branch', 'Gada Melba Branch', 'Koye Fache Branch', 'Koticha Branch', 'Konno Branch', 'Zerihun Wadajo branch', 'Tokumma branch', 'Kara Mexi Branch', 'Shonkola Branch', 'Allache Branch', 'Adi-Haki Branch', 'Enkodo Branch', 'Adwa Branch', 'Godena selam', 'Wukro Branch', 'Ijo Old Branch', 'Sharif Kalid Eco-Branc', 'Biyo Awale Eco-Branch', 'Bordode Eco-Branch', 'Oda Nagelle Eco-Branch', 'Qanxicha Eco-Branch', 'Udassa Eco-Branch', 'Qollo Siri Eco-Branch', 'Aba Goro Eco-Branch', 'Choche Eco-Branch', 'Akko Eco-Branch', 'Gatta Eco-Branch', 'Challo Eco-Branch', 'Haso Eco-Branch', 'Gaba Jimata Eco-Branch', 'Waqenxira Xijo Eco-Bra', 'Eddo Eco-Branch', 'Hisu Eco-Branch', 'Ambentu Eco-Branch', 'Dillo Eco-Branch', 'Burqa Gogeti Branch', 'Enticho Branch', 'Edaga Hamus Branch', 'Lachi Branch', 'Mehoni Branch', 'Endaselasie branch', 'Trade Service Process']
\ No newline at end of file
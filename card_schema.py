@@ -0,0 +1,59 @@
+"""Column layout of an emboss file row and of the output.csv row built from it."""
+
+from operator import itemgetter
+
+# Columns of an emboss file line, in file order.
+CARD_FIELDS = (
+    'last4_cvv',       # last four PAN digits and the CVV
+    'pan',             # PAN in groups of four
+    'expiry',          # MM/YY
+    'name',            # name as embossed
+    'track1',
+    'track2',
+    'service_code',
+    'encrypted_pan',
+    'card_branch',     # branch code as written in the file
+)
+# Columns added from the file name and the branch list.
+FILE_FIELDS = ('product', 'branch_code', 'branch_name', 'district', 'request_date')
+OUTPUT_FIELDS = CARD_FIELDS + FILE_FIELDS
+# output.csv column index by field name.
+COLUMNS = {field: index for index, field in enumerate(OUTPUT_FIELDS)}
+
+
+def fit_rows(rows, file_name):
+    """Give every parsed row exactly the CARD_FIELDS columns, keeping empty columns in place.
+
+    Short rows are padded with empty columns. Empty columns past the schema
+    (trailing commas) are dropped; anything else past it is dropped and
+    reported once per file.
+    """
+    width = len(CARD_FIELDS)
+    overflow = 0
+    for row in rows:
+        if len(row) != width:
+            if len(row) < width:
+                row.extend([''] * (width - len(row)))
+            else:
+                if any(row[width:]):
+                    overflow += 1
+                del row[width:]
+        yield row
+    if overflow:
+        print(f"Error: {overflow} row(s) in '{file_name}' have more than {width} columns; "
+              f"the extra columns were dropped.")
+
+
+def project_rows(rows, fields):
+    """Keep only the named columns of CARD_FIELDS rows; the others are emptied so every column stays in place."""
+    width = len(CARD_FIELDS)
+    # Each position picks its own column, or the empty column appended past the end.
+    pick = itemgetter(*[index if field in fields else width for index, field in enumerate(CARD_FIELDS)])
+    for row in rows:
+        row.append('')
+        yield list(pick(row))
+
+
+def project_suffix(suffix, fields):
+    return [value if field in fields else '' for field, value in zip(FILE_FIELDS, suffix)]
+
@@ -0,0 +1,297 @@
+import csv
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from itertools import accumulate, islice
+
+
+MAGIC = b'CONSCOL3'
+FOOTER = struct.Struct('<Q8s')
+SIDECAR_SUFFIX = '.cols'
+BATCH_ROWS = 8 * 1024
+COPY_BLOCK_SIZE = 1024 * 1024
+CODE_TYPECODES = {1: 'B', 2: 'H', 4: 'I'}
+
+
+def sidecar_path(csv_path):
+    return csv_path + SIDECAR_SUFFIX
+
+
+def pad_to_word(file):
+    padding = -file.tell() % 8
+    if padding:
+        file.write(b'\0' * padding)
+
+
+def code_width(dictionary_size):
+    if dictionary_size <= 1 << 8:
+        return 1
+    if dictionary_size <= 1 << 16:
+        return 2
+    return 4
+
+
+def copy_codes(source, target, width):
+    # Codes are spooled as uint32 while the dictionary grows; narrow them once its size is known.
+    typecode = CODE_TYPECODES[width]
+    while True:
+        block = source.read(COPY_BLOCK_SIZE)
+        if not block:
+            break
+        codes = array('I')
+        codes.frombytes(block)
+        target.write(codes.tobytes() if typecode == 'I' else array(typecode, codes).tobytes())
+
+
+def write_sidecar(csv_path, columns, path=None, dictionary_columns=(), progress=None):
+    """Write the given CSV columns to a columnar sidecar file next to csv_path.
+
+    Layout: MAGIC, then one section per column, then a JSON footer describing
+    the sections and the CSV's size and mtime, then the footer length and
+    MAGIC. A plain column is an array of row end offsets (uint64) followed by
+    its UTF-8 bytes. A column listed in dictionary_columns is an array of
+    1, 2 or 4 byte codes into a list of distinct values kept in the footer.
+    progress, a JobProgress, is advanced by the rows read and checked once
+    per batch; on cancel the partial files are removed and JobCancelled is
+    raised.
+    """
+    path = path or sidecar_path(csv_path)
+    csv_stat = os.stat(csv_path)
+    directory = os.path.dirname(os.path.abspath(path))
+    encoded_columns = [column in dictionary_columns for column in columns]
+    if progress is not None:
+        progress.start("Indexing columns")
+
+    with tempfile.TemporaryDirectory(dir=directory) as work_directory:
+        data_files = [open(os.path.join(work_directory, f'{i}.data'), 'wb') for i in range(len(columns))]
+        offset_files = [open(os.path.join(work_directory, f'{i}.offsets'), 'wb') for i in range(len(columns))]
+        dictionaries = [{} for _ in columns]
+        ends = [0] * len(columns)
+        rows = 0
+
+        try:
+            for i, offset_file in enumerate(offset_files):
+                if not encoded_columns[i]:
+                    array('Q', [0]).tofile(offset_file)
+
+            with open(csv_path, 'r', newline='') as csv_file:
+                reader = csv.reader(csv_file)
+                while True:
+                    if progress is not None:
+                        progress.check()
+                    batch = list(islice(reader, BATCH_ROWS))
+                    if not batch:
+                        break
+                    for i, column in enumerate(columns):
+                        if encoded_columns[i]:
+                            dictionary = dictionaries[i]
+                            codes = array('I', [dictionary.setdefault(row[column] if column < len(row) else '',
+                                                                      len(dictionary)) for row in batch])
+                            codes.tofile(offset_files[i])
+                            continue
+                        encoded = [row[column].encode('utf-8') if column < len(row) else b'' for row in batch]
+                        offsets = array('Q', accumulate(map(len, encoded), initial=ends[i]))
+                        del offsets[0]
+                        ends[i] = offsets[-1]
+                        offsets.tofile(offset_files[i])
+                        data_files[i].write(b''.join(encoded))
+                    rows += len(batch)
+                    if progress is not None:
+                        progress.advance(rows=len(batch))
+        finally:
+            for file in data_files + offset_files:
+                file.close()
+
+        sections = []
+        temp_path = os.path.join(work_directory, 'sidecar')
+        with open(temp_path, 'wb') as sidecar:
+            sidecar.write(MAGIC)
+            for i, column in enumerate(columns):
+                pad_to_word(sidecar)
+                offsets_position = sidecar.tell()
+                if encoded_columns[i]:
+                    width = code_width(len(dictionaries[i]))
+                    with open(offset_files[i].name, 'rb') as offset_file:
+                        copy_codes(offset_file, sidecar, width)
+                    sections.append({'source': column, 'kind': 'dictionary', 'codes': offsets_position,
+                                     'width': width, 'dictionary': list(dictionaries[i])})
+                    continue
+                with open(offset_files[i].name, 'rb') as offset_file:
+                    shutil.copyfileobj(offset_file, sidecar, COPY_BLOCK_SIZE)
+                data_position = sidecar.tell()
+                with open(data_files[i].name, 'rb') as data_file:
+                    shutil.copyfileobj(data_file, sidecar, COPY_BLOCK_SIZE)
+                sections.append({'source': column, 'kind': 'plain', 'offsets': offsets_position,
+                                 'data': data_position, 'size': ends[i]})
+
+            footer = json.dumps({
+                'csv_size': csv_stat.st_size,
+                'csv_mtime_ns': csv_stat.st_mtime_ns,
+                'byteorder': sys.byteorder,
+                'rows': rows,
+                'columns': sections,
+            }).encode('utf-8')
+            sidecar.write(footer)
+            sidecar.write(FOOTER.pack(len(footer), MAGIC))
+
+        os.replace(temp_path, path)
+
+
+def open_sidecar(csv_path, path=None):
+    """Return a ColumnStore for csv_path, or None if the sidecar is missing or stale."""
+    path = path or sidecar_path(csv_path)
+    try:
+        store = ColumnStore(path)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        csv_stat = os.stat(csv_path)
+    except FileNotFoundError:
+        store.close()
+        return None
+    if store.csv_size != csv_stat.st_size or store.csv_mtime_ns != csv_stat.st_mtime_ns:
+        store.close()
+        return None
+    return store
+
+
+class ColumnStore:
+    """Read-only, memory-mapped view of a sidecar written by write_sidecar."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            footer_length, magic = FOOTER.unpack_from(self.buffer, len(self.buffer) - FOOTER.size)
+            if self.buffer[:len(MAGIC)] != MAGIC or magic != MAGIC:
+                raise ValueError(f"'{path}' is not a column sidecar.")
+            footer_end = len(self.buffer) - FOOTER.size
+            footer = json.loads(self.buffer[footer_end - footer_length:footer_end])
+            if footer['byteorder'] != sys.byteorder:
+                raise ValueError(f"'{path}' was written on a machine with a different byte order.")
+        except (struct.error, KeyError, ValueError):
+            self.buffer.close()
+            raise ValueError(f"'{path}' is not a valid column sidecar.")
+
+        self.csv_size = footer['csv_size']
+        self.csv_mtime_ns = footer['csv_mtime_ns']
+        self.rows = footer['rows']
+        self.sources = [section['source'] for section in footer['columns']]
+        self.view = memoryview(self.buffer)
+        # Per column: (offsets, data) for plain columns, (codes, dictionary) for dictionary columns.
+        self.offsets = []
+        self.data = []
+        self.data_starts = []
+        self.codes = []
+        self.dictionaries = []
+        for section in footer['columns']:
+            if section['kind'] == 'dictionary':
+                start = section['codes']
+                width = section['width']
+                self.codes.append(self.view[start:start + self.rows * width].cast(CODE_TYPECODES[width]))
+                self.dictionaries.append(section['dictionary'])
+                self.offsets.append(None)
+                self.data.append(None)
+                self.data_starts.append(None)
+            else:
+                start = section['offsets']
+                self.offsets.append(self.view[start:start + (self.rows + 1) * 8].cast('Q'))
+                self.data.append(self.view[section['data']:section['data'] + section['size']])
+                self.data_starts.append(section['data'])
+                self.codes.append(None)
+                self.dictionaries.append(None)
+
+    @property
+    def column_count(self):
+        return len(self.sources)
+
+    def is_dictionary(self, column):
+        return self.dictionaries[column] is not None
+
+    def dictionary(self, column):
+        return self.dictionaries[column]
+
+    def code_array(self, column):
+        """The raw code view of a dictionary column: one unsigned int of itemsize bytes per row."""
+        return self.codes[column]
+
+    def data_start(self, column):
+        """Position in the mapped file where a plain column's bytes begin, for searching the map directly."""
+        return self.data_starts[column]
+
+    def value(self, row, column):
+        dictionary = self.dictionaries[column]
+        if dictionary is not None:
+            return dictionary[self.codes[column][row]]
+        offsets = self.offsets[column]
+        return str(self.data[column][offsets[row]:offsets[row + 1]], 'utf-8')
+
+    def row(self, row):
+        return [self.value(row, column) for column in range(self.column_count)]
+
+    def read_rows(self, rows):
+        """Decode many rows at once, column by column; returns a list of tuples."""
+        contiguous = isinstance(rows, range) and rows.step == 1 and len(rows) > 0
+        columns = []
+        for column in range(self.column_count):
+            dictionary = self.dictionaries[column]
+            if dictionary is not None:
+                codes = self.codes[column]
+                if contiguous:
+                    codes = codes[rows.start:rows.stop]
+                else:
+                    codes = map(codes.__getitem__, rows)
+                columns.append(list(map(dictionary.__getitem__, codes)))
+                continue
+            offsets = self.offsets[column]
+            data = self.data[column]
+            if contiguous:
+                # Decode the rows' bytes in one go; when every character is one byte,
+                # byte offsets are also string offsets.
+                base = offsets[rows.start]
+                block = str(data[base:offsets[rows.stop]], 'utf-8')
+                if len(block) == offsets[rows.stop] - base:
+                    bounds = [offset - base for offset in offsets[rows.start:rows.stop + 1]]
+                    columns.append([block[start:end] for start, end in zip(bounds, bounds[1:])])
+                    continue
+            columns.append([str(data[offsets[row]:offsets[row + 1]], 'utf-8') for row in rows])
+        return list(zip(*columns))
+
+    def column(self, column):
+        dictionary = self.dictionaries[column]
+        if dictionary is not None:
+            for code in self.codes[column]:
+                yield dictionary[code]
+            return
+        offsets = self.offsets[column]
+        data = self.data[column]
+        for row in range(self.rows):
+            yield str(data[offsets[row]:offsets[row + 1]], 'utf-8')
+
+    def close(self):
+        if self.buffer is None:
+            return
+        for view in self.offsets + self.data + self.codes:
+            if view is not None:
+                view.release()
+        self.view.release()
+        self.buffer.close()
+        self.buffer = None
+        self.offsets = []
+        self.data = []
+        self.codes = []
+        self.dictionaries = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,156 @@
+"""Headless entry point for the consolidator: process and merge without the GUI.
+
+    python -m consolidator process      [-i INPUT_DIR] [-o OUTPUT_DIR] [-w WORKERS] [--full] [--parser NAME]
+                                        [--product P,..] [--branch CODE,..] [--district D,..]
+                                        [--start YYYY-MM-DD] [--end YYYY-MM-DD] [--columns FIELD,..|viewer]
+    python -m consolidator merge-date   [-i INPUT_DIR] [-o OUTPUT_DIR]
+    python -m consolidator merge-product [-i INPUT_DIR] [-o OUTPUT_DIR]
+    python -m consolidator merge-range  --start YYYY-MM-DD --end YYYY-MM-DD [-i INPUT_DIR] [-o OUTPUT_DIR]
+    python -m consolidator merge        --by date,product,branch,district,product+date
+                                        [--start YYYY-MM-DD --end YYYY-MM-DD] [-i INPUT_DIR] [-o OUTPUT_DIR]
+
+Messages from the processor go to stderr. The result and timing stats go to
+stdout, as text or as one JSON object with --format json.
+"""
+import time
+
+_started = time.perf_counter()
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+from datetime import datetime
+
+from card_schema import OUTPUT_FIELDS
+from data_processor import SELECTED_FIELDS, DataProcessor
+from ingest_filter import IngestFilter
+from parsers import DEFAULT_PARSER, PARSERS
+
+_imported = time.perf_counter()
+
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a date in YYYY-MM-DD format.")
+
+
+def parse_list(value):
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def parse_columns(value):
+    if value.strip() == 'viewer':
+        return list(SELECTED_FIELDS)
+    columns = parse_list(value)
+    unknown = [column for column in columns if column not in OUTPUT_FIELDS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown column(s) {', '.join(unknown)}; "
+                                         f"use 'viewer' or some of {', '.join(OUTPUT_FIELDS)}")
+    return columns
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='consolidator', description='Card embossing file consolidator.')
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-i', '--input-dir', help="folder with PersoFile_ files (default: OUTPUT_DIR/inputfiles)")
+    common.add_argument('-o', '--output-dir', help="folder for output.csv and merge folders (default: current folder)")
+    common.add_argument('--format', choices=['text', 'json'], default='text', help="how to print the result and stats")
+
+    commands = parser.add_subparsers(dest='command', required=True)
+    process = commands.add_parser('process', parents=[common], help="consolidate PersoFile_ files into output.csv")
+    process.add_argument('-w', '--workers', type=int, default=None,
+                         help="parser processes (default: number of cores, 1 for serial)")
+    process.add_argument('--full', action='store_true', help="ignore the manifest and rebuild output.csv")
+    process.add_argument('--parser', choices=list(PARSERS), default=DEFAULT_PARSER,
+                         help=f"backend that splits the input files into rows (default: {DEFAULT_PARSER})")
+    process.add_argument('--product', type=parse_list, help="only files of these comma-separated products")
+    process.add_argument('--branch', type=parse_list, help="only files of these comma-separated branch codes")
+    process.add_argument('--district', type=parse_list, help="only files of branches in these comma-separated districts")
+    process.add_argument('--start', type=parse_date, help="only files requested on or after this date")
+    process.add_argument('--end', type=parse_date, help="only files requested on or before this date")
+    process.add_argument('--columns', type=parse_columns,
+                         help="comma-separated output fields to fill, or 'viewer' for the viewer's columns; "
+                              "the others are left empty")
+    commands.add_parser('merge-date', parents=[common], help="merge files by request date")
+    commands.add_parser('merge-product', parents=[common], help="merge files by product")
+    merge_range = commands.add_parser('merge-range', parents=[common], help="merge files within a date range")
+    merge_range.add_argument('--start', type=parse_date, required=True)
+    merge_range.add_argument('--end', type=parse_date, required=True)
+    merge = commands.add_parser('merge', parents=[common],
+                                help="write several merge families from one pass over the input files")
+    merge.add_argument('--by', required=True,
+                       help="comma-separated partitions: date, product, branch, district, range, "
+                            "or fields joined with '+' such as product+date")
+    merge.add_argument('--start', type=parse_date, help="only merge files requested on or after this date")
+    merge.add_argument('--end', type=parse_date, help="only merge files requested on or before this date")
+    return parser
+
+
+def run(args):
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    try:
+        data_processor = DataProcessor(args.output_dir, getattr(args, 'parser', None))
+    except ValueError as e:
+        return f"Error: {e}"
+    if args.command == 'process':
+        ingest_filter = IngestFilter(args.product, args.branch, args.district, args.start, args.end, args.columns)
+        return data_processor.process(args.input_dir, workers=args.workers, incremental=not args.full,
+                                      ingest_filter=ingest_filter)
+    if args.command == 'merge-date':
+        return data_processor.merge_files_by_date(args.input_dir)
+    if args.command == 'merge-product':
+        return data_processor.merge_files_by_product(args.input_dir)
+    if args.command == 'merge':
+        partitions = [partition.strip() for partition in args.by.split(',') if partition.strip()]
+        result, _ = data_processor.merge_files(partitions, args.input_dir, args.start, args.end)
+        return result
+    return data_processor.merge_files_by_date_range(args.start, args.end, args.input_dir)
+
+
+def peak_rss_bytes():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'merge' and (args.start is None) != (args.end is None):
+        parser.error("--start and --end must be given together")
+
+    run_started = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr):
+        result = run(args)
+    finished = time.perf_counter()
+
+    success = 'successfully' in result.lower()
+    stats = {
+        'command': args.command,
+        'success': success,
+        'result': result,
+        'import_seconds': round(_imported - _started, 6),
+        'run_seconds': round(finished - run_started, 6),
+        'total_seconds': round(finished - _started, 6),
+        'peak_rss_bytes': peak_rss_bytes(),
+    }
+
+    if args.format == 'json':
+        print(json.dumps(stats))
+    else:
+        print(result)
+        for key in ('import_seconds', 'run_seconds', 'total_seconds', 'peak_rss_bytes'):
+            print(f"{key}: {stats[key]}")
+    return 0 if success else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
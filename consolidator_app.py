@@ -1,24 +1,39 @@
 import sys
-from PySide6.QtWidgets import QApplication, QMainWindow, QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox
-from PySide6.QtCore import Qt
-import csv
+from PySide6.QtWidgets import QApplication, QMainWindow, QHeaderView, QFileDialog, QMessageBox, QProgressBar, QPushButton
+from PySide6.QtCore import Qt, QTimer
 import os
 
-from branch_list import get_branches
-from data_processor import DataProcessor
+from data_processor import DataProcessor, SORT_TYPES
 from ConsolidatorApp_ui import Ui_MainWindow
-from About import AboutDialog
-from date_range_dialog import DateRangeDialog
+from table_model import CardTableModel, RowSelectionProxyModel
+from filter_engine import FilterEngine
+from search_index import SearchIndex
+from sort_index import SortIndex
+from filter_widgets import ComboBoxMultiSelect
+from job_runner import JobRunner
+from exporters import export_format, export_rows
+
+SEARCH_DELAY_MS = 250
+EXPORT_FILTERS = {
+    "CSV Files (*.csv)": ".csv",
+    "Excel Workbook (*.xlsx)": ".xlsx",
+    "JSON Lines (*.jsonl)": ".jsonl",
+    "All Files (*)": ".csv",
+}
+MAX_SORT_KEYS = 3
+MAX_CACHED_COUNTS = 64
+
 
 class ConsolidatorApp(QMainWindow, Ui_MainWindow):
-    def __init__(self) -> None:
+    def __init__(self, startup_timer=None) -> None:
         super().__init__()
+        self.startup_timer = startup_timer
+        self.started_up = False
         self.setupUi(self)
         self.setWindowTitle("Card File Consolidator App")
         self.data_processor = DataProcessor()
         self.source_directory_line_edit.setText("./inputfile")
-        self.tableWidget.setSortingEnabled(True)
-        self.tableWidget.setStyleSheet(
+        self.tableView.setStyleSheet(
             "QHeaderView::section {"
             "background-color: #00AEEF;"
             "color: white;"
@@ -29,71 +44,230 @@ class ConsolidatorApp(QMainWindow, Ui_MainWindow):
             "}")
 
         self.init_ui()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.started_up:
+            # Load the data after the first frame: the timer is posted from the first paint,
+            # so it fires once that paint pass has reached the screen.
+            self.started_up = True
+            QTimer.singleShot(0, self.finish_startup)
+
+    def finish_startup(self):
         self.load_csv()
+        if self.startup_timer is not None:
+            self.startup_timer.mark('interactive')
+            if self.startup_timer.finish():
+                QApplication.quit()
 
     def init_ui(self):
         headers = ["Last 4digit + CVV", "PAN", "Expire Date", "Customer Name", "Encrypted PAN", "Product Type", "Branch Code", "Branch Name", "District", "Request Date"]
-        self.tableWidget.setColumnCount(len(headers))
-        self.tableWidget.setHorizontalHeaderLabels(headers)
-        header = self.tableWidget.horizontalHeader()
+        self.table_model = CardTableModel(headers, self)
+        self.proxy_model = RowSelectionProxyModel(self)
+        self.proxy_model.setSourceModel(self.table_model)
+        self.tableView.setModel(self.proxy_model)
+        header = self.tableView.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
-        self.sort_order = Qt.AscendingOrder
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(True)
+        header.sectionClicked.connect(self.sort_by_column)
+        # Fixed row heights let the view skip measuring rows it never shows.
+        self.tableView.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        # (column, descending) pairs, most significant first; earlier sorts break ties.
+        self.sort_keys = []
+        self.sort_index = None
+        self.filter_engine = None
+        self.search_index = None
+        # Typing restarts the timer, so a query is only searched once the user pauses.
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.search_table)
+        self.product_filter = ComboBoxMultiSelect(self.product_combobox, "All Product", "products")
+        self.branch_filter = ComboBoxMultiSelect(self.branch_comboBox, "All Branches", "branches")
+        self.district_filter = ComboBoxMultiSelect(self.district_comboBox, "All Districts", "districts")
+        # Store columns the combos filter on: product, branch name and district.
+        self.column_filters = {5: self.product_filter, 7: self.branch_filter, 8: self.district_filter}
+        self.filter_counts = {}
 
         self.process_button.clicked.connect(self.process_data)
         self.browse_button.clicked.connect(self.browse_folder)
         self.search_button.clicked.connect(self.search_table)
         self.search_line_edit.setPlaceholderText("Search Anything...")
-        self.populate_branch_filter()
-        self.populate_product_filter()
-        self.product_combobox.currentIndexChanged.connect(self.filter_table)
-        self.branch_comboBox.currentIndexChanged.connect(self.filter_table)
-        self.district_comboBox.currentIndexChanged.connect(self.filter_table)
-        self.search_line_edit.textChanged.connect(self.search_table)
+        for multi_select in self.column_filters.values():
+            multi_select.changed.connect(self.filter_table)
+        self.search_line_edit.textChanged.connect(self.search_timer.start)
         self.reset_filter.clicked.connect(self.reset_filters)
         self.actionSave_as_CSV.triggered.connect(self.save_as_csv)
+
+        self.job_runner = JobRunner(self)
+        self.job_progress_bar = QProgressBar(self)
+        self.job_progress_bar.setMaximumWidth(200)
+        self.cancel_button = QPushButton("Cancel", self)
+        self.cancel_button.clicked.connect(self.job_runner.cancel_all)
+        self.statusBar().addPermanentWidget(self.job_progress_bar)
+        self.statusBar().addPermanentWidget(self.cancel_button)
+        self.job_progress_bar.hide()
+        self.cancel_button.hide()
+        self.job_runner.job_started.connect(self.job_started)
+        self.job_runner.job_progress.connect(self.show_job_progress)
+        self.job_runner.job_finished.connect(self.job_done)
+        self.job_runner.job_failed.connect(self.job_failed)
+        self.job_runner.queue_changed.connect(self.show_job_queue)
         self.actionExit.triggered.connect(self.exit_application)
         self.actionDeveloper.triggered.connect(self.show_about_dialog)
         self.actionBy_Date.triggered.connect(self.merge_files)
         self.actionBy_Date_Range.triggered.connect(self.show_date_range_dialog)
         self.actionBy_Product.triggered.connect(self.merge_files_by_product)
-    def load_csv(self):
+    def load_csv(self, index_columns=True):
         filename = "./output.csv"
         if os.path.exists(filename):
             try:
-                with open(filename, "r", newline="") as file:
-                    csv_reader = csv.reader(file)
-                    selected_columns = [0, 1, 2, 3, 7, 9, 10, 11, 12, 13]
-
-                    self.tableWidget.clearContents()
-                    self.tableWidget.setRowCount(0)
-
-                    for row_data in csv_reader:
-                        row = [row_data[col] for col in selected_columns]
-                        row_position = self.tableWidget.rowCount()
-                        self.tableWidget.insertRow(row_position)
-                        for col, data in enumerate(row):
-                            self.tableWidget.setItem(row_position, col, QTableWidgetItem(data))
-
-                self.tableWidget.horizontalHeader().sectionClicked.connect(self.sort_by_column)
+                store = self.data_processor.open_columns(filename, build=False)
+                if store is None:
+                    # Show rows straight from the CSV while the column sidecar is built in the background;
+                    # filtering, search and sorting need the sidecar and start working once it is loaded.
+                    self.filter_engine = None
+                    self.search_index = None
+                    self.sort_index = None
+                    self.populate_filters(None)
+                    self.table_model.set_store(self.data_processor.open_rows(filename))
+                    if index_columns:
+                        self.job_runner.submit("Indexing columns", self.data_processor.update_columns, filename,
+                                               on_finished=self.columns_indexed)
+                    return
+                self.table_model.set_store(store)
+                self.filter_engine = FilterEngine(store)
+                self.search_index = None
+                self.sort_index = SortIndex(store, SORT_TYPES)
+                self.sort_keys = []
+                self.populate_filters(store)
+                self.tableView.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+                self.update_visible_rows()
             except Exception as e:
                 print(f"Error reading CSV file: {e}")
         else:
             print("CSV file does not exist.")
 
+    def columns_indexed(self, job, result):
+        # A cancelled build leaves no sidecar; the rows already shown stay as they are.
+        if not job.cancelled:
+            self.load_csv(index_columns=False)
+
     def sort_by_column(self, logical_index):
-        self.tableWidget.sortItems(logical_index, self.sort_order)
-        self.sort_order = Qt.DescendingOrder if self.sort_order == Qt.AscendingOrder else Qt.AscendingOrder
+        if self.sort_index is None:
+            self.tableView.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+            return
+        if self.sort_keys and self.sort_keys[0][0] == logical_index:
+            self.sort_keys[0] = (logical_index, not self.sort_keys[0][1])
+        else:
+            self.sort_keys = [(logical_index, False)] + [key for key in self.sort_keys if key[0] != logical_index]
+            del self.sort_keys[MAX_SORT_KEYS:]
+        descending = self.sort_keys[0][1]
+        self.tableView.horizontalHeader().setSortIndicator(logical_index,
+                                                           Qt.DescendingOrder if descending else Qt.AscendingOrder)
+        # The first sort on a column ranks its values, which can take a moment on large files.
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            self.update_visible_rows()
+        finally:
+            QApplication.restoreOverrideCursor()
+
+    def visible_rows(self):
+        store = self.table_model.store
+        if store is None or self.filter_engine is None:
+            return None
+
+        search_query = self.search_line_edit.text()
+        search_mask = None
+        if search_query:
+            if self.search_index is None:
+                self.search_index = SearchIndex(self.filter_engine)
+            search_mask = self.search_index.search(search_query)
+
+        filters = {column: multi_select.selected() for column, multi_select in self.column_filters.items()}
+        mask = self.filter_engine.select(filters, search_mask)
+        self.update_filter_counts(filters, search_query, search_mask)
+        rows = None if mask is None else self.filter_engine.mask_rows(mask)
+
+        if self.sort_keys:
+            selected = None if mask is None else self.filter_engine.mask_bytes(mask)
+            rows = self.sort_index.order(self.sort_keys, rows, selected)
+        return rows
+
+    def update_visible_rows(self):
+        self.proxy_model.set_rows(self.visible_rows())
+
+    def job_started(self, job):
+        self.job_progress_bar.setRange(0, 0)
+        self.job_progress_bar.show()
+        self.cancel_button.show()
+        self.statusBar().showMessage(f"{job.title}...")
+
+    def show_job_progress(self, job, progress):
+        if progress['files_total']:
+            self.job_progress_bar.setRange(0, progress['files_total'])
+            self.job_progress_bar.setValue(progress['files'])
+        else:
+            self.job_progress_bar.setRange(0, 0)
+        message = f"{job.title}: {progress['stage']}"
+        if progress['files_total']:
+            message += f", {progress['files']}/{progress['files_total']} files"
+        if progress['rows']:
+            message += f", {progress['rows']:,} rows"
+        if progress['bytes']:
+            message += f", {progress['bytes'] / (1024 * 1024):,.1f} MB"
+        queued = len(self.job_runner.queue)
+        if queued:
+            message += f" ({queued} queued)"
+        self.statusBar().showMessage(message)
+
+    def show_job_queue(self, queued):
+        if queued and self.job_runner.is_busy():
+            self.statusBar().showMessage(f"{self.job_runner.current.title}... ({queued} queued)")
+
+    def job_done(self, job, result):
+        if not self.job_runner.is_busy():
+            self.job_progress_bar.hide()
+            self.cancel_button.hide()
+        if job.cancelled:
+            self.statusBar().showMessage(f"{job.title} cancelled.", 5000)
+
+    def job_failed(self, job, message):
+        self.job_done(job, None)
+        QMessageBox.critical(self, "Error", f"{job.title} failed: {message}")
+        if job.function == self.data_processor.process:
+            self.load_csv()
+
+    def closeEvent(self, event):
+        # Let a running job stop at its next check instead of being killed mid-write.
+        self.job_runner.cancel_all()
+        self.job_runner.wait()
+        super().closeEvent(event)
 
     def process_data(self):
         source_dir = self.source_directory_line_edit.text()
-        result = self.data_processor.process(source_dir)
+        self.job_runner.submit("Processing", self.data_processor.process, source_dir,
+                               on_started=self.release_table, on_finished=self.process_finished)
+
+    def release_table(self, job):
+        # process() rewrites output.csv, leaving its column sidecar stale, so release the memory maps first.
+        self.filter_engine = None
+        self.search_index = None
+        self.sort_index = None
+        self.filter_counts = {}
+        self.table_model.set_store(None)
+
+    def process_finished(self, job, result):
         if result == "No folder exists. Please select the appropriate folder.":
             QMessageBox.critical(self, "Error", result)
         elif result == "The folder is empty or does not contain embossing files.":
             QMessageBox.critical(self, "Error", result)
-        else:
-            self.load_csv()
+        elif result.startswith("Error"):
+            QMessageBox.critical(self, "Error", result)
+        elif not job.cancelled:
             self.statusBar().showMessage(result, 5000)
+        self.load_csv()
 
     def browse_folder(self):
         folder_path = QFileDialog.getExistingDirectory(self, "Select Directory")
@@ -101,100 +275,87 @@ class ConsolidatorApp(QMainWindow, Ui_MainWindow):
             self.source_directory_line_edit.setText(folder_path)
 
     def search_table(self):
-        search_query = self.search_line_edit.text().lower()
-        for row in range(self.tableWidget.rowCount()):
-            match = False
-            for column in range(self.tableWidget.columnCount()):
-                item = self.tableWidget.item(row, column)
-                if item and search_query in item.text().lower():
-                    match = True
-                    break
-            self.tableWidget.setRowHidden(row, not match)
-
-    def populate_product_filter(self):
-        self.product_combobox.clear()
-        product_options = ["All Product", "GAMTA", "HAIFB","DEPON"]
-        self.product_combobox.addItems(product_options)
-
-    def populate_branch_filter(self):
-        self.branch_comboBox.clear()
-        branch_options = ["All Branches"]
-        all_branches = get_branches()
-        all_branches.sort()
-        branch_options.extend(all_branches)
-        all_districts = ["ADAMA DISTRICT", "ASELLA DISTRICT", "BAHIRDAR AREA BR RELATIONSHIP OFFICE",
-                         "BALE DISTRICT", "CENTRAL FINFINE DISTRICT", "CHIRO DISTRICT", "DIRE DAWA DISTRICT",
-                         "EASTERN FINFINE DISTRICT", "HAWASSA DISTRICT", "HEAD OFFICE", "HOSSANA DISTRICT",
-                         "JIMMA DISTRICT", "MEKELE AREA BR RELATIONSHIP OFFICE", "NEKEMTE DISTRICT",
-                         "NORTH FINFINE DISTRICT", "SHASHEMENE DISTRICT", "SOUTH FINFINE DISTRICT",
-                         "WESTERN FINFINE DISTRICT"]
-        all_districts.sort()
-        district_options = ["All Districts"]
-        district_options.extend(all_districts)
-        self.district_comboBox.addItems(district_options)
-        self.branch_comboBox.addItems(branch_options)
+        self.search_timer.stop()
+        self.update_visible_rows()
 
-    def filter_table(self):
-        product_filter = self.product_combobox.currentText()
-        branch_filter = self.branch_comboBox.currentText()
-        district_filter = self.district_comboBox.currentText()
+    def populate_filters(self, store):
+        # The combos list the values present in the loaded data; counts follow in update_filter_counts.
+        self.filter_counts = {}
+        for column, multi_select in self.column_filters.items():
+            multi_select.set_values(sorted(store.dictionary(column)) if store is not None else [])
 
-        for row in range(self.tableWidget.rowCount()):
-            product = self.tableWidget.item(row, 5).text()
-            branch = self.tableWidget.item(row, 7).text()
-            district = self.tableWidget.item(row, 8).text()
+    def update_filter_counts(self, filters, search_query, search_mask):
+        # Each combo counts its values among the rows the other filters and the search leave,
+        # so changing one filter only recounts the others.
+        for column, multi_select in self.column_filters.items():
+            others = tuple((other, tuple(values)) for other, values in filters.items() if other != column)
+            key = (column, others, search_query)
+            counts = self.filter_counts.get(key)
+            if counts is None:
+                if len(self.filter_counts) >= MAX_CACHED_COUNTS:
+                    self.filter_counts.clear()
+                other_mask = self.filter_engine.select(dict(others), search_mask)
+                counts = self.filter_counts[key] = self.filter_engine.value_counts(column, other_mask)
+            multi_select.set_counts(counts)
 
-            product_match = (product_filter == "All Product" or product == product_filter)
-            branch_match = (branch_filter == "All Branches" or branch == branch_filter)
-            district_match = (district_filter == "All Districts" or district == district_filter)
-
-            self.tableWidget.setRowHidden(row, not (product_match and branch_match and district_match))
+    def filter_table(self):
+        self.update_visible_rows()
 
     def reset_filters(self):
-        self.product_combobox.setCurrentIndex(0)
-        self.branch_comboBox.setCurrentIndex(0)
-        self.district_comboBox.setCurrentIndex(0)
-        for row in range(self.tableWidget.rowCount()):
-            self.tableWidget.setRowHidden(row, False)
+        for multi_select in self.column_filters.values():
+            multi_select.clear()
+        self.search_line_edit.blockSignals(True)
+        self.search_line_edit.clear()
+        self.search_line_edit.blockSignals(False)
+        self.search_timer.stop()
+        self.update_visible_rows()
 
     def save_as_csv(self):
-        save_path, _ = QFileDialog.getSaveFileName(self, "Save File", "", "CSV Files (*.csv);;All Files (*)")
+        save_path, selected_filter = QFileDialog.getSaveFileName(self, "Save File", "", ";;".join(EXPORT_FILTERS))
         if save_path:
-            if not save_path.endswith(".csv"):
-                save_path += ".csv"
-            try:
-                with open(save_path, "w", newline="") as file:
-                    writer = csv.writer(file)
-                    headers = [self.tableWidget.horizontalHeaderItem(i).text() for i in range(self.tableWidget.columnCount())]
-                    writer.writerow(headers)
-
-                    for row in range(self.tableWidget.rowCount()):
-                        if not self.tableWidget.isRowHidden(row):
-                            row_data = []
-                            for column in range(self.tableWidget.columnCount()):
-                                item = self.tableWidget.item(row, column)
-                                row_data.append(item.text() if item else "")
-                            writer.writerow(row_data)
-
-                QMessageBox.information(self, "Success", f"Data successfully saved to {save_path}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save file: {e}")
+            if export_format(save_path) is None:
+                save_path += EXPORT_FILTERS.get(selected_filter, ".csv")
+            self.job_runner.submit("Exporting", export_rows, None, None, self.table_model.headers, save_path,
+                                   on_started=self.begin_export, on_finished=self.export_finished)
+
+    def begin_export(self, job):
+        # Export what the table shows when the job starts; the row arrays are replaced, never changed.
+        job.args = (self.table_model.store, self.proxy_model.source_rows()) + job.args[2:]
+
+    def export_finished(self, job, result):
+        if job.cancelled:
+            return
+        if result.startswith("Error"):
+            QMessageBox.critical(self, "Error", result)
+        else:
+            QMessageBox.information(self, "Success", result)
 
     def exit_application(self):
-        QApplication.quit()
+        # Close through closeEvent so a running job is cancelled and waited for.
+        self.close()
 
     def show_about_dialog(self):
+        # The dialogs are imported on first use to keep them off the startup path.
+        from About import AboutDialog
         about_dialog = AboutDialog(self)
         about_dialog.exec()
 
-    def merge_files(self):
-        source_dir = self.source_directory_line_edit.text()
-        result = self.data_processor.merge_files_by_date(source_dir)
+    def merge_finished(self, job, result, success_message):
+        if job.cancelled:
+            return
         if "successfully" in result.lower():
-            QMessageBox.information(self, "Success", "Emboss merged by Date Successfully")
+            QMessageBox.information(self, "Success", success_message)
         else:
             QMessageBox.critical(self, "Error", result)
+
+    def merge_files(self):
+        source_dir = self.source_directory_line_edit.text()
+        self.job_runner.submit("Merging by date", self.data_processor.merge_files_by_date, source_dir,
+                               on_finished=lambda job, result: self.merge_finished(
+                                   job, result, "Emboss merged by Date Successfully"))
+
     def show_date_range_dialog(self):
+        from date_range_dialog import DateRangeDialog
         dialog = DateRangeDialog(self)
         if dialog.exec():
             start_date = dialog.start_date_edit.date().toPython()
@@ -203,21 +364,16 @@ class ConsolidatorApp(QMainWindow, Ui_MainWindow):
 
     def merge_files_by_date_range(self, start_date, end_date):
         source_dir = self.source_directory_line_edit.text()
-        result = self.data_processor.merge_files_by_date_range( start_date, end_date,source_dir)
-        if "successfully" in result.lower():
-            QMessageBox.information(self, "Success", "Files merged by date range successfully")
-        else:
-            QMessageBox.critical(self, "Error", result)
-
-
+        self.job_runner.submit("Merging by date range", self.data_processor.merge_files_by_date_range,
+                               start_date, end_date, source_dir,
+                               on_finished=lambda job, result: self.merge_finished(
+                                   job, result, "Files merged by date range successfully"))
 
     def merge_files_by_product(self):
         source_dir = self.source_directory_line_edit.text()
-        result = self.data_processor.merge_files_by_product(source_dir)
-        if "successfully" in result.lower():
-            QMessageBox.information(self, "Success", "Files merged by product successfully")
-        else:
-            QMessageBox.critical(self, "Error", result)
+        self.job_runner.submit("Merging by product", self.data_processor.merge_files_by_product, source_dir,
+                               on_finished=lambda job, result: self.merge_finished(
+                                   job, result, "Files merged by product successfully"))
 
 
 if __name__ == "__main__":
@@ -1,14 +1,62 @@
 import csv
-import json
+import io
 import os
 import sys
+from collections import deque
 from datetime import datetime
+from functools import partial
+from itertools import count
+
+from card_schema import COLUMNS, OUTPUT_FIELDS, fit_rows, project_rows, project_suffix
+from column_store import open_sidecar, write_sidecar
+from dataset import Dataset
+from file_catalog import get_catalog, parse_file_name
+from job_progress import JobCancelled, JobProgress
+from manifest import FileManifest
+from merge_engine import MergeEngine
+from parsers import DEFAULT_PARSER, get_parser
+from reference_data import get_reference_data
+from row_store import CsvRowStore
+
+MANIFEST_SUFFIX = '.manifest.json'
+REFERENCE_CACHE_NAME = '.reference_cache.json'
+# Columns of output.csv shown in the viewer and stored in the column sidecar.
+SELECTED_FIELDS = ('last4_cvv', 'pan', 'expiry', 'name', 'encrypted_pan', 'product', 'branch_code', 'branch_name',
+                   'district', 'request_date')
+SELECTED_COLUMNS = [COLUMNS[field] for field in SELECTED_FIELDS]
+# Low-cardinality columns stored as dictionary codes.
+DICTIONARY_COLUMNS = [COLUMNS[field] for field in ('expiry', 'product', 'branch_code', 'branch_name', 'district',
+                                                   'request_date')]
+# Typed sort keys by output.csv column (see sort_index.SORT_KEYS); other columns sort as text.
+SORT_TYPES = {COLUMNS['expiry']: 'expiry', COLUMNS['branch_code']: 'integer', COLUMNS['request_date']: 'date'}
+COPY_BLOCK_SIZE = 1024 * 1024
+
+_worker_processor = None
+_worker_branch_data = None
+
+
+def _init_worker(base_directory, branch_data, parser):
+    global _worker_processor, _worker_branch_data
+    # Workers started by spawn get the real stdout, not the caller's; their messages go to stderr
+    # so stdout only carries results (the CLI's --format json object).
+    sys.stdout = sys.stderr
+    _worker_processor = DataProcessor(base_directory, parser)
+    _worker_branch_data = branch_data
+
+
+def _format_file(file_name, input_directory, columns):
+    buffer = io.StringIO(newline='')
+    _worker_processor.write_file_rows(file_name, input_directory, _worker_branch_data, buffer, columns)
+    return buffer.getvalue()
 
 
 class DataProcessor:
-    def __init__(self, base_directory=None):
+    def __init__(self, base_directory=None, parser=None):
+        # parser names a parsers.PARSERS backend; an unknown or unavailable one raises ValueError.
         self.base_directory = base_directory or os.getcwd()
         self.base_path = getattr(sys, '_MEIPASS', os.path.abspath(os.path.dirname(__file__)))
+        self.parser_name = parser or DEFAULT_PARSER
+        self.parser = get_parser(self.parser_name)
 
     def get_input_directory(self, specified_directory=None):
         if specified_directory:
@@ -16,80 +64,184 @@ class DataProcessor:
         else:
             return os.path.join(self.base_directory, "inputfiles")
 
-    def load_json_data(self, filename):
-        try:
-            with open(os.path.join(self.base_path, filename)) as json_file:
-                return json.load(json_file)
-        except FileNotFoundError:
-            print(f"Error: '{filename}' file not found.")
-            return {}
+    @property
+    def reference_data(self):
+        cache_path = os.path.join(self.base_directory, REFERENCE_CACHE_NAME)
+        return get_reference_data(self.base_path, cache_path)
 
     def load_branch_data(self):
-        branches = self.load_json_data('branches.json')
-        districts = self.load_json_data('districts.json')
+        return self.reference_data.branch_data()
 
-        branch_data = {}
-
-        for branch_code, branch_name in branches.items():
-            district = self.find_district(branch_code, districts)
-            branch_data[branch_code] = {'name': branch_name, 'district': district}
+    def parse_file_name(self, file_name):
+        metadata = parse_file_name(file_name)
+        if metadata is None:
+            print(f"Error: Filename '{file_name}' does not have the expected format.")
+            return None
+
+        _, product, branch_code, date_part, _ = metadata
+        return {
+            'product': product,
+            'branch_code': branch_code,
+            'date': f"20{date_part[:2]}/{date_part[2:4]}/{date_part[4:]}",
+        }
+
+    def file_suffix(self, file_info, branch_data):
+        # The FILE_FIELDS columns, the same for every row of the file.
+        branch_code = file_info['branch_code']
+        branch_info = branch_data.get(branch_code, {'name': 'Unknown Branch', 'district': 'Unknown District'})
+        return [file_info['product'], branch_code, branch_info['name'], branch_info['district'], file_info['date']]
 
-        return branch_data
+    def read_file(self, file_name, input_directory, branch_data, columns=None):
+        """The file's suffix columns and an iterator of its CARD_FIELDS rows, or None for an unexpected name.
 
-    def find_district(self, branch_code, districts):
-        for district, branch_codes in districts.items():
-            if branch_code in branch_codes:
-                return district
-        return 'Unknown District'
+        The suffix is built once per file and only joined to the rows where
+        whole output rows are needed. columns, a set of OUTPUT_FIELDS names,
+        empties every other column.
+        """
+        file_info = self.parse_file_name(file_name)
+        if file_info is None:
+            return None
 
-    def parse_file(self, file_name, input_directory, branch_data):
         file_path = os.path.join(input_directory, file_name)
+        suffix = self.file_suffix(file_info, branch_data)
+        rows = fit_rows(self.parser.parse(file_path), file_name)
+        if columns:
+            return project_suffix(suffix, columns), project_rows(rows, columns)
+        return suffix, rows
+
+    def iter_file_rows(self, file_name, input_directory, branch_data, columns=None):
+        parsed = self.read_file(file_name, input_directory, branch_data, columns)
+        if parsed is None:
+            return
+
+        suffix, rows = parsed
+        for row in rows:
+            row.extend(suffix)
+            yield row
+
+    def write_file_rows(self, file_name, input_directory, branch_data, file, columns=None):
+        """Write the file's output rows as CSV to file and return how many were written."""
+        parsed = self.read_file(file_name, input_directory, branch_data, columns)
+        if parsed is None:
+            return 0
+
+        suffix, rows = parsed
+        # The writer only formats the card columns, ending each line with a bare \n; parsed
+        # columns never hold a line break, so one replace then puts the suffix, formatted
+        # once, at the end of every line. csv quotes each field on its own, so the lines
+        # are the same as for the whole rows.
+        line_end = io.StringIO(newline='')
+        csv.writer(line_end).writerow(suffix)
+        buffer = io.StringIO(newline='')
+        # zip stops before drawing from the counter once the rows run out,
+        # so the counter's next value is the number of rows written.
+        counter = count()
+        csv.writer(buffer, lineterminator='\n').writerows(row for row, _ in zip(rows, counter))
+        file.write(buffer.getvalue().replace('\n', ',' + line_end.getvalue()))
+        return next(counter)
+
+    def iter_chunks_parallel(self, input_file_names, input_directory, branch_data, workers, columns=None):
+        # Files are submitted in order and results collected in the same order, with at
+        # most 2 * workers files in flight, so output matches the serial path exactly.
+        # Imported here because multiprocessing noticeably slows down cold start.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.base_directory, branch_data, self.parser_name)) as executor:
+            pending = deque()
+            try:
+                for input_file_name in input_file_names:
+                    pending.append(executor.submit(_format_file, input_file_name, input_directory, columns))
+                    if len(pending) >= workers * 2:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                # When the consumer stops early, don't wait for files it will never read.
+                for future in pending:
+                    future.cancel()
+
+    def dataset(self, specified_directory=None):
+        """A lazy Dataset over the records the input folder would give output.csv; see dataset.Dataset."""
+        return Dataset(self, self.get_input_directory(specified_directory), SORT_TYPES)
+
+    def get_catalog(self, input_directory):
+        return get_catalog(input_directory)
 
-        file_parts = file_name.split('_')
-        if len(file_parts) < 5:
+    def get_input_file_names(self, input_directory):
+        catalog = self.get_catalog(input_directory)
+        for file_name in catalog.invalid:
             print(f"Error: Filename '{file_name}' does not have the expected format.")
-            return []
-
-        product_name = file_parts[2]
-        branch_code = file_parts[3]
-        date_part = file_parts[4].split('.')[0]
-        date = f"20{date_part[:2]}/{date_part[2:4]}/{date_part[4:]}"
+        return catalog.names()
+
+    def iter_file_chunks(self, input_file_names, input_directory, branch_data, workers, columns=None):
+        workers = min(workers or os.cpu_count() or 1, len(input_file_names))
+        if workers > 1:
+            return self.iter_chunks_parallel(input_file_names, input_directory, branch_data, workers, columns)
+        return (partial(self.write_file_rows, name, input_directory, branch_data, columns=columns)
+                for name in input_file_names)
+
+    def copy_segment(self, source, target, offset, length):
+        source.seek(offset)
+        while length > 0:
+            block = source.read(min(length, COPY_BLOCK_SIZE))
+            if not block:
+                break
+            target.write(block)
+            length -= len(block)
+
+    def write_output(self, csvfile, input_file_names, parse_file_names, input_directory, branch_data,
+                     workers, previous_files=None, previous_output=None, progress=None, columns=None):
+        # Files in parse_file_names are parsed; every other file is copied unchanged from
+        # its recorded segment in previous_output. Returns each file's (offset, length).
+        progress = progress or JobProgress()
+        chunks = self.iter_file_chunks(parse_file_names, input_directory, branch_data, workers, columns)
+        parse_file_names = set(parse_file_names)
+        segments = {}
+        offset = csvfile.tell()
 
         try:
-            with open(file_path, 'r') as file:
-                data = file.read()
-        except FileNotFoundError:
-            print(f"Error: The file '{file_path}' was not found.")
-            return []
-
-        cleaned_data = data.replace('~', '').replace('^', '  ')
-        rows = cleaned_data.split('\n')
-        cleaned_rows = [row.split(',') for row in rows if row.strip()]
-
-        branch_info = branch_data.get(branch_code, {'name': 'Unknown Branch', 'district': 'Unknown District'})
-        branch_name = branch_info['name']
-        branch_district = branch_info['district']
-        processed_rows = []
-
-        for row in cleaned_rows:
-            row = [column.strip() for column in row if column.strip()]
-            row.extend([product_name, branch_code, branch_name, branch_district, date])
-            processed_rows.append(row)
-
-        return processed_rows
-
-    def get_input_file_names(self, input_directory):
-        return [file for file in os.listdir(input_directory) if file.startswith('PersoFile_')]
-
-    def save_to_csv(self, output_file_name, all_rows):
+            for input_file_name in input_file_names:
+                progress.check()
+                rows = 0
+                if input_file_name in parse_file_names:
+                    # Formatted text from a worker, or a function that writes the file here.
+                    chunk = next(chunks)
+                    if isinstance(chunk, str):
+                        csvfile.write(chunk)
+                        rows = chunk.count('\n')
+                    else:
+                        rows = chunk(csvfile)
+                else:
+                    entry = previous_files[input_file_name]
+                    csvfile.flush()
+                    self.copy_segment(previous_output, csvfile.buffer, entry['offset'], entry['length'])
+                end = csvfile.tell()
+                segments[input_file_name] = (offset, end - offset)
+                progress.advance(files=1, rows=rows, bytes=end - offset)
+                offset = end
+        finally:
+            chunks.close()
+
+        return segments
+
+    def output_matches_manifest(self, manifest, output_file_name):
         try:
-            with open(output_file_name, 'w', newline='') as csvfile:
-                csv_writer = csv.writer(csvfile)
-                csv_writer.writerows(all_rows)
-        except IOError as e:
-            print(f"Error: Unable to save to '{output_file_name}'. {e}")
-
-    def process(self, specified_directory=None):
+            stat = os.stat(output_file_name)
+        except FileNotFoundError:
+            return False
+        recorded = manifest.data.get('output') or {}
+        return recorded.get('size') == stat.st_size and recorded.get('mtime_ns') == stat.st_mtime_ns
+
+    def process(self, specified_directory=None, workers=None, incremental=True, progress=None, ingest_filter=None):
+        """Consolidate the input files into output.csv.
+
+        ingest_filter, an IngestFilter, limits the run to the files whose
+        names can match it, without opening the others, and to its columns.
+        The column sidecar is not rebuilt here: it is only needed by the
+        viewer, which builds it with update_columns when it opens the file.
+        """
+        progress = progress or JobProgress()
         input_directory = self.get_input_directory(specified_directory)
         if not os.path.exists(input_directory):
             return "No folder exists. Please select the appropriate folder."
@@ -98,153 +250,165 @@ class DataProcessor:
         if not input_file_names:
             return "The folder is empty or does not contain embossing files."
 
-        branch_data = self.load_branch_data()
-        all_rows = []
-
-        for input_file_name in input_file_names:
-            rows = self.parse_file(input_file_name, input_directory, branch_data)
-            all_rows.extend(rows)
+        reference_data = self.reference_data
+        branch_data = reference_data.branch_data()
+        filter_description = ingest_filter.describe() if ingest_filter else None
+        columns = ingest_filter.columns if ingest_filter else None
+        skipped = 0
+        if filter_description is not None:
+            catalog = self.get_catalog(input_directory)
+            matching = ingest_filter.select(catalog, branch_data)
+            skipped = len(input_file_names) - len(matching)
+            input_file_names = catalog.names(matching)
+            if not input_file_names:
+                return "No embossing files match the filters."
 
         output_file_name = os.path.join(self.base_directory, 'output.csv')
-        self.save_to_csv(output_file_name, all_rows)
-
-        print(f"All data has been processed and saved to '{output_file_name}'.")
+        manifest = FileManifest(output_file_name + MANIFEST_SUFFIX)
+        reference = reference_data.digest
+
+        if not (incremental and manifest.matches_input(input_directory)
+                and manifest.data.get('reference') == reference
+                and manifest.data.get('schema') == list(OUTPUT_FIELDS)
+                and manifest.data.get('filter') == filter_description
+                and self.output_matches_manifest(manifest, output_file_name)):
+            manifest.reset(input_directory)
+            manifest.data['reference'] = reference
+            manifest.data['schema'] = list(OUTPUT_FIELDS)
+            manifest.data['filter'] = filter_description
+
+        previous_files = manifest.files
+        progress.start("Checking files", len(input_file_names))
+        fingerprints = {}
+        try:
+            for name in input_file_names:
+                progress.check()
+                fingerprints[name] = manifest.fingerprint(input_directory, name)
+                progress.advance(files=1, bytes=fingerprints[name]['size'])
+        except JobCancelled:
+            return "Process cancelled."
+        changed = [name for name in input_file_names
+                   if name not in previous_files or previous_files[name]['sha256'] != fingerprints[name]['sha256']]
+        removed = [name for name in previous_files if name not in fingerprints]
+
+        temp_file_name = output_file_name + '.tmp'
+        try:
+            if not changed and not removed:
+                segments = {name: (entry['offset'], entry['length']) for name, entry in previous_files.items()}
+            elif previous_files and not removed and not set(changed) & set(previous_files) \
+                    and changed[0] > max(previous_files):
+                # Only new files that sort after everything already written: append them.
+                progress.start("Parsing files", len(changed))
+                with open(output_file_name, 'a', newline='') as csvfile:
+                    append_offset = csvfile.tell()
+                    try:
+                        segments = self.write_output(csvfile, changed, changed, input_directory, branch_data,
+                                                     workers, progress=progress, columns=columns)
+                    except JobCancelled:
+                        # Drop the partly appended files; the manifest still describes what is left.
+                        csvfile.flush()
+                        csvfile.truncate(append_offset)
+                        csvfile.close()
+                        output_stat = os.stat(output_file_name)
+                        manifest.data['output'] = {'size': output_stat.st_size, 'mtime_ns': output_stat.st_mtime_ns}
+                        manifest.save()
+                        return "Process cancelled."
+                segments.update((name, (entry['offset'], entry['length'])) for name, entry in previous_files.items())
+            else:
+                progress.start("Parsing files", len(input_file_names))
+                previous_output = open(output_file_name, 'rb') if previous_files else None
+                try:
+                    with open(temp_file_name, 'w', newline='') as csvfile:
+                        segments = self.write_output(csvfile, input_file_names, changed, input_directory,
+                                                     branch_data, workers, previous_files, previous_output,
+                                                     progress, columns)
+                except JobCancelled:
+                    os.remove(temp_file_name)
+                    return "Process cancelled."
+                finally:
+                    if previous_output:
+                        previous_output.close()
+                os.replace(temp_file_name, output_file_name)
+        except IOError as e:
+            if os.path.exists(temp_file_name):
+                os.remove(temp_file_name)
+            return f"Error: Unable to save to '{output_file_name}'. {e}"
+
+        for name, fingerprint in fingerprints.items():
+            fingerprint['offset'], fingerprint['length'] = segments[name]
+        output_stat = os.stat(output_file_name)
+        manifest.data['files'] = fingerprints
+        manifest.data['output'] = {'size': output_stat.st_size, 'mtime_ns': output_stat.st_mtime_ns}
+        manifest.save()
+
+        print(f"All data has been processed and saved to '{output_file_name}'. "
+              f"{len(changed)} file(s) parsed, {len(removed)} removed, {skipped} skipped by the filters.")
         return "Process completed successfully"
 
-    def merge_files_by_date(self, specified_directory=None):
+    def update_columns(self, output_file_name, progress=None):
+        store = open_sidecar(output_file_name)
+        if store is not None:
+            store.close()
+            return
+        try:
+            write_sidecar(output_file_name, SELECTED_COLUMNS, dictionary_columns=DICTIONARY_COLUMNS,
+                          progress=progress)
+        except OSError as e:
+            print(f"Error: Unable to write the column sidecar for '{output_file_name}'. {e}")
+
+    def open_columns(self, output_file_name=None, build=True):
+        # With build=False a missing or stale sidecar gives None instead of being rebuilt here.
+        output_file_name = output_file_name or os.path.join(self.base_directory, 'output.csv')
+        if build:
+            self.update_columns(output_file_name)
+        return open_sidecar(output_file_name)
+
+    def open_rows(self, output_file_name=None):
+        output_file_name = output_file_name or os.path.join(self.base_directory, 'output.csv')
+        return CsvRowStore(output_file_name, SELECTED_COLUMNS)
+
+    def merge_files(self, partitions, specified_directory=None, start_date=None, end_date=None, progress=None):
         input_directory = self.get_input_directory(specified_directory)
         if not os.path.exists(input_directory):
-            return "No folder exists. Please select the appropriate folder."
+            return "No folder exists. Please select the appropriate folder.", {}
 
-        all_files = os.listdir(input_directory)
-        if not all_files:
-            return "The folder is empty or does not contain any files."
-
-        merged_data = {}
-
-        for file_name in all_files:
-            date_str = file_name.split('_')[4].split('.')[0]
-            try:
-                corrected_date_str = '20' + date_str[:6]
-                date = datetime.strptime(corrected_date_str, '%Y%m%d').date()
-            except ValueError:
-                continue
-
-            file_path = os.path.join(input_directory, file_name)
-            try:
-                with open(file_path, 'r') as file:
-                    file_data = file.read().strip()
-            except FileNotFoundError:
-                continue
-
-            if date not in merged_data:
-                merged_data[date] = []
-            merged_data[date].append(file_data)
-
-        merged_output_directory = os.path.join(self.base_directory, "Merged_by_Date")
-        os.makedirs(merged_output_directory, exist_ok=True)
-
-        timestamp = datetime.now().strftime('%H%M%S')
-        for date, data_list in merged_data.items():
-            output_file_name = f"PersoFile_00006_BYDATE_10000_{date.strftime('%y%m%d')}.{timestamp}"
-            output_file_path = os.path.join(merged_output_directory, output_file_name)
-
-            try:
-                with open(output_file_path, 'w') as output_file:
-                    for data in data_list:
-                        output_file.write(data + '\n')
-            except IOError as e:
-                return f"Error: Unable to write to '{output_file_path}'. {e}"
+        catalog = self.get_catalog(input_directory)
+        if not catalog:
+            return "The folder is empty or does not contain any files.", {}
 
+        engine = MergeEngine(input_directory, self.base_directory, self.reference_data)
+        try:
+            families, error = engine.run(catalog.entries, partitions, datetime.now(), start_date, end_date,
+                                         progress)
+        except ValueError as e:
+            return f"Error: {e}", {}
+        except JobCancelled:
+            return "Merge cancelled.", {}
+        if error:
+            return error, families
+
+        return f"All files have been merged by {', '.join(partitions)} successfully.", families
+
+    def merge_files_by_date(self, specified_directory=None, progress=None):
+        result, _ = self.merge_files(['date'], specified_directory, progress=progress)
+        if "successfully" not in result:
+            return result
         return "All files have been merged and saved successfully."
 
-    def merge_files_by_product(self, specified_directory=None):
+    def merge_files_by_product(self, specified_directory=None, progress=None):
         input_directory = self.get_input_directory(specified_directory)
         if not os.path.exists(input_directory):
             return "No folder exists. Please make sure the 'inputfiles' folder exists."
 
-        merged_data = {}
-        all_files = os.listdir(input_directory)
-
-        for file_name in all_files:
-            parts = file_name.split('_')
-            if len(parts) < 5:
-                continue  # Skip files that don't match the expected format
-            
-            product_name = parts[2]
-            file_path = os.path.join(input_directory, file_name)
-
-            try:
-                with open(file_path, 'r') as file:
-                    file_data = file.read().strip()
-            except FileNotFoundError:
-                continue  # Skip files that can't be found
-
-            if product_name not in merged_data:
-                merged_data[product_name] = []
-            merged_data[product_name].append(file_data)
-
-        output_directory = os.path.join(self.base_directory, "Merged_By_Product")
-        os.makedirs(output_directory, exist_ok=True)
-        datestamp = datetime.now().strftime('%y%m%d')
-        timestamp = datetime.now().strftime('%H%M%S')
-        for product, data_list in merged_data.items():
-            output_file_name = f"PersoFile_00006_{product}_10000_{datestamp}.{timestamp}"
-            output_file_path = os.path.join(output_directory, output_file_name)
-
-            try:
-                with open(output_file_path, 'w') as output_file:
-                    for data in data_list:
-                        output_file.write(data + '\n')  # Ensure each data block is separated by a newline
-            except IOError as e:
-                return f"Error: Unable to write to '{output_file_path}'. {e}"
-
+        result, _ = self.merge_files(['product'], specified_directory, progress=progress)
+        if "successfully" not in result:
+            return result
         return "All files have been merged by product successfully."
 
-    def merge_files_by_date_range(self, start_date, end_date, specified_directory=None):
-        input_directory = self.get_input_directory(specified_directory)
-        if not os.path.exists(input_directory):
-            return "No folder exists. Please select the appropriate folder."
-
-        all_files = os.listdir(input_directory)
-        if not all_files:
-            return "The folder is empty or does not contain any files."
-
-        merged_data = []
-
-        for file_name in all_files:
-            date_str = file_name.split('_')[4].split('.')[0]
-            try:
-                corrected_date_str = '20' + date_str[:6]
-                date = datetime.strptime(corrected_date_str, '%Y%m%d').date()
-            except ValueError:
-                continue
-
-            if start_date <= date <= end_date:
-                file_path = os.path.join(input_directory, file_name)
-                try:
-                    with open(file_path, 'r') as file:
-                        file_data = file.read().strip()
-                        merged_data.append(file_data)
-                except FileNotFoundError:
-                    continue
-
-        output_directory = os.path.join(self.base_directory, "Merged_by_date_range")
-        os.makedirs(output_directory, exist_ok=True)
-
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-        output_file_name = f"PersoFile_00006_{start_date.strftime('%Y%m%d')}-{end_date.strftime('%Y%m%d')}.{timestamp}"
-        output_file_path = os.path.join(output_directory, output_file_name)
-
-        try:
-            with open(output_file_path, 'w') as output_file:
-                for data in merged_data:
-                    output_file.write(data + '\n')
-        except IOError as e:
-            return f"Error: Unable to write to '{output_file_path}'. {e}"
+    def merge_files_by_date_range(self, start_date, end_date, specified_directory=None, progress=None):
+        result, families = self.merge_files(['range'], specified_directory, start_date, end_date, progress)
+        if "successfully" not in result:
+            return result
 
+        output_file_path = families['range'].output_path(())
         return f"All files within the date range have been successfully merged and saved to '{output_file_path}'."
-
-
-
-
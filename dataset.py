@@ -0,0 +1,246 @@
+from collections import Counter
+from datetime import date
+from heapq import nlargest, nsmallest
+from itertools import islice
+from operator import itemgetter
+
+from card_schema import FILE_FIELDS, OUTPUT_FIELDS
+from exporters import EXPORT_BATCH_ROWS, export_batches
+from sort_index import SORT_KEYS
+
+# Field added by group_by(...).count().
+COUNT_FIELD = 'count'
+
+
+class Between:
+    """Inclusive range condition for Dataset.filter, either end open when None.
+
+    Dates are compared as output.csv writes them, 'YYYY/MM/DD', so
+    request_date=Between(date(2024, 6, 1), date(2024, 6, 30)) works.
+    """
+
+    def __init__(self, low=None, high=None):
+        self.low = low.strftime('%Y/%m/%d') if isinstance(low, date) else low
+        self.high = high.strftime('%Y/%m/%d') if isinstance(high, date) else high
+
+    def __call__(self, value):
+        return (self.low is None or value >= self.low) and (self.high is None or value <= self.high)
+
+
+def condition_test(condition):
+    # A value matches itself, a list/tuple/set any of its items, a Between or callable whatever it accepts.
+    if isinstance(condition, Between) or callable(condition):
+        return condition
+    if isinstance(condition, (list, tuple, set, frozenset)):
+        return frozenset(condition).__contains__
+    if isinstance(condition, date):
+        condition = condition.strftime('%Y/%m/%d')
+    return lambda value: value == condition
+
+
+class Dataset:
+    """A lazy query over the card records of an input folder, as process() would write them to output.csv.
+
+    filter, select, sort, limit and group_by(...).count() each return a new
+    Dataset and read nothing. Iterating, count(), to_list() and write()
+    run the query: file-level conditions that come before any limit or
+    group_by are checked once per distinct product, branch and date in the
+    catalog's indexes, so files that cannot match are never opened; the
+    rest streams file by file. Only sort holds rows
+    in memory, and sort followed by limit keeps just the limit.
+    """
+
+    def __init__(self, processor, input_directory, column_types=None, steps=()):
+        self.processor = processor
+        self.input_directory = input_directory
+        # Sort key name by output.csv column, as in SortIndex.
+        self.column_types = column_types or {}
+        self.steps = steps
+        self.fields = OUTPUT_FIELDS
+        for step in steps:
+            if step[0] == 'select':
+                self.fields = step[1]
+            elif step[0] == 'count':
+                self.fields = step[1] + (COUNT_FIELD,)
+
+    def then(self, *step):
+        return Dataset(self.processor, self.input_directory, self.column_types, self.steps + (step,))
+
+    def check_fields(self, fields, required=False):
+        if required and not fields:
+            raise ValueError("Name at least one field.")
+        unknown = [field for field in fields if field not in self.fields]
+        if unknown:
+            raise ValueError(f"Unknown field(s) {', '.join(unknown)}. Use {', '.join(self.fields)}.")
+        return tuple(fields)
+
+    def filter(self, predicate=None, **conditions):
+        """Keep records matching every condition, keyed by field; predicate, if given, gets a dict per record."""
+        self.check_fields(conditions)
+        tests = {field: condition_test(condition) for field, condition in conditions.items()}
+        return self.then('filter', predicate, tests)
+
+    def select(self, *fields):
+        return self.then('select', self.check_fields(fields, True))
+
+    def sort(self, *fields, descending=False):
+        # Stable, with the typed keys of the viewer's sort; count sorts as an integer.
+        return self.then('sort', self.check_fields(fields, True), descending)
+
+    def limit(self, count):
+        return self.then('limit', count)
+
+    def group_by(self, *fields):
+        return Grouping(self, self.check_fields(fields, True))
+
+    def plan(self):
+        """Split the steps into file-level tests for the catalog, the columns to read and the steps left to stream."""
+        file_tests = []
+        steps = []
+        pushable = True
+        for step in self.steps:
+            if step[0] in ('limit', 'count'):
+                pushable = False
+            if step[0] == 'filter' and pushable:
+                _, predicate, tests = step
+                file_tests.extend((field, test) for field, test in tests.items() if field in FILE_FIELDS)
+                tests = {field: test for field, test in tests.items() if field not in FILE_FIELDS}
+                if predicate is not None or tests:
+                    steps.append(('filter', predicate, tests))
+                continue
+            steps.append(step)
+
+        # Fields used before the first select or count are all that need reading.
+        used = set()
+        for step in steps:
+            if step[0] == 'filter':
+                if step[1] is not None:
+                    used = None
+                    break
+                used.update(step[2])
+            elif step[0] == 'sort':
+                used.update(step[1])
+            elif step[0] in ('select', 'count'):
+                used.update(step[1])
+                break
+        else:
+            used = None
+        return file_tests, used, steps
+
+    def read(self, file_tests, columns):
+        processor = self.processor
+        branch_data = processor.load_branch_data()
+        catalog = processor.get_catalog(self.input_directory)
+
+        def branch_values(branch_code):
+            # The branch name and district written for the code, as in DataProcessor.file_suffix.
+            branch_info = branch_data.get(branch_code, {'name': 'Unknown Branch', 'district': 'Unknown District'})
+            return {'branch_code': branch_code, 'branch_name': branch_info['name'], 'district': branch_info['district']}
+
+        entries = catalog.select(
+            index_test(file_tests, ('product',), lambda product: {'product': product}),
+            index_test(file_tests, ('branch_code', 'branch_name', 'district'), branch_values),
+            index_test(file_tests, ('request_date',), lambda day: {'request_date': day.strftime('%Y/%m/%d')}))
+        for entry in entries:
+            yield from processor.iter_file_rows(entry.name, self.input_directory, branch_data, columns)
+
+    def sort_key(self, fields, schema):
+        keys = []
+        for field in fields:
+            if field == COUNT_FIELD:
+                keys.append((schema.index(field), lambda value: value))
+            else:
+                sort_type = self.column_types.get(OUTPUT_FIELDS.index(field), 'text')
+                keys.append((schema.index(field), SORT_KEYS[sort_type]))
+        return lambda row: tuple(key(row[index]) for index, key in keys)
+
+    def __iter__(self):
+        file_tests, columns, steps = self.plan()
+        rows = self.read(file_tests, frozenset(columns) if columns else None)
+        schema = OUTPUT_FIELDS
+        position = 0
+        while position < len(steps):
+            step = steps[position]
+            kind = step[0]
+            if kind == 'filter':
+                rows = filter_rows(rows, schema, step[1], step[2])
+            elif kind == 'select':
+                pick = itemgetter(*[schema.index(field) for field in step[1]])
+                if len(step[1]) == 1:
+                    rows = ([value] for value in map(pick, rows))
+                else:
+                    rows = map(list, map(pick, rows))
+                schema = step[1]
+            elif kind == 'sort':
+                key = self.sort_key(step[1], schema)
+                following = steps[position + 1] if position + 1 < len(steps) else None
+                if following is not None and following[0] == 'limit':
+                    # nsmallest/nlargest give what sorted(...)[:n] would, holding only n rows.
+                    rows = iter((nlargest if step[2] else nsmallest)(following[1], rows, key=key))
+                    position += 1
+                else:
+                    rows = iter(sorted(rows, key=key, reverse=step[2]))
+            elif kind == 'limit':
+                rows = islice(rows, step[1])
+            elif kind == 'count':
+                rows = count_rows(rows, schema, step[1])
+                schema = step[1] + (COUNT_FIELD,)
+            position += 1
+        return rows
+
+    def count(self):
+        return sum(1 for _ in self)
+
+    def to_list(self):
+        return list(self)
+
+    def write(self, path, progress=None):
+        """Write the records to path as CSV, JSONL or XLSX, by extension, with the fields as header; returns a message."""
+        rows = iter(self)
+        if COUNT_FIELD in self.fields:
+            rows = ([str(value) for value in row] for row in rows)
+        batches = iter(lambda: list(islice(rows, EXPORT_BATCH_ROWS)), [])
+        return export_batches(batches, list(self.fields), path, progress)
+
+    def __repr__(self):
+        return f"Dataset({self.input_directory!r}, {' -> '.join(step[0] for step in self.steps) or 'all'})"
+
+
+class Grouping:
+    """The result of Dataset.group_by; count() gives a Dataset of the group fields and a count per group."""
+
+    def __init__(self, dataset, fields):
+        self.dataset = dataset
+        self.fields = fields
+
+    def count(self):
+        return self.dataset.then('count', self.fields)
+
+
+def index_test(file_tests, fields, values):
+    # A test of a catalog index key, or None when no file test is on fields; values gives the fields' values for a key.
+    tests = [(field, test) for field, test in file_tests if field in fields]
+    if not tests:
+        return None
+
+    def test_key(key):
+        key_values = values(key)
+        return all(test(key_values[field]) for field, test in tests)
+    return test_key
+
+
+def filter_rows(rows, schema, predicate, tests):
+    tests = [(schema.index(field), test) for field, test in tests.items()]
+    for row in rows:
+        if all(test(row[index]) for index, test in tests) and \
+                (predicate is None or predicate(dict(zip(schema, row)))):
+            yield row
+
+
+def count_rows(rows, schema, fields):
+    # Groups come out in the order they are first seen.
+    pick = itemgetter(*[schema.index(field) for field in fields])
+    counts = Counter(map(pick, rows))
+    for values, count in counts.items():
+        # itemgetter gives a bare value for a single field.
+        yield [values, count] if len(fields) == 1 else [*values, count]
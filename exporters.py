@@ -0,0 +1,176 @@
+import csv
+import json
+import os
+from json.encoder import encode_basestring
+
+from job_progress import JobCancelled, JobProgress
+
+
+EXPORT_BATCH_ROWS = 8 * 1024
+# Excel's row limit per sheet, header included.
+XLSX_MAX_ROWS = 1048576
+
+
+class CsvSink:
+    def __init__(self, path):
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.width = 0
+
+    def write_header(self, headers):
+        self.width = len(headers)
+        self.writer.writerow(headers)
+
+    def write_rows(self, rows):
+        # csv.writer only quotes fields holding a comma, a quote or a line break, so when
+        # the joined batch has none beyond its own separators it is exactly what it would write.
+        text = ''.join([','.join(row) + '\r\n' for row in rows])
+        if self.width > 1 and text.count(',') == len(rows) * (self.width - 1) and '"' not in text \
+                and text.count('\r') == text.count('\n') == len(rows):
+            self.file.write(text)
+        else:
+            self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+    def discard(self):
+        self.file.close()
+
+
+class JsonlSink:
+    # Each line is what json.dumps(dict(zip(headers, row)), ensure_ascii=False) gives, built
+    # from pre-encoded keys instead of a dict per row.
+
+    def __init__(self, path):
+        self.file = open(path, 'w', encoding='utf-8')
+        self.prefixes = []
+
+    def write_header(self, headers):
+        self.prefixes = [json.dumps(header, ensure_ascii=False) + ': ' for header in headers]
+
+    def write_rows(self, rows):
+        prefixes = self.prefixes
+        self.file.write(''.join(['{' + ', '.join([prefix + encode_basestring(value)
+                                                  for prefix, value in zip(prefixes, row)]) + '}\n'
+                                 for row in rows]))
+
+    def close(self):
+        self.file.close()
+
+    def discard(self):
+        self.file.close()
+
+
+class XlsxSink:
+    """Streams rows into a write-only openpyxl workbook, starting a new sheet at Excel's row limit."""
+
+    def __init__(self, path):
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise ValueError("XLSX export needs the openpyxl package.")
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+        self.headers = None
+        self.sheet = None
+        self.sheet_rows = 0
+
+    def write_header(self, headers):
+        self.headers = headers
+
+    def new_sheet(self):
+        self.sheet = self.workbook.create_sheet(f"Cards {len(self.workbook.worksheets) + 1}")
+        self.sheet.append(self.headers)
+        self.sheet_rows = 1
+
+    def write_rows(self, rows):
+        for row in rows:
+            if self.sheet is None or self.sheet_rows >= XLSX_MAX_ROWS:
+                self.new_sheet()
+            self.sheet.append(row)
+            self.sheet_rows += 1
+
+    def close(self):
+        if self.sheet is None:
+            self.new_sheet()
+        self.workbook.save(self.path)
+
+    def discard(self):
+        # Nothing has been written to path yet; the sheets only live in openpyxl's temp files.
+        self.workbook = None
+
+
+EXPORT_SINKS = {
+    '.csv': CsvSink,
+    '.jsonl': JsonlSink,
+    '.xlsx': XlsxSink,
+}
+
+
+def export_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    return extension if extension in EXPORT_SINKS else None
+
+
+def export_rows(store, rows, headers, path, progress=None):
+    """Write the given store rows to path, in the format its extension names.
+
+    rows is a sequence of row ids in the order to write, or None for every
+    row of the store. A CsvRowStore that has not found all its rows yet is
+    reopened and indexed to the end first, so the export never stops at the
+    rows the view has fetched. Rows are decoded straight from the store in
+    batches, so memory stays flat whatever the count. Returns a status
+    message; a cancelled export removes the file.
+    """
+    progress = progress or JobProgress()
+    own_store = None
+    try:
+        if rows is None:
+            if not getattr(store, 'complete', True):
+                store = own_store = store.reopen()
+                progress.start("Indexing rows")
+                while not store.complete:
+                    progress.check()
+                    progress.advance(rows=store.fetch_more())
+            rows = range(store.rows)
+        batches = (store.read_rows(rows[start:start + EXPORT_BATCH_ROWS])
+                   for start in range(0, len(rows), EXPORT_BATCH_ROWS))
+        return export_batches(batches, headers, path, progress)
+    except JobCancelled:
+        return "Export cancelled."
+    finally:
+        if own_store is not None:
+            own_store.close()
+
+
+def export_batches(batches, headers, path, progress=None):
+    """Write an iterable of row batches to path, as export_rows does; batches are only read as they are written."""
+    progress = progress or JobProgress()
+    extension = export_format(path)
+    if extension is None:
+        return f"Error: Unsupported export format '{os.path.splitext(path)[1]}'. Use {', '.join(EXPORT_SINKS)}."
+
+    try:
+        sink = EXPORT_SINKS[extension](path)
+    except (OSError, ValueError) as e:
+        return f"Error: Failed to save file: {e}"
+
+    progress.start("Exporting rows")
+    try:
+        sink.write_header(headers)
+        for batch in batches:
+            progress.check()
+            sink.write_rows(batch)
+            progress.advance(rows=len(batch))
+        sink.close()
+    except (JobCancelled, OSError) as e:
+        sink.discard()
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        if isinstance(e, JobCancelled):
+            return "Export cancelled."
+        return f"Error: Failed to save file: {e}"
+    return f"Data successfully saved to {path}"
@@ -0,0 +1,106 @@
+import os
+import re
+from collections import namedtuple
+from datetime import datetime
+
+
+FILE_PREFIX = 'PersoFile_'
+FILE_NAME_PATTERN = re.compile(
+    r'^PersoFile_(?P<sequence>[^_]+)_(?P<product>[^_]+)_(?P<branch_code>[^_]+)_(?P<date>\d{6})(?:\.[^_]*)?$')
+
+CatalogEntry = namedtuple('CatalogEntry', 'name sequence product branch_code date_part date size mtime_ns')
+
+_shared = {}
+
+
+def parse_file_name(file_name):
+    """Return (sequence, product, branch_code, date_part, date) for a PersoFile name, or None."""
+    match = FILE_NAME_PATTERN.match(file_name)
+    if match is None:
+        return None
+    date_part = match.group('date')
+    try:
+        date = datetime.strptime('20' + date_part, '%Y%m%d').date()
+    except ValueError:
+        return None
+    return match.group('sequence'), match.group('product'), match.group('branch_code'), date_part, date
+
+
+def get_catalog(directory):
+    """Return the shared FileCatalog for directory, rescanning it only if the folder changed."""
+    key = os.path.abspath(directory)
+    catalog = _shared.get(key)
+    if catalog is None or not catalog.is_current():
+        catalog = _shared[key] = FileCatalog(directory)
+    return catalog
+
+
+class FileCatalog:
+    """One os.scandir pass over an input folder with the PersoFile name metadata parsed.
+
+    Entries are sorted by name and indexed by date, product and branch code.
+    Stat results are as of the scan; the catalog is considered current while
+    the folder's own mtime is unchanged, i.e. until files are added, removed
+    or renamed.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.entries = []
+        self.invalid = []
+        self.by_date = {}
+        self.by_product = {}
+        self.by_branch = {}
+        self.scan()
+
+    def scan(self):
+        self.mtime_ns = os.stat(self.directory).st_mtime_ns
+        entries = []
+        invalid = []
+
+        with os.scandir(self.directory) as directory_entries:
+            for directory_entry in directory_entries:
+                if not directory_entry.name.startswith(FILE_PREFIX) or not directory_entry.is_file():
+                    continue
+                metadata = parse_file_name(directory_entry.name)
+                if metadata is None:
+                    invalid.append(directory_entry.name)
+                    continue
+                stat = directory_entry.stat()
+                entries.append(CatalogEntry(directory_entry.name, *metadata, stat.st_size, stat.st_mtime_ns))
+
+        entries.sort()
+        self.entries = entries
+        self.invalid = sorted(invalid)
+        self.by_date = {}
+        self.by_product = {}
+        self.by_branch = {}
+        for entry in entries:
+            self.by_date.setdefault(entry.date, []).append(entry)
+            self.by_product.setdefault(entry.product, []).append(entry)
+            self.by_branch.setdefault(entry.branch_code, []).append(entry)
+
+    def is_current(self):
+        try:
+            return os.stat(self.directory).st_mtime_ns == self.mtime_ns
+        except FileNotFoundError:
+            return False
+
+    def names(self, entries=None):
+        return [entry.name for entry in (self.entries if entries is None else entries)]
+
+    def select(self, product=None, branch_code=None, date=None):
+        """Entries whose product, branch code and date each pass the given test (None for any), in name order.
+
+        Each test runs once per distinct value in its index, not once per file.
+        """
+        selected = None
+        for index, test in ((self.by_product, product), (self.by_branch, branch_code), (self.by_date, date)):
+            if test is None:
+                continue
+            entries = {entry for key, group in index.items() if test(key) for entry in group}
+            selected = entries if selected is None else selected & entries
+        return list(self.entries) if selected is None else sorted(selected)
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,119 @@
+import sys
+from array import array
+from collections import Counter
+from itertools import compress
+
+
+class FilterEngine:
+    """Row masks for the values of a ColumnStore, combined with fast set operations.
+
+    A mask is an int with bit 8*i set when row i is selected, i.e. one byte per
+    row. Masks intersect and unite with & and | in C, and expand back to row ids
+    with itertools.compress. Masks for a dictionary column are built from its
+    codes with bytes.translate, one pass per code byte, and cached per value.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.rows = store.rows
+        self.value_masks = {}
+        self.code_lookups = {}
+        self.code_planes = {}
+        self.full_mask = None
+
+    def all_rows_mask(self):
+        if self.full_mask is None:
+            self.full_mask = int.from_bytes(b'\x01' * self.rows, 'little')
+        return self.full_mask
+
+    def planes(self, column):
+        # Split the column's codes into one bytes object per code byte, low byte first.
+        planes = self.code_planes.get(column)
+        if planes is None:
+            codes = self.store.code_array(column)
+            width = codes.itemsize
+            raw = bytes(codes.cast('B'))
+            order = range(width) if sys.byteorder == 'little' else range(width - 1, -1, -1)
+            planes = self.code_planes[column] = [raw[k::width] for k in order]
+        return planes
+
+    def code_lookup(self, column):
+        lookup = self.code_lookups.get(column)
+        if lookup is None:
+            lookup = self.code_lookups[column] = {value: code for code, value
+                                                  in enumerate(self.store.dictionary(column))}
+        return lookup
+
+    def value_mask(self, column, value):
+        key = (column, value)
+        mask = self.value_masks.get(key)
+        if mask is not None:
+            return mask
+
+        if self.store.is_dictionary(column):
+            code = self.code_lookup(column).get(value)
+            if code is None:
+                mask = 0
+            else:
+                mask = self.all_rows_mask()
+                for k, plane in enumerate(self.planes(column)):
+                    table = bytearray(256)
+                    table[(code >> (8 * k)) & 0xff] = 1
+                    mask &= int.from_bytes(plane.translate(table), 'little')
+        else:
+            mask = int.from_bytes(bytes(data == value for data in self.store.column(column)), 'little')
+
+        self.value_masks[key] = mask
+        return mask
+
+    def column_mask(self, column, values):
+        mask = 0
+        for value in values:
+            mask |= self.value_mask(column, value)
+        return mask
+
+    def rows_mask(self, rows):
+        selected = bytearray(self.rows)
+        for row in rows:
+            selected[row] = 1
+        return int.from_bytes(selected, 'little')
+
+    def select(self, filters, extra_mask=None):
+        """Intersect the given filters; returns a mask, or None when nothing is filtered.
+
+        filters maps a column to the values it may take; columns with no values are ignored.
+        """
+        mask = extra_mask
+        for column, values in filters.items():
+            if not values:
+                continue
+            column_mask = self.column_mask(column, values)
+            mask = column_mask if mask is None else mask & column_mask
+        return mask
+
+    def mask_bytes(self, mask):
+        return mask.to_bytes(self.rows, 'little')
+
+    def mask_rows(self, mask):
+        return array('I', compress(range(self.rows), self.mask_bytes(mask)))
+
+    def value_counts(self, column, mask=None):
+        """Rows per distinct value of column among the rows in mask (all rows if None)."""
+        if not self.store.is_dictionary(column):
+            values = self.store.column(column)
+            return Counter(values if mask is None else compress(values, self.mask_bytes(mask)))
+
+        dictionary = self.store.dictionary(column)
+        codes = self.store.code_array(column)
+        if codes.itemsize == 1:
+            # One byte per code: bytes.count runs one C pass per distinct value.
+            data = bytes(codes) if mask is None else bytes(compress(codes, self.mask_bytes(mask)))
+            counts = {value: data.count(code) for code, value in enumerate(dictionary)}
+        else:
+            selected = codes if mask is None else compress(codes, self.mask_bytes(mask))
+            counts = dict.fromkeys(dictionary, 0)
+            counts.update((dictionary[code], count) for code, count in Counter(selected).items())
+        return counts
+
+    def count(self, mask):
+        return mask.bit_count() if mask is not None else self.rows
@@ -0,0 +1,134 @@
+from PySide6.QtCore import QAbstractListModel, QEvent, QModelIndex, QObject, Qt, Signal
+
+# Keys that step a closed combo box from one item to the next.
+STEP_KEYS = {Qt.Key_Up, Qt.Key_Down, Qt.Key_PageUp, Qt.Key_PageDown, Qt.Key_Home, Qt.Key_End}
+
+
+class FilterValuesModel(QAbstractListModel):
+    """Checkable filter values with row counts; row 0 is the "All ..." entry that clears the checks.
+
+    Values whose count is zero stay listed but are disabled unless checked.
+    Replacing the counts only repaints, so the list stays put while it is open.
+    """
+
+    def __init__(self, all_label, noun, parent=None):
+        super().__init__(parent)
+        self.all_label = all_label
+        self.noun = noun
+        self.values = []
+        self.counts = None
+        self.checked = set()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.values) + 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if index.row() == 0:
+            return self.label() if role == Qt.DisplayRole else None
+        value = self.values[index.row() - 1]
+        if role == Qt.DisplayRole:
+            if self.counts is None:
+                return value
+            return f"{value} ({self.counts.get(value, 0):,})"
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if value in self.checked else Qt.Unchecked
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.row() == 0:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        value = self.values[index.row() - 1]
+        if self.counts is not None and not self.counts.get(value) and value not in self.checked:
+            return Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+
+    def label(self):
+        selected = self.selected()
+        if not selected:
+            return self.all_label
+        if len(selected) == 1:
+            return selected[0]
+        return f"{len(selected)} {self.noun} selected"
+
+    def selected(self):
+        return [value for value in self.values if value in self.checked]
+
+    def set_values(self, values):
+        # Checked values missing from the new list are dropped, as they can no longer match.
+        self.beginResetModel()
+        self.values = list(values)
+        self.checked &= set(self.values)
+        self.counts = None
+        self.endResetModel()
+
+    def set_counts(self, counts):
+        self.counts = counts
+        self.dataChanged.emit(self.index(0), self.index(len(self.values)))
+
+    def toggle(self, row):
+        if row == 0:
+            self.checked.clear()
+        else:
+            self.checked ^= {self.values[row - 1]}
+        self.dataChanged.emit(self.index(0), self.index(len(self.values)))
+
+    def clear(self):
+        self.toggle(0)
+
+
+class ComboBoxMultiSelect(QObject):
+    """Turns a QComboBox into a checklist: each pick toggles a value, the first item clears them all.
+
+    The combo always shows its first item, whose text sums up the checks, so
+    any other current index (a key typed on the closed combo, Enter in the
+    list, setCurrentIndex) is taken as a pick. The wheel and arrow keys are
+    ignored on the closed combo rather than stepping through the values.
+    """
+
+    changed = Signal()
+
+    def __init__(self, combo_box, all_label, noun):
+        super().__init__(combo_box)
+        self.combo_box = combo_box
+        self.model = FilterValuesModel(all_label, noun, self)
+        self.combo_box.setModel(self.model)
+        self.combo_box.view().pressed.connect(self.item_pressed)
+        self.combo_box.currentIndexChanged.connect(self.index_changed)
+        self.combo_box.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Wheel:
+            return True
+        if event.type() == QEvent.KeyPress and event.key() in STEP_KEYS:
+            return True
+        return False
+
+    def set_values(self, values):
+        self.model.set_values(values)
+        self.combo_box.setCurrentIndex(0)
+
+    def set_counts(self, counts):
+        self.model.set_counts(counts)
+
+    def selected(self):
+        return self.model.selected()
+
+    def clear(self):
+        self.model.clear()
+        self.combo_box.setCurrentIndex(0)
+
+    def item_pressed(self, index):
+        if self.model.flags(index) & Qt.ItemIsEnabled:
+            self.model.toggle(index.row())
+            self.changed.emit()
+        self.combo_box.setCurrentIndex(0)
+
+    def index_changed(self, row):
+        if row > 0:
+            self.item_pressed(self.model.index(row))
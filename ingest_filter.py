@@ -0,0 +1,62 @@
+from card_schema import OUTPUT_FIELDS
+
+
+class IngestFilter:
+    """Which input files process() reads and which output.csv columns it fills.
+
+    Files are judged from their name alone, before they are opened:
+    products, branches (codes) and districts are collections of allowed
+    values, or None for any, and start_date/end_date bound the request date,
+    either end open when None. Products and districts match case-insensitively.
+    columns names the OUTPUT_FIELDS to keep; the others are written empty, so
+    output.csv keeps its layout for the viewer. None keeps every column.
+    """
+
+    def __init__(self, products=None, branches=None, districts=None, start_date=None, end_date=None, columns=None):
+        self.products = {product.upper() for product in products} if products else None
+        self.branches = set(branches) if branches else None
+        self.districts = {district.upper() for district in districts} if districts else None
+        self.start_date = start_date
+        self.end_date = end_date
+        if columns:
+            unknown = [field for field in columns if field not in OUTPUT_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown column(s) {', '.join(unknown)}. Use {', '.join(OUTPUT_FIELDS)}.")
+        self.columns = frozenset(columns) if columns and set(columns) != set(OUTPUT_FIELDS) else None
+
+    def select(self, catalog, branch_data):
+        """The catalog entries whose files can hold matching rows, from their name metadata, in name order."""
+        product_test = None
+        if self.products is not None:
+            product_test = lambda product: product.upper() in self.products
+        branch_test = None
+        if self.branches is not None or self.districts is not None:
+            branch_test = lambda branch_code: self.matches_branch(branch_code, branch_data)
+        date_test = None
+        if self.start_date is not None or self.end_date is not None:
+            date_test = lambda day: (self.start_date is None or day >= self.start_date) and \
+                (self.end_date is None or day <= self.end_date)
+        return catalog.select(product_test, branch_test, date_test)
+
+    def matches_branch(self, branch_code, branch_data):
+        if self.branches is not None and branch_code not in self.branches:
+            return False
+        if self.districts is not None:
+            # The district written to output.csv for the file's branch.
+            district = branch_data.get(branch_code, {}).get('district', 'Unknown District')
+            if district.upper() not in self.districts:
+                return False
+        return True
+
+    def describe(self):
+        # JSON form kept in the manifest, None when nothing is filtered; an output.csv
+        # written under another filter is rebuilt.
+        description = {
+            'products': sorted(self.products) if self.products is not None else None,
+            'branches': sorted(self.branches) if self.branches is not None else None,
+            'districts': sorted(self.districts) if self.districts is not None else None,
+            'start_date': self.start_date.isoformat() if self.start_date else None,
+            'end_date': self.end_date.isoformat() if self.end_date else None,
+            'columns': [field for field in OUTPUT_FIELDS if field in self.columns] if self.columns else None,
+        }
+        return description if any(value is not None for value in description.values()) else None
@@ -0,0 +1,70 @@
+import threading
+import time
+
+
+PROGRESS_INTERVAL = 0.1
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class JobProgress:
+    """Counters a long-running DataProcessor call updates as it works, plus a cancel flag.
+
+    The job calls start() for each stage and advance() as files, rows and bytes
+    are done; callback receives snapshot() at most every PROGRESS_INTERVAL
+    seconds. cancel() may be called from any thread; the job notices it the
+    next time it calls check() and stops by raising JobCancelled.
+    """
+
+    def __init__(self, callback=None, interval=PROGRESS_INTERVAL):
+        self.callback = callback
+        self.interval = interval
+        self.cancel_event = threading.Event()
+        self.last_report = 0.0
+        self.start('')
+
+    def start(self, stage, files_total=0, bytes_total=0):
+        self.stage = stage
+        self.files = 0
+        self.files_total = files_total
+        self.rows = 0
+        self.bytes = 0
+        self.bytes_total = bytes_total
+        self.report(force=True)
+
+    def advance(self, files=0, rows=0, bytes=0):
+        self.files += files
+        self.rows += rows
+        self.bytes += bytes
+        self.report()
+
+    def snapshot(self):
+        return {
+            'stage': self.stage,
+            'files': self.files,
+            'files_total': self.files_total,
+            'rows': self.rows,
+            'bytes': self.bytes,
+            'bytes_total': self.bytes_total,
+        }
+
+    def report(self, force=False):
+        if self.callback is None:
+            return
+        now = time.monotonic()
+        if force or now - self.last_report >= self.interval:
+            self.last_report = now
+            self.callback(self.snapshot())
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def check(self):
+        if self.cancel_event.is_set():
+            raise JobCancelled()
@@ -0,0 +1,121 @@
+from collections import deque
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+from job_progress import JobCancelled, JobProgress
+
+
+class JobSignals(QObject):
+    # Each signal carries its job, so receivers on the GUI thread get queued calls.
+    progress = Signal(object, object)
+    finished = Signal(object, object)
+    failed = Signal(object, str)
+
+
+class Job(QRunnable):
+    """Runs function(*args, progress=...) on a pool thread and reports back through signals.
+
+    on_started and on_finished, if given, are called on the GUI thread with the
+    job, and with the job and its result.
+    """
+
+    def __init__(self, title, function, *args, on_started=None, on_finished=None):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.title = title
+        self.function = function
+        self.args = args
+        self.on_started = on_started
+        self.on_finished = on_finished
+        self.signals = JobSignals()
+        self.progress = JobProgress(lambda snapshot: self.signals.progress.emit(self, snapshot))
+        self.result = None
+
+    def run(self):
+        try:
+            self.result = self.function(*self.args, progress=self.progress)
+        except JobCancelled:
+            self.result = None
+        except Exception as e:
+            self.signals.failed.emit(self, str(e))
+            return
+        self.signals.finished.emit(self, self.result)
+
+    def cancel(self):
+        self.progress.cancel()
+
+    @property
+    def cancelled(self):
+        return self.progress.cancelled
+
+
+class JobRunner(QObject):
+    """Runs queued jobs one at a time off the GUI thread.
+
+    The processing and merge jobs all write into the same folders, so they are
+    never run concurrently: a single pool thread takes them in submission order.
+    job_started and on_started run on the GUI thread before the job begins, so
+    they can release files the job is about to replace.
+    """
+
+    job_started = Signal(object)
+    job_progress = Signal(object, object)
+    job_finished = Signal(object, object)
+    job_failed = Signal(object, str)
+    queue_changed = Signal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.queue = deque()
+        self.current = None
+
+    def submit(self, title, function, *args, on_started=None, on_finished=None):
+        job = Job(title, function, *args, on_started=on_started, on_finished=on_finished)
+        job.signals.progress.connect(self.job_progress)
+        job.signals.finished.connect(self.job_done)
+        job.signals.failed.connect(self.job_error)
+        self.queue.append(job)
+        self.queue_changed.emit(len(self.queue))
+        self.start_next()
+        return job
+
+    def start_next(self):
+        if self.current is not None or not self.queue:
+            return
+        self.current = self.queue.popleft()
+        self.queue_changed.emit(len(self.queue))
+        if self.current.on_started is not None:
+            self.current.on_started(self.current)
+        self.job_started.emit(self.current)
+        self.pool.start(self.current)
+
+    @Slot(object, object)
+    def job_done(self, job, result):
+        self.current = None
+        if job.on_finished is not None:
+            job.on_finished(job, result)
+        self.job_finished.emit(job, result)
+        self.start_next()
+
+    @Slot(object, str)
+    def job_error(self, job, message):
+        self.current = None
+        self.job_failed.emit(job, message)
+        self.start_next()
+
+    def cancel_current(self):
+        if self.current is not None:
+            self.current.cancel()
+
+    def cancel_all(self):
+        self.queue.clear()
+        self.queue_changed.emit(0)
+        self.cancel_current()
+
+    def is_busy(self):
+        return self.current is not None
+
+    def wait(self):
+        self.pool.waitForDone()
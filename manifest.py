@@ -0,0 +1,68 @@
+import hashlib
+import json
+import os
+
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_sha256(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class FileManifest:
+    """Persistent record of the input files behind an output, keyed by file name.
+
+    Each entry holds the file's size, mtime and SHA-256. The hash is only
+    recomputed when size or mtime differ from the recorded values.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.data = self.load()
+
+    def load(self):
+        try:
+            with open(self.path) as manifest_file:
+                data = json.load(manifest_file)
+        except (FileNotFoundError, ValueError):
+            return self.empty()
+        if not isinstance(data, dict) or 'files' not in data:
+            return self.empty()
+        return data
+
+    def empty(self, input_directory=None):
+        return {'input_directory': input_directory, 'files': {}}
+
+    def reset(self, input_directory):
+        self.data = self.empty(os.path.abspath(input_directory))
+
+    def matches_input(self, input_directory):
+        return self.data.get('input_directory') == os.path.abspath(input_directory)
+
+    @property
+    def files(self):
+        return self.data['files']
+
+    def fingerprint(self, input_directory, file_name):
+        file_path = os.path.join(input_directory, file_name)
+        stat = os.stat(file_path)
+        previous = self.files.get(file_name)
+        if previous and previous['size'] == stat.st_size and previous['mtime_ns'] == stat.st_mtime_ns:
+            sha256 = previous['sha256']
+        else:
+            sha256 = file_sha256(file_path)
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256}
+
+    def save(self):
+        temp_path = self.path + '.tmp'
+        try:
+            with open(temp_path, 'w') as manifest_file:
+                json.dump(self.data, manifest_file)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Error: Unable to save manifest '{self.path}'. {e}")
@@ -0,0 +1,331 @@
+import os
+import re
+from collections import OrderedDict
+
+from job_progress import JobCancelled, JobProgress
+from manifest import FileManifest
+
+
+MERGE_MANIFEST_NAME = '.merge_manifest.json'
+MERGE_BLOCK_SIZE = 1024 * 1024
+# Bytes str.strip() treats as whitespace in the ASCII range.
+MERGE_WHITESPACE = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+MAX_OPEN_OUTPUTS = 64
+
+PARTITION_FIELDS = ('product', 'branch', 'district', 'date')
+RANGE_PARTITION = 'range'
+# Output folders the GUI merges have always used.
+OUTPUT_DIRECTORIES = {
+    ('date',): 'Merged_by_Date',
+    ('product',): 'Merged_By_Product',
+    (): 'Merged_by_date_range',
+}
+
+
+def parse_partition(partition):
+    """Turn 'date', 'product+date', 'range', ... into a tuple of partition fields."""
+    if partition in ('', RANGE_PARTITION):
+        return ()
+    fields = tuple(field.strip().lower() for field in partition.split('+'))
+    unknown = [field for field in fields if field not in PARTITION_FIELDS]
+    if unknown or len(set(fields)) != len(fields):
+        raise ValueError(f"Invalid merge partition '{partition}'. "
+                         f"Use fields from {', '.join(PARTITION_FIELDS)} joined with '+', or '{RANGE_PARTITION}'.")
+    return fields
+
+
+def output_directory_name(fields):
+    if fields in OUTPUT_DIRECTORIES:
+        return OUTPUT_DIRECTORIES[fields]
+    return 'Merged_By_' + '_'.join(field.capitalize() for field in fields)
+
+
+def name_slug(value):
+    return re.sub(r'[^A-Za-z0-9]+', '-', value).strip('-') or 'NONE'
+
+
+def find_content_bounds(file, size):
+    # Offsets of the first and one past the last non-whitespace byte, found by
+    # reading blocks from each end of the file.
+    start = 0
+    while start < size:
+        file.seek(start)
+        block = file.read(MERGE_BLOCK_SIZE)
+        stripped = block.lstrip(MERGE_WHITESPACE)
+        if stripped:
+            start += len(block) - len(stripped)
+            break
+        start += len(block)
+    else:
+        return size, size
+
+    end = size
+    while end > start:
+        block_start = max(start, end - MERGE_BLOCK_SIZE)
+        file.seek(block_start)
+        stripped = file.read(end - block_start).rstrip(MERGE_WHITESPACE)
+        if stripped:
+            return start, block_start + len(stripped)
+        end = block_start
+    return start, start
+
+
+def copy_stripped(source, output_files):
+    """Stream an open binary source into every output file.
+
+    The result matches what the merges always wrote in text mode: surrounding
+    whitespace removed, line endings converted to os.linesep and one line
+    ending appended. Only one block is held in memory at a time.
+    """
+    linesep = os.linesep.encode()
+    start, end = find_content_bounds(source, os.fstat(source.fileno()).st_size)
+    source.seek(start)
+    remaining = end - start
+    carry = b''
+    while remaining > 0:
+        block = source.read(min(remaining, MERGE_BLOCK_SIZE))
+        if not block:
+            break
+        remaining -= len(block)
+        if carry:
+            block = carry + block
+            carry = b''
+        if b'\r' in block or linesep != b'\n':
+            if block.endswith(b'\r') and remaining > 0:
+                # Keep a split \r\n together for the next block.
+                block, carry = block[:-1], b'\r'
+            block = block.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            if linesep != b'\n':
+                block = block.replace(b'\n', linesep)
+        for output_file in output_files:
+            output_file.write(block)
+    for output_file in output_files:
+        output_file.write(linesep + (linesep if carry else b''))
+
+
+class OutputHandles:
+    """Append-mode output files kept open in least-recently-used order, at most max_open at once."""
+
+    def __init__(self, max_open=MAX_OPEN_OUTPUTS):
+        self.max_open = max_open
+        self.handles = OrderedDict()
+
+    def get(self, path):
+        handle = self.handles.get(path)
+        if handle is not None:
+            self.handles.move_to_end(path)
+            return handle
+        while len(self.handles) >= self.max_open:
+            _, oldest = self.handles.popitem(last=False)
+            oldest.close()
+        handle = self.handles[path] = open(path, 'ab')
+        return handle
+
+    def close_all(self):
+        while self.handles:
+            _, handle = self.handles.popitem()
+            handle.close()
+
+
+class MergeFamily:
+    """One requested output family: a partition, its output folder and its manifest."""
+
+    def __init__(self, fields, output_directory, input_directory, now, start_date=None, end_date=None):
+        self.fields = fields
+        self.output_directory = output_directory
+        self.now = now
+        self.start_date = start_date
+        self.end_date = end_date
+        # The range folder keeps one output per window ever requested, so it is never pruned.
+        self.prune = bool(fields)
+        os.makedirs(output_directory, exist_ok=True)
+        self.manifest = FileManifest(os.path.join(output_directory, MERGE_MANIFEST_NAME))
+        if not self.manifest.matches_input(input_directory):
+            self.manifest.reset(input_directory)
+        self.outputs = self.manifest.data.setdefault('outputs', {})
+        self.groups = {}
+        self.rewrite = {}
+
+    def group_key(self, values):
+        if not self.fields:
+            return f"{self.start_date.strftime('%Y%m%d')}-{self.end_date.strftime('%Y%m%d')}"
+        return '_'.join(values)
+
+    def output_file_name(self, values):
+        if not self.fields:
+            return f"PersoFile_00006_{self.group_key(values)}.{self.now.strftime('%Y%m%d%H%M%S')}"
+
+        by_field = dict(zip(self.fields, values))
+        product = by_field.get('product') or 'BY' + ''.join(field.upper() for field in self.fields)
+        if 'branch' in by_field:
+            branch = by_field['branch']
+        elif 'district' in by_field:
+            branch = name_slug(by_field['district'])
+        else:
+            branch = '10000'
+        date = by_field.get('date') or self.now.strftime('%y%m%d')
+        return f"PersoFile_00006_{product}_{branch}_{date}.{self.now.strftime('%H%M%S')}"
+
+    def add(self, values, file_name):
+        key = self.group_key(values)
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = (values, [])
+        group[1].append(file_name)
+
+    def plan(self, fingerprints):
+        # Decide which groups need a new output: new groups, groups whose members or
+        # member contents changed, and groups whose previous output has gone missing.
+        for key, (values, file_names) in self.groups.items():
+            members = {name: fingerprints[name]['sha256'] for name in file_names if name in fingerprints}
+            previous = self.outputs.get(key)
+            if previous and previous['members'] == members \
+                    and os.path.exists(os.path.join(self.output_directory, previous['file'])):
+                continue
+            self.rewrite[key] = (self.output_file_name(values), members)
+
+    def finish(self, fingerprints):
+        for key, (output_file_name, members) in self.rewrite.items():
+            previous = self.outputs.get(key)
+            if previous and previous['file'] != output_file_name:
+                self.remove_output(previous['file'])
+            self.outputs[key] = {'file': output_file_name, 'members': members}
+
+        if self.prune:
+            for key in [key for key in self.outputs if key not in self.groups]:
+                self.remove_output(self.outputs.pop(key)['file'])
+
+        referenced = {name for output in self.outputs.values() for name in output['members']}
+        files = self.manifest.files
+        files.update((name, fingerprint) for name, fingerprint in fingerprints.items() if name in referenced)
+        self.manifest.data['files'] = {name: entry for name, entry in files.items() if name in referenced}
+        self.manifest.save()
+
+    def output_path(self, values):
+        return os.path.join(self.output_directory, self.outputs[self.group_key(values)]['file'])
+
+    def remove_output(self, output_file_name):
+        try:
+            os.remove(os.path.join(self.output_directory, output_file_name))
+        except FileNotFoundError:
+            pass
+
+
+class MergeEngine:
+    """Produce several merge output families from one read of each input file."""
+
+    def __init__(self, input_directory, base_directory, reference_data, max_open_outputs=MAX_OPEN_OUTPUTS):
+        self.input_directory = input_directory
+        self.base_directory = base_directory
+        self.reference_data = reference_data
+        self.max_open_outputs = max_open_outputs
+
+    def partition_values(self, entry, fields):
+        values = []
+        for field in fields:
+            if field == 'product':
+                values.append(entry.product)
+            elif field == 'branch':
+                values.append(entry.branch_code)
+            elif field == 'district':
+                values.append(self.reference_data.district(entry.branch_code))
+            else:
+                values.append(entry.date_part)
+        return values
+
+    def run(self, entries, partitions, now, start_date=None, end_date=None, progress=None):
+        """Merge catalog entries into each partition's outputs.
+
+        Returns (families, error) where families maps each partition to its MergeFamily.
+        Raises JobCancelled if progress is cancelled; partly written outputs are removed.
+        """
+        progress = progress or JobProgress()
+        if start_date is not None:
+            entries = [entry for entry in entries if start_date <= entry.date <= end_date]
+
+        families = {}
+        for partition in partitions:
+            fields = parse_partition(partition)
+            if not fields and start_date is None:
+                raise ValueError("A range merge needs a start and end date.")
+            directory_name = output_directory_name(fields)
+            if fields and start_date is not None:
+                # Windowed families get their own folder so they never replace the full merges.
+                directory_name += f"_{start_date.strftime('%Y%m%d')}-{end_date.strftime('%Y%m%d')}"
+            output_directory = os.path.join(self.base_directory, directory_name)
+            families[partition] = MergeFamily(fields, output_directory, self.input_directory,
+                                              now, start_date, end_date)
+
+        fingerprints = {}
+        progress.start("Checking files", len(entries))
+        for entry in entries:
+            progress.check()
+            progress.advance(files=1, bytes=entry.size)
+            for family in families.values():
+                family.add(self.partition_values(entry, family.fields), entry.name)
+            try:
+                fingerprints[entry.name] = self.fingerprint(entry.name, families.values())
+            except FileNotFoundError:
+                continue
+        for family in families.values():
+            if not family.fields and not family.groups:
+                family.groups[family.group_key(())] = ((), [])
+            family.plan(fingerprints)
+
+        error = self.write(families.values(), {entry.name: entry.size for entry in entries}, progress)
+        if error:
+            return families, error
+
+        for family in families.values():
+            family.finish(fingerprints)
+        return families, None
+
+    def fingerprint(self, file_name, families):
+        # The first family whose manifest already knows the file's hash saves rehashing it.
+        path = os.path.join(self.input_directory, file_name)
+        stat = os.stat(path)
+        for family in families:
+            known = family.manifest.files.get(file_name)
+            if known and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns:
+                return dict(known)
+        return next(iter(families)).manifest.fingerprint(self.input_directory, file_name)
+
+    def write(self, families, sizes, progress):
+        targets = {}
+        output_count = 0
+        try:
+            for family in families:
+                for output_file_name, members in family.rewrite.values():
+                    path = os.path.join(family.output_directory, output_file_name)
+                    open(path, 'wb').close()
+                    output_count += 1
+                    for file_name in members:
+                        targets.setdefault(file_name, []).append(path)
+        except IOError as e:
+            return f"Error: Unable to write to '{e.filename}'. {e}"
+
+        # Each input may feed one output per family, so all of those must fit at once.
+        handles = OutputHandles(max(self.max_open_outputs, len(families) + 1))
+        progress.start("Merging files", len(targets), sum(sizes.get(file_name, 0) for file_name in targets))
+        try:
+            for file_name in sorted(targets):
+                progress.check()
+                try:
+                    source = open(os.path.join(self.input_directory, file_name), 'rb')
+                except FileNotFoundError:
+                    continue
+                with source:
+                    copy_stripped(source, [handles.get(path) for path in targets[file_name]])
+                progress.advance(files=1, bytes=sizes.get(file_name, 0))
+        except IOError as e:
+            return f"Error: Unable to write to '{e.filename}'. {e}"
+        except JobCancelled:
+            # The manifests are not updated, so removing the outputs makes the next run rewrite them.
+            handles.close_all()
+            for family in families:
+                for output_file_name, _ in family.rewrite.values():
+                    family.remove_output(output_file_name)
+            raise
+        finally:
+            handles.close_all()
+        return None
@@ -0,0 +1,157 @@
+import csv
+import locale
+import mmap
+import os
+
+
+# What open(path, 'r') decodes with, so every backend reads the files the same way.
+TEXT_ENCODING = locale.getpreferredencoding(False)
+
+
+def missing_file(file_path):
+    print(f"Error: The file '{file_path}' was not found.")
+
+
+def read_bytes(file_path):
+    # Returns None for a missing file.
+    try:
+        file = open(file_path, 'rb')
+    except FileNotFoundError:
+        missing_file(file_path)
+        return None
+
+    with file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return b''
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            return view[:]
+
+
+def clean_bytes(data):
+    # Universal newlines first, as text mode does, then the ~ and ^ separators.
+    return data.replace(b'\r\n', b'\n').replace(b'\r', b'\n').translate(None, b'~').replace(b'^', b'  ')
+
+
+def strip_rows(text):
+    for line in text.split('\n'):
+        row = list(map(str.strip, line.split(',')))
+        # A line of only blanks is skipped.
+        if len(row) > 1 or row[0]:
+            yield row
+
+
+def split_rows(text):
+    # text has no whitespace left around separators or at line ends, so a blank line is empty.
+    for line in text.split('\n'):
+        if line:
+            yield line.split(',')
+
+
+class PythonParser:
+    """Line by line: replace the separators, split on commas and strip every column.
+
+    Empty columns are kept so later columns stay in place; lines of only
+    blanks are skipped. This is the reference behaviour; every other
+    backend yields the same rows.
+    """
+
+    def parse(self, file_path):
+        try:
+            file = open(file_path, 'r')
+        except FileNotFoundError:
+            missing_file(file_path)
+            return
+
+        with file:
+            for line in file:
+                line = line.rstrip('\n').replace('~', '').replace('^', '  ')
+                if line.strip():
+                    yield [column.strip() for column in line.split(',')]
+
+
+class CsvParser:
+    """Splits lines with the csv module's C reader, without quoting, so quotes stay part of the value."""
+
+    def parse(self, file_path):
+        try:
+            file = open(file_path, 'r')
+        except FileNotFoundError:
+            missing_file(file_path)
+            return
+
+        with file:
+            lines = (line.replace('~', '').replace('^', '  ') for line in file)
+            for columns in csv.reader(lines, quoting=csv.QUOTE_NONE):
+                # A line of only blanks is skipped, as in PythonParser.
+                if len(columns) > 1 or columns and columns[0].strip():
+                    yield list(map(str.strip, columns))
+
+
+class MmapParser:
+    """Maps the file and cleans it whole: bytes-level separator passes, one decode, then a C-level strip per column.
+
+    The file is held in memory while its rows are read, as the parallel
+    path already does for the text it formats.
+    """
+
+    def parse(self, file_path):
+        data = read_bytes(file_path)
+        if data:
+            yield from strip_rows(clean_bytes(data).decode(TEXT_ENCODING))
+
+
+class NumpyParser:
+    """Like MmapParser, but finds the blanks to drop with vectorized passes over the byte buffer.
+
+    A blank is kept only when its column has other text both before and
+    after it; a running max/min of the non-blank positions finds those
+    neighbours in one pass each way, so the columns come out already
+    stripped. Files with non-ASCII bytes, where str.strip() knows more
+    whitespace, are stripped as in MmapParser.
+    """
+
+    def __init__(self):
+        try:
+            import numpy
+        except ImportError:
+            raise ValueError("The numpy parser needs the numpy package.")
+        self.numpy = numpy
+
+    def parse(self, file_path):
+        data = read_bytes(file_path)
+        if not data:
+            return
+        data = clean_bytes(data)
+        if not data.isascii():
+            yield from strip_rows(data.decode(TEXT_ENCODING))
+            return
+
+        numpy = self.numpy
+        buffer = numpy.frombuffer(data, dtype=numpy.uint8)
+        # ASCII whitespace as str.isspace() sees it, except the line break: \t \v \f \r, 0x1c-0x1f and space.
+        space = (buffer == 32) | ((buffer >= 9) & (buffer <= 13) & (buffer != 10)) | ((buffer >= 28) & (buffer <= 31))
+        text = ~space & (buffer != ord(',')) & (buffer != ord('\n'))
+        # The nearest non-blank byte (text or separator) at or before and at or after each byte; -1 and size past the edges.
+        size = len(buffer)
+        position = numpy.arange(size)
+        before = numpy.maximum.accumulate(numpy.where(space, -1, position))
+        after = numpy.minimum.accumulate(numpy.where(space, size, position)[::-1])[::-1]
+        inside = (before >= 0) & text[before.clip(0)] & (after < size) & text[after.clip(None, size - 1)]
+        yield from split_rows(buffer[~space | inside].tobytes().decode('ascii'))
+
+
+PARSERS = {
+    'python': PythonParser,
+    'csv': CsvParser,
+    'mmap': MmapParser,
+    'numpy': NumpyParser,
+}
+DEFAULT_PARSER = 'python'
+
+
+def get_parser(name=None):
+    """Return an instance of the named backend; raises ValueError for an unknown or unavailable one."""
+    name = name or DEFAULT_PARSER
+    if name not in PARSERS:
+        raise ValueError(f"Unknown parser '{name}'. Use {', '.join(PARSERS)}.")
+    return PARSERS[name]()
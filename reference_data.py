@@ -0,0 +1,165 @@
+import hashlib
+import json
+import os
+
+
+SNAPSHOT_VERSION = 2
+UNKNOWN_BRANCH = 'Unknown Branch'
+UNKNOWN_DISTRICT = 'Unknown District'
+
+_shared = {}
+
+
+def get_reference_data(base_path, cache_path=None):
+    """Return the process-wide ReferenceData for base_path, reloading it if the JSON files changed."""
+    key = (os.path.abspath(base_path), cache_path)
+    reference_data = _shared.get(key)
+    if reference_data is None:
+        reference_data = _shared[key] = ReferenceData(base_path, cache_path)
+    reference_data.refresh()
+    return reference_data
+
+
+class ReferenceData:
+    """Branch and district lookups compiled from branches.json and districts.json.
+
+    The compiled snapshot is saved as JSON to cache_path together with the SHA-256 of
+    both JSON files, so it is rebuilt only when one of them changes.
+    """
+
+    def __init__(self, base_path, cache_path=None, branches_file='branches.json', districts_file='districts.json'):
+        self.branches_path = os.path.join(base_path, branches_file)
+        self.districts_path = os.path.join(base_path, districts_file)
+        self.cache_path = cache_path
+        self.stamp = None
+        self.snapshot = self.empty_snapshot()
+        self.cached_branch_data = None
+
+    def empty_snapshot(self, digest=None):
+        return {'version': SNAPSHOT_VERSION, 'digest': digest, 'branches': {}, 'district_of': {},
+                'districts': [], 'unknown_codes': [], 'duplicate_codes': {}}
+
+    def file_stamp(self):
+        stamp = []
+        for path in (self.branches_path, self.districts_path):
+            try:
+                stat = os.stat(path)
+                stamp.append((stat.st_size, stat.st_mtime_ns))
+            except FileNotFoundError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def refresh(self):
+        stamp = self.file_stamp()
+        if stamp != self.stamp:
+            self.stamp = stamp
+            self.load()
+
+    def read_file(self, path):
+        try:
+            with open(path, 'rb') as json_file:
+                return json_file.read()
+        except FileNotFoundError:
+            print(f"Error: '{os.path.basename(path)}' file not found.")
+            return None
+
+    def load(self):
+        branches_bytes = self.read_file(self.branches_path)
+        districts_bytes = self.read_file(self.districts_path)
+
+        digest = hashlib.sha256()
+        for content in (branches_bytes, districts_bytes):
+            digest.update(content or b'')
+            digest.update(b'\0')
+        digest = digest.hexdigest()
+
+        snapshot = self.load_snapshot(digest)
+        if snapshot is None:
+            branches = json.loads(branches_bytes) if branches_bytes else {}
+            districts = json.loads(districts_bytes) if districts_bytes else {}
+            snapshot = self.compile(branches, districts, digest)
+            self.report(snapshot)
+            self.save_snapshot(snapshot)
+        self.snapshot = snapshot
+        self.cached_branch_data = None
+
+    def load_snapshot(self, digest):
+        if not self.cache_path:
+            return None
+        try:
+            with open(self.cache_path) as cache_file:
+                snapshot = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION \
+                or snapshot.get('digest') != digest:
+            return None
+        # Anything not shaped like a compiled snapshot is rebuilt.
+        expected = self.empty_snapshot(digest)
+        if any(not isinstance(snapshot.get(key), type(value)) for key, value in expected.items() if value is not None):
+            return None
+        return snapshot
+
+    def save_snapshot(self, snapshot):
+        if not self.cache_path:
+            return
+        temp_path = self.cache_path + '.tmp'
+        try:
+            with open(temp_path, 'w') as cache_file:
+                json.dump(snapshot, cache_file)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"Error: Unable to save reference data cache '{self.cache_path}'. {e}")
+
+    def compile(self, branches, districts, digest=None):
+        snapshot = self.empty_snapshot(digest)
+        snapshot['branches'] = dict(branches)
+        snapshot['districts'] = list(districts)
+        district_of = snapshot['district_of']
+        duplicate_codes = snapshot['duplicate_codes']
+        unknown_codes = set()
+
+        for district, branch_codes in districts.items():
+            for branch_code in branch_codes:
+                if branch_code not in branches:
+                    unknown_codes.add(branch_code)
+                if branch_code in district_of:
+                    # The first district listing a code wins, as the old linear scan did.
+                    duplicate_codes.setdefault(branch_code, [district_of[branch_code]]).append(district)
+                else:
+                    district_of[branch_code] = district
+
+        snapshot['unknown_codes'] = sorted(unknown_codes)
+        return snapshot
+
+    def report(self, snapshot):
+        for branch_code in snapshot['unknown_codes']:
+            print(f"Warning: Branch code '{branch_code}' in districts.json is not in branches.json.")
+        for branch_code, districts in snapshot['duplicate_codes'].items():
+            print(f"Warning: Branch code '{branch_code}' is listed in several districts: {', '.join(districts)}.")
+
+    @property
+    def digest(self):
+        return self.snapshot['digest']
+
+    @property
+    def unknown_codes(self):
+        return self.snapshot['unknown_codes']
+
+    @property
+    def duplicate_codes(self):
+        return self.snapshot['duplicate_codes']
+
+    def branch_name(self, branch_code):
+        return self.snapshot['branches'].get(branch_code, UNKNOWN_BRANCH)
+
+    def district(self, branch_code):
+        return self.snapshot['district_of'].get(branch_code, UNKNOWN_DISTRICT)
+
+    def branch_data(self):
+        if self.cached_branch_data is None:
+            district_of = self.snapshot['district_of']
+            self.cached_branch_data = {
+                branch_code: {'name': branch_name, 'district': district_of.get(branch_code, UNKNOWN_DISTRICT)}
+                for branch_code, branch_name in self.snapshot['branches'].items()}
+        return self.cached_branch_data
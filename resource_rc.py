@@ -1,4033 +1,36 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.7.0
-# WARNING! All changes made in this file will be lost!
+# Registers the binary resources built from resource.qrc (see comands.txt).
+# The generated *_ui.py modules import this module for the :/ images, so the
+# resource file is only mapped in once a form or the splash first needs it.
+import os
+import sys
 
-from PySide6 import QtCore
+from PySide6.QtCore import QResource
 
-qt_resource_data = b"\
-\x00\x00^\x92\
-\x00\
-\x00\x01\x00\x01\x00\x00\x00\x00\x00\x01\x00 \x00|^\x00\
-\x00\x16\x00\x00\x00\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\
-\x0dIHDR\x00\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\
-\x00\x00\x5cr\xa8f\x00\x00\x00\x01orNT\x01\xcf\
-\xa2w\x9a\x00\x00^6IDATx\xda\xed]\x05\
-x\x1bG\xb7]Yf\x8e\x1d\xdbqb\x8cc\x87\xa9\
-i\xcaM\xda\xb4)\xa6\xcc\x902\xb7)sSff\
-\xe6\xbe\xb6\x7f\x19S\x8a1\xe0$\x0e\xb3\xc3\xec0;\
-1\xcb\xf7\xdd3\xb3+\xc9\xb2d\x0bm\xc9^\x7f\xdf\
-\xb1\xa4\x95V\xbb\xda\x9ds.\xcc\x9d\x19Ei\xa7?\
-jlT\xa8\xaeN!\x93I\xa1\x86\x06\x89={\xf0\
-\x18\xcf\x18\xc48\x9f1\x9e\xf1\x15c\x12c\x19c\x1b\
-\xe3\x00\xa3\x9eA:t\xf8\x11\xea\xd5\xb6\xb9Mm\xab\
-%j\xdb\x1d\xaf\xb6\xe5A\xa2mWVZ\xda;P\
-_/8\xd0)\xfe\x04\xe9\xad\x7f<`2\x85\xf1c\
-_\xc6X\xc6{\x8cRF\x05\xa3ZoT::\x00\
-\x1a\xd5\xb6\x5c\xa1\xb6m\xb4\xf1\xcbE\x9b\x97m\xbf)\
-\x1f\x98#\x1d\x8f\xf8\xb0\xf2P:\x0b\xe9\x83U\xd2\x8f\
-cL`lf\x98\xf4\xc6\xa2\xa3\x93\xc0\xa4\xb6\xf9\x09\
-*\x07 \x06\xc6\x0e\xe7\x154#~CC,c\x0c\
-\xe3kU\x11\xf5\xc6\xa0CGC\xc3&5\x5c\x18\xa3\
-r$\xb0\x85\xa0I\x5c/\x91\xc0\xb8\x92Q\xac\xbb\xf6\
-:t8D\x95\xca\x91+T\xceX{\xcd\x01B~\
-\xf5d\xd5\x13\x8ff\x5c\xca\x98\xaa'\xeet\xe8p)\
-\xa18E\xe5N\xb4\xb5\x10\x04\x86\xd5ol4\xf0\xe3\
-\x08\xc6\x1f\x8cZ\xfd\x86\xea\xd0\xe1\x16jU\x0e\x8d`\
-~\x19\xfc\xd6\x1b\x10\xe4\xb7\x08@7\xc6s\x8c\x9d\xfa\
-\x0dl'\x98|\x08\xfd\xfa\xb6\x07\xc0\xa5\xe7\x19\xa9~\
-\xe5\x0d\x10\x91\xc5\xea\x1f<\x88\xc7Q\xaa\xbb\xaf\xdf4\
-\x1f\x13\xba\x91\xb7\xd7\xd57PU]\x03\xed\xadi\xa0\
-\x1d\xd5\x0d\xb4\xb9\xaa\x816\x1ch\xa05\x95\x0d\xb4\x8a\
-\xb1b\x7f\x03-c,w\x13\xda\xbe+\xd5\xef[\xcb\
-\xdf\xbd\xf1`\x03m\xe5\xe3\xec\xe4\xe3\xed\xafm\xa0j\
->~C}\x0b\xc2\xa3\xdf?o\xa2Tp\xac\xb6\xd6\
-\xc2;\xe6`\xfb\xf7\xe9\x9bL\x11\xfcx7c\xbb~\
-\x93\xbcCt\x90j\x1f\x13{=\x93n\xce\x1e\x13\xfd\
-\xb3\xcdD\x9fo4\xd1\xf3\xabMtwy#]\xb1\
-\xb0\x91\xce\x9c\xdbH\xc7\xcdj\xa4\xe13\x1ai@i\
-#\xe5N%\xca\x9aL\x94\xce\xe81\x89\xa8;#\xb5\
-\xc4CL\x92\xdf\x95\xc6\xc8\xe0\xef\xed9\x85\xa8\x0f\x1f\
-g\xf0\xb4F:\xa2\xac\x91N\x9c\xddH\xe7\xcdo\xa4\
-\xeb\x177\xd2C\xcb\x1b\xe9\x8d\xb5&\xfa\xae\xc2D\xc5\
-;L\xb4d\x9f\x14\x0b\x88T3\x81\xd0\xef\xb7\xbb\x00\
-\xc7\xeebD\xb4[H \xdc}T\xf1Y\x5c\xfe\x8f\
-\x19u\xfa\xcdq\x83\xec\x0d\x92  \xfa\x94]\x92\xe4\
- \xd2\x85\xf3%\xc1\xb2\x99p]\x8a\x88\xc2\x0aX\xea\
-'2\xfes\x02\x13}\x04'\x8f\x1d\x94O\x14YH\
-\x94\xcc\x02\xd2wj#\x8db\x91\xbafQ\xa3\x10\xaf\
-\x9f\xb6\x98h\xde^\x13mca\xa8\xaf\xd7E\xc1\x83\
-$\xe1G\x8c\x14swa[\x85\x04\xc2\xf2[\x5c\xff\
-<\xc6\xbf\xfa\x0dq\x9e\xf0p\xdd\xe1>\xcf\xda#\xc9\
-~\x07[\xf3\x13fI\xa2G3i\x0c\x13\xdb\x90\xd0\
-m\x01\x9b\xdf\x12\xcc\xe2\x90PL\xc2c9g^#\
-=\xb1\xd2D\xbf\xb2( \xd48P\xdb\x5c\x1cu\xb4\
-\x88\x7fT\x0eJ^\xfa\xda\x13\xb0!\xffPF\x99~\
-\x13Z!}\x83t\xe5\xe72\xe1?\xda`\xa2\xab\xd9\
-\x12\x0e\x9d\xde(\xacz3\xb2O\xecD\xb0\xfa\xdd!\
-\xf92\x5cA8s\xdf\xb2F\xfa\x99\x05aue\x03\
-\xd5\xd6\xe9b\xe0\x04\xcaT.\xfaV\x04\x84\xdbo!\
-\xff0\xc6|\xfd\xe2;&=\x12r\x7fq\xdc\x8e\x06\
-}\x14\xbb\xf2\x89\xc56\x0d\x7f\xa2\x0eG\xa2\x00A\xc8\
-\x9cLt\xd6\xdcFzu\x8d\x89f\xee6\x89\x84\xa3\
-.\x06\x0e1_\xe5\xa497\xe7\x9b\x91{\x16\xcb\xaf\
-\x93\xdf\x0e\xe9+\x0e6\xd0/l\xbdn\x5c\xd2H\xfd\
-\xd8\xc5\x0d/\xd0\x09\xef\xb1\x870Q\xe6@\x8e\x9d\xd9\
-HOr\xb8P\xbaK\x17\x83\x16D`\xa89'\xe0\
-\xadAEM\xba\xfad\xbc\xa1\xbb\xfdVq\xeanv\
-\xef\xff\xddn\xa2[\x976R_&}h\xbeNz\
-_\x0aB\x1c\x8b\xc1\x08\x16\x83\x17V\x9bh\xfe^\xab\
-0Ao\x93Z8\x90\xe7\xd5.B\xab\x02\x9f\x145\
-\xe9\xd0\xe9\x89\x8f.\xbaE\xfb\x1a\xe89n\x84G\xcc\
-h\xa4H\xdd\xd2\xb7\xbd\x18L\x94\xbd\x0c\xe7\xcek\xa4\
-\xaf7\x99D\xc8e\xed\x8dub\xfc\xab\xf6\xccy\x1e\
-\x0a\x98\xeb\xfae?\xff\xc7\x9d\x9d\xf8H\xe6M\xe0\xb8\
-\xfe\xf2\x85\x8d\xa2\x8f\xdc\xba1\xeah?1@\xcf\x02\
-z\x15\xc6\xaf\x90]\x8c\x0d\xf5\x9d^\x08>V9\xeb\
-\xbe\x08\x98\xcb{\xab\xab\x15\xb5\xc8\xa7\xbe\xb3\xba\xf9[\
-\xd8\xba|\xbc\xc1D\xc7\xb1\xeb\x19Q\xa0\x93\xde\x9fC\
-\x84\x14\x16f\x14I\xe5sXV\xd5y\xc3\x83:\xc1\
-\xd9\x9a\x1a3\x8f\xdd\xb3\xfe\x12\xa3:]\x85\x9f\xdah\
-P\xfa\xfa\xd2\x1a\x93\xa8z\x0b\xca\xd7\x89\x1fHb\x80\
-\x9a\x8a1se\x97\xa29i\xd8\xf9*\x06G\xb9\xe5\
-\x05X\xc5\xfd\xa9j\xfdq\xa7\xbax\xe8\x83~j\x95\
-\x89\xf2\xa66\xean~\x80\x0b\x01zbF\xcfn\xa4\
-\xef7wJ!\x98\xear>\xc0\xec\xfa\x13\x19\xd4\x11\
-H\x9d\xc6\xeac\xa0\xcb\x8b\xabu\xe2wD!@)\
-\xf5I,\x04\xe8\xa6=\xd8\xb9\x84\xe09ux\xbes\
-\xa1\x80\x95\xeb?\xa2S\x0c\xe9\xe5\x86\xb0\xab\xba\x81\xde\
-_o\xa2A\xd3t\xe2wt!@\x0e\xe7\xecy\x8d\
-T\xb8\xc3d\x19\x8b\xd0\xf1\x87\x12\x8fp\xca\x0b0[\
-\x7f\x93)Z\x9d\x88\xa0C\x13\xbf\xa6\xae\x81~c\x8b\
-0rf#\x19\xf5\x18\xbfS\x09A|\x11\xd1\x0d\x8b\
-\x1bi\xd1\xdeN\xe1\x05\xfca\x9eY\xa8%/\xc0j\
-\x02\xcfK;\xfaL>s\xf74\x88\xee\xbc\xa8B\x9d\
-\xf8\x9dY\x08Pr\x8cQ\x8a\x18\x9d\xd8\x81\xbd\x81Z\
-\x95\xd3\x82\xe3\xad%\xfe\x12\xd4\xf9\xc8:\xa4\xd5\xc7\xc4\
-\x19\xb8\xe1\x18\xdf\xae\x13_\x07\xda\x00\x06e\x1d]\xd6\
-H\x7fl\xed\xd0a\xc1T\xf3D\xa3\xf6\xbc\x00+\xeb\
-\x7fEG\xec\xf371&no\x10\xee\xbeA\x8f\xf3\
-u\xd8\x11\x82\x18\xf6\x06oY\x22G\x22v@\x11\xa8\
-Wg\xe6n\xee\x05h\xc3\x08\x19\xb1\xea\xb4\xc4\x1d\xca\
-\xea\xa3\x90\xe7\xa1\xe5&1\xa8D'\xbe\x8e\xd6\x84\x00\
-U\x85\xdfV\x98:\xe28\x83b\xf3\xba\x03\xd6\x83\x85\
-\xac2\xffc\xd4\xb9\xc9;\xcc\x8f.\xd8\xd1@\xc7\x94\
-5\xea\x0d[\x87K\x22\x80\xf1\x1d7\xb17\xb0\xee@\
-\x87\x12\x81j\x95\xe3M{\x04\x84\xf5ol4\xaa\xab\
-\x93t\x08\xab\x8f\x892\x9f[e\xa2\xae\xc5\xba\xd5\xd7\
-\xe1\xbe\x10\x0c\x9b\xdeH\x7fm\x9339u\x10\x11\xf8\
-Z]\x9a\xaf\xd9\xe4\x9e}\xd5%\x8a\x02\x9e\xfc\x8b\xf7\
-5\x88\xbe^Q\xbe\xab7d\x1d\x1e\x8a@\x02\x87\x8e\
-O\xb31\xc1`\xb0\x0e\xe0\x0dT\xa8\x5c\x97\xc3\x85\xad\
-\xa6\x18\x1e\x17\xe8\xe4o\xac\xc7\x84\x1c\x0d\xd4\x07\x95|\
-\xba\xd5\xd7\xe1E\x041\xcec\xa3\x82\xa9\xd2;\x80\x08\
-\x8c\xb3\x08\x80L\xfea\x99\xe2\x09\x81l\xf5+k\x1b\
-\xe8\x19V\xe98=\xd1\xa7\xc3\x87\xde\x00\xaaE\xff\xd9\
-\x16\xe8^\xb2i\x02\x93?L\x0a\x80\xc5\xfd\xdf\x1c\xa8\
-\xe4\xc7b\x18c\x17\xaa\xd5|zC\xd5\xe1c\x11H\
-*&z{\x9d\xdaK\x10\x98\x02\xb0\x99\xc9\xdf\xd7Z\
-\x00.'\xb9fy\xc0\x91\x1f\x15}\x98\x22J\xb7\xfa\
-:\xda\x12\x18\x5ctw\xb9\x89vW\x07`H\xd0\xd8\
-hb\xf2\x8f\x95\x02PY\x09\x01x/\x10\x95\xeco\
-v\xc5z\xeb\xf1\xbe\x8ev\xc4\x05\xf3\x1b\x03\xaf\xab\xb0\
-\xb1\x91\xb9O\xefi\x1e@|\xa0\x8d\xf97\xd57\xd0\
-\x17\x1b\x1b\xc4\xec/:\xf9u\xb4wH\x00\x0ft\xc1\
-\xde\x00\x12\x01)\x00\xa5\x8cx\x08\xc0 \xb5k  \
-N\xbe\x8e\xe3.\xcc\x15\x1f\xab\x0f\xe2\xd1\xe1g\xc9\xc1\
-);\x03J\x00*\x18\x83 \x00\xe7\xab\x15B~\x7f\
-\xe2U\xb5\x0d\xf4\xd8\x0a\x93\x9co_ox:\xfcL\
-\x04r\xa6\x04H\x0f\x81\x14\x80j\xc6\xf9\x10\x80\xf1\x8c\
-F\x7f?\xe9\x03\xb5\xf5tO\xb9I\xcc\x00\xab78\
-\x1d\xfe*\x02=&5\xd2\xaf[\x02B\x00\xf07^\
-\x09\x84\xf2_T`\xdd\xb6\xd4\xa4w\xf3\xe9\x08\x08\x11\
-@n\xea\xbb\x8a\x80\x10\x80\xaf \x00%\xfeN\xfe\x9b\
-\x97\x98\xe4\x10^\x1d:\x02\xa8V\xe0\x7f\x15~/\x00\
-\x93 \x00\xcb\xfc\xd9\xed\x1f\xb7T'\xbf\x8e\xc0\x15\x81\
-\x1f*\xfcZ\x00\x96A\x00\xb6\xf9g\xc2O\xc6\xfc\xba\
-\xdb\xaf#\x90E \xb5\xa4\x91~\xdf\xe2\xb7\x02\xb0\x0d\
-\x02p\xc0\xdf\xc8_[W/\xb2\xfdz\xc2OGG\
-\x10\x81\xf4IX\xa9\xc8/\x05\xe0\x80\xe2o\xd3\x7f\x99\
-\xea\xeb\xe9\xd55\x0dzW\x9f\x8e\x0e%\x02Xkb\
-\xc6.?)\x16\xb2\x08\x80\x98\x07\xd0\x8f\xac\x7f\xbd\xa8\
-\xf0\x13E>z\xc3\xd1\xd1\x01'\x17Y\xba\xaf\xde\x9f\
-\x04\x80\xfcJ\x00\xfe\xde\x8a\xf2^\xbd\xb6_G\xc7\x15\
-\x81\xd1\xb3LTq\xa0^\x17\x00[\xcc\xde]\xaf\x0f\
-\xec\xd1\xd1)0v\xa1\x89\xf6\xd7\xd4\xeb\x02\xa0a\x03\
-+\xe2\xb1e:\xf9ut\x92\xd9\x85\xf2\x89\x1e]\xde\
-@\xf5u\xf5\xba\x00T\xb2\x12\x8e]`\xd2\xc9\xaf\xa3\
-S\x01+R}\xbeA\xe6\xbd:\xad\x00 \xe3\xff\xf4\
-\xca\x06\xbd\xaf_G\xa7\xcc\x07\xa4Mj\xa4);:\
-\xad\x00\xd4\xd3\xcf\x9b\x1b\xe4\x1c~z\x83\xd0\xd1IE\
-\xe0\xc8\x19\x8d\xb4\xbe\xb2\xbe\xf3\x09\xc0\xa2\xbd\xf5\xfa\xec\
-\xbd:tp\xfb\xbff\x91IT\xbev\x1a\x01\xd8S\
-]Og\xcf\xd5\xe3~\x1d:\x80P\x0e\x81\xdfY\xcb\
-\xdc\xa8\xaf\xef\xf8\x02\xd0\xc8?\xf2Y\x8e\xfb\x83\xf4\x1b\
-\xafCG\x93y\x04Jw\xd6\xb7MR\xb0\xfd\x04\xa0\
-\x9e\xf2\xb7\xd5S\xd7b}\xad>\x1d:lE\xe0\x84\
-Y&\xda~\xb0\x03\x0b\xc0\xe6\x03\xf5tt\x99\xee\xfa\
-\xeb\xd0\xe1\x08\x8f-\x97\xbdc\x1dN\x00\x1a\xea\xea\xe9\
-\xfe\xf2\x06\xfd&\xeb\xd0\xd1\x02\x12\xd9;\x86\x97\xec\xd3\
-P\xa0\xed\x05\xa0\x9e\xfe\xdbZO]\x8at\xd7_\x87\
-\x8e\xd6B\x81\x913M\xb4\xed`]\xc7\x11\x80\xed\xfc\
-cF\xe8\xae\xbf\x0e\x1dN\x013`\xa1@\xae\xd1W\
-\xa1@\x9b\x0a\x80\x9a\xf5\xd7\xa7\xf5\xd2\xa1\xc3y`&\
-\xa1\x19;\xeb|\x13\x0a\xb4\x9d\x00\xd4\xd3\xec]u\xa2\
-\xe4Q\xbf\xa9:t\xb8\x16\x0a\x9c7\xd7D\x07j\xea\
-\x02W\x00\xaak\xeb\xe8\xb2\xf9\x0d\xba\xeb\xafC\x87\x1b\
-\xc0\x02\xa4\xff\xb7\xc1\x07\x09\xc1\xb6\x11\x80z\xfa\xb9\xa2\
-\x9e\x22\xf5\xa9\xbdt\xe8p\x7f\x16\xa1i&\xdaTY\
-\x17x\x02\xb0CO\xfc\xe9\xb0F\xbe\x0b(p\x02\x85\
->\x82\xbdc\xb5t\xae\xad\xfd^\xebsus\xd4\xeb\
-3+\xd8\x03\xa8\xaf\x0b$\x01\xa8\xa7w\xd7\xd6\xeb\xc3\
-|;\x0a1\xec\x11\xc1\xfc\x1b0\xa0\x8b\xf1/\x8b\xfd\
-\xbf\x1c\xee\xfdSG\xca\xdf\xb5\xa4\xfcUC\xca\x84j\
-R\xfe\xacb\x1c$\xe5\x8f\x03\xa4\xfc\xbe\x9f\x94_\xf7\
-\x92\xf2\xcbnR~\xdaI\xca\x8f\xdbI\xf9a+)\
-\xdfm!\xe5\x7f\x15\xa4|\xb3\x91\x94\xaf\xd7\x91\xf2\xd5\
-\x1aR\xbeXI\xcag\xcbH\xf9d))\x1f-\x22\
-\xe5\x83\x05\xa4\xbc7\x97\x94wf\x91\xf2\xd6\x0cR\xde\
-(%\xe5\xb5\xc9\xa4\xbc\x5cL\xca\x8b\x05\xa4<\xff/\
-)\xcf\xfcE\xcaS\x7f\x90\xf2\xf8\xaf\xa4<\xfa\x13)\
-\x8f|O\xca\x83\xdf\x90r\xff\x97\xa4\xdc\xf3\x19)w\
-}D\xca\xed\xef\x93r\xdb;\xa4\xdc\xfc\x06)7\xbe\
-J\xca\xf5/\x91r\xcd\xf3\xa4\x5c\xf54)W<A\
-\xcae\x8f\x92r\xc9\xc3\xa4\x5c\xf4\x00)\x17\xdcK\xca\
-yw\x91r\xce\x1d\xa4\x9c5\x8e\x943n!e\xcc\
-M\xa4\x9cv\x03)\xa7^\xc7\xb8\x96\x94\x93\xaeb\x5c\
-\xa9>\xaa8\x85\xb7\x9fv=)g\xdeJ\xca\xf9\xf7\
-\x90r\xe5S\xf2<~\xd8&\xaf\xa3\x8b^@\xd6\xe4\
-FZ\xbc\xc7\x8b\x09A_\x0b\xc0\xfa\xfdu4\xb0\xb4\
-\x0d\xac\xbf\xbbd\xf1\xb5\xa50\xdf<\x90\xc3dE\x8e\
-z&G\x9d\x1594bT\x92\xf2\xdb\xbe\xe6\xe4\xf8\
-~\xab$\xc6\xb7 \xc6z&\xc6ZR\xbe\x5cM\xca\
-\xe7+H\xf9\xb4\x9c\x94\x8f\x17\x93\xf2!\x13\xe3}\x8d\
-\x18eL\x8ciL\x8c)\xa4\xbcbC\x8c'\x7fg\
-b\xfcB\xca\xf8\x1fIy\xf8\x7f\xa4<\xf0\x7f\xa4\xdc\
-\xfb9)w\x7fB\xca\x1d\x1f0)\xde\x96\xa4\xb8\xe1\
-\x15R\xae}\x81\x09\xf1\x0c)cA\x88\xf1\xa4\x5c\xfc\
-\xa0$\xc3\xb9wJ\x22\x8c\xb9Y6\xf0\x93\xaf&\xe5\
-\xc4\xb1\xa4\x1c\x7f\x09)#/$\xe5\x98sI9\xea\
-,R\x0e\x1fC\xca\xf0SH9d4)C\x8e'\
-e\xe0\x08R\xfa\x1fEJ\x9f\xc3I\xe9=\x9c\x94^\
-\x87\x90\xd2s0)Y\x03H\xc9\xe8GJZoR\
-\xba\xf7\x22\xa5[6))\x99\xa4$\xa5\x93\xd2\xb5\x07\
-)\x09\xa9\xa4tI!%.\x89\x94\xd8DR\xa2\xbb\
-\x90\x12\x15GJX\x14)!\xe1\xa4\x04\x87I\x84\x86\
-K\x84\x84\xf2\xeb\x10R\x0cA\xa4(\x8a\x7f\x01\xe74\
-\xf4\x04\x16\xb4%n\x89\xc0\x1dK\xea\xa9\xa1\xae.\x00\
-\x04\x80]\x95gW\xd6\xbbOh[\x92i\x84\x02\x89\
-\x04\x81j%y@\x9c\xdf\xd8\xa2\xfc\xb2\x87\x94\x9fw\
-\xa9\x84aK\xf2\xed&\x95,6D\x11\x16d\x0e)\
-o\x97I\xeb\xf1*\xacG\x11)/L$\xe5\xd9\x7f\
-Hy\xfaOi9\xc6\xff@\xcaCL\x90\xfb\xbfb\
-\x82hV\xe3=Rn}\x8b\x94\x9b^#\xe5:\xb6\
-\x18W?'U\xfd\xf2\xc7\x98\x1c\x0f19\xeecr\
-\xb0\xa58\x1bV\xc2\x86\x1c\xa3.\xb5\x90\xe3\xc83\x99\
-\x1c\xa7\x93r\xe8\xc9L\x8e\x13I\x19\x0cr\x1cKJ\
-?\x95\x1c\xb9\xc3H\xc9\x19BJ\xf6 R2\xfb\x93\
-\x92\xde\x87\xc9\x91\xc7\xe4\xc8\x91\xe4H\xce`b\xa4Y\
-\x88\x11\x9f\xcc\xc4\xe8JJL\x02\x93#\x9e\xc9\x11K\
-JD\x0c)\xe1L\x90\xb0\x08\x95\x14a\x16b\x18\x83\
-I\x0922\xb81\x1a\x0c\xfeG\x12'\x10\x14d\xa0\
->}z\xd3\xf9\xe7\x9fO\x17_|1\x0d\x1a4\x90\
-\x82\x83\x8dM>\x93\x96\x96F\xa7\x9ez*]r\xc9\
-%4r\xe4H\x8a\x8f\x8fo\xf2~vv6\x9dq\
-\xc6\x19t\xe1\x85\x17\xd2\xa1\xc3\x87SxD\x84\xddc\
-u\xef\xde]|\x0f\x8e5t\xe8P\x0a\x09\x0dU\xc9\
-lp\x1d\xda\xf7\x0e8V\xb6O\x17\xbdcL\x96[\
-\xe6\xadnA\xdf\x09@=\xad\xdeWK\xbd\xa7\xb81\
-\xce\x1f\x17\x04\xae\xe0\xb3\x7f\x93r\xe7\x87L\xb2g\xa5\
-\x1b\x067\x0ad:\xeebR\x8e>\x87\x94\xc3N\x95\
-J\x0a\xab\xd2\xf7\x08R\xf2\x0e\x95\xd6\x04\x841[\x92\
-,iE\x12\xbb[,\x88 \x89jAlI\x12\xec\
-\x88 \x81I\x92\xb6\xb3j\x06\xfbB\xe2\x0eA\x9c \
-Prr2\xbd\xf4\xd2K\xb4i\xd3&s\x03\xde\xb6\
-m\x1b\xbd\xf5\xd6[\x94\x9c\x92B\xa1L\xd0\x9bo\xbe\
-\x99\xca\xcb\xcb\xa9\x1eE4\xfcWUUE%%%\
-4z\xf4h\x8a\x8d\x8d\xa5\x87\x1ez\x88V\xaf^M\
-&\x93I\xbc\xbfg\xcf\x1e\xfa\xe1\x87\x1fh\xe0\xc0\x81\
-\xe6s\x0f\xe2\xfb\x7f\xd1E\x17\xd1\xa2E\x8b\xb8Y7\
-\x88\xcf\xed\xde\xbd\x9b>\xf8\xf0C\xea\x96\x9a*>g\
-\xe0\xcf\xb9\x03q\x0c\x84\x14\xff5\xba\xec\x05\x5c\xb7\xb0\
-\x81\xeaj\xeb\xfcX\x00\xd8\xfa#a\xe1\xb2\xe5\x87\xa5\
-\x7f}*\xbb\x87\x87Ik\x15\x88$hI\xf5\xed}\
-\xae\xa5\xfd}E\x22\x1b\x18\x02\x04\xb8\x1eql\xc5\xbf\
-\xfd\xf6[\xd1hkkki\xce\x9c94c\xc6\x0c\
-A\xf0\x1d;v\xd0\xb0a\xc3\xe8\xce\xbb\xee\x12\xef\xe1\
-o\xd5\xaaUTVVF[\xb6l\x11\xaf7n\xdc\
-Hw\xdcy'UTTp\xfbo\xa4\x05\x0b\x16P\
-ii)\xed\xda\xb5K\xbc\x8f\xef\xeb\xd3\xa7\x8f8\xd6\
-)\xa7\x9c\x22\xb6\xef\xdc\xb9\x93>\xf8\xe0\x03z\xe2\x89\
-'\xc4g\xf1\xf7\xc5\x17_PDd\xa4\xfb\x22\x80{\
-\x9b\xd9O\xe6>\x5c\xf4\x020\x8av\xda\x8eZ\xcf\xbd\
-\x00_\x09\xc0*a\xfd]\x8c\xfdA~\xb8\xe9\x88\x07\
-}mE\xec\x10\xa0\xb5\xd7N5\xd0\x00\x22S \x02\
-\xed\xe1\xfa\xeb\xaf\x17\xc4\x05\xd9\xaf\xb9\xf6Z\xea\x92\x90\
- ,\xfae\x97]F\xe3\xc7\x8f\x17.:\xc8\x0d\xcb\
-\xfe\xea\xab\xafRfV\x96x\x7f\xc8\x90!\xf4\xe7\x9f\
-\x7f\x8a\xc6\x0eO\xe0C\xb6\xe2\xf7\xdf\x7f?%%%\
-QtL\x0c\x8d\x181\x82f\xcf\x9e-\xde\x07\xd9\xa3\
-\xa2\xa2\xe8\x8f?\xfe\x10\xc2\x82\x10A\xf3\x02a\xf9\xff\
-\xfb\xef?\xb1}\xd4\xa8\x13\xa4\x00\xb0\xa7\xe02\xf0\x9b\
-\x10\xba!,u#\x17p\xfd\xc2z\xcf\xbd\x00\x9f\x08\
-\x00[\xff\xe7W\xd6\xb9n\xfd\x11\xd7\x9fz\x9dPF\
-\xbd\xb1\xb7\x07\x82l\x9ek\x0d5\xa8\xe9\xeb6D\x90\
-\x0a\xeduxx\xb8\x99\xc4O?\xfd\xb4\xd9@\x18T\
-w=4,\x8c\xeeb\xeb\x8f\xbf\x82\x82\x02\x8a\x8b\x8b\
-3[h<\xc2\xbd\x878TVV\xd2\xe9\xa7\x9fN\
-AFc\x93\xf7\xb1\x0d\xc4\x86\xd7p\xcc1\xc7\xd0\xda\
-\xb5ki\xf2\xe4\xc9\x14\x15\x1dm>\x06>7v\xec\
-Xq\x8c{\xef\xbdW\xcdG\x04\xb9\x0e\x9cw$\x87\
-\xa0\xaf\x97\xca<\x97\x8b|Ia/`\xd6N\x0f\xbd\
-\x00_\x08\xc0\xc6\xfd\xb54\xa8\xd4\x0d\xeb\xff\xe1B\x11\
-\xa7\xfb\xaf\x00\x04\xd9G;\x10\x22\xc8\x0e9l\xb7\x05\
-u0\xe0\x1e$&&\xd2\xfc\xf9\xf3E\x5c?\xfa\xa4\
-\x93\x9a\x90\xcf\xa0\x92\xf3\xcd7\xdf\x14\x0d\xfa\xb9\xe7\x9f\
-o\xf6~$[\xf5\xa2\xa2\x22\xf1\xfe\x05\x17\x5c\xd0\xe4\
-}-i\x88\xbc\xc0\x9e\xbd{\xc5\xfb\x08\x17\x8a\x8b\x8b\
-\xc5~\x06\xab\xcf]z\xe9\xa5\xe2;\xeec\x0f\xc2\xfc\
-\x1d,&\x96\xf35\xca\xd7-\x01\xe7\x14\x16N\xca\xf3\
-\xff\xb9%\x00\xe0\xd7]K\xea\xc9\xe4I\x8f\x80\xd7\x05\
-\x80\xad\xff\xfbk\xeb\x5c\x9f\xe6\x0b\x17\xe0\xa1o\xf9\x22\
-\x1b\xdd&\x863\x16$HG;\xc2\x09R\xb4\x00\xdc\
-?\xc4\xff\xd3\xa7O\x17\x0d\x16$\x14\xe4\xb3z\x1f\xaf\
-\x9fy\xe6\x19\xf1\xfe\xe7\x9f\x7fN\xc6\xe0\xe0&\x84\x0b\
-\xe6\xd7H\xf4\xe1\xef~\x8d\xbc\xea\xfb\x9a\x87\xb0}\xfb\
-v\x91P\x1cs\xc6\x19\xb4~\xfdz\xda\xcbb\x80\x9e\
-\x02-$M\xec\xda\x95~\xfb\xfdw\xaa\xa9\xa9\x119\
-\x02l3\xf2\xfe\xee ($Dv\xc9\xba\xb9\x06&\
-\xea\x02\xca\xf7x\xe0\x05x[\x00v\x1f\xac\xa5\x11e\
-n\xd4\xfc\xe3\x02\xdc\xf4\xba\xb0\xfe\x9d\x8e\x18M,G\
-\x90G$\xf1\x14F\x07\xdb\x8c-<o+h\xc7|\
-\xfb\xed\xb7\xcd.~zz\xba\xa5\xab\xaeG\x0f\x1a3\
-f\x0c\x9d}\xf6\xd9\x22\x01\x08\x12\x9ft\xf2\xc9\xe6\xf7\
-\x11>\x9cs\xce9\xf4\xc2\x0b/\x88\xfd\xe7/X@\
-\xfd\x07X\xf2M\xd1\xec\xe6\xa3\x17\x01\x7f\xb0\xfa\x83\x07\
-\x0f\xa6\xbf\xfe\xfaK\xe4\x12\xd0\xdb\xf0\xe2\x8b/\xd2\xdd\
-w\xdf-\xe2\x7f\xfcAHbbc\xc5=s\xff7\
-\x05\x93\xf2\xe0\xd7n\x0b\x00\xf0\xdc\x8a:\xf7\xab\x03\xbd\
-+\x00\xf5\xf4[E-E\x14\xb81\xe2\x0f\x17\xe0\xca\
-\xa7\xed\x0b\x80\x8d\xdb\xd4\x9e\x04qD\x0e\xdbF\xda\x1e\
-\x04\xe9\x0c@\xbc\x7f\xd8a\x87\x09\xd7\x1c\x7fS\xa7N\
-\x15\xa4\xbc\xfd\x8e;\x04i\xd7\xacYC\xc7\x1c{,\
-\xfd\xf4\xf3\xcf\xe2\xfd\x0d\x1b6\xd0\xb3\xcf>K\xd7]\
-w\x1d}\xc6\x1e\x01\xba\xf0 \x003g\xce\x14\xef/\
-\x5c\xb8\x90\xc6?\xfa(\x8d\x1b7\x8e~\xfd\xf5W\x11\
-ZTWW\xd3%\xec]ddd\xd0\x1bo\xbc!\
-\xba\x07!&\xda\x1fr\x04\xdf}\xf7\x1d\xf5\xec\xd9S\
-x\x1d\xf0*\x8c6\x08Va\xefu\xb0\x15\x84\xe7\x81\
-\x02\xacB\xf7\xc7\x08\x1c2\xcdD[*k\xdc\xf3\x02\
-\xbc)\x0055\xb5t\xc9\xbcz\xf7\xaa\xfe\x90\x03\xb8\
-t<\x05y\xe0N\xe9\xb0EpS\x04\xfb?\xec\x91\
-\xc4\xf6=\xfc6\xf4\xcd\xc3=\xb7\xfd\x83\xa5>q\xf4\
-h\xca\xcd\xcd\xa5\xbf\xff\xf9G\xf4\x16X\xff\x81\xbc\x0f\
->\xf8 \x1d;b\x04\xcd\x99;\xb7\xd9\xfe\x10\x08\xd4\
-\x07\x84\x85\x85\x89\x22!x\x1b\xb3f\xcd\xa2\xe3\x8e?\
-^\x14\x1b\xa1\x07\x02\xcfcbb\xcc!\x85'0\x06\
-\x19d9\xb2\x07\x1e@H>\xd17\x1bj\xdd\xf3\x02\
-\xbc'\x00\xf54wg\x8d\xc8L\xba\xf5C \x00\x17\
-=\xd0\x0e\x02\xd0~$\x09v\xe1s\x8e\x88\xe1tC\
-s\xf1\xf3\xfe\x0a\xfc\x06-c\x7f\xc8\xb0a\xf4\xf2\xcb\
-/S~~>\x15\x16\x16\xd2\xeb\xaf\xbf.\xbc\x83\x10\
-\x8e\xaba\x99\xd1\xbdw-[\xfe\xef\xbf\xff\x9e\x0a\xf8\
-\xfd\x0f?\xfa\x88N;\xfdt\xd1w\x8f\xf7a\xc1\x91\
-\xc5\xff\xe9\xa7\x9fh\xc2\x84\x09b\xff\x91\xc7\x1d'\xaa\
-\xfcp\x8cl~\x1f\x02\x80\xde\x06\x1cW\x0b\x15\xf0\x9e\
-\xb8\x96|\x1cO!\x04\x00\xe3\x10\x0a=\x1b)x\xd6\
-\x9cz:X]\xdb\x8e\x02PWGO-\xafs\xff\
-G@\x00.\xbc\x9f\x8c\x10\x00'\x09\xe1j\xc3i\x8d\
-8\x1d\x81 m\x8b\x10\x0b\xb4F\x1d\x1c\xe2\x15b8\
-\x02\xb2\xf1gq\x8c\x8f\xe4[$\x13\x19dE\x1f~\
-l\x5c\x1c\xe5\xe5\xe5\xd1!\x87\x1c\xa2\x9eG\xb0\xb0\xe2\
-\x88\xebQ\x1f\x90\x99\x99I\xc7rhp\xee\xb9\xe7\x0a\
-a@\xa5\xa0\xf6\x9da\xe1\xe1\xe2;\xf0]\xa80\xec\
-\xd7\xaf\x9fx\x0e\x81x\xe7\x9dw\xe8\xf9\xe7\x9f\x17\xdf\
-\x07a\xf16\x82!\x00\xd7<\xe7\x99\x00\xa00\xa8\xa8\
-\x91flw#\x0c\xf0\x8e\x00\xd4\xd3v\x8eA\x0e\x9b\
-\xe6\xc1\x84\x1fV\x02\xd0\xe1H\xd1\xce\x08q\xe1s!\
-6\xcf}\xd2\xe8\xdd\xdd\x8f\xaf/\xc8\xfb\xd5W_\xd1\
-g\x9f}&\x12z\x0f=\xfc0]y\xe5\x95\xa2B\
-\x0f\xfd\xff\x1f\x7f\xf2\x89(\x04B\xd1\xcf\x03\x0f< \
-\xb6}\xf6\xd9\xe7b\xdb\x93O>E7\xdcp\x83\xe8\
-%\xb8\xf3\xce;\xe9\xc6\x9bn\x12\x15\x81\xd7\x5cs\x8d\
-\xc8\x13\xe0;\x90+\xc0k\xec\x07w\xff-\xf6\x00^\
-y\xe5\x15/\xfe\xfeP\x0b B\x10\x80+\x9et\xbd\
-\x10\xc8\x8e\x17\xf0hy\x1d5\xd6\xd5\xb6\x83\x00p\xec\
-\xf1gE\x8d{\xc9?[\x010(mF\x0a\xd7\x1b\
-h\xb0\x1d\x84\xe8\xf0:B\x9bC\xb5\xd8\x10\x00T\xf0\
-}\xc4\xee\xfc\xcbL\xcc_\x7f\xfb\x8d^{\xed5z\
-\xe2\xc9'\xe9\x95W_\x15\x19\xfa\xd3N;\x8d\xcea\
-K\x0f\xf7\x1d\x99\xfb{\xee\xb9\x87\xb2\xb2\xb2\x05\xc9\xef\
-a\x97\xff\x05\xde\x06\x82?\xcdB\x80$\xdf\xab\xbc?\
-\xac\xfc3\xfc>B\x0a\x8c1@\x86\x1f\xe4\x7f\x9b=\
-\x00$\xfc\xe0I\xe0\x1c\x1c!\xd4\xe6\xb9\xb3\x08\x81\x00\
-\x5c\xfa\x88W\x04`\x18\x1b\xe0\xad\xae&\x03\xbd!\x00\
-\x0d\xb5\xb5t\xd3\xc2:\xcf\x86\xfc\xaa\x02\x10\xcc\x02\xe0\
-V\xa3\x81\xf5ER\x06\x02\xe2\x08|\xb1%\xd0m\xa3\
-A\xcd\x05h!\x06\xe22np\xc6\xd002\x86\x85\
-\x931<\x82\x11I\xc6\x88h2F\xc6HD\xc5Z\
-\x9ec;>\xc3\xfb\x04\xf3\xf7\x05\xfb\x9c\x14V\xaf\xb5\
-FgE\x12\x7fA\x93F\xde\xcag\x9c%\x11\xb6#\
-~G\x9c?h\xd0 \xea\xdb\xb7/\x0d\x1f>\x5c\xb8\
-\xfeH\xd8\xf5\xee\xdd[l\xeb\xd5\xab\x17%$$\xd0\
-\x11G\x1c!2\xf9YYYb\xff>\xfc\xde\xe1\xbc\
-\x0d#\xfbz\xf4\xe8!>\x87\x90\x01\xef\xe7\xe4\xe4P\
-O\x06\xbe\x0b\xdfs\xf8\xe1\x87S\xbf\xfe\xfdE\x090\
-\x0a\x82\xdc!\xb7\xd3\x02\x80\x11\xa4^\x98-\x0b\x06\xf8\
-\x8fM5\xae%\x03=\x17\x80zZ\xb7\xb7\x9a\xfaL\
-1y.\x00\x17=\xe0\xa2\x00\xc8\x86/\xbaS\xa2\xe3\
-\xc9\xd0\xefH2\x1c{\x1e\x19N\xb9\x86\x94\xb3n\x93\
-\x130`\x88.\x86\xeab\xc8.b\xad\xeb^\x94I\
-\x97[\xde$e\xdc\xbb\xa4\xdc\xf1\xa1\x1c\x0b?\xea2\
-R\x8e=_\x0e\x01~\xf4GR\x9e\xf8UN(\x81\
-\x11\x89\xa8\xd4z\xa9\x90\x94W&\xc9\xa1\xc3\x18\xac\x84\
-\x09(^\x9d$\xb7\xe33\x8f\xfd$F+B,B\
-BC\xbcF\x1a\x8f\x1a\x97\x0f\x1al{\x03\xbfI\x13\
-\xec`\xb5G XK\xc8iaXH\x88\xf9s\x9a\
-\xc7'b\xfe`\x99\xe8\xb5\xf6\xf4\x1c%\xf3\xb4\xef\x87\
-\xe0 G \x8e\x1f\x16\xe6u\x84\xb0\xd10`n\x85\
-\x02\xefL\x1bv\xcb\xa2:j\xa8\xa9iC\x01`\xb5\
-\xf9~C\x8d\xe8\x8a\xf0\xe8\xe4q\x01.yXXh\
-g]+i\xfd\x98\xfc\x980\x02\xb3\xbe`\x22\x8d\x7f\
-\x1b,C\x8a\x9d\x9d\xf8\xa3\x84\xe4\xec0\x88\xc5J\xdc\
-\x9c\x14\xa4\x88\xc4d\x1e\x86CN\x1475\xf0\xc8\x15\
-\xe6\x18a\xfe\x890\x15\xa1V\x8f\xa1v^\x87\xd9\x81\
-\xa3\xed\xf6>\xe7\xecg\xddA(\x04\x00\xc3\xdc\xf3\xbd\
-#\x00\xfd\xd8\x10o\xd8W\xed|\x18\xe0\xa9\x00\xd4\xb1\
-\xda\x5c\xbb\xa0\xce\xf3\x19\x7fD\x1d\xc0#\xc2%r\xd5\
-\x852`\xd2\x8d|\xf7\xe7Y\x13\x04\xc6L8\x9e\xc6\
-b\xd8w\xec\xe3R\x00\xfc\x90,\xbel\xc8\x1d\x0a\xdc\
-\xaeZ\xfeL\xb8|D\x0f\x82\xf9\xb5\x0d\xc2m\x9e;\
-\x80\x10\x80\xd3o\xf0\xde\xec\xc1\xf9\x8d\xf4\xf3\xc6j\xe7\
-\xc3\x00\xcf\x04\xa0\x9e\xd6{\xc3\xfd\xd7\xc8\xc3\xae\xba\xab\
-\xe4\x09A%\x15\xdczO\xbaQ\xb0/\xaa\xb1.z\
-\xd03\x01\xc0\xf7\xdc\xff%\xbb\x90\xa1\x9d\x9cD\x1aA\
-\x82\x9b\x93\xc4\x96\x04\xb8\x8f\xc1F&]H\xb3mr\
-{\xa8c\x02\x89\xcfI\x97>T\xfb\x1c\xb6\xc1\x8d\x17\
-\x8f\xc1\x8e\xf7\x85\xf1\xe0\xf3\x09\x8e\x8a\xb1\xec\xcb\x08A\
->\x87=\xca\xe0\x88(\xbb\xc7\x0eW\xf7\x0d\x8eM\xa0\
-\xa0\xac\xfe\x14\x1c\x97 \x8e\x19n\xf3\x19g\x11\xc6\xbf\
-\xd1\x80In&6zm\xf6\xe0[\x16\xd6:\x1f\x06\
-x$\x00\xac2\xbf\xb1\xda@u<>q\x90\x87]\
-p\x08\x80+\x8d\x0d\xc9?\xe1\xbe{*\x00\xf7}!\
-\xe7\xba\xf3T\x00\x9e\xfd[6\x1e\xa7H\x12\xee\xd8z\
-\x04\x18\xc2m\x88\x19\x1c\x15KA}\x0f\xa7\xa0\xec\x01\
-\x22T\x0b\x0f\x0fk\xde\xf8\xc3\x98H\xd1qd\x186\
-Z|\x0e\x82\x1e\x8e}\xe3\xbb\x0aR\x18\xce\xb8\x99\x8c\
-\xc9\xe9B\x1c\x9a\xed\xab\x92\xd0\x80\x5c\x0f\xdf\xff\xa0\x8c\
-\xbe\xe2s \xb0\x01\x13q>\xf2\x1d\x19\x8e9\x97I\
-\x1e\xd6\xec\xd8\xf8\x9c\x113E\xc1\xeb{\xb9\x98\x0c#\
-/b\x11\x08\x11\x82\x85}\xc4\x9c\x14\xf7|J\xc6\xd4\
-\x9eB\xc0\x9a\xed\xdb\xbd\xa7\xcc\x11\xfd\xb4C|GH\
-D\xa4K\xa4o&\x00\x98.\xee?\xef\x09\xc0\x90\xd2\
-\x06\xda\xbc\xafJ\xac\xc4\xe5S\x010\xb1\xca\xdc\xb5\xb8\
-\xd6;\x13~\x82<W=\xc3\x846\x9a\x1b\x91Cb\
-X=\x87\xfa{TK\xad\x1d\x1b\x13cb.\xbf|\
-\x0f\xbf\xe7\xf5\xa9\x14\x1c\x13\xcf\xe7\x16\xe6\x14i\xc2\xdd\
-\xb0\x1a\xfe\x0e\xd1\xa8O\xb8LNl\xfa\xcd\x062\x9c\
-z\x9dJD\xab\xcf\x81\xe8L`!\xde\x7f\xd5\x8a\x84\
-jp\x5cW\xb9/\xa6y\x9bP%\xef\xc5\x0b\xf9d\
-L\xcbSE B\x00m\xc3\xc8\x22!\x92\xb7\x98h\
-\xb5\x98\xc8p\xde\xdd\x14\xca\xe1\xa0\xb1G/qLl\
-\xc3\xf1\x11_\x9b\x8f\x1d\x11!\x8ek\x8cO\x22\xe5\xb1\
-\x9f-\xf9\x9f[\xdf\x12^\x83\x10\x80sn\xb7\xe4u\
-^\xcc\x17d\x0f\x87\x80a_\xfe\x8e\xe0\xd8.B\x5c\
-\xccy\x1f\xfe\x1e!\x00x\xdf\x1d\xe0\x98\xc7_,\xe7\
-\xb9\xf4R\x18\x10U\xd0H\xf9\x9b\xab\x9c\x0b\x03\xdc\x16\
-\x00V\x97\x1d\x95Ut\xc4\xb4z\xef\x09\xc0\xb5\xcf\x0b\
-\xb7\xcf\x95\xc6&&gDC\xf0T\x000;\xee\xd9\
-\xb7{&\x00\xf0\x1e\xde\x9b\xcb\x16,I4\xb4\xb6'\
-_\x84\xd5c\x0b\x88\xf0-\x04\x91\x8e:S\xcex\x8c\
-k\xf2\xdb>2\x8c\xbeRXY\x8dH!\xe1\x912\
-t\x83\xe5+\x92D\x0fao@\x10\x94\xad\xbe\xf2\xee\
-\x1c\xcbd\xb0\xcf\xfc\xcdnyw\xf1^\x04\xef\x0f\xc2\
-\x89\x9e\x1c\xed\x9a\xff\xbc\x8b\x82\x86\x1c\xcfDe\x0f\x80\
-\xc5W\xb9\xefKK\xf2W\x1c\xfb\x0aql\xec\x0b/\
-C\xf4\x08\xc1\xe5\xce\xd7\xf6\x1d%\xf6\x15\xc7\xce\xe8#\
-'\x90\xd5\xf6\x7f\xfcW\x0aN\xe8\xc6\xef\xc9D\xa9\x01\
-\xd3\x84#\xd1\x9c\xaf&}\x8f:K\xec\x8b\xefv\x06\
-\xe1\xb6\xafq\xadF\x9coI^{\xc9\x0bx\xa2\xbc\
-\x86\x1akk|)\x00u4}k\x95\xf7\x96\xf9\xc6\
-\xcd\xbe\xfe%\x11\xd3\xb9.\x00_4\x15\x00W\xa7\x07\
-\x87\xb5@/\x02\xdc\xc9\x02g\x16{P\xe7\xbf\xb7\x05\
-\xf6\xfdd\x09\x05\xa3\xb1j\x16\xa7\x0d`\xdd\xb8\xc2\xed\
-<os\xc0R\x82\x88\x9a\x95\xc5u\xf9_\x85 \x9a\
-\xc8\x0b0a\x84\x9b\x8e\xa9\xd0q\x8dY(\x0c\xa3.\
-\x13\xeev\x84\x10\x90\x10\xe1\x96\x8b)\xd2\xb5\xfb\x00W\
-\x9b\xc3\x8a\xb0\xe0 \xfe\xec\xa5r&hl\x87\x07p\
-\xf9cL\xecp\xf9\xbbAb\xb8\xf7\xe8\xae-\xb0:\
-6{\x15\xa1A\x8a \xac\xf0L\xb4{{\xf5\xb3\x14\
-\x1a\x1e\xae\x9e{\xa4<7\xcc\xf3\x0f\xf1\xd2>\xc3\xe1\
-!<\x0eAT\xcc<\xad\x9d\xd3-o\xb2\x18E\xc9\
-}##\xdd\x02\xc4#\xe8\xe8\xb3\xe5lX^\x14\x80\
-\x93\xca\xeai\xff\x01'\xc2\x00\xb7\x05\xa0\xae\x86\xde^\
-Y\xed\xbd\x93FC\xb9\xf15\xe1\x8a\xb9\xd2\xf0\xa1\xca\
-b\xcan\xdc\x10L\x13\x8eF\x85\x1b\x8c\xf9\xf41\x97\
->\xdcA,.\xf1\xd9rR>Z,\x17\x94\xc0b\
-\x12\xe8\xc7\xc7\x5c\xf9\xe8\xc3\x7f\xeaOR\xce\xe7\xf8\x7f\
-\xd8I\xb2\xd1b\xde|\xcc\x9f\x8f\xf70U8\x16\x9c\
-@\xdf\xff\xdb3Iy\x7f\x9e\x9c\xcf\x1d\xdf\xf7\x7f\xeb\
-H\xf9n\xb3\x9c\x86\x1c]\x90\x98\xe7\xff\xb3e\x14\x9c\
-\x92\xc9$\x08k\x1f\xf2\xb5\x09\x22[\x06\x1a6[\xcc\
-\xa0\xdc\xa1M\xad\xe9\xbb\xb3)\x88]\xf4 L\x7f\x8e\
-)\xdb\xb5\xed\xf7|\xc6\xd6?\xd6B$\xdcWXy\
-\xcc\x06\xfd\x9fj\xa9A\x10~m\x184\xa2\xe9w\xb2\
-;\x1e\x12\x97\xd0\x84\x84\xe2\xd8\xbd\x0f\x95\x8b\x89\x14X\
-<31\x15;\xee\x9f\xd9\xba\xffB\xc1]\x92y\xdf\
-p\x0b)\xe1aDF\xcbu\x114c\x02\x91A\xbd\
-\x07\xa6\xf0\xd6\xf6\xe5v\x11\x9c\xd4C\x88\x1d\xc6$\xb8\
-\x8b\x08\x08\xc0\x11cd\xdb\xf1\xe2:\x19i%&Z\
-\xb2\xf3`\xeba\x80\xbb\x02PSUE\x97\xcf\xad\xf5\
-\xde\x82\x1f\x85RQCCB\x5cj\x8c\xc8\xe0*w\
-},\xbfC[`\x03d\xd4\x16\xd5\xc0\x0a,\x10\x02\
-\x10\x15\x8d\x0e\x82\x80\x15g\xfeo\xad\x14\x06,\xae\x81\
-\xe7H\x08aQ\x0b\xbc\x87\xcfa\x9f\x1fw\xc8u\x06\
- (Xw\x00V\x07\xb1)bV\xdc04J\xb8\
-nh ZC\xe5\xef2v\xcf\x11\x0d\xc3\x96\x14\x96\
-F\x16\xe9\xb6\xc5\xf07DZ=\xda\x02\xd6\x0d\x85Y\
-\xe2^hV\xf3\xf9\x89B\x08\xccDba5\xa6f\
-\x0b\xc1lB\x0c&ep\x5c\xa2\x8c\xb75\xaf\x0c\x02\
-\x8f\xfb\xa2\xb9\xfe,\xc8\xc6\xb4\xdcf\xfb\x9a\x8f}\xc4\
-\x19\xb2\x0dh\x96\x1c\xd6[\xf3\xd4\xde\x99E\xc6\xf4\xde\
-\x14\x11\xd6|_q\xec\x84\x146\x02\x13,I\xe1\x02\
-+/\xf2\xd3r\x0a\xea5\x94\xf7\x0du\x83\xf4QM\
-\x80\xef\x08\xc2\xf4\xf6\xf08\xbc(\x00\xa8\xcb\xf9n\x1d\
-{\x00\xad\x8d\x0dpK\x00\xd8\xad\xa8\xd8{\x90\x06M\
-m\xf0\xae\x00\xdc\xf6\xae \xb4+\x0d0\x94/\xa0r\
-\xe7G\xce\x85\x00\x8eB\x82\x22\x19g\x8a%\x9e&\xba\
-\xb8\xee\x9b\xedz\x06,\x1ehX\x91V\x96!\xc2\x03\
-\x0b\xe1\x925i\xa3\xe3\xb8\x02$\xec\x0c\x17\xde'\x97\
-\x09\xb3\xbd\xb6\xff\xdb$\xbc\x01Xl\x8c\xf2kB\x0e\
-~\x0db#\x01(\xacw\x81\xcd\xbd\xe5\xeb,\xe2~\
-m_;\x10\xc7\x161\xbb\xa9\xe9\xbe,\xd2A\x83F\
-J\x02;\xd8W\x1c\xbb\xd7\x10\xe9E\xe4[\x1d\x9b\xbd\
-\xbd \xf6$Z:\xaeK\xe0\xe3\x04\x0d\x1b-\x0d\x8b\
-\x97\x17\x13\xbdgq\x0d5\xd4T\xfb@\x00\xea\xeah\
-\xea\x96\x83\x14_\xd8\xe8\xdd\x10\xe0\x8e\x0fE\xf7\x8eK\
-\x0d\x0c\x1e\x807\xba\x01\x9f\xfbW.:\xe2I6\x16\
-\x0d\xe4\xfb-d\xcc\xea\xd7D\x00<C\x94]\xcba\
-M\x14\xf3\xa3?\x02Cv\x91\x0f@yuA\xd3\xa5\
-\xd2 \x0c R\x94\x83}\xb1\x1d.\xb2\xe1\x84\xcb\x9b\
-\xba\xc8\xb8\xce\x97\x8d\x17\xf9\x84(\xf5sv\x11\x19!\
-\xf21\xca\x07\xf3\x9bZ\xf2\xdb\xde\x16I\xc1\x16\xf7\x85\
-\x80\xf0\xf7+7\xbc\xdct_\xfe.#\x87x\x91\xec\
-%\xb4\xb6\xbf3\x10\x020t\x94\xf4\x5c\xbd,\x00\xa3\
-f\xd4\xd1\xde\xca\x83-\xe7\x01\xdc\x12\x80\xda\x1az\x7f\
-U\x15\x19\xbcy\xc2j1N\x98\x1d\x97\xcc!1\xa2\
-d\xb1\x86\xa73\xaah]>\xca\xe8+\xd9R5x\
-&\x00?l'c\xcfA\xa2\x81\xf8\x82PQV\x8f\
-Qv\xb6\xd9~\xd6\x1f\x10\x1eb\x94\xe5\xae\xd6\xd7\x8a\
-C'\xc3\x98\x9b\x84\xab\xde\xd2\xbeB\x00\xb0\x0a\xd4\x84\
-\xea\xa6\xd7Y\xc4\xe0i|\x9d#\x1c\xec\x1b-\xc8e\
-\xcc=D\x86x\xf9MW\x9d\x0a:\xf2\x0c\xe1\x01`\
-\xbao|\xb6\xc9ct\xb4\x10p\xdcG\xb1 \xa9\xad\
-\x07x\xef\xe7\x14\x12\x9b\xc0\x9f\x8f4\x7f\xdemp;\
-1\x0e\x1eiIxz\x91S\x19%&*\xdfy\xa0\
-\xe5<\x80;\x02P\xc7\xf1\xff\xcd\x0bj\xbc\xbb\xe0\xa7\
-Z\x8c\x83>qW\xc8\x00\x0b\x22\x06\xf6x*\x00H\
-\xf4\xa1 \xe3\x9f:\xcf\x04\x80cN4:oY\x08\
-\xdf \xda9D{\x0e\x104\x98\xe3t\x91x-\xb0\
-\xb9V_\xad\xa1\xa0~G\x0a\xa2\xda\xdd\x1f\x16\x1cE\
-7\xda\xbeZ\xd8\xa6\xed\x7f\xfb{\x14\x1a\x1d+\x7f\x93\
-\xed\xbeL\xce\x10\xc4\xf1X\xe7\xb1\xc0N\xe8\xf7\xf9J\
-2\xf6;B\x1c;\xdaj\xbfh\xeb}1\x18L\xdb\
-W\x08\x90\x9a\xe7A\xde\xe7\xaa\xa7)\x8c\x8dPtt\
-\x94\xd8\xc7]\x08\x01\x18p\x8c\xcc1yY\x00\xc2\x0b\
-\x1a\xe9\xcf\x0d\x07Z\xce\x03\xb8,\x00\xecN\xec\xde\x7f\
-\x80FN\xaf\xf3\xbe\x00<\xf0\x7f,\x00\x11\xaeY\x17\
-\x08\x80\xa7S*a_\xf4\x0a\xa0{\x09\x89&O\x04\
-\xe0\xe7\xddd\xec3\x5c\x0a@tt\x87B\x8b\x0d\xd9\
-\xde6\x10\xa9K\x92\x5c\x85X#\x12\x12\xa7\x80F\xc4\
-7J\x85@D\xb1P4\xd9\x9f\xefm(B\x07t\
-\xf1j\xc4EB\x16+\x1d#\xe9*\xba\x0fk\xc9p\
-\xf68\xd1\xe5j{l\x90S\xacl\xac\x91\x16\xc9\xe0\
-\xeb_\x96\x8b\xc6j\xc7~s:\x05\xa7\xe7\x09\xa1i\
-\xbao\xb4\x5c\x19\xd9\xea\x9e\x8a\xa5\xc0\x9f\xfb\xc7\xf2;\
-\xd8e\xc7\x18\x94\x08q\xec\x98\xd6\x11c\x1f86\x84\
-\xa8I\xd7\xa4\x17\xf1\xe2\xb2*jl)\x0f\xe0\xba\x00\
-\xd4\xd1\xb2\x1d\x07(\xb3\xa4\xc1\xbb'\xab\x16\xe3\x84E\
-\xb8\xe6V\xa1\xdf\xd7\x80u\xdd\x0b=,\xe0\xc1*\xc1\
-Xt\xd4\x93ll\xbe\xac>3\xb2U\x83\xb2{b\
-\x19:\x02\xc2\xd8\x8b\x10\xa4\xd3zH@\x5c\xc4\xd4 \
-\xa6VL\x83k?\xfe\x07\x0a\x8d\xef*\xad\xa9J\x0c\
-t\xf3\x1a0\x9c[\x13\x0b~4\x5c\xf4 \x19\x93z\
-\xc8\x15\x9c5\x22~\xbf\x95\x82\x0e9Q\x08\xae\xb6/\
-H)*\x11\xb5Z\x01\x0e\xeb\x0c\x17\xde/\x12\xcc\x08\
-;\x94?\xab\xac\x8e\xfd#\x85\xb2H\x89s\xe6}\xf1\
-=A#.\xb0\xaa3h$\xc3\x15O\xc8\xd2\xe3\xac\
-~\xb2+\xd8\xaa\xbe\xc08\xf0X) 1\x8eI\x1e\
-\xa3\xc2\xf6\xb5\xd8\xc6\xe1,\x0c\x86\xb9\xbe\xc0\xcby\x80\
-+\xe6\xd6P\xcd\xc1\x83\xd4\xe8(\x0f\xe0\xb2\x00\xb0;\
-1q\xe3\x01Qn\xe8u\x01\xe0\x86\x10\x1e\xe9\x9aK\
-\x858\xce\xe0\xe9\x9cj\xd8\xf7\xad2RP|\xa2\x15\
-\x80\xb8\x02k\x01`W\x0e.]3\x8b\xe6\x8c\x95h\
-\xc5Z\x04\x12@$Q\xe2\xaa\x15\xfb\x800\x0f}C\
-\xa1q\x89\xd2\xb2\xa3\xe7F\xbbf\xff\x9a\x04\xd9\xd1\xad\
-\x0bR\xe0\xda\x81\xd4\xa2\xbeB\xbb\xc6\xc8\x0f\xc5v\x91\
-.s\xce`R>^\xd2\xa4+1$%]\x0a\x08\
-{\x1d\xc1\xd9\x03d\x9d\x86\xf6\xfe\xc3\xdf\xf1q\x13(\
-\x86\xdf\x17\xa2\xa4U \xaa\xa2\x04q\x10\xc7\xe6\xfb\x14\
-\x9a\xc8\xae\xffkS,\x05LO\xfc\xc6\x02\x91,\xde\
-\x13\xc7\x86\xb5\xc6X\x01m\x889\xbf\x8f\xf3\x8a\xb1!\
-\xb6\xb3\x10\xe7\x9bw\x88\xf4n| \x00GN\xab\xa3\
-\x1d{+\xbd'\x00p'\xde_y\xd0\xbb\x09@\x8d\
-\x84\x8f\xff\x22n\x90+$Aw\x8d\x01\xa5\x9d\xb6\x83\
-xDu\x9eIf\xf5am`I\xe0\xde\x83\xe0Z\
-\xbd\xc0\x1f\x95\xb2f\x00@Q\x10\x0aEP\xec\xf1\xc3\
-v\xd9\xf8\x04v\xc8A\x1f\xe8O\x86+\x88>m\xa8\
-\xf5\xaf\xea~\xa26\xa0Z~/\x8e\xf1\xfb~\x91\xd4\
-\x89n\xc5*\xb8\x82\x18;\x8f\x8e,\x8a_\x00DJ\
-H\x96a\x95F\xa4\x97\x8b)$5[4x\xb8\xf7\
-!]Se\xf5e\x81\xa5o=\x84\xe3}A\xd2X\
-\x16\x88\xa7'X\xf6E\x99pJ\x86\xd8\x0f\x0bq\x08\
-+\x8d\xbes\xb6\xc0\x9a\xf0c\xe0\x10\x08\x8a\xe4\x9da\
-\xec\xe3\x96z\xfe\xf7\xe6Ppf_q\x5c\xec+\xce\
-\x8d\x09-\x16\xe3\xd0\xba\x80\xd9\xaa\x0b/\x00\xee8\x0a\
-\x8d\xd06\xb0\xfd\xfdyBL\xcc\xfb2 N\x22i\
-\x87\xeeA\x8c#\xf8t\x19\x85t\xcb\xe0\xdf\x1dm\xfe\
-\x8cK\xe0\xdf\x1b\x8c\xeeF\xb43\x1f\x84\x00\x19\xec\xa9\
-/\xdd^)z\xee<\x16\x00\xa8H}\xd5A\xbag\
-a\x95w\xe3\x7fM\x00\x9e\xfa\x83\xc2\xa3\x9b6nG\
-D\xd0\x80$\x8e\x013\xfeL\x94q\x99 (\x88\xfb\
-\xedFR\xbe\x5c%o\xd4\x07\x0b\xa4\xeb\x86j>\xc4\
-\x90Z\x05 *\xfe\xd0\x08Qlr\xd5\xd3\xa4\xe4\x1d\
-*F\x81\x89Y\x81\xf0\x1eb>T\x80iU\x80\xe8\
-N\xc2J\xae\xb0.(\x18B\x03Dl\xf9\xeb\x1e)\
-&\x10\x18\x16\x04\xe3\xd0Q\xa21\xb5-\xf1b\xad\x1e\
-[@\xac\x83m\xde\x04\x1a5\xac4D\xb3H\x8d\xb5\
-{\x0e\x12\xee\xae\xf6\x19!\x02\xdd2e\xf7\xa0ZW\
-\x8f\xd0)\x86\xc9\x06\x8b*fX*\x94\x05;\xc19\
-\x83\x9a\x90P\x8a@\x84,\xa1\xfd|\xa5\x10\xe0\xa0\x93\
-\xae\x14\xd7\x1c\xee\xb8\x98\x1f\x02\xc2\xfc\xeel2\xf6?\
-Jl\x8bU\xf7\x8bU\xcf/49\x8d\xbd\x90\x0f\xf9\
->n \xc3e\xe3)\x82\x85\x01\xe2\x10\x92\xd1[\xce\
-\x00\xf5\xfcDq>\xd1\xea\xbe\xd6\x10\x22\xc0\xdf\x8b\xa4\
-u\xd0\x89c)\x92\xf7\xb3\xfd\x8c\xb3\x90\xd7j\x90,\
-p\xf2\x81\x00D\xb3\xa7^\xb0\xb1R\xf4\xdcyE\x00\
-\x0eT\x1e\xa0\xb3g\xd5\xf8F\x00\x9e\xf9\x9b\x05 \xd6\
-\xa5F/\x04\xe0\xd2\x87\xa5\x9a\xff\xa7Z{\x0d\xff4\
-X\xac\xbf\x06\xeb\xf7\xffU=\x84|\xa9\xf6\x0a\x86\x82\
-Zw\xc7\xb8\x1a\x06\xa8\xd9b\xe3\xb0\xd1R\x00bc\
-\xfd\x12\xe6\xc6gM\x0a\x9b\xed.5b\xdbm|o\
-\xc2\xe0\x01\xdc\xf8\x9ap\xdd\x83\xb3\xfa\xdb%R\x0c\x12\
-}\x89\xdd\xd8\xfd\xbf[\x84\x00a]\xba\xf2\xf6\x18\xe1\
-\xca\x87\xa4\xe5\x8a\xaeCM8\xec\x1d7\x8a\xb7\x07\xf7\
-\x1cHA\x87\x9fF\xe1\xf1\x89\xe6s\x09gw\xdf8\
-\xe48\x0a\xe9\xd1K|\xa6\xf9\xbeq\x82\xec\xe1\xeci\
-\x84\xa4\xf5\xa2\x88\x988\xf57\xc4\xc9\xdc\x05{\x03a\
-\xc8I\xf0\xf9a[\x13\xc4I\xe0\xbd\x085\x11-\xbe\
-3.\xce=\xb0\xe7\x10\x92\xdd_V\xaa\xfa@\x00\xb0\
-F\xe7'+\x0f8N\x04\xba&\x00u\xb4u\xcf~\
-:\xb4\xb4\xce7\x02\xc0\xca\x1b\xae\xde\x0cg\x01\xb7\xcf\
-p\xd1\x03\x9e\xcf\xe4\x83q\x02\xe8o\x86[\xef\xc9\x8d\
-\xe0P\xc08\xfc\x14\x8a\xb1\xd3\xe0=A\x8c\x17\xbf\xcb\
-5\xc4\xb9\x0en\xd8\x10\xe8\x08\x0e\xe7\x00\x90\xcd\x11\x01\
-bbe&<J\x15L\xf3v\x91 \x0boq_\
-\x8d@\xf0\x1a\x9a\x90P\xb5\xac\xb1\xeaz\x01-\xef\xdf\
-\xfc3qq\xf8\xae\xd6I\x1dg\x05\xebm\xb6\xef9\
-\xfa\x9c\x00\xd6#\xe0\x10Ex\xac>\x10\x00\xf0\xf4\x91\
-\xc5\x07\x85\xe7n7\x0f\xe0\x92\x00\xd4\xd5R\xf9\xf6\xfd\
-\xde\xef\x01\xd0\x04\x80\xddm\xa8\xb2+\x0dT\x08\x00\xb2\
-\xc5\x9e\x0a\xc0'\xe5,\x00g{\x9e\x8d\xfd\xab\x96\x8c\
-G\x9c.\x1be\x9c}\xeb\xd1\x91a\xaf\x91\xb7\xf49\
-{\x04\x89\xeb0\x88\xb7\xf3\xda\x06,\x80\x22\xec@\xee\
-\xc9G\x020vN5UUVzA\x008\x8e\x98\
-\xbci?\xc5\x15\x9a|#\x00\xaf\x94\x08\xf7\xcd\x15\x97\
-*\x1a\x02p\xce\x1d\x9e\x8f\xe3\xc7\x083\x0c\x15\xf54\
-\x1b\xfbw\x1d\x19\xf9{\xcc\x02\xe0$Y\xdci\xf8\xb1\
-\x01O\x8ax\xe7\x10\xdf\x81\xc1\x9eFhzn\xd3j\
-Eo\x97\x04O\xaf\xa5\xdd{\xf7\x0b\x0f\xde3\x01\xe0\
-8\xe2\xa75\xfb)4\xbf\xd17\x02\xf0\xfaT\x8e\xe5\
-\xba\xdau\xa9\x1c\x11\x05\xae\xb6\xc7\xb3\xaab_\x8c\x0a\
-D/\xc0O\x1efc\xffa\x018\xf6\x5c!\x00\x9e\
-\x91\xc4\x0d\x044\x19\x1c]\x8bX\x89X\x0d1M\x11\
-\x03D7\x05\xbb\xff\x1ab\xcd`A\x8ej\x8e\x18\x81\
-\x08\xd1\x8e\xec!\xda\xfc\x18i\x83\xa6\x9f\xc3w\xe1|\
-\xe2\xf9\xb7\xb8\x04\xfe\x8d\xa1=rd\xfb+\xf0\x8d\x00\
-\x0c\x9cRG\x1bv\xeec\x0f\xdeC\x010U\x1f\xa4\
-w\x97Wz\xff$'Z*\xb3\xc2\x13\x92\x5c\x22\x07\
-.~\xd0\xe97zvlu\x84\x98\x10\x80\x1f\xb6{\
-(\x00\xf5\x144\xf2\x02\xd9 \xfc\x84\x5c\xf1v^\xc7\
-[m\x8f\xf7\x10q6\x0dZ\x10\x0f\xc4\xd2\x88\x83\x9a\
-ym\xacBt\x0cE\xc6\xc4R\x04\x87z\x11q]\
-(\x22>\x81\xc2\xbbt\xe5\xfb\x9eL\xe1]\xbbQX\
-Rw\x0aKN\xa3\xb0\x94t\x0aK\xcd\xa4\xd0\xee\xd9\
-\x14\x9a\xd6\x8bB\xd9M\x0e\xcd\xeaK!\x98c0g\
-\x10\x85\xe4\x0e\xa1\x90\xbca\x14\xdcg8\x05\xf7;\x82\
-\x82\x07\x1eC\xc1\x83GR\xf0\xd0Q\x22\x09\x8b<\x8c\
-\xf1\xf0\xd3\xd9\x1b;\x93\x8c\xc7\x9cC\xc6\x11\xe7S\xd0\
-\xf1\x17S\xd0\x09\x97Q\xd0IWP\xd0)\xd7P\xd0\
-i\xd7S\xd0\x197Q\xd0Y\xb7Q\xd09\xb7\x8bi\
-\xc5\x0c\x17\xdc+rJ\x18E\x88\xde\x01t)\x0a\x5c\
-\xf9\x14\x19\xaez\xc6\x02\xbc\xc6v|\xee\xbc\xbbD/\
-DH\xcf\x81\x22\x8f\x11\xdf\xa5\x8b\xf3`\xe1\x0b\xe3\xdf\
-h\x9e\xe3\xc0\x07\xdcJ/n\xa0\xc5[Y\x00jk\
-\xdd\x17\x00\xd1\x05x\xf0\x00=\xb6\xf8\x80\xf7\x13\x80V\
-\xe3\xbb\xc3\x13S$\xd1\x9dl\xdcPp\xdcL\x8ff\
-U\x05\xe1\x11\x83A\x00<\xed\x8e\xf9\xb7A44\x10\
- \xde\x0b\xe4\xf2>\xba\xb8\x07'\x1a3\xee[8\x13\
-\xd8x\xc4\x18\x0a\x1as#\x19.~P\x14i\x190\
-V\xe3\xae\x8fH\xb9\xff+R\x1e\xf9^N\xa8\x89\x09\
-W\xb4\xc9VPx\xc3\xe2\x8f.?\xd1\x1b\xf3\xe1B\
-9\x08\x07\xdd\xad_\xac\x92\xf36\xe0\xfe Q\xf6\xbf\
-\xcd\xea\x5c\x0d\xdbe7#\xba}\xc5|\x0d\xfbd\x0f\
-\x0e\xba\xff\xd0\x1d\xac\xd5fX\xcf\xdb`=w\x83u\
-{\xc9wr\x1d\x89\x22;(\xb6z\xce\xbf\x09\x82\xd6\
-\x85\xaf\x85-\xe2\xedl\x13\xe0{\x12\x86\xee\xd0O\x97\
-\xf9L\x00\xbap\xc8>u\xd3^1\x87\xa7G\x02P\
-]\xb9\x9fn\x9ew\xd0w\x02\xf0\xde\x1c\xb6\x02\xa9\xc2\
-\x8a8\xdb\xa0A\xb4\xa0\xd1WX*\xbbZ\x9a\xfe\xab\
-\xa5E=\xbe\xdb\x22s\x00\xf0\x00\x8a\x5cX\x10\xc4\xf6\
-\xbb\xd1\xf52\xeaR\xe1v\xbad\x09\x02\x1ch\xcc\xe8\
-\x1aS\xc6>a\x09\xe94\x82x\x0bEN\xc0\xd1\xfd\
-)\xb0\x9a\xd4\xc3\xbaX\xacI\xa1X\x9d\x9c\xec\x05\xe2\
-\xf1\xc7A)(\xbfZM.\x03\xe1\xc1d1\xf0\x16\
-?_.\x85\x0a\x03\x95 d\x0f\xfc\x1f\x05\x1dw!\
-E\xc7\xc6\xf1\xb5Hh\x8a\x84\x16\xc0\xd7-\xac[\x86\
-\xa5\xb2\xd1\x07\x02\x10\xc1!\xfb\x9fk\xf7\xb1\x07_\xe5\
-\x99\x00\x1c\xd8\xb7\x8f.\x9aU\xe5;\x01\xf8`>\xbb\
-\x7f=$\xb9\x9dlx Z\xd0\xa8Kd}7*\
-\xf5P\x9c\x03\x8b\x81rM\xdc \x16\x15Q\xe6\xfbz\
-\xa9\x5c\xca\xeb\xe5\x22y\xc3P\xe4\x83j3\x14\xfc<\
-\xfe\x8b\x5c\x22\x0cCGa\xad0\x00\x05\xb3\x0ca\x9e\
-\x81\xdb\xde\x96\xd3Ca\xc0\x11JHQv\x8c\xcaC\
-\xac\x22\x84Gv\x07\xc5\xf6[\xde\x923\x0b\xbf;G\
-\xb8\x99p\x83\xbb\xd8!\x89\xb55\x88w`\x19\x1cZ\
-\x0b\xbf\x85l\xe8\xe8\xc37\x1e:ZN\xb0\x8ab+\
-Q@U&g\x00\x02`\xdd1\xd9\xa7\xf6\xfa\x9d\x99\
-\x92@oN\x93\x9f\xc5<~\xaf\x94\xc8\xe2+q\x8f\
-\xfe\x95\x9e\x02F\xe5=\xfe\xab,\x1az\xf8;Y\xc5\
-\x87\x89?Q\xb4\x85\x92\xe2q\xef\x91\xe1\xd6\xb7\xc8p\
-\xd3kd\xb8\xfee2\x5c\xfb<\xbb\xe9OK\x17\xfd\
-\xd2G\x84K\x1ft\xfe=\x14t\xee\x1d\xec\xee\xdf*\
-\xbc\x93\xa0S\xafe\xb7\xfd*2\xf2\xbd2\xb2\xc7f\
-\x1cq\x1e\x19\x8f>K\xf4\xe0\x04\x0f?\x99\x82\x0f9\
-A\x84\x14!\x03\x8f\xa6\x90\xbe\x87s\xb8q\x08\x85r\
-\xe8\x11\x9a\xdd\x8f\xc2\xd2\xf3\x84\xdb\x1e\x9e\x92F\x11\xec\
-\xb1F\xb2\xd5\x17K\x943Z$\xbb\x1d$\xf0\xf5\xc3\
-\xf7\x88\xb6\xea#\x010\xb2\xb7\xf3\xe5\xca}\xd4\x80\xae\
-@w\x05\xc0TWG\xbb\xf7\xec\xa5\x93g\xd4\xf8N\
-\x00>Z,b?\xb8E\x8e\x1a\x9b-i\xe2b\xa2\
-\xc8\x88i\xa7\xd0x0\x82\x0bs\xfb\xa3\x12\x0c^\x01\
-\xa6\xf8\xc2\xc0\x0e\xbc\x8f\xc7\xe3.\x92\xdb\xb0\x0e \x86\
-\xfeb\xfc?&\x01\xc1\xe7O\xe4\xcf\xa7d\xc9\xd7\x1c\
-\xd3\x89\xefA}\x01f\x94\xb9\xecQI\xf8\xab\x9f\x91\
-\x03Yp\x1c\x10\x1e\xa2\x81\x86\x88\xcaA\x08\xca[\xec\
-\xc6~\xb3QT\x87I\x01HhB\x10\xfb\xaf\x9d@\
-B\xe0\x00\x89\xba(\x14h\xc5'29\x92)\x82\xe3\
-\xfa\x08\xf6\xea\x00\x84\x07\x11I\xa9\xe6\xd7\xe2=&\x90\
-D2E&$Qd\x97\xae\x8cDA\xaa\xc8\xb8.\
-\x14\x15\x17OQlU%b\x99h\x1a\xd4\xaaP\xb5\
-\x82\x0f\xfd\xfe\x1abm\x10g\x0f1\xd1\x14o\x0b$\
-\xf1\x18]\x04b\xa9K\x9c\x06\xb6\xea\xf1\x12\x09\xdc6\
-\x13\xba\xc4\x0b\xe2\x0a\x80\xc4\x1e\x22\x82\x8d\x9ey\xae\xc2\
-\x89\xbe\xc1\x9b\xe5\xfbE\x08\xdf\xac+\xd0y\x01\xa8\xa5\
-m\xbb\xf6\xd0Q\xa5\xb5\xbe\x13\x00\xb6\xdap\x87\xa4\x00\
-8G\x08\xdc8$z\x84\xdb\x86R\x5cL\xad\x84\x18\
-\xb0\x09\xaa\xec\xc7\x84\xe6xP\x1d.z\xe4Y\xd2\xbd\
-+ta]A[w\x13!\x00\x8b\x0f\x1aX{\x91\
-PkX]l\x1a\x9a\xbd\xcf$\xd8\xf9L\x82\xcf\xd0\
-E\x85+\xfb$\xdaGb\x07\x01\x04\x80\x85\xd1<O\
-\xe2D\xdf\xf4\x04<\xb5x?\xd5\x1d\xa8\xf4@\x00j\
-ki\xe3\x8e=4dJ\x9d\xef\x04\xe0\xf3\x15\xecZ\
-eI+\xe9dc\x87b\x07\x1fv\x8a$x>y\
-4\x91\x87\xc8\x01 \xe9\xe4\xc9\x8d`A\x81\x00@\x98\
-|G\xa4D\xe7H\xe2\x0c\x12u8\x83D\x9bG\xeb\
-\xed\x9e\x02\x9e\x90\x08S}(\x00\xf7-\xa8\xa4\x9a\xca\
-\xfd\x9e\x08@\x0d\xad\xde\xb6\x9b\xfaL\xaa\xf3]7\xe0\
-\x97\xab(\xacG\x8eK\xae\x15\x5c\xb4\xe0!\xc7{6\
-\xa5\x12\xf6C\xa2\xe7\xa8\xb3-\xc3H\xdd\xee\x050\x89\
-\xb8\x12\xc2\xd4\x99I\xd2\xd2s\xffAW\x15\xb6\xaf]\
-@W\xabGw\xc0\xc7\x8d\xec\x9aB\xca\x1b\xd3<\x1b\
-\xd2\xde\xdaz\x81s\x0fP\xd5\xbe}drW\x00\xb0\
-\xd8`\xf9\x96\xdd\x94]R\xef;\x01\xf8j\xadH\xb0\
-\x08\x01p\xb2\xd1!.\x0b\xe9w\xb8e\xeai\x0f&\
-\xf2\x10\x02\x80\xee\xa7\x02\xcf\xea\x00\xd0\xe7\x8c82\xd1\
-\x81\xa5Hp@\x8a\x04\xbf\x22\x85\x07\xe8\xaa\xc3Yt\
-eD&&[\xe6 \xf0\x91\x00\x5c=\xfb\x00\x1d\xd8\
-\xbbW\xe4\xf2\xdc\x14\x80jZT\xb1\x8b\xd2\x8b}$\
-\x00j_|Xf\x1f!\x00\xce\x12\x02\x9f\x0d\xc5h\
-*d\xff=\xe9\xbf\x87\x071\xe2B\xb9\xe8\x87'\x02\
-\xf0g\x15\x05\x0f\x1bM\x09,L:I|C\x18\x0d\
-\xf6\xb69\xf3^\xdb \xc9It\xa5\xa8\x84$\xd9\xfb\
-\xe1C\x01\xb8t\xd6A\xda\xbfg\x8f\x07\x02P]M\
-\xf36\xed\xa2\xeeE\x0d\xbe\x13\x80o7Q\x18\x939\
-1\xa1\x8b\xf3$A\x0c\x85n\x14O\xb3\xa8\xc8!\xa0\
-7\xc0\x93\x10\x00\xfb}\xb1\x92\xc22z\xf3oHh\
-\x132\xb4\xf6^W\xbfF\x92{H\xb2y\x1e\xe0\x88\
-J\xe8*\xbbM}(\x00\xe7\x97\x1d\xa4}\xbb=\x12\
-\x80*\x9a\xbdq\x17u\xf3\xa5\x00|\xb7\x99\xc2r\x06\
-J\x01p\x81\x04\x18<$f\x05\xcaw!co\x0b\
-\xec{\xf3\xeb\xb2\xd8\xa3\xc8A\x11I\x81\x9di\xc0\xcc\
-k\x03\x9aD\x0f\x04\x06&a\xbc\x82k\x96(\xc9s\
-$\xe9\xf0\x04I*\x9c\xd9\x9ed\x83\x96\xdes\x06\xd1\
-]\xba\xcaIH|(\x00\xe7\xb0\x00\xec\xd9\xbd\x9b\x1a\
-l\xcb\x81\x9d\x15\x80z\x16\x80\x99\x1bvR\x8a/\x05\
-\x80\xc9\x17\x9a;DXOW\x08\x22\xbd\x80tY\x18\
-\x22f\xfe\xb1.\xfa\xc9W\x0bJ\xd4\xa2\x1f\xac\xfd7\
-\xfe{R\x1e\xfa\x96\x94\x07\xbe\x92+\x0b\xabE?\xa2\
-\xae\xfb\xfa\x97\xc8p\xc3+d\xb8\xee\x052\x5c\xfd\x0c\
-\x19\xaex\x92\x0c\x97=JA\x17?DA\x17\xdeG\
-A\xa8\xfb>\xe7v\x0a:\xf3\x16\x0a:\xfd\x062\x9e\
-z-\x19O\xba\x92\x8c'^N\xc6#\xcf\xa0\xa8D\
-\xe9\xd6u$R\xb4F\x0e\xdb\xcf$\xb5\x0b\x92\xbd\x83\
-\xe4\xb6GLB\xa2,x\xf2\xa1\x00\x9c5\xe3 \xed\
-\xde\xe5\x89\x00TU\xd1\x0c\x16\x80d_\x0a\xc0\x8f;\
-(\xb4\xf70\xea\x9a\x98\xe0rcM\xe4}\xa2P@\
-\x92\x94JQ]S\x98\x88\xc9\x14\xcd\xb1U4\xbbW\
-\xd1\xbc=\xbaK\x02\xc5\xc4wQ\x11\xcfV:\xde2\
-\xbaP\x1bi\xa6>\x8f7\xc3\xba0DE\x5c\x0c%\
-\xc4\xc56C\x22b\xfexi\xf9\x93\xda\x8d\x04\x1d\x9b\
-(\x81\x88\xe4V\xb6\xe31\x86\xdb\xa7\xa8v\xf4\xa1\x00\
-\x9c)\x04`\x97\x9f\x0b\xc0\xcf\xbb(\xb4\xefp\xea\xca\
-\x1e@\x9b\x11@o\xa4~A\x92\xe4V\x88\x93\xdc\xe6\
-HQa\xfd\xdc\xdek'\x90\xd22b\xd98\x89r\
-t_\x0b\xc0NO\x05`\xbd\x8f\x05\xe0\x97=\x14\xda\
-\xffH\xe1\x01\xe8\xa4\xb0\xdf\xf0\x93Z\xd8\xeeL\xc3N\
-\xf2\x09I\xbc\x80\x94\xce\x89\x14M\x000\xce\xc1\xc7\x02\
-\xb0\xcb\xef\x05\xe0\xd7\xbd\x14:\xf0\x18J\xf2@\x00\x92\
-\xfd\xc6\x82\xe8$\xf1w\xe2Y#\xd9\xe6y\xb2\xcdv\
-{\xfbx\x07\xdd(\x0e\x02\x80\x01T\x9d^\x00~\xdf\
-O!CF\x0a\x01\xd0\x89\xd1\xbe\xe4H\xb6C\x90\xe4\
-\x16H\xe3-24\x7f\xed&\xba\xd9y\xed\xa7\x88\xeb\
-\xd2E\x8ep\xec\xf4\x02\xf0\xc7\x01\x0a9\xe4\x04)\x00\
-~B\x82\xd6\xb6\xa7\xb49\xbay\x17\xddt\xf8\x0a\xdd\
-TX\xbf\xb6\xde.\x91*F\xb7b\x8d\x01\xff\xcf\x01\
-\xf82\x09\xa8.\xec\x11r\xe8IB\x00<\xb32:\
-I\x02\x990\xbeG\xaa\xf7\x91\xea>0\xf8M\xb9\xfb\
-\xd3\x00\xf0\x00|-\x00\x13\xaa)\xe4\xf0\xd3(\xa9k\
-b\xa7\xb7\x16\x8e\xdes\xa6\x81\xa7\xf8\x13ARu\xb4\
-\x84TU\x00\x0cX\xa5\xa8S\x87\x00\xea\x9c\xfa!G\
-\x9dA\xc9\xec\x01t\xb3C\x02W\x09\xd4\x11\xad\x85\x0e\
-\xcf\xc8f\xfb<\xd5+\xe8\xee>\xbaw\x17s$\x18\
-\xc6\xbd\xab{\x00\x98\xac#\xf8\x98s(\x99=\x00\xbd\
-\xc1z\xbf\xd1;z?\xd5\x01)l\x09\xd2\xad\xbdH\
-\xd2\x0a\x81\x02\x1d\x18\xd6.&N\xed\xf4\x02\xf0O=\
-\x05\x8f\xbc\xc0/\x04 \xb5\x15\x92x\xcfz\xf8\x98(\
-\xddu\xf8\x02\xdd\xed<\xef\xde\xcas{\xaf\xbbw\xef\
-!J\xdf1\x9f\xa1\x9f'\x01\x0f\xfa^\x00\xfem\xa0\
-\xe0Q\x97\x08\x01\xd0\xadE`\x93\x22\xd5\x01Al\xc9\
-\xd1\x9c\x10\xce\xa2\x87o\xd0\xa3\xed\x81\xc27\x8cA\xd1\
-=\x80\x7fM\x14<z\xac\x14\x80NL\x9a\xee^C\
-\x8f\x0eE\x94\x8e\x88\x1e\x0c\xf4za\xfd\x84\xce]\x0a\
-\xac\x0e\xad5\x9er5\xa5\xb0\x00t\xf7\x19Iz\xf8\
-\x9e\x1c:A\xfc\x82X\xdacK\xcf[G\x9a\xf7\x91\
-\xa6B}\x9e\x94\x98HA\x18\xce^\xd0\xd9\xeb\x000\
-\x87\xf9\xe9\xd7\x0b\x0f@o\xc4\xde#B\x0f\x9b\xc6\xdf\
-\xd2{mN\x06[RtB\xa0\xbd\x07\x8d}\xcc\xe7\
-\x02\xb0+ \x04\xe0\xcc\x9b\xa5\x07\xe0eK\xd0\xdd\x8e\
-\x15p\xf4~\xf7\x16\xc8\xd0\xbdE\xa2\xa4\xe9$\xe9\x84\
-H\xb3\x82\xbdm\xcd\x91nAz\xbah\xefA\x97>\
-\xa2\x0b\x00\xca\x81\x8d\xe7\x8c\x13\x17\xc4\xec\x22\xb9\xe2N\
-\xe9$\xf1Kb\xb4N\x08\x07\xe4\xf0\x05\xd2\xfd\x0f)\
-I])\xe8\xe2\x07\xfc?\x04\xc0\x8c@\xdd\x8a\xea}\
-*\x00\x98q\xc7,\x00\x1d\x90\x10\xee\x90\xa3\x87h\xbc\
-i\x9d\x8e\x18\x9d\x01\xe9\xe9\x19\xd4\x0d\x02\x80\x95\xa8\xf2\
-}<#\x90\xa7\x020k\xc3\x0e\xdf\x0a\x00+`\xd0\
-E\xf7\x0b\x01@\xa3\xec\xd1*1:\xa7\xc5\xd0aK\
-\x22\x09\xeb\xe7M\x91\xc1\xefe\x88G\x9f!\xc3}t\
-KN\x22\xe3\xb9w\xfaT\x00\xce\xf1\x86\x00\xcce\x01\
-\xe8\xe1k\x01\xe0X\x08.\x91\xde\xb0\xbdG\x0e{d\
-\xb1&\x87\xcfI\xe1\x05\x92td\xa4\xa6$\x93\xf1\xec\
-\xdb|\xd8\xbbFtA\xd9\x01\xda\xe3\xa9\x00,\xdc\xb8\
-\x832\x8a},\x00c\x1f\x17\x02\x90\xeec28\xb2\
-\x18i-\x12$\xdd/-\x88\x0e\xdf!\xa3\x85G\x0b\
-2\xddGf&u\x87\x00\x9cy\xb3O\x05\xe0\xd2\xb2\
-J\xda\xeb\xc9\x9c\x80u,\x00K7m\xa7\x9c\x92:\
-\xdf\x0a\xc0U\xcfH\x01\xd0\x1b\x9f\xdf4\xfe\xd6\xde\xcb\
-\xb0\x0b\xd9\xc0\xd3Ud\xf8\x0a\x99\x81\x8f\xee\xddR(\
-\xf8\xf4\xeb}*\x00\xd7\xcc\xdaO\xfb=\x12\x80\xea*\
-ZQ\xb1\x9d\xfaM\xaa\xf5\xdd\x89\x16\x12\x19\xae}\x81\
-\x92\x03T\x002\x1cZ\x08GD\xf1\x0e\x09\xd2;8\
-A:223\xb3\xa8G\xb7n\x14|\xca5\x96\x95\
-\xaa} \x00\xb7\xce\xdeG\x95\xbb=\x12\x80jZ\xb7\
-y;\x1d2\xb9\xc6\xb7\x02p\xe3\xab\xec\x01$\xc9\x0b\
-\x94\xd1F\xd0\x1b\xa2\x9f\x93\xa4)2\x984\x99v\xe0\
-\xeav\xa7\x91\xe5[\xf4He\x018\xe9\x0a\x9f\x0a\xc0\
-\xfds\xf7\xd0\x01O\x04\xa0\x9e\x05\xa0b\xebv:f\
-j\x95o\x96\x07\xd7\x04\xe0\x967\xd9\x03H\xd2\x1b\xbe\
-\x1b\x96\xc4Q\x83\xf7\x98\x00\xb6\xdf\x93\xe5\xbf\xc8\xc8\xf2\
-\xef\xf3\xb3\x87\xb4\xee\xa9\x14r\xe2eb,\x8c\xaf\x8c\
-\xeb\xd3\xf3w\xd3\xc1=\xbb\xdd_\x1a\xac\xbe\xa6\x86\xb6\
-o\xdbN\xa7M;\xe0[\x01\x18\xf7\xae\x10\x00\xd9\xe0\
-\xbcg52\xed\x10\xc5\xa7\xc8\xd2\x11h\xc8\x12\xc8\xe6\
-\xe7\x12Ym\x81\xeclJ\xef\xd1\x9dBF]L\xca\
-?\xbe)\xb230\xde\x5c\xb4\x93\xaa\xf6\xee\xf1L\x00\
-v\xef\xd8A\x97\xcc\xd8\xef[\x01\xb8\xf3#1\x9d\xb6\
-\xde \xfd\x97 \x96\xc7\x96\x91\xe9\x01)\x9a\xbd\xee\xc0\
-\x80\x00\x84\x1ew\x01\x0b\x80o\x12\xec\xc1\x13\x1b\xe9\xcb\
-\xa5\xdb\xa9z\x9f'\xcb\x83s\xec\xb0o\xe7N\xbau\
-\xd6^\xdf\x0a\xc0\xbd\x9fQRrJ\x80\x10\x22\xbb\x89\
-\xc5\xf0\xb9\xe5\xc8\xd6\xe1}\xf4\x14\xc8\xb6\x87\x9e\x0e\x90\
-\xdd\x0al>\x97\xe5\x00\xda\xfb\x19i=(\xf4\xd8s\
-I\xf9\xdb7\x09\xf6\xc8|\x13\xfd\xbe|\x1bU\xef\xdf\
-G\x8d\xf5\xf5\xee\x0b\x00\x92\x08O\xcc\xdb\xe5\xd3$ \
-\x16\xecLJIin\x05\x9c\xb50z\xa3\xf69a\
-Z%\x89]bd;\x07\x16V\x81&\xdb-\xdf\x9b\
-\x95\xed$\x01\xf1\xd9\xacL\xca\xcaH\xa7\xcc\xf44A\
-\xb2\x0c\xb6\xb4\xb0\xb6\xe9\x1cs#\xeeNKM\x15\x09\
-8\xa0;\xd0M\x22UE\xb7n)\xd4-EB\x9b\
-m:\xb9\x9b\x05I\xddR\xed\x22Y\xdd\x17\xdf\x8b\xd0\
-\xd3\xa1\x90\xa8\xc0\xf9\x85\x1e}\x16)\x7f\xf9&\xc1\x9e\
-X\xd8@\x93Vm\xa5\x9a\xca\xfd\xee\x0b\x00\x5c\x07$\
-\x11\xde]\xb4\x83\x82&6\xfaN\x00\x1e\xfe\x1f\x0b@\
-\xb7\x0eK \xe7\x88\xd3\x021l \x1ay\xa6=d\
-\xd8\xc0\xf2\x9e$\x98\xcd1[j\xa4|\xfcL&\x12\
-H\x04\xe2\xf4H\xd5\x88\x92b\x99\x88\x15\xe4P\xa1\x11\
-\xa1k\xb7\xee\xd45\xb5\x07%\x0a\xa4QBw \x9d\
-\xba\xf4\xc8`dR|Z\x16\xc5\xa7\xf7\xa4\xf8\x8c\x1c\
-\x8a\x13\xe8Eq\x99\xb9*z\x89m\xf1i\xd9b\x1f\
-\x90*=-\xadU2\x01\xe8b\xc51\xa3s\x07S\
-\xc4\x90\x91\x14v\xc4i\x14:\xe2<\x0a9\xe12\x0a\
->\xe5j\x0a\x1es\xa3\xa8\xbc3\x9ew\x17\x19\xb1\xe2\
-\xf3%\x0fQ\xd0\xe5\x8fR\xd0\x95OR\xd05\xcfR\
-\xd0u/\x8a\xde(\xc3-o\x90\xe1\xb6w\xc8p\xc7\
-\x07d\xb8\xebc\xe1\x9d\x1a\xee\xffR.\xe2\xf1\xf0\xb7\
-r\x95\xe9\xf1?\xc8e\xbd\xc4\xaa\xd3\xfc\xfc\x91\xef\x84\
-\x113\xdc\xfe\x1e\x05]\xf4\x00E\xf19\xa0\x80\xac5\
-\x01\x08;r\x8c\x98\x15\xdb\x17\xbc\xca*\xaa\xa5\xf9\xeb\
-\xb6P\xcd\x81J\xcf\x04\xa0\x8ac\x88\x1f\xcb\xb7Rx\
-\xbe\xc9w\x02\xc0\x17\x13\x02 \xd5\xde\xb1\xcb\x96e\xa3\
-\xf6\xb6DiJ\x0c&@\x86\x86t\xd1\x983\xd3\xa5\
-e\x10HS-\x84\x86\x1eV\xd6\xc2\x0e\xf0\x1e>\x87\
-}\xf1\x9d\xe2\xb8N4L\x9cg:\xef\x07\x02I\xf2\
-\xa4\x08\xf2h\xd6\xa4kjw\xd1p\x9b\x92$[\x92\
-\x83I\x11\x9b\x95G\xb1\xd9}(\xa6g?\x8a\xc9\xe9\
-O\xd1\xbd\x06r#\x1fDQyC(\xaa\xf7P\x8a\
-\xea3\x8c\xa2\xfa\x1e*\x10\xd9\xef0\x8a\xec\x7f\xb8\x19\
-Q\xfd\x86\xcb\xf7\xf8s\xd1\xbc\x7fR\xf7\x1eR\x90Z\
-9g\x0c}\x8eeb\x86\x0f=N$\xaa\x82\xcf\xbc\
-\x85\x8c\x17?HAW=E\x86\x1b^&\xc3\xado\
-I\x82`iv,\xb7\x8e%\xae@\x04,v\x89\x15\
-o\xb1\xec\xf5\xf3\xff\x91\xf2b\x01)\xaf\x14\x93\xf2\xda\
-\x14R\xde\x98F\xca[3Hyg&)\xef\xce!\
-\xe5\xfdy\xa4|0\x9f\x94\x0f\x17\x92\xf2\xd1b\x89\x0f\
-\x17\xf1v\xde\xf6\xce,\xde\xaf\x84\x94\xfb\xbf\xa2\xb0a\
-'P\x1a\x9fO\xcf\x9e9v\xcf\x15\xdbaq\xa3r\
-\x060\x11\x99\x9c\xdfl\x14\xcb\xcd)\x7fV\x89\x09g\
-1\xe5\x5c\x93\xae\xb6|Y|\xd6\x0c\x85^\xc4s\xff\
-\x8a{\xd8\x13\xe7\x97\x93c\x17h\x93a\x87\x9f*\xd6\
-\xc5\xf0\x05\xaf\x86N\xaa\xa6U\x1b7S\xed\xc1\x83\xee\
-\x0b\x00vD\x0cQ\xbcr\x0b%\x16\xd4\xfbN\x00\x9e\
-\xf8M\x90\xa1\xb5\x86\x89\xc6\xdb\xa3{wA\x1eX\x16\
-X\x13X\x90\xd8\xec\xde\x92\x1c \x86J\x0aA\x86\x01\
-GR\xc4\xa0c\xd8\x22\x8c\xa0\xf0C\x8e\xa7\xf0CO\
-\xa4\xb0\xc3N\x16\xd6\x01\xea\x0b\x17\x0cqX\xe8\xc8\x0b\
-(\xe4\xf8\x8b\xd9Z\x5cB!\xa3/g\x8c\xa5\x90\x93\
-\xafd\x5c%\x81\xd7'^*\x926\xd8/b\xd0\xd1\
-\x82\xac\xce\xb8z\xc9L\xba\x90c\xce\xa6\xa0\xcb\xc6\x93\
-\xe1z\xb62\xe3\xd8\xba\xdc\xf3\x19)\x0f\xb15y\x9c\
--\xc8\xd3\x13$Y^f\xa2\xbc>\x95IR&\x09\
-\x02r|\xc4\x84\xf8d))\x9f-'\xe5\x8bU\xa4\
-|\xb5\x86\x94\xaf\xd7\xcbF\xfe\xed&R\xfe\xb7\x99\x94\
-\xef\xb6\x90\xf2\xfdV\x89\x1f\xb6\x91\xf2\xe3v\x0b\xbe\xdf\
-&\xb7\xff\xaf\x82\xf7]+\xac\x13&6\x95d\x92\xe8\
-\xa9B{\x0e\x8b\x1b\xca\xd7G\x9c\xc3o\xfb\xc4\xa4\xad\
-Z\xc5\xa6\xc7D)p\x01\xf8|1\xe3\xcd\xe9B\x0c\
-[\x22S\x0a\xff&1\xc5v\x91J\xf0|\xf2\xe9\xfc\
-\x15\xad\xaev\xc5\xd7\x0d^H6\xb7\x0f\x87\x02\xc0\x06\
-*|\xf8Ibe,_\xd4\x00\x9c<\xb5\x926o\
-\xdeB\xb5UU\xcd\xb9\xed\x8a\x00\xc0\x85X\xb0n3\
-\xe5\x14\xd7\xfaN\x00\x98\x04p\x1d{\xb6B\xa6$\xb6\
-\x94\xa2x\xe2\xa1oHy\xa9\x90\x94\xb7gJ\x92\x80\
- _\xae\x96\xe4\x001\xd0\xe8A\x80\x9fv\x92\xf2\xf3\
-ni\x11\xd0\x98\x7f\xaf\x94\x17\x1c\xd6\x01\xb1\xd7_\xb5\
-\xd2J\x00h\xe8\x00,\x86\x00{<\xff\xa9\xd0\xb6!\
-c\x0b\x97\xed\x97=bU\x17Xmy\xceM\xc9$\
-\x90\x93#,\x7f\x08\xbb\xa1\xe2\xf8\xde\x22I\xbe\x9b\xc0\
-w\xf35\x82\x07\x01\xef\xc5~\xc3\xec%\xdc{Xw\
-A\xbe\xf6$\x92\xd5\xe2\xb1\x11\x83\x8fe\x0f\xcf>\x99\
-r\x18\xb8\x0f\xcak\x93}7\xbf\x9e\xcb\x02\xb0\x9f\x22\
-\xd8{\xc29\xe7\xf05\xb5\x07\x88C8{7\xa2M\
-\xe6{_\x00\xae.\xdbC\xbb\xb6m\x15\xc5|\x9e\x09\
-\x00\xbb\x10\xeb\xd8\x958r\xf2A\xdf\x09\x00\xbbL\x88\
-\x1b\xc5M\xb5!\x91\x06\xb8\xef\xa1p\x99@\xa6\x22\x07\
-dq\x86\x08^\x1a\xbf\x00\x11@\xc3\xcc\xcar\xac\xf2\
-)\xec\xd5(\xf7~.\xcfw\xa2\x1f\x80\x85\x0fn'\
-B\x18\xbbd\xea\xa5\x0a\xc0=\x9f\xfa\x07\x99p\x9d\xd9\
-\xabA(\xd3\x93EK\x90\xa7\x97\x0d\x99p\xce\x1cF\
-\x19nx\xc5u\x81t\xd6\x13qV\xb8\xf3\xe5$\xb7\
-\x08\x83\xba\xa4g\x0bq\x12\xe7k\x07\x10\x07\x88\x04\xc4\
-\xc2\x17B\xfb\xd8\x9c\x1d\xb4o\xc7v\xd1\x95\xef\xb6\x00\
-\x00p!\xb6o\xd9B\x17L\xdb\xe7\x9b\xae@\x5c<\
-\x8e\x15\x13aM\x1d\x10\x09@\x0c\x1dt\xc5\x13\xfe\xd1\
-0\xd5%\xcd\xc2\x8e<]\xc4r\xb0\x9c\xf6\xc8$\x04\
-\x00\x09\xa4\xc2v\xb2D\xb6\x1e\xc0/\xbbUk\x9a\xe5\
-\xb0a\xf6\xe8\x9e\xca\xe1\xca\xa3\x96}\x1cy'\xde\x8a\
-\x97m\xc5\x1b\xf1:<1xiL~\xe4\x1c\x92z\
-\xa49<_A\xa6\xec,\x11\xfe\x09\x8f\x1015H\
-\x05C\xc1\xbfW\xf9y\x17{\x82;dx\x84p\x09\
-\xe1\xd07\x1bH\xf9\xbfu2\xa4\xfab\xa5\xf4 ?\
-)\x97y\x88\x0f\x16\x90\xf2\xde\x5c\x99\x87\xe0\xf0C\x84\
-e\xafL\x92\x1e'B5\x84l\x8f\xff*\xf2\x0d\x86\
-\x07\xfeO&\x0aoy\x93\x82\xae~\x96\x8c\x17\xdcK\
-\xa1\xa3.\x169\x9b,q\x8ds\x1d\x9cs.\x0bZ\
-\x96\x08M\xc5y\xe6{\xbf\x06\xe0\xe3E[\xed\x97\x01\
-\xbb*\x00u\xac {\xb7o\xa3\xfbf\xef\xf4\x9d\x07\
-\xf0J\x09%rL\x9d\xa3\xba\xa1\xb6\xc0EC&Z\
-\xcc\xa1V\xd8F\x84qd)p|Xt\x8e\xc3\x91\
-k\x10\x96\xc9A\xc3D\xd20\xf8\xe4\xabd\xf8\xe0\xac\
-\xab\xef\x8c\xe7\x02\x92h\xa1\x09\xc8\x82\x10\x06\xe1\xcc\x84\
-\x1aI\x1c\x849 \x01B\x95\x1fw\xc8\x86\xff\xc5*\
-2\x8c}\x9c\xc9\x94\xde2\x99zfS\x5cV\x9e\xc8\
-\x96#\x09\xa7<\xf3\xb7L\xc8\xbd^\xca\x84\x98f\x01\
-^#\xb9\x87\xf7@\x8e\x17&\x92\xf2\xec?\x92 O\
-\xfe\xa6f\xc8\xbf\x17\xe1\x9a\x81\xbf\x07y\x0f\xc3]\x1f\
-q\xac\xfe\x9e \x0c2\xeeA\xd7\xbe f\xc65^\
-6^d\xe6\x83\xcf\x19G!\xa7_G\xa1'\x5cB\
-\xe1G\x9c&,?\xce\x17a\x96$\x93}\xf4\xca\xcd\
-\x15\xc3\xab#s\x07S\xf8a'Q\xc4\xb0Q\xc2\xba\
-F\xb2\xd8E\x0e:\x9a\xa2\x06\x1c\xc1\xdfu\x18E\xf7\
-=\x94\xa2\xfb\x1cB1\xbd\x87P\x0c\x0bFl\xaf\x01\
-\x14\x97\xd3\x9f\xe2z\xf6\xa5\xf8\xec\xde\x14\x9f\x95K]\
-2{18\xac\xc8\xe8I\x09l\xc5\x13\xd3\xb3\xa8k\
-Z&u\xe5\xf3\x80\x10%wO\xa3\x94\xee=\x04\xba\
-\x89\xd9\xaaSE^*MM\x12\xc3 \xa0\x1d\xe3\x9c\
-ZB\x0e_\xe7\xc8\xc1\xc7\xc8\x10\xd5\xcb\x02\x10W\xd0\
-@\xff,\xab\xa0\x83\xf6\xaa\x00]\x15\x00(H\xe5\xae\
-\x9d\xf4\xc1\xc2\xadd\xf4EW \xc8\xc0*\x9b\x90\x96\
-\xd5r\xc3\x84\xcb4\xe0H\x995F\xf1\xc4\x7f\xa6\xe6\
-\xe4\x9dh\x8f(\x1aYLM\xc9\x82\x1c\xc0\x84*i\
-1@\x98\xdfa5\xf6I\xab\x01\x8b\xa1%\xcf\xbe\xde\
- \xf3\x0bH\xc6\xbd7G6\xf8G\xbe\x13k\x19t\
-k\xc52\xa1!\xa0\xcb\xcb\x80\x0c\xfa\xf5/\xc9\x06\xcf\
-\x96\x22\xe8\xeagd\xf7\x13{4\xe8\x8a\x12\x04\xb8\xe4\
-a\xc6\x83d\xbc\xe8~&\xc3\xbdlM\xeea\x12\xde\
-I\xc1\xe7\xdeA\xc1g\xdfF\xc1g\xddB\xc1g\xdc\
-D\xc1\xa7]G!\xa7\x5c-\x93\x94\xa3/g\x8bs\
-\x89LN\x1e{.\x85\x1d}\xa6 \x0e\x92K A\
-$[\x98\xa8\x81Gr\xc3\x1fF\xb19\xfd\xe4\xf9\xa2\
-q\x824\x1ay\xac\xa0\x91)G\xcd_\xa0\x81'q\
-\x83\x07\x01@\x84\x04\x15\x89\x1a@\x0c\x81\x0cAT\x8d\
- \xc9*A4\x92t\xb3\x99\xda\xbd\x87 M\xaa \
-M\x9a\xd6\xcb\x22zX\xd4^\x96L&=\xe2g&\
-~kD\xb2FO&\x15,\xab\x06\x90L\x82\x05$\
-\xc7\x82^\xb8\x06\xe2:h\xe8eA\xae5Z9f\
-^\x9e\x05\xb9y.\x9d+\xce+j\xe0Q2O\xe5\
-e\x01\xc8)\xaa\xa1y\xab7Q\xd5\xfe\xfdd\xb2\xed\
-\x01pU\x00d-\xc0\x1e\xa1(P\x16\x9f\xc4yo\
-\xcd\x10j\xdb\x22\x99\xb8qb\xe2\x0e\xb8za\xc7\x9c\
--\xb2\xf3\xc1g\xdc\xc8\xc4\xb8\x95-\xc7\xedL\x14\xc6\
-\xd9\xe3$Q\xce\xbc\x99\x82\xc7\xdc@!\x1aYN\xba\
-B\x0c\xbc\x80{&\xc82\x82\xc9r\xccY\x14v\xd4\
-\x18\x0a\xe7\x98X#L\xc4\xd0\x91B\x95A\x9a\xa8\xfe\
-l1\xd8\xc2\xc7\xe4\x0df\xf2\xf4\x17\x16\xa2KF\x8e\
-h\xf0)\xdc\x883\xd2%\xf9\xad\x09d\xefFg\xab\
-=\x17i\x1a\xac\x1a}\x130\x01\xd2\xad\xbb%\xad`\
-\xee\xbaT\x91\x95\x91&,\x0d\x90\x9d\x99a\x01\xf2\x11\
-\x80-\x01\xd0\xe8{\xe5\xb8\xd4@\xbd\x06k\x92\xd8\x22\
-\xd7\x16mqNy^A\xae\x0a\xeb\xe7\xd6\xdb\xecm\
-\x17\xef\xf1\xef\xce\xc5o\xe7{\x02\xcfD\xf9a\xbb\xd7\
-\x05`\xe4\xe4JZ\xb7a\x13U\x1f8\xd0\xbc\x0b\xd0\
-U\x01\xc0\x17T\xed\xdfG\xf3Wo\xa4\xdc\xe2\x1a\xdf\
-\x08\xc0\xbbs\x84\xcb%\x15\xb8\x15\xe5\xe4\x0b\x97\x9d\x99\
-a\xae\xf6\x92`\xa2\xa47'\x8a$K\xba\x15Y\xd2\
-\x9b\x93\xc5\x9a0\xd9\xd9MH#ae%\x9c\xb1\x0a\
-n5:\xeb\xcf\xe5\xfa\x09\xdc'\x863\xef\xe7\xb6@\
-\x92\xdc\xbc\x8e\x0f\xb4\xa9h62\xc2\xd3\xcc\xf7n\x0f\
-\xc0u3v\xd3\x8e\xcd\x9bE\xfe\xae\xd1\x1e\xaf]\x15\
-\x00(\xc9\x86\x8d\x9bh\xf4\x94\xfd\xbe\x11\x80\x0f\x16\x88\
-\xd8\xcb}\x829j\xbc\xad}&\xd7\x8d\xcf\xe4\xb9L\
-\x90V\xad\x82#\x228\x22F'!I`\xa2\xb7s\
-`\x83\x12\xd3\xf7PY\xcb\xe1E\x01\xc0(\xc0\x97\xe7\
-n\x15y;\xbb=\x00.\x0b\x80\xda\x13\xb0s\xcbf\
-\xba\xbdl\xa7o\x04\xe0\xe3\xc5\x14\x9f\x85\x86\x9d\xeb\xb4\
-+\xd5\x99\xacE\xa7!E\x0b\xc8\xb3y\x9egg\x9b\
-\xbd\xf7\xb5\xedy\xbd\xfd\x0b\xb9l\xecb\xfa\x1c\x22\xeb\
-V\xbc(\x001\xf9\x0d\xf4\xdb\x92\x8dT\xb9\xcbA\x0f\
-\x80\xab\x02\xa0\x0d\x0bF\x9f\xe2\x87\xf37\x8b.\x06\xaf\
-\x0b\xc0\xa7\xcb(\xbeg_)\x00:I<\x22I\x9e\
-\x9d\xe7\xf6H\x91go\xbb/\x1b|o\xff#a\xbb\
-\x82\xdbzl\xef!2\xc9\xecE\x01\xc8-\xaa\xa6\xb9\
-\xab\xd6\xd3\xc1\xbd{\xed\xf7\x00\xb8#\x00\xa2'`\xf7\
-n*Z\xb6\x81\x92\x0b\xea\xbc/\x00_\xac\xa4\xb8^\
-\xfd[\x11\x00\xef\x11\xc4)2\xb4\x111tx\x03}\
-\xac\x1e\xbd\x87\xde\xad\xbc\xd7\x04}\x5c\x04\xb7\xe98\xd4\
-.\xa0\x1e\xc1\x8b\x02p\xda\x94}\xb4a\xfd\x06\xaa\xaa\
-\xac\xb4\x9f\x00tG\x00DO\xc0\xfe}\xb4|\xcdz\
-:l\xd2\x01\xef\xf7\xbf\x7f\xb5\x96\xe2\xf2\x06\x09U\xd4\
-\x1b\xb3m\xc3\xf6?\xd86~\xbb\x84p\x91\x18y}\
-\xdc Q \xa37\x04`\x80\xecb\xf6\xe2\xf2`\x0f\
-\xce\xdcF;7W8N\x00\xba#\x00Z\x22p\xeb\
-\xa6\x8dt\xed\xf4\x9d\xde\x17\x80o6\xb0;4Tx\
-\x00\xde&\x8b\xeb7\xc6\x11z\xdb\x07+\xb9\x86<\x81\
-\x5c)df\xf4\xa2\xbc^\x12\xb9\xbdr(7GC\
-O\xd1\x15\xd4\x0b}\xdd=\xb3\x05D/\x84\xe8\x8d`\
-deYz)\x00\x0c<\xb2\xee\xf2\xb3\x03\xd1w\xce\
-\xfb\xe2;q.\xbd;\x1b\xa9|\x82\xbe>A\x1fn\
-;\xf1\xec\xf5*\x9f\xaf\xf0\x9a\x00D\xe4\x9b\xe8\xdb\x85\
-\x1bi\xaf\xa3\x12`w\x05@\x9b!x\xcf\xb6\xad\xf4\
-\xee\xdc\x0a\xef\xe6\x01 \x00\xdfm\x16\x19Q\x10\xa6\x89\
-\xe5h\xc9\x92\xa8q\x94$\x15\x93\x08\xe4QI\xa3u\
-\x13\x9a'\x86P\x91n\xb3\xc4Xw\x15\xa9i\xe9\x02\
-\xdd\xd22(\x05H\xcf\xa4d\x81,JB%XF\
-6u\xcd\xecI\x89\x99\xbd(1+\x97\x12\xb2\xf3(\
-\xa1go\xea\x82\x0a\xb2\x9c~\xe2F\xc6\xe5\x0ed/\
-f0\xc5\xf6\x19\xca\xbfe\x18\xc5\xf4\x1bN\xd1\x03\x0e\
-\xa7h\xd4\x14\x0c>\x9a\xa2\x86\x1cK\x91\xa8N\x1bv\
-\x02E\x0c\x1fM\x11\x87\x9fB\xe1G\x9eN\xe1(\xde\
-9\xf6l\x0a\x1by\x1e\x85\x1dw\xa1\xacU@\xcd\x02\
-j\x17P\xc3\x80Z\x06\xd44\xa0\xb6\x015\x0f\xa8u\
-@\xdd\x03\x8a\x84\xce\xbbK\xc5\x9d\xa2X(\xe4\x8c\x9b\
-(\xf4\xe4+\xc5w\xa2\xba\x0d\x15t\xb2\xc1\xf9\x9a \
->$\x8a\xd5\xa3=4y\xaf\xafD\xef\xbe\x96\xe7~\
-\x0b\xbef]\xb8\xed(\x9f\x96{M\x00zq\xfc?\
-k\xf9:\xaa\xdc\xb3\xdbq\x02\xd0]\x01\xc0\x17b\x91\
-\x81\x92\xf2u\x94ZX\xeb]\x01\xf8a\x9b \x8b\x10\
-\x80\x96\xdcD\xb6j\x19Lj\x90\x13\xc4\x03\xc9\x221\
-\xcc\xf7\xa81\x92< \x0d\x93\x05EA(-5^\
-\xf6\x88:\xe1\xc3s\x14\x84q\xec\x98\xeca\xdc\xbbd\
-\xb8\xf3Cu\xa2\x87\xaf\xe4\xb0\x5c\x8ceG\xe9\xea\x93\
-\xbf\x93\xf2\xcc\x0418Iy!_\x0e\xd1}u2\
-)o\x94\xaac\xd9g\xc9j\xc0fCuW\xca\xba\
-r\xc4s\xa83Gf\x97E\xcd2*q\x97,\xcb\
-\x15\xa3\x12\xf7[\x8dJ<(G\x17\xa2*\x11\xd5\x8d\
-\x18m\xf8\x8f\xedh\xc4F\xfbSG;*\x15\xc6~\
-\xf8\xbeW&Q,\xc7\x98\xb8f}\x02\x81\x10\x9d\x06\
-\xfd$\xb8='\xe4\xf4%\xe5\xe3%^\x13\x80\xb3\xa6\
-\xec\xa1\x0d\xeb\xd6s\xb8\xee\xa0\x02\xd0\x13\x01@\x1e\xe0\
-\xc0\xbe}\xb4j\xcd::~\xf2~\xef\x0a\xc0O;\
-)z\xd0\xd1\xaa\x008\xb0\x06l\xf1\xbbf\xf5\x12\x0b\
-\x89*\xcfO\x94\xca\x89\x1aw\x90j\x826\xf9\x83\xa9\
-)9\xbc9p\xa5\xc0\xcbCu\xdb`$\x1d\xca\x89\
-\xe1\x0d\x05,I\xda\x00}[\xd9\xde\xb7_\xcb\xe8\xd3\
-\xaf\xf5\xcf\xd8\x05\xff\xce\xc4\x9e}di\xbb\x97\x04\xe0\
-\x99Y\x9bE\xfc_co\x12\x10O\x05@\xcb\x03l\
-\xdf\xb4\x91\x1e(\xdb\xea]\x01`\xeb\x18\xc5\xee1\x04\
-\xc0Q\xa3@\x8c\x1cz\xfcE\xb2\x9e\xbf\xd0\x86p\x13\
-u\xd8\x1bc\x11t\xe3+b\x18\xb5h\xa8\x1e\x10\xa4\
-ok\xdb\xdd%A\xa7\x06\x0b@vo93\x92\x17\
-\x04\x00\x13\xf6\xfc\xbdxm\xeb\xf1\xbf\xbb\x02`\xce\x03\
-l\xdfF?/\x5cG\xb1\xf9\x0d^\x9d@!r\xf8\
-\x89\x22a\xe6\xc8\x22\x08\x01\xc0\xc8\xba\xffL:\xb9[\
-\x1b\xd1\x88\x06\xc5B\x891\x10(k\xd6\xc9f\x8d\xfe\
-\xed\x8e~\x02\xfd\xa8kv\x1e)\xef\xce\xf6\x8a\x00\x1c\
-URI\xe5+\xd7p\xfc\xbf\x87\x1a\x1c\xf5\xff{*\
-\x00\x22\x0f\xb0{7-Z\xb1\x86\x86\x15{\xb1;\x90\
-c\xe1\x88#N\xa5\xde,\x00\x8en\x1c\x12}\x18&\
-*\xe2\xe1\x02\x1f[\xfe\xf6\x98P\xc2\xd9\xf0\xc3\xda\xeb\
-1\x8fp\xac\x95\xf9\x04\x84C\x08\x8b>ZL\x86k\
-\x9e\xa3\xe4\xcc\x9e\xc2\xd5\xf4GR\xf4ka[\xbf\xfe\
-\xcd\xd1\xb7\xbf\xfd\xed\xad\xbd\xe7\x0fpt~I\x1c\xd2\
-\x8a9\x0c\xbc \x00w\xcf\xd8J[7\xaco\xb9\xff\
-\xdfS\x01\x10\x03\x83\xf8\x00\x9b\xd7\xaf\xa7\xdb\xa6o\xf3\
-\x1e\xe1\xfe\xaa\xa1\xf0c\xce\xa2\xbc^9\x8ec\xad>\
-\xbdE\xa6]y\xf0\x1b\x99l\x13\xb1\x7f\xb5L\x9c\xfd\
-kjy\x8d5-\x91\xf6\xaf\xcd\x18z\x10G\x1bG\
-\x8f\xef\xd2\xc6\xd2\xff\xaeM(\xb1GN(\xf1\xa3:\
-\xa1\xc4\xf7[d\xed\xf6\xb7\x1b\xe5\xf4cM&\x94X\
-j\x99P\x02n\xdd;\xb3e\xe2\x10\x09D$\x12_\
-.\x92\x89E$\x18\xc5\x98\xf9\xdfm\xc6\xcc\x7f)f\
-\xe2\x11\x09J$*1\xc9\x04\xbb\xf0A\xd7>O\xc6\
-\xab\x9e&\xe3\xe5\x8f\x91\xf1\x92\x87(\x98\xe3z1n\
-\xfe\x8c\x1b)\xf4\x94\xab)\xec\xc4K)|\xc4y\x14\
-q\xe4i\x145\xecx\x8a\xed\x7f\x98H.\xa5ef\
-\x0a\xef\xa9\x9f\x9f\x93\xa3c`\x80\xd5\xa3s\xe8\xcfH\
-\xce\xca\x91\x93\x8e\x14z^\xfe\xfb\xe3\x82\xb5\xb4k\xeb\
-\x96\x96\xfb\xff\xbd!\x008\x00\x0e\xf4\xdd\xfc\xb5\x14\xed\
-\xad0\x80\xc9\x18v\xfc\x85B\x00\xfa9\xb2\x18|\x81\
-\x91\xd1N\xcd\xc8\xa2\xb8\xdeCDc\x87h\x84\xa1\xdb\
-\x8c]\xdd\xd0S\xaf\xa1\x90\xd3\xaf7w\x99\x85\x8c\xb9\
-Q\xbe\x06N\xbbV\x90\x05]d\xa1\xa3\xc7\x0a\xd2`\
-\xbf\xf0\xe3.`\xf2\x9c+\xbe'\xe2\xa81\xec\x85\x9c\
-F\x91\x87\x9d\xcc\xe1\xc8h\xfe\xfeQ\x14u\xc8q\x14\
-=\xe4X\x8a\x19|4\xc5\x0c<R\x90+\xb6\xdf\xa1\
-\x14\xd7\xf7\x10\x8a\xeb3\x94\xe2{\x0f\xa6.y\x03)\
-!w\x00%\xf4\xeaG\x899H\xec\xf4\x16\xae]R\
-v\xaePx\xdc\xe4\x14\xb6\xc4@\xb7\xcclq\xfe@\
-\xf7\x8cL\xea!\x90Ai6\xab\x0dg\x02V\xd3{\
-[\x0f\xf3\x95\xfd\xfc\xb2n\x00^\x11\xae\x19<\xa7\xde\
-y\xb9\xd4\xa7w\x1e[\xfc>\xc2\xbdl\x7fB\x0c\xb0\
-\x22\x86k\xe4h\x0b\xf4\x1f \xd1\xcf\x0a\xd6\xdb\xfa\xb7\
-\x01R \x00\x98q\xc8C\x01\x18^\x5cI\x8b\x96\xaf\
-\xa2}-\xd5\xff{C\x00\xcc\xab\x05\xf1\x81\x16\xf2\x01\
-\x87\xf1\x81\xbd\x22\x00l\x95A\xe2\xbc^=\x9ds\xa9\
-\x90\x17\xe0\xc6\xde[\x14\xd9\xe4P.\xef\x072h\x90\
-\xe4\xc8n\xb2M\x03>\xafA\x10G\x03\x08$\x90'\
-\xbe[\xa27\xf5\xed\xa3\xa1\x8f$\x17\xac\xaa\x86~}\
-%\xd9\xaca\xe7|\xfb\x9b\x1f\xa5\xf2{\xdap\xcc\x8d\
-\xd6\x9b\xa4\x18\xd0:\xfa\xeb\xf0\x1a\x06\x0c\x18H\xdd \
-\x00\x98`\xc6C\x01\xb8{\xfa\x16\xf6\xca\xd7\xc9\xee\xbf\
-\xd6\xe2\x7fO\x05@\x96\x05\xef\xa7\xcd\xeb\xd6\xd1]|\
-`o\x85\x01piAP\x8f\xac\x86Mcu\xa4\xea\
-\xfd\x1c\x90\xc9\xf6\xfd&\x0d\xbf\xbf}\x12\xf4kc\xab\
-\xa1\xc3\x16\x03\xfd\x0a\x03\xb4\xe7\x03\x9bb\x80\x0a\xeb\xe7\
-)\x19\xd9\x1e\x0b@\x97\xfcz\xfau\xfej1ZW\
-\xb8\xff\xad\xc5\xff\x9e\x0a\x80\x16\x06\xe0\x80\xbf\xf1\x81\x13\
-\xbc\xb1^@>\x89\xd8\x16\x96[o\xd0\x1d\x8f\x14M\
-\x081\xc0B\x80\x01\x03\x9b\x13\xc5\x9a \xf6H\xd3!\
-0h\x90(\x07\x0f;\xf6\x1c\x99c\xf2 \xa1}\x5c\
-\xc9^*_\xbe\x92\xf6:\xeb\xfe{*\x00Z\x18\x80\
-\x03.\xe3\x03\x9f0i\xafw\x8aV\xae|J\xc4\xb8\
-\xb2\x91t|b\xd8Z\x8a\x01\x03\x1d?w\x16\x1d\x8e\
-(\xed\x82A>\xc5@&?\xc2K1\x19\x08\xaaJ\
-=\xe8\x01\xc0r}\xcf\x94m\xa4-\xae\xb8\xff\xde\x10\
-\x00-\x0c\xd8\xb2a\x1d\xbdX\xb6\xc1\xf3\xc9B\xb1B\
-\xf0\xed\xef\x89%\xbdp\x91\x1cZ\x0f;\x96\xa2\xbf\x03\
-\x12\xf4\xd7\x09\x11\xb0$q\x1b\x83\xecc`\x0b\xdb\x06\
-\xb6%\x06\x0f\x16\xf9\xa6\xd8\xbe\xc3Hy\xa9\xc8\xe3\xee\
-\xbf\xcc\xc2j*^\xb8\x82vj\xd9\x7fg\xdc\x7fo\
-\x08\x80\xb97`\xdbV\x9a\xbah\x05\xf5*\xac\xf2\xca\
-\xe2 \xa9\x99Y\x1d\x84\x14\xfeA\x92\x81\xd6\xc4h\x81\
- \x8eH\xd3\xf6\x18,1\xd8}\x0c\x12\x8f\xce\x1ck\
- _\x1fk\x0c\x90\x10\x09:\xa0\xbfD\x7f\xa0\x1f\xf5\
-\x07\xfa\x01}%D\x22\xb8\x8f\x84\x96(F/\x0c\x92\
-\xc7H$\xabIes\x92\xb9W/\xb1\x94\x5c\xc4a\
-'\xcb\xae?/\xf4\xfd\x8f\x9d\xb2\x9d\xd6\xae\x5cI\xfb\
-v\xefv\xde\xfd\xf7\x86\x00\x98\x8b\x82\xf6\xec\xa1\xf5\xab\
-V\xd1\x0dS\xb7za<\xc0\x0e1\xa55b\xa3\x81\
-\x83\xda\xc7R8c9\xac\xc91\xa0\xad\xc9\xe111\
-T\xb4F\x0c{\xe4\xb0K\x0cI\x0eA\x10\xbb\xc4\xb0\
-G\x8e\xdcf\xe4\xd0ze\xcc#;\xd5a\xd2\xda\x04\
-\xadX{\xa1\xa7\xba\x10\xac\xb6\x84|\xa6\x8a\x0cF\xba\
-\x8a4F\x8f\xac\x9e\x02\xdd\xb3r(5\x1b\xe8E\xdd\
-\xb2s)\xa5g\x9e@r\xcf\xde\x94\x94\xd3\x87\x92z\
-\xf5\xa3\xae\xb9\xfd)\x11\xdd\xb8\xbd\x07QB\x9f!\xd4\
-\x05]\xbbl\x9d\xe3\xd1\xd5\xdb\xff0\x8a\x1bx\x04\xc5\
-\xa2\x0b\x18]\xc1\x87\x8c\xa4ht\x0d\x0f?\x91\xa2\x0e\
-;\x89\x22\x8f8\x95\x22\xd1u|\xcc\x99\x141\xe2\x1c\
-\xd9\xa5<\xeab\x0a;\xf12\x0aC\xb74\xba\x9d1\
-\x92\xf3\x8c\x1b)\xe4\xac[(\xe4\x9cqb\x05bQ\
-GR\xe0\x9d\xa9\xbf\xbe\x9e\xb3\x9a\xb6m\xdc\xe0\x5c\xf1\
-\x8f\xb7\x05@\x1b\x1b\xb0m\xd3&\xfae\xeeJJ\xcc\
-\xaf\xf3|f\xa0\xf7\xe6\x8aa\xb3H\x06\xb6\xa5\xd5h\
-\x9d\x14\x8e\x881\xb0E\xab!\xd0\x82\xd5\x10\xe4\xe8\xdd\
-\x9c\x1c\xbds\xed\x90#\xa799z\xf6\xb4\x10C\x90\
-C\xac\x90\x9c\xc5\xc4\xc8\x12\xc4\xc8\xb0\x22F\x9aJ\x0c\
-I\x8e\x9e\x82\x1c\xdd@\x8e\x9e\x92\x1c\xc99\xbd\x19L\
-\x8c\x9c\xbe\xd4\xd5\x1e9\xfa\x1e\x22\x88\x11\xdf\x7f8\xc5\
-\x0d8\x9cbQ\x171H#\xc7q\x14}(\xc81\
-\x9a\xa2\x0e?\x85\x22\x8f<\x8d\xc9q\x06\x93\xe3,&\
-\xc7\xb9\x16r\x8c\xbe\x9c\xc2P\x8bq\xea5\x14\x8a\xfa\
-\x0c\xd4k`\xcd\x03\xac}\x80\x02\xa7\x8b\xee\xa7\xe0K\
-\x1f&\xe3\xd8\xc7\xc8x\xe5\x93dT\x97\xed\x16\x05Q\
-7c\xd9\xee\xb79T|\xdfj\xd9\xee\xaf\xc8\x80u\
-\x22\xb1*\xb0\x18\xcd\xf9\x1b)O\xffI\xca\xb3\x7f\xcb\
-\x01cX\xb0\x04Yv,`\x02\xab\xfb\xb6\xb62\xb1\
-\xba*1F\xe2aP\x19\xc6\xe4cb\x8e\xaf\xd6\xca\
-)\xba\xacGs\xfe\xa0\xad1\xa9\x8e\xe84\xaf1y\
-P\x16\x8eY\x8f\xe6\xd4\xd6\x98\x14+\x12\x9b\xec\xafJ\
-\xec\xa5\x0aV$\xff\x16\x97/\xa7\xdd;\xb6\xdb_\xff\
-\xcf\xd7\x02\xa0\xcd\x15\xb8g\xc7\x0eZ\xb6l9\x9d1\
-i\x97\x97\xe6\x07,\x175\x01\xdd\xb8\x91\x8a\xd2`\x90\
-\xc3\x8eK%'\xd9\xc8\xb1\x9ad\xc32\xb9\x86]r\
-`\xbd{39\xb2\xec\x92\x03VCZ\x8e^\x92\x1c\
-\xd96\xe4\xe8\xd5W\x12#w\x80$G\xde \xb6\x1a\
-\x16r\xc4\x0dP\xad\xc6\xa0\xa3\xd8r\x1cC1CG\
-P\xb4F\x8e\xc34r\x9cN\x11G\xb3\xd58\xf6l\
-\x0a\x1fy\x1e\x85\x1f\x7f!\x85\x9dp\x89\x85\x1c(Z\
-B1\x93j5\xc4X\xff\x0b\xef\xa5\xe0\x8b\x1f \xe3\
-\xa5\x8fHr\x5c\xf5\x94\x1c\xe2|=\xc8\xf1*\x05a\
-\xa5\x1dT\x0fb\xc9\xee\xbb?ar|.\x97\xadj\
-q\xa83\xc7\xa0\xafN\x92\x85(\x1a9\xccC\x9d\x17\
-[\x86:\x7f\xbeR\x92\xe3\xff\xd6Z\x0du\xde\xa2\xae\
-D\xbcC\x1d\xea\xec`\x01VA\x8e\xda\xe6\x8b\xaf\xda\
-#\x87\xa3\xf2\xea\xc2N:\x9a\xb3\xa5.\xf3\x89\x8d\xf4\
-J\xd9:\xaaX\xbbF\x8c\xd0u:\xf9\xe7m\x010\
-\xd7\x04\xac_G\x1f\xcfZM\x91\xde\xa8\x0c,\x90\xeb\
-\xeea\xc9pQ\xeaz\xc2\xa5\xecR\x8d\xe5\xe7W\xa9\
-\xe4P]*,\x04r\xfe]L\x8e\xfb(\x18+\xea\
-`u\x9d+\x9e\x10e\xb3(\x9f\x15+\xf1\xdc\xf4\x1a\
-\x05a-{m\x0e\x00\x94\xda\xde\xf7\x05\x19\x1e\xfcZ\
-\xaei\xff\xe8\x8fM\xd7\xb4\x079\xb0\xa6\xfd\xcb\xb6k\
-\xda\xcf\x92\xeb\xc5\xa1\xcc\xd7\x9a\x1c\xe6%\xbb\xd7\xc9%\
-\xbb\xb1\x92\x90594\xab\x81\x15\x87\xcc\xf3\x00\x1c\xb4\
-O\x0e\xf3\x1c\x00\x8d\xf6\xc9Q\xa0\x93C\x87\xc4\xa0\xa2\
-J*[\xb4\x8cvlq1\xf9\xe7m\x010\xd7\x04\
-l\xdbF\x0b\x96,\xa3c\x8b\xf7zo0N\x81\xd5\
-`\x17{V\xc3\x91\xe5(\xf42\xbcI\x0e\xbd\xf1\xea\
-\xf0\xc2\xbc\xff\x8fL\xdb@\x1bV\xb9\x91\xfc\xf3\xb6\x00\
-\x98g\x0c\xde\xbb\x976\xadYM\xaf\x97\xad\xa5\xd0\x89\
-\xfap]\x1d:|\x85\xbc\xc2\x83T2\xbf\x9c\xb6U\
-\xb4\xb0\xf4W[\x0a\x00N\x003\x90l\xdf\xb2\x99f\
--*\xa7\xc3\x8a\xf6\xe97J\x87\x0e\x1f\xe1\x9e\xd2\x8d\
-\xb4v\xc5rQ\x88\xd7\xea\xc4\x1fm!\x00\xe6\x01B\
-\xec\x8elX\xbd\x8a^\x9c\xbeV$)\xf4\x9b\xa5C\
-\x87\x97W\xfd-\xac\xa2\xc2yKi\x8b\xda\xf5\xe7r\
-\xf2\xcfW\x02`\xee\x12\xdc\x5cA3\x17.\xa5\xc3u\
-/@\x87\x0e\xaf\xc7\xfe\xf7N\xddH\xab\x97/\xa3\xdd\
-;v\x08\xeb\xdf\xe8.g\xbd-\x00\xe6\xe5\xc3\xd8\x0b\
-X\xbfj%\xbd>}5\x85\xe9\xb9\x00\x1d:\xbc\x86\
-\xde\x1c\xfb\x17\xcf[B\x9b7lp\xad\xee\xbf\xad\x04\
-\xc0\xec\x05TT\xd0\xdc\x85K\xe8\xb8\xe2\xdd\xfa\x8d\xd3\
-\xa1\xc3\x0b\xc0\xa0\x9f\xf1\xa5\xebh\x8dj\xfdQ\xf8\xd3\
-\xe8\x09_}!\x00\xb6^\xc0G3VPt~\xbd\
-~\x03u\xe8\xf0\x10\xc38\xa4.\x9d\xb7\x986o\xf4\
-\x82\xf5\xf7\xa5\x00Xr\x01\x9bi\xd1\xa2\xc5tN\xc9\
-v\xfd\x06\xea\xd0\xe1\x01\xc29\x94~u\xda*\x91\xf9\
-\xdf\xb3s\xa7\xb4\xfe\xeet\xfd\xb5\x85\x00X\x0f\x12B\
-\x8f\xc0O3\x97R\xb7\xfc\x1a\xfdF\xea\xd0\xe1&N\
-.\xdeIs\x17,\xa2-\x9b6z\x96\xf9o+\x01\
-\xb0\xd4\x05l\xa1\xe5K\x96\xd0m\x937\xea7R\x87\
-\x0e7\xd05\xbf\x96\xbe.+\xa7u+W\x98\xfb\xfd\
-\x1b\xbd\xc1S_\x0a@\x93\xea\xc0\xb5k\xa9x\xce\x22\
-\x1a\x5c\xb8_\xbf\xa1:t\xb8\x88\x1b&o\xa2\xa5\x8b\
-\x16\x89\x90\xda\xed\xaa\xbf\xf6\x10\x00\xf3\x84!\xdb\xb7\xd3\
-\xeae\xe5\xf4\xfa\xb4\x15\x149\xb1A\xbf\xa9:t8\
-\x89\x01\x85\x95T8{!mX\xb3F\x84\xd4n\xd5\
-\xfc\xb7\x97\x004\x19)\xb8q#\xcd_\xb0\x90\xce/\
-\xd9\xaa\xdfX\x1d:\x9c\x00\x8c\xe5k\xa5+hU\xf9\
-R1\xd0\xce\xad\x11\x7f\xed-\x008a\xc4,\x88]\
-\xd6\xad\x5cI\x7f\xce\x5cD\xbd\x0a\x0e\xea7X\x87\x8e\
-VpA\xc9\x16\x9a?\x7f\x01Ul\xd8 \xc6\xfb7\
-x#\xf1\xd7\xd6\x02\xd0dE\xe1-[h\xc5\x92\xc5\
-\xf4\xfc\xd4\x95\xa2[C\xbf\xc9:t8\x18\xedWp\
-\x80\xfe\x9a\xb9\x90\xd6\xae\x5c\xe1\xbdn\xbf\xf6\x12\x00\xeb\
-\x84\xe0\xc6u\xebh\xce\xbc\xf9tn\xb1\x1e\x0a\xe8\xd0\
-\xe1\xc8\xf5\x7fy\xea\x0aZ\xce\xc6RK\xfc\x99\xbcm\
-\xfd\xdbZ\x00\xa0^P1\x940\xaeY\xb1\x9c\xfe*\
-[@}\x0a*\xf5\x1b\xaeC\x87\x0d.+\xa9\xa0y\
-l$a,a4\xbd\x9a\xf8k/\x01\xd0\x12\x82Z\
-\x85\xe0\xf2\xc5\x8b\xe8\xcd\xa9\xcb(V/\x13\xd6\xa1\xc3\
-\x8c\xa1\x85\xfb(\x7f\xe6|6\x92+,\xf5\xfe\xdev\
-\xfd\xdbK\x00lC\x81\x05\xacr7\x96l \x83>\
-o\x80\x0e\x1d\xa2\xe0\xe7\x93\xd2%\x22O\xe6S\xd7\xbf\
-=\x05@\x0b\x05\x90\xd8\xc0b\x06Sf\xcd\xa3\xe3\x8b\
-v\xea\x0d@G\xa7F\xc8D\x13=0i\x0d-\x9e\
-?\x9f6\xad_\xef[\xd7\xbf=\x05\xc0:\x14@\xaf\
-\xc0\xca\xa5K\xe8\xa7\xe9\x0b(\xa7\xe0\x80\xde\x10tt\
-Z\x9cW\xbc\x85\xcaf\xcf\xa5u\xabV\xf9.\xeb\xef\
-/\x02 B\x01\x16\x01\xf4m\xa2@\xa8|\xe1\x02z\
-sJ9\xc5{\xba\xa8\x88\x0e\x1d\x01\x88C\x0b\xf7\xd0\
-\x7f3\xe6\xd1\xaae\xe5\xb4c\xebV1\x86\xc6\xa7\xae\
-\xbf?\x08@\xa3\xd5\xbc\x01(s\x5c0w.\xdd\xcb\
-.P\x88^\x1f\xa0\xa3\x13!#\xbf\x8a\xbe.]H\
-\xcb\x16c\xa4\xdf&\xef\x8c\xf3\x0f\x04\x01\xb0\x1e+ \
-\xba\x06W\xae\xa0\xb2Ys\xe8\xe2\xe2\x0a\xbda\xe8\xe8\
-\x14\x88c\x8f\xf7U\xf6|\x97\xcc\x9fg\xee\xf2\x13#\
-\xfd|\xed\xfa\xfb\x8b\x00X\xe7\x03\xe0\xfa\xac,/\xa7\
-\xa2\xb294\xaap\x87\xde@tth`\xae\xcc\xfb\
-JV\xd3\xfc9sh\xdd\xea\xd5\xa2T\xbeM\xe2~\
-\x7f\x13\x00\xeb\x01Cp\x81P\x1f\xf0\xc7\xb4\xb94\xa4\
-`\xaf\xdePtt\xd8\xb9\xfd\xae.\xde@3g\xcd\
-\xa6\xd5+\x96\x8b\xd1\xb2\x88\xfb\xdb\x94\xfcv\x04\xa0\xbe\
-\xbd\x04@\xcb\x07\x88\xb9\x03\xd6\xaf\xa7\xa5\x0b\x17\xd07\
-S\x17PN\xbe\xde3\xa0\xa3\xe3\xe1\xec\xa2-4\xa5\
-l6{\xbcKEO\x98\xcf\xfb\xfb[\x17\x80z\x08\
-\xc0\x81\xf6\xf4\x02D}\x80\x96\x14\x5c\xbb\x96\x16\xcf\x9b\
-G\x1fNYD=\xf2\xab\xf5F\xa3\xa3\xc3\x00\xe1m\
-\xc1\xf4\xd9\xa2\xce\x7fkE\x85\xf0|}\xde\xdf\xdf\xba\
-\x00\x1c\x80\x00lkO\x01\xb0N\x0a\xa2\x1f\x14q\xd1\
-\xc2\xb9s\xe8\xf5\xc9K(I\x9fOPG\x07\xc0\x91\
-\x05\xbb\xe8\xafis\xa8|\xd1B1\xc4W+\xf6i\
-s\xd7\xbf\xb9\x00l\x83\x00,ko\x01\xd0\xf2\x01\x96\
-\x9e\x81\x954\x7f\xcelzaR9%\xe4\xd7\xea\x8d\
-HG\xc0bX\xc1\x1e\xfa\xadt\x0e-] +\xfd\
-0\xbbO\x9bf\xfc[\x16\x80e\x10\x80I\xfe \x00\
-\x9a\x08 )\x82YPV\xafXA\xf3f\xcf\xa2\xa7\
-'-\xd3\x0b\x85t\x04$\x06\x17\xec\xa5\x1f\xa7\xce\x15\
-\xdd}\x08o\x11\xe6\xb6y\xc6\xbfe\x01(\x81\x00|\
-\xe5/\x02`\xdb=\xb8j\xf9r\x9a;k\x16=\xa5\
-\x8b\x80\x8e\x00$\xff\xf7L~\xe4\xb4\xd6\xafY\xd3>\
-\xdd}\xad\x0b\xc0W\x10\x80\xf1\xfe$\x00\x9a\x08`\x0e\
-t1f`\xd92!\x02\xcf\x94\x94S\xa2\x1e\x0e\xe8\
-\x08\x10\xb7\x1f\x96\x7f\xd1\xbc\xb9\x22\xa7\x85\xdc\x96\xd7\xe7\
-\xf5\xf3\x5c\x00\xf0o<\x04\xe0|F\xb5?\x09@\xa3\
-:|\xb8\xa9\x08\xcc\xa4\x97&-\xa5\x14=1\xa8\xc3\
-\xcf\x13~\xbfN\x9dm!\xff\x8e\x1d\x82\xfc&\x7f!\
-\xbfE\x00\xaa\x19\xe7C\x00\x061*\xfc\xcd\x0b\xb0'\
-\x02\xf3\xd8\x13xk\xd2\x22J\xcf\xaf\xd2\x1b\x9b\x0e\xff\
-\xeb\xea+\xd8N\x7fN\x9de&\xffn\x7f$\xbfE\
-\x00*\x18\x83 \x00\xf1\x8cR\x7f\x13\x00\xbb\x22\xb0|\
-\x19\xcd\x9f=\x8b>\x99<\x9fz\xe7\xeb\x8b\x8d\xe8\xf0\
-\x9f\x0a\xbf\xb3\x0a7\xd3\xc4\xd2\x99\xb4x\xbe\x8c\xf95\
-\xb7\xbf]\x0a}\x9c\x13\x80RF\xbcB\xbbwC\x04\
-\xde\xf3G\x01\xb0\x15\x01-1\xb8`\xf6l\xfa\xdf\x94\
-94\xbc@_\x82\x5cG\xfb\xd7\xf6_U\xb4\x9eJ\
-\xa6\x95\xd1\xe2\x05\xf3i\xfd\xda\xb5\xfeM~\x8b\x00\xbc\
-\x87J`\x90\x1f\x18\xcb0\xf9\xab\x08h\xf3\x08\xa0w\
-@t\x11\xae\x5c)\x8a\x85\xe0n\x9dZ\xb8U(\xb0\
-\xde\x18u\xb45\xe2'\xd6\xd1\xbd\xc5+i\xda\xf4\x19\
-\xb4d\xe1B1\xb2\x0f\xd9~\xbft\xfb\x9b\x0a\x80\x89\
-\xc9\x7f\xb9\xb5\x00\xf4el\xf6g\x01\xb0\xee\x22\xc4 \
-\x8a\xb5\xabVq\xac5\x8f\x8aJ\xcb\x84\x02\x87\xebK\
-\x8f\xe9h\xd3\xf1\xfc\x07\xe9\xa5\x92\xc54k\xc6\x0c*\
-_\xbcH\x14\xf9\xf8M?\x7fk0\x9963\xf9\xfb\
-J\x010\x99\x800~c\x82\xbf\x0b\x80u\xb1\x10\xdc\
-,\xc4ZK\x16,\xa0\xe9\xac\xc0\xe3\x8b\x97S\xb2\xde\
-C\xa0\xa3M\xba\xf9v\xd3\x97\x93\xe6\xd2\xdc\x99e\xb4\
-|\xe9R1\xbb\x15*\xfc\x02\x82\xfcR\x00&0\xf9\
-\xc3\xa5\x00\xd4\xd5i^\xc0\xb8@\x10\x00\xeb\xb2a\xb8\
-[P^(\xf0\xec\xb2\x19\xf4\xfe\xa4\x054 \x7f\x9f\
-\xdeHu\xf8l\x02\xcfs\x0a+h\xc2\x94\x99\xb4`\
-\xf6,\xd13\x85Y|1\xc5]\xbb\x97\xf7\xba\x86q\
-\x82\xf3B\x00\x1a\x1b\xad\xc3\x80\x8a@\x11\x01m\x96a\
-(\xaf\x98O\x80\x95x\xfe\xac\x99\xf4\x1b\xdf\x9c1\x05\
-[(X\x9fbL\x877\xa7\xee\x9eXC\xf7\x16\xad\
-\xa0\xc9\xa5\xd3E7\x1f\xc6\xab )\x8d\xe4t\xbb\x0e\
-\xecq\x1d\x9bT\xaeK\x01\xc0\x9fxa2\x05\xf3\xe3\
-\xd7\x81\x22\x00\xd6\x0b\x90bh%\xba\x09W\xadX!\
-\x92\x83\x93\xf8&\xddS\xb4\x92\x92&\xea!\x81\x0e\xcf\
-1$\x7f\x0f\xbd_2\x9f\xe3\xfd\xe9\x22\xd9\x87\xd0\x13\
-}\xfc\xdax\xfe\xc6\x00\xe2\x8cZ\xfao\x04\xe7\xcd\x7f\
-\xaa\x07\x00\x8c\xf1\xb7\xaa@gD\x00\x0a\xac%\x07\xd7\
-\xad^C\x8b\x17,\x107\xebC\xbei\x87\xea]\x85\
-:\xdc\x04\xd6\xea\xbb\xb8p#\xbb\xfce4\x8f\xbd\xcb\
-eK\x96\x88\xe1\xbcH\xf6\xf9u7\x9fcT\xa9\x1c\
-W\x9a\x0a\x80%\x0c\x88e\x14\x07\xd8\x8fj\x92\x1cD\
-^\x007\x097\x0b7\xed\x9f)3\xe8\xea\xc2u\x14\
-;Q\x1fL\xa4\xc3y\xe4\xe6W\xd2s\xc5K\xa8t\
-\xda4\xf6*\xe7\x0a\xefR\x8b\xf7\x03&\xd9\xd7\x1c\xc5\
-*\xc7\x15\xaa\xafW\x9a\xfcYy\x01W\xb6\xe74a\
-\xde\xc8\x0b`\xc2\x05\xdc,\x0c)^\xc8\xf1\xda\x0c\xbe\
-\x89o\x96,\x14\xae\x9cAo\xdc:Z\xb1\xfa\xe7\x16\
-n\xa2\x9f'\xcf\xa49e3h\xc9\x22\xe9\xf2\xc3\xbb\
-\x0c\xc0x\xdf\x1a\xe0\xf4\x15v\xc9o#\x00\x09\x8c\xa9\
-\x81(\x00\xd6!\x01n\x16n\x1a\xc6a/]\xb4H\
-t\xd9\xfc\xcd\xde\xc0\xf5\x85k)q\xa2>\xaaPG\
-s\xf4\xcb\xdfG\xcf\x17/\xa6\xa9\xa5\xd3h\xc1\x9c\xd9\
-\xb4\xa2\xbc\x5ct\xf1Y\xbb\xfc\x8d\x01\xca\x0b\xc6\x14\x95\
-\xdb\xa2\xeb\xdf\xee\x1f\x94A\x15\x81K\x19\xb5\x14\xb8?\
-\xd6\xdcU\xa8\xf5\x12\xac\x5c\xbe\x5c\xb8re\xec\x0d|\
-\x5c2\x97\x8e+\xd8\xae/F\xa2C\x00\x06\xe1\x1a6\
-\x0c\x7fL\x9e!\xad\xfe\xc2\x85b0\x0f\xb2\xfcH0\
-\x07X\x17\x9f=\xd4\xaa\x9cn\x1a\xfb7\x13\x00\x14\x05\
-\xc9\x0fE3\xfe\x08d\x01\xb0\xee%h\xe2\x0d,^\
-L\xf3\xd8\x1b(\x9a2\x8d\x1e+*\xd7\x07\x15u\xea\
-:\xfe\x06:\xb1`\x1b}R\x22\xc3\xc4\x05s\xe6\x98\
-\xad>rI\xc8)\x05\xb0\xcbo\x8d?TN;\xb6\
-\xfevB\x81\x11\x8c\x9d\x01/\x026\xde\x00fdE\
-n`\xd1\xfc\xf94{\xc6t\xa1\xfa7\x14\xae\xa1T\
-}\x16\xe2N5z\x0f\xf9\xa0g\xd9\xdd/\x99R*\
-\x0c\x02\xc2D\xc4\xfa\x18k\xa2Y}S\xe0\x13\x9fT\
-\x0e\x8fh\xd5\xfa7\xf1\x02\x80\xc6F\x03\xef\xf0\x5c\x07\
-\xb8\x00\xcd\xbc\x01\xf4\xe1\xa2\x82\x10\xc5CP}\x84\x05\
-\xdf\x94\xcc\xa2\x0b\x0b6R\x82\x9e\x1f\xe8\xf0\xd9\xfd\xfb\
-\x8a\x96\xd3\xbf\x93\xa7\xd3\x1c6\x000\x040\x080\x0c\
-\x88\xf5\x85\xd5G\xac\xdf1\xc8\x0f<\xcf|68e\
-\xfd\xedx\x01\xdd\x029!\xe8(7\x80\x9e\x02t\xe7\
- \xc6\x83\xea\x8b\xb0`\xd6L\x9aVZJ\x9f\x96\xcc\
-\xa1\xb3\x0a*\xc4H/\x9d0\x1d\x07\xd9\xf9\x07\xe8\xd6\
-\xc2U\xf4\xfb\xa4\x194k\xfa4\xb1(-\xdc}\x18\
-\x02\x18\x04\x18\x86\x0e\x10\xeb\xdb\x02\xf3|\xa4:m\xfd\
-\x1d\x88\xc0(\xc6\xf6\x8e$\x02ZO\x01\xd4\x1e\xaa\x0f\
-\xf5Gi'\x92?\xe8-\x98:\xb5\x94>\xe2\xb8\xf0\
-l\x16\x02\xdd#\x08\x5c\xa0\xcb7\x87->\x88\xff\xeb\
-\xa42\x9a9\xadTL7\x8f\x1a\x11\xe4\x83\xe0\xeek\
-\xfd\xfa\x01\x9e\xe1\xb7\x87\xed*w]'\x7f\x93P\xe0\
-\xe0A|\xc1\xdd\x8c:\xeaX\x17\xc8\x1c\x16\xa0\x8a\x10\
-I\x1f\xf4\x16\xc0\x1dD%\xe1\xdc\xb22*\x9d:\x95\
->c\x8f\xe0\xe2\x82\x0dz\x8e \x80\x80q \x03\xf2\
-\xf7\xd2=\x85+\x84\xc5\x17\xc4\x9f=\x9b\xca\xd9\xd3\x83\
-\xc7\x87\xb2q\xe4\x83\x90\x17\xea I>{}\xfew\
-Qm\xad\xe2\x92\xeb\xef\xb0W\xc0d\x8a\xe0\xc7\x8f;\
-\x9a\x00X\x87\x05Z~\x00\xc3\x8c\x91\x05^\xa5\x09\x01\
-{\x04\xd3Y\x08\xbe+\x99I7\x15\xae\x16\xbd\x06\xc1\
-\xfa\x04$~\x89\xe8\x89\xf5tL\xfe\x0ez\xb2h\x09\
-\xfd3y\x1a\xcd\xb2\x22>\xba\xf5P\x1cf\x8e\xf3;\
-&\xf15|\xc4\x88p\xdb\xfa\xb7\x90\x0f\xf8\xa7\xa3\x8a\
-\x00\x1a\x83\x96\x1f\xd0\x12\x85\x10\x02x\x04\x08\x0d\x90#\
-(+-\xa5\x09\x93\xa6\xd3\x13\xdc\xc0F\x16l\xd7\xf3\
-\x04~\x92\xd1O\xcf?H\x17\x14l\xa4\xf7\x8a\xe7Q\
-\xf1\x94R\x9a=]v\xe9\xc1\xd5\xb7&><\xbd\x0e\
-\x18\xe7\xdb\x02\x1cM\xf1\x0a\xf9\x85\x00\x10Y\x8b@\x1e\
-\xa3\xac\x03_\xbcfB\x00\x8f\x00\xa1\x01f B\xb2\
-\x101$\x1aX\xc9\x94\xa9\xf4i\xf1\x1c\xba\xbap-\
-\xf5\xc9\xdf'\xe6\x86\xd3\x09\xd9\xb6\xd3q\x1d\xcd\xd6\xfe\
-\xc1\xa2e\xf4sI\x19Mc/\x0dE<\x0b\xe7\xcd\
-\xa3\xe5\xe5\xe5\x22\xc6\xd7\x5c\xfdNB|R\xb9\x99g\
-\xe6\xab6\xdc\xd7c\x11\xc0`!\xcb\xc4!C\x19\xf3\
-;\xf8\x854\x0b\x81\x16\x1a G\x00K\x82\x18\x12\xdd\
-\x87hh\xc8\x13\xcc(\x9dJ\x7fO\x9aF\xaf\x14-\
-\xa4\xf3\x0a6\x89l\xb3^a\xe8;\x17\x1f\xfd\xf7\x08\
-\xc5>+\x9eM\xc5\x93\xa7\x0a7\x1f\xd3\xc5/f/\
-\x0d\x13\xc6\x22\xab\x8f\xe4\x1e\xc6\x83t\x02W\xdf\x1a\xf3\
-Un\xca\x8a^w\xe3\xfe\x16\xf3\x01\x16o`Xg\
-\x10\x01s\x8e@M\x16\xa2A\xc1\xa2\xa0\x81\xa1\xa1!\
-<@\x01\x89\xf0\x0afL\x13V\xe8w\x0e\x11^(\
-ZD\xe7\xb3K\x9a\x9b\xbf\x9f\x22\xf4\xb9\x0a=\xca\xe2\
-w\x99XK\x87\xe6\xef\xa2\x1b\x99\xf4\x1f\x16\xcf\xa5\xfc\
-\xc9\xa5\x1c\x8aY\xac\xbd\xe6\xe6\xc3KC\xd8\x86\xac~\
-\x07N\xee\xb5D\xfea\x9a\xd5\xf7:\xf9\x9bx\x02\x16\
-\x11\x18\xda\xd1\xc3\x01G\xdd\x87h`\xa8\x16Cx\x80\
-.Dx\x05+\x96-\x13IC,h\x8a\x10a\xda\
-\xd4)\xf4\x17{\x06os\x5cz]\xe1\x1a:<\x7f\
-'%O\xac\xd6\x13\x88\xad\x00\x82\x99\xc5^\xd4\xc9\x05\
-[\xe8\xfe\xc2e\xf4e\xf1,*dK\xaf\x91~>\
-\xc7\xf6\x08\xc5 \xbe\x10a\xd4rh\xf1\xbd\xb9;\xaf\
-\xf3\x10_s\xfb\xa5\xe5\x07?}E~\x07\x22\x90\xd7\
-\x91\x13\x83\xce\x84\x07\xf0\x0a\xe0nb\xac\x01\xac\x10\xac\
-\x11\x0aL\xa4\x18\xcc\x16\xd5fe\xec\x19\x14MFO\
-B\x19=[\xb4\x98.+XO\xc3\xd9\xaaucA\
-\xe8\xcc\xb9\x03\x83\xea\xd6#l\x1a\x95\xbf\x8dn)\x5c\
-Eo\xb1`\xfe\xc1^\xd4\x94)S\xd8\xbd\x97\xa4G\
-\xd1\x0e<-\xb8\xf8\x98z\x1b\xa1\x18B2\x88p'\
-\xb4\xf6\xd6\xf8\xd7\x1c\xf3\xfb\xd2\xf2\xdb\x0d\x07,9\x81\
-\x14\xb5\x8b\xb0\xbe\x13\xde\x00\xb3W\x00\xeb\x03+\x84\x10\
-A\x13\x03x\x06\x18\x85\x88\xc6\x8bF\x8c.\xc5\xd9\xd3\
-Ki\x06{\x07\x10\x84\x1fKf\xd0\xebE\x0bh\x5c\
-\xe1J:\xbd`3\x0d\xe2\xf8\x16\xa2\x00+h\xe8`\
-\x9e\x02<\x1fL\xca\x929\xf1\x00\x1d\xc1\xde\xd0E\x05\
-\x1b\xe8\xa1\xc2rv\xeb\xe7\xd0\x9f\xec)M\x9e<E\
-Xy\x8c\xcf@L\x8f\x12]\xb8\xf7X\x03B#=\
-<.\xb8\xf8\x10]Q\xab\xdf\xf9\xac\xbd\x86:\x95s\
-\xdd\x04\x07\xc1\xc5\xb6\x22\xbf\x9dY\x84\xb4:\x81\xbb;\
-Z\xc5\xa0\xa7b\x00\xcf\x00q)\x1a/\xdcU\xf4$\
-\xc0;@\xb7\xa2\x14\x84\x99\x22\x5c\x98\xc9\x0d\xbf\x94-\
-^\xfe$)\x0a\xefr\xac\xfbh\xe1R\xba\xb6`\x0d\
-\x9d\x9e\xbf\x99\x0eco!w\xe2~Jaq\x00\x89\
-0\x8a\xcd\xe8G\x02aP\x09\x0e\xe1B\xcc\x9e6\xf1\
- \xf5\xcb\xdfK\xc7\xe6o\x17\xb9\x90\xdbX\xe0\x9e+\
-Z$\x12w\xbf\x97L\xa7b&\xfbt\xcd\xc2\xab\x84\
-_\xc8\x84G\x7f=\x04\x13^\x14\xba`\xe1\xdek\x96\
-^'}\x93\x0a\xbf\xbb\xad\xfb\xf9\xc1\xc5v\xf9\xd3\xdc\
-\x0e\x81\xeaj\xadl\xb8\xb43\x8b\x80=1@\xe3E\
-#F\xac\x0a\xef\x00y\x03X5\x08\x02\xa6\x96\x86\xa5\
-C\xc8\x80\xf8\x16\xd3\x9b#\xb3\x0dQ(cO\x01\x89\
-\xc5\xe2)S\xe9\x1f\xb6\x92?r\x08\xf1i\xd1,z\
-\xa3p\x1e=U\xb0\x90\xee+(\xa7[\x0aV\xd2U\
-,\x14\x17qXqV\xfe&:\x8d\x05\xe3\xa4\xfc-\
-tB\xfeV\xe1V\x1f\xafb\x94\x13p\xfc\xd9\xadt\
-\x22\xe3d\xfe\xde1\xf9\x15tn\xfeF\xba\xb4`\x1d\
-\x0b\xd4j\xba\xbd`\x05=\x5c\xb0\x84\x9e/X@\xef\
-\x16\xcd\xa1\xaf\x8ag\xd2\xaf\x93f\xd0\xc4\xc9l\xd5\xf9\
-\xbc\xa7\xf3o\xc0o\x01P\x83\x0f\xd1[0o.-\
-a\xaf\x08\xbd)\x88\xe5AxL\xe3\x86n;\x08&\
-\x84\x13=/p\xefu\xd27\xc1T\xc11Y\x9d\xeb\
-\xdd\xae>\x8f\x8b\x85,s\x09\xa4\x8a\x11H\x1d`(\
-\xb1\xb7s\x06\x8e\x04\x01\x96\x0e^\x02\xac\xde:$\x14\
-U/\x01Y\xee\x05\x00{\x0b\x02,\x10\x18\xba\x0a\x81\
-\x981e2M\x9bT\x22P*0\x89\xa62\xa60\
-&\x0bL\xa6I^\x04\xbeo\x8az\x0c\xa0T=6\
-0}\xf2$!Vp\xdf\xe7\xb35_0w\x8e\xe5\
-\x9c\xf9\xfca\xdd\x91\xb8Cu%\x84\x0f\xe1\x11~/\
-~7\xdcz[\xc2\xe3:\xa1\xe7E'}\x93!\xbd\
-\xcf\x99]~\x95k~\xf5g%\x00P%\x83:\x06\
-\xf9\x8f@\x9fY\xc8\xa7\x82\xa0&\x12\xd1\xf0\x112 \
-\xbe\x05\x19\xe0\xf6j\x9e\x02,#\x8aZ\x90O\x00`\
--a5\xe15,b\xaf\x01$\x9b\xdf\x8e\x80H\xc1\
-\x9aC\xb4\xd6\xb0G\xa3\x9d'\xce\x19d\x87\xa8i\x96\
-\x1d\x82\x87\xdf\x07\xf1\xd3\xb2\xf6\x82\xec\xaa\x85\xd7\x09o\
-w&\x9f?T.\x19\xacBn\xc5o\xff\xcc!\x81\
-<\xd1hu*\xa2)\x9d5I\xe8\xae(\x80\x1c\x9a\
-0\x800 \x0e\x12\x8c \x11\x04b\x0f\x13\x0a\xf5\x08\
-\x10\x09\x90\x0cB\xd1\x96\xc01a\xc9An\x88\x15,\
-9\xce\x0b\xe7\x87\xf3\x84\x98\xc1\xaa\xc3\xdb\xc1o1[\
-v\x9d\xec\xce\x0e\xe6\x99\xaar'\xda\xaa\x12W\x09\x88\
-?+\x01\xb0\x9eh\xf4\x0auZ\xe2*\xfd\x06;/\
-\x0a\x1a@\x1c-\x8c\x00\x99\xacE\x02$\x83P\x00 \
-]\x13Xm\xb7\xfb~\x0b\xdb\x1d}\x16\xc01ql\
-\x9c\x83Fpk\x92\x9b\xac\xce\xbdQ\xbf\x97\xce\xa2Z\
-\xe5\xc8\x95\xe6\x09<\x03\xc1\xea\xb7(\x04\x96\x89F\xf1\
-:V]\x98\xe0+u\x89\x22\xfd\xa6\xfb@,\xda\x0a\
-\xfau\xf7\x1a*\xd4U\xb9\xc6\x98\xe7\xed\x0f4\xab\xef\
-\x94\x10X<\x03\xa3\xba>\xd98\xb1R)\x96+\xc6\
-\x9a\xe5\x8d\x8d\xa4CG'\x80I\xb4y\xb4}\xb9P\
-'\xb8\x10\xdc\xe1\x88\xefphq\xd3\x84a\xb8\xbaV\
-\xf9\xe5\x8c\xf7\x18\xa5\x8c\x0aF5\x83\xaf\x96\xfe\xa7\xff\
-\x05\xfc_\xb5\xda\xa6K\xd56>Vm\xf3a\xb6\xa4\
-\xb7\xbbhGG\xfc\x135\x04\xf6\x11\xcf\x18\xc48\x9f\
-1\x9e\xf1\x15\xa3\x84\xb1\x8c\xb1\x8dq\x80Q\xaf\xb7)\
-\xfd\xcf\xcf\xfe\xea\xd5\xb6\xb9Mm\xab\x93\xd4\xb6;^\
-m\xcb\x83\xd4\xb6m\xb7\xdd\xb7\xd7\xdf\xff\x03(\x935\
-,Ql\x11x\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00@\xd5\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02p\x00\x00\x02p\x08\x06\x00\x00\x00\x09\x13\x5c\xa3\
-\x00\x00\x00\x09pHYs\x00\x00,K\x00\x00,K\
-\x01\xa5=\x96\xa9\x00\x00\x00\x01sRGB\x00\xae\xce\
-\x1c\xe9\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfc\
-a\x05\x00\x00@jIDATx\x01\xed\xdd\xd1r\
-\x1cE\x9a(\xfe\xafm\x8c\xb5\xe7\xbf\x7f,E\x9c\xd8\
-\xdbi\x9e\x00\xf1\x04#\xae7f\xc0\x10{\x8d\xfc\x04\
-\x03O0\xe2\x09\x06\x9e\x00q\xb5\x11\x1b\x81evc\
-\xaeG<\xc1\x88'\xa0\xf7j#\xe6Fb\xe3\xc4Y\
-\x18\xb0\xfbTVv#\xd9\x96\xd4\xd5\xea\xea\xae\xac\xea\
-\xdfo\xa2\xc7\xc6\xb4\x85\xd4U\x95\xf9\xe5\x97\x99_F\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\xb0\x16\xa3\xa0\xff\xbe\xfc~7\xfe\
-i\xf7Q\xfd\xfb\x9fb\xfc\xd2\xbf{\x18\x93\xd9\x9f\xef\
-\xc6\x0f\x17\xff\x19O\xde\xbe\x08\x00\xa0\xd7\x04p}\x90\
-\x02\xb4G\xbb\xbf\xa9~\xb7\x1f\xd3\xeau\xaf\x0a\xc6\xd2\
-\xafQ\xfd\x1a\xaf\x04l\x8b\xa5\x00\xee\xac\xfa\xfb\x17\xd5\
-\xd79\xad~=\xab\x02\xbb\xef\x04v\x05\xfb\xf3\xf9o\
-\xaa\x00<_\xefQ}\xbd\xc7\xf1\xa2\xfe}\x93\xeb\x7f\
-Q\xbf\xf2\xf5N\xbf\x9fT\xbf\x9f\xd4\xbf\xa6\xe0\xfe\x9f\
-\xf7\xfe3\xe8\xd6\xd5\xe7{~}\x93i\xfd\xeb\xee\xec\
-u\x9d\xc9\xec}\xf9\xba\xde\xab\xaf\xf3Y\xa4\xeb\xed\x99\
-\xe6:\xb9-I\xf7\xd3\xfe\xac\xfdx\xb9\x0d\x99\xb7+\
-\x97\xedE\xfa\xb3\x8b\xd9\xbd5\x89\x98\xddk\x92\x01E\
-\x10\xc0\x95(?d\x07\xd5\xd59\x98\x05j\xfb\xb1~\
-\x93\xba\xf1\x1f\xc5\xb3H\x01\xde\x87{\xdf\x05\x9b\x95;\
-\xf2w\xaak\x90\xaf\xf9\xb4\xba\xfe\xcb\x07\xe8\xcb\x9a\x07\
-\xf4)\x008\xab\xef\x81\x0f\xf7\xbe\x0d\xd6c\xfelO\
-\xeb\x0et\xfel\xef\xc6z\xcc\xafmz\xaeO#=\
-\xe3\x9e\xeb\xed\xf1\xf4\xfc\x9d\xba\x0f\x99\x0f\xfc\xe3\xd7\x01\
-A[\xdc_\x1d\x13\xc0\x95 w\xdc\xbf\xad;\xecQ\
-|\x10\xeb\xef\xb4\x9bH\x01\xddi\x1d\xd0\xfdp\xf1\xad\
-\xd1\xd6\x1a\xcc\x03\xb6iu\xcd\xe7\x0dm\x19r\xc3<\
-\xaa3\xb4\xa7\x02\xba\x15\xe4k\xfc\xfel0\x96\x9e\xed\
-u\x05kM]\xd4\xd7\xf4\xde\xaf\xd7V\x87;\x14O\
-\xcf\x7f[\x0f\x0a\xf2}\xb6\xce\x81\xc1m.\x13\x01\xe9\
-\xfe\xfaH\x86\x7f\x9d\x04p]I\x0d\xfb\xee\xee\xc7\x1d\
-?l\xcdM\xab\x072=\x94\x1f\xee}\x15\xdc]\xdf\
-\xae{v\x19\xcc\x7f\xb8\xf7Mp\xbb\x94\xf9\xb8\x0c\xca\
-\x0f\xa2l\xf3k{,P\xef\xa1\x14\xb4\xe5{\xed0\
-\xcalK\xce\xea\xfb+\xe2s\xc1\x5c\xfb\x04p\x9b\x96\
-\x1e\xb8\x88\xa3(\xbfa\xbf\xc9\xc5,\x98\xd3\xe07\xf5\
-r\xd0v\x10\xfdvq%\x98\x17\xcc\xcd\xa5k\xfc\xd6\
-\xee\x1fz\x12\xb4\xddD0\xd7\x07\xffQ\x0d\x10\xfe^\
-\x07m\x9fD?\x06\x80si}\xe6\xe72s\xed\x11\
-\xc0m\xc2e\xe3\xde\xb7\x07n\x91I\xa4`TV\xee\
-z\xe5\x8f\x8eW5\x99\x8d\xae\x8f\xb6\xb6A\xee\xff\x80\
-\xec&\x93H?\x97\xce\xb6\x1cC\xba\xd7\xa6\xd5 a\
-T\x05s\xa6\xf0W\x22\x80[\xa7\xe16\xee\xaf\x9a\xd4\
-\x0fdT/\x8d}\xba\xee\x1fW\xff\x7f\x18\xc3\xbf\xee\
-\x97r\x83\xbc\x1d\x99\x9b\xe1\x0e\xc8\xae\x97\x9f\xed\xed\x0d\
-\xd2\xbbt\x99\xbdO\xf7\xda8\x86\xe74\xa2\x0e\xe4d\
-\xf3\xef@\x00\xb7\x0e\xdb\x13\xb8\xbdjRO\xafm\xe3\
-z\x87m\xeb\xd4o\x96\xa7I\x86\x98\x95u\x8dO#\
-g\xdcM\xafn\xc2\xd7\xe7\x7f\xdc\xa2{mR\xbd>\
-\x11\xc8-G\x00\xd7\xa6\xed\x0d\xdc^\x953r\xff\x1d\
-_\xc4\x93\xbda\xef^\xd5\xa9\xdfd\x12C\x99^w\
-\x8d_u\x1a\x02\xb9\xf5yz\xfe~\xa4A\xd003\
-n\x8b\xa4\xdd\xd1\x87\xb2\xbd\xcd\x08\xe0\xda p\xbb\xc9\
-$\x86\xbcF.O\x95\x1e\xc5v6\xb4M\xf5\xb7A\
-\x16\xb8\xdd.g\xdb?\xd1\xd9\xb6$\xed^\xce\x81\xdb\
-Al;\xd3\xf6\x8d\x08\xe0V\xf1\xaf\xff5\x8e\x87;\
-_\x86\x07n\x91I]\xe3n(\x0f\xa3\x80}y}\
-k\x90O\xce\xffP}\xcfG!p[Lg\xbb\x9a\
-\xcb\x81\xc2Qp\xd5$l\x92\xbb\x95\x00\xee.\xf2\x03\
-7_\x9f@S\xd3jt\xf9\xdf\xf1Yo\xa7U]\
-\xf7UM\xea\x9dg\x8f\xf7\xbe\x88R\xe5\xe0<eA\
-J)\xaa\xdc\x17\x93\xd0\xd9./\xdfo\xc7!\x8b\x7f\
-3\x03\x84\x1b\x09\xe0\x96\xb5\xdd\xeb\x13\xda0\x89\xb4C\
-\xb3o\xebg\x5c\xf76\x95\x97\x91\x15\x9c\xb7eX\xd9\
-\xf6u\xcaY\xde\xcf\x83&&a\x80\xf0\x1a\x01\x5cS\
-\xb9\x81\xffrv\xd4\x15\xab\x9a\xd6#\xaa\xcf\xa2t:\
-\xf6\xf5)\xe5\x1e\x90\x05i__\x9e\xef.Xzs\
-w\xee\xab\x97\x08\xe0\x9a\xc8\xd9\x97\xe3\xb0\x1e\xa6me\
-\x8f\xd6u\xec\x9b\xd0\xdd&\x07\xc1\xf9\xba\xd9Q\xf8\xaa\
-\xbcQ!m\xfe\x18\x07wuV\x17Hw_\x09\xe0\
-n\xa5\x81\xdf\x84\xb4\x1e\xee\x93\xe2R\xe3\xa676i\
-\x12\x9b\x9eV\xd7\x91n\xca$\xd4\xf7\xca\xb4)m2\
-U\x1f\x02\xb8\x9b\xe54\xf7_B\x03\xbf\x19\xa5\xa4\xc6\
-M\x95wgS\xf7\x80\x8et\xf3\xb6}\xea\xeb\xe4\xfc\
-\x8f\xb3]\xcd\xb4'\x0d\xfe\x0f\xb7yp \x80\xbbN\
-\xae\xef\x95\x1axS\xa6\x9b\x94\xeaJ\xfdw<\xe9l\
-\x97\xaa\xa0\xbd{\xd3\xfa\x14\x8fOc\x1drp\xfe\xa7\
-\xd9\xd9\xb4lZ\xd7\xcfwW\xbe>\xff\x93Y\x9c\xb5\
-:\xdc\xd6\xcd\x0d\x02\xb8W\x19)u\xad\x9b\xd4\xb8)\
-\xb5\x92\xb4\xbf\xc6%\x07\xe7'\xa1<H\xd7\xb6k\xea\
-\xeb\xeb\xf3/\x0d\x186`K3\xbc\x02\xb89\xa3\xf3\
-\x92l\xb6\x91\x97q-Q{\xf7\x80\xe0\xbc4\xdb\x11\
-\xc4\x09\xde6k\x0b\x838\x01\x5c\x92\x82\xb7G\xbbi\
-\xea\xcc\xe8\xbc\x1c\x9bi\xe4\xad\x87*\xd9\xea\xf7@\xde\
-I\x9c\x827\xc1yY\xd24\xeaA5\xf5\xf5]\x0c\
-\x91\xe0\xad\x1bi\xaa\xba\xe4B\xe1-\xbb\x17\xdb.M\
-\xad<\xda\xfdk\x08\xdeJ3\xae\x1e\xc6\xd3\xaa!\xfc\
-M\xacK\x9e.\x17\xbc\x95+\xdf\x039\x83\xb6\xbc\x9c\
-Y=\x0d\xc1[\x89\xd259\x9b]\xa3aI\xed\x8a\
-\xe0\xad\x1b\xa9=\x1f\xe2=u\x83\xed\x0e\xe0,Z/\
-\xdd\xb8\xbaC\xd7\xb3\x1b\xd4Z\xc7\xbe\x18G\xdc!\x88\
-\xcb\x8d\xf8qP\xba\xe3Au\xb8\xda\x95\x12\x1c\xdfy\
-\xd0\xd73\xdb;\x85*x+\xdf\xa8z\x10\x1f\xef=\
-\x89\xb6id\xfb\xa8\xf9tj~\xb6\xbf\x0f\xfa\xa4\xff\
-;\x09-\xc7(\xc9Eu-\xf6\x87\xbe\xcer;\x03\
-8\xc1[\x1f\xa4\x83\xcf\xdf\xad\x02\xb8vK\x0e\xc8\xcc\
-\xf4Y\xf3 Ng\xdaG\x07\xbd;#y\xce\xa0\xa1\
-D\x93\xf8\xa1\xeaC\x06\x5c\xb6f\xfb\xa6P\xd3\x86\x85\
-\x5cN`\x1c\x94\xea\xa2\xbaF\x07k\x08\xde\xe6Gc\
-\xd1O\xcd\xd7E\xa6\x85\xccS\xd7\xbag\x9e\xf5r\xea\
-\xeb2!@Y\xc6\xf1V|\x19\x03\xb6}\x01\x5c\xaa\
-\xb2o\xc3B\xd9F\xd5\xf4\xe6?\xffC\xbb\xa9\xef\xd4\
-\xc8\xe6\xdd\x88\xf4[\x0a\xe2\x9e\xc5\x97\xe7\x8b7&\xdc\
-\x8bT\x10x\x12\xf4E\xba\xa6\xcf\xd6\xbaqi\x1d\xde\
-\xdc\xf9SH\x08\x94)\x9d\xa8\x93\xb2\xf1\x03\xb5]S\
-\xa8\xd6>\x95o\x1d\xeb\xdeL\x99\x0fO\xca\xae}\xd4\
-\xe0>\xf9\xf7*\xeb\xfaK\xbd\x13\x95\xfe\xe8\xcf\xd4W\
-?\xfb\x94\xb4<\xe5,\xd2.\xe0\x17\xf1\x9f\xd5@g\
-\x12W\x07:\x8f\xf7&\xd5\xcf5\x9e\xfd\xd3\xee\xec\x95\
-2\xa3\xe9\xcf\xf6\xeb\xb5e\xfd\xdb\xd9\xbd?\xc4\x925\
-\xdb\x13\xc0Y\x13\xd3\x07\x93z\xea\xb4\xed\xec\xdb\xd3s\
-eb\x86\xa8i\xe1\xce\x93\xf3?U\xefu\x94Q\xbf\
-\x9cV\x1d\xee{Q\xb2\xfe\xac{\xbb\xa8\xb3\xd6/\xe2\
-\xdb*X{\xd6\xca\xd2\x94\x93\xf3\x14\xc8\xbdSg\xb8\
-\xa6\xbd87z\x90\xeb\xe1\xb6#\x80\xcb\xeb*\xce\x82\
-\xd2\xb5\xbf\x13M\xd6u\xe8\x9a-|\x17\xc4\xf7\xcf:\
-\xcf\xc5m\xc3\xd3\xf3\x14\xbc\x8d\xa3T\xa3:\xf3\xfcY\
-\x15\xb0\x9d\xc6:\x9d\x9c\xefV\xd7\xea\xfd\xba\xf6]\xda\
-dT\xaa\xd2\xef\xa7;\x18~\x00g\xfa\xac\x1f\xd61\
-uj\xc7\xe96h\xb63\xf5?\xaaA\xdc\xcf\x06q\
-=\xf4A\x15\xa0\x7f\x13\xa5)w`\x98\xb2mi\xa6\
-\xe9\x8b\xd67\x815\x91\xa7^\xd3gs\x18e\xea\xef\
-N\xe7k\x0c?\x80\xfb\xfa\xfc\xa4N\xf3n\x8f\xc9+\
-\xff<\x8e\xf2\xb5?u*p\xdf&\xcd\xa6\xdb\xfa9\
-\x95z1{]5_\x97\xb4\x0d\xca\xab\xe7U\xe6\xd4\
-i\xb7\x81\xdb\xab\xca\x0d\xe4\xce\xaa\xb6\xe2\xdd\x18\x88a\
-\x07p\xc3\x9c>\xbb\xb8\xb2\x00\xf5\xbb\xb8W7\xeeg\
-\xf5\x9f\xdf\xf6\xe0\xe6\x07*\xbd\xe6\x0bR\x0f\x0aJw\
-\xb7?u:\xfc)\xb3\xf9B\xe4\x8b\xb8\xbe\x93O\xd2\
-\xb5\x1e\xd7\xbfN\xeb_\xc71TM\xce@\xccS=\
-\xe9\xbe\x18Gy\xf2:\xa5\xfc,\xffg\xfdkZL\
-~\x9b\x93\xf3\xf9\xf5M\xaf\xf4L\xef\xd7\xbf\x9f\x0e\xee\
-\xbe/k=\x5ci\xe7\x9c\x8e\xeaY\x86O\x8b\x08\xdc\
-^\x95\xfa\x9di\x945\x90\x1e\xd0y\xa9\xc3\x0d\xe0\x86\
-TX1\xafeH\xafo[]\xcf\x90\x1f\xae\xdfv\
-\xbcvaR5\xceoG\x9b\x86\x16\xb8\xe7@\xedt\
-\x16\xb0\x9f.\xec\xd8os\xb9\xf8\xf8 .w\x94\x0d\
-A\xb3L\xcd\xd3\xf3\xf7\xa3\x94r2\x97\xcf\xf57\xd5\
-5moz7\x07v\x07\xd5\xeb\xfd\xd9s=\x8e\xbe\
-+\xa5\xd3-kYF\x1a\xc4=Y\xfb\x1a\xb76\x94\
-\xb5\x89\xf0\x22~\x88\xb7\x87\xb0\xa1a\xb8\x01\x5c\xe9\x0b\
-L\x17;\x9b\x8d\xc87\x93\x12\xcf\x19\xba\x8fg)\xef\
-ql\xca\xc3\x9d\xf1\x1a\xa6N\xfb\x1e\xb8\xe7,\xeb\x8b\
-\xf8\xaa\xb5]c7)#\x88oK\xd3\xa9\xd4\xbft\
-\xf8\xb3\xce\xa7\xba\xda\x0d\xdansr~\x10\xf9\xd9N\
-\xbf\x8e\xa3\xbf\xba/\x05QJ\xbf\x92\xfb\x86'Ef\
-\xddnRR6\xae\xe9\x0e\xf6\xc2\x0d3\x80\xebs\x06\
-fS;\x87n\x93G\x99G\xb1\xee\x07m=\x1b\x17\
-R\x03q\x10}\x94\xaf}j\x98\xbf\xeal\x01r\x0a\
-\xe66q\xed\xd7\xa5I\xa6\xa6\x9b\xdap\x93Y\xe0\xf6\
-U\xa7\x9dnz\xb6\xfb\x1b\xacw;\x95ZJ\xf6\xad\
-\xcfS\x809;\xfc\xc7\x02\xd6\xa2\x0e\x22\x0b7\xbc\x00\
-\xae\xaf\x19\x98\x12\x02\xb7W\xad;\x90k;\xfb\xd6\xd7\
-]\xa7%^\xfb\x9c\xb5\xf9c\x0f;\xfafS\xa9'\
-\xe7'\x1b\xaa_5\x89\xf4\x0c\x95vP{_\xafo\
-\x97\xc1K\xf7\xd9\xb7\x14l\x1c\x16\xb9+wY%$\
-Y\x06PVdx\x01\x5ci\x0bL\x17)\xb1\xf3~\
-\xd5:\x1e\xb6\xb6\xb3o}\xdcu\xda\x8fk\x7f\x10}\
-\xeb\xe8\xa7U\x16\xf3\xa3\xbd\xc7\xb7\xbe'g\x1b\xd79\
-\xd0+kW\xe0M\xd2\xf5\x9d\xd6\xe7E\x8e\xa3\x1f\xba\
-\xc9\x9ct?8\xbc\x88\x07\x0f\x0e\xe2w\xff8\x9c\xd3\
-\x04\xba\x0f\xe2z\x9f\x85\x1bV\x00\xd7\xaf\x0c\xccE}\
-\xe6g_R\xe1m\xaf_h;\xfb\xf6\xf5\xf9\x9f\xea\
-\xd1y?\xf4g\xf1\xf1\xdc\xa6\xa6\xd5\xdb\xb3\xb8\xde\xd3\
-I5\xd8[G\x99\x83\xb4>\xe9\xcd\x9dOZ?Q\
-d\x9d\xfat}\x9b\x1e\xa3\xd6\xa6n\xb3o\x17U{\
-\xb9\xdf\xab\xfb\xa9\xa9\xae\xfb\xec\x9e\xaf\x85\x1bZ\x00\xd7\
-\x8f\x8d\x0b}\x5c\x80:\xd7\xc6\xa8i=\xd9\xb7~L\
-\x9b\xe7\xa0\xbd\xbf\x8bg\xfb\xb3\xbet\xf1z\xa9\xf6\xb3\
-p\xfd\x9e\xe2*\xbf\x08\xebU\x9b+\xc8\xda\xedy\xba\
-\xc3\xcb\xbc\xbd\xaa\xdb6\xa5\xd7Y\xb8{1\x149\x92\
-\x1fG\xd9.fk8\x1e\xf72xKR\xf0\xf1\xa0\
-.=1\x89\xbbzs\xe7(\xda\xf4\xe6\xce\x1f\xa3|\
-\x93\xaa!\xde\xefu\xf0\x96\xa4\xef\x7fT5x\xab\x5c\
-\xff\xcd8\xa8\xda\x84\xdf\xde\xfa\x8eT\x8ee\xd4R\xc7\
-\x9c\xbeN\xca\x92\xf4y}R\xfa<\xd2\xc0\xaa\x1f\x99\
-\xec\xa3\xd8\x94\x9f;\x0dh\x0f\x07\x1d\xbc%\xb9M9\
-\x8an\xecV\xff\xfb8zj8\x01\x5c\x14\x9f\x15\x98\
-\xd4#\xa9!\x14\x10\xfc\xdd\xdew\xd5\x03\x97\xb2\x1b\x93\
-XV\xca\xbe\xb5]6\xa4\xf45\x8fi\xb1\xec(\xde\
-\x1dLC\x9c\x03\x9fwcT\xfcr\x85\xe3\x85\xef\xb8\
-\xdfB\xbb1\xad\xb3\xaa\xef\x0df\x8a+\xb5Q\xe5\x07\
-\xe9\x8b\x03\xf46t\xd9\xbeL\xeb\xcd/\xfd\xdf\xb0\xd0\
-D\x0e\xe2N\xa3\x0b\xd3\xfe\x9e\xd44\x8c\x00\xae\xfc\xec\
-\xdbY}T\xd4\x90FR\x97\x9d\xf8rEQ\x7f\x89\
-vw\xe3\x95\x9e}K\xd9\x8c\xb4\xd3\xa9\xaf\x19\xd7\x9b\
-\xa4\x9f'gk\x8e\xa2\x5c\xe3Y\xdbp\xb3\xdfW\xd3\
-pw\xef8\xf2\x94\xe9\x00\xeaI\xbd&?\xdfi\x90\
-\xb6\x99Zuws\x14\xeb\xb6\xb3\xf3~taT\xaf\
-\xf3\x1b\xde}u\xbb\xb4\xf1h\x12\x9b\xb7\x99\xc1\xc0\x1a\
-\x0c%\x03w\x14\xa5J\x0bnSC8\xc4\x05\xa8\xb9\
-\x13\x7f\x5c\xff\x8c\xcdL\xe2_Z\x5c\xb8_v\xf6-\
-u\xee\x1f\x0c\xe5\xc8\x96\x1b\xe5)\xe14\x82-5@\
-=\x5c\xf8\x8e\xbbe\xe1rF\xbd\xb4\xf2 mJA\
-\x5c:7rZl\xa6u\xfd\x1do7\xf5\xca&\xad\
-/3\xe9\x83\xd4\x9f\xbc\xd1Y\xb6\xb3\x97Y\xb8\xfe\x07\
-p%g\xdf\xe6\xbb\xa5\x86\x96}yU\xfa\x19\x9b5\
-\xf2G\xd1\xa6r\xb3o\x17\xb3\xce};\xa6?\xd2\xcf\
-\xf9\xa0.3R\xe2}\xbe\xb8\x93\xff}\xbd\x18~\x99\
-\xef}2\xb8\x8c\xfam>\xaa3\xad\xa5\x1c\x83\xf4\xaa\
-\xa3X\x97\x7f\xfb[>[v\xf3\x8e\x069\xe0o\x22\
-g\xc47\x7f\xaf\xf5\xa9\xf4\xd8\x15C\xc8\xc0\x1dE\x89\
-\xba\xd8\xea\xde\xa5\xdc\xc8\x9f\xde\xfa\x9e\x87;\xb7\xff\xfb\
-e\x94\x9b}\x1b\xfe\xae\xb1\xeb\xa4u\x91\xe5\x06qG\
-\x0b\xdf\xd1\xbc\xd3\xc8\xc1\xdb\xb6u\xb0\x8f\xf7>-4\
-\x13\xb7\xbe,\xdc\x83\x07\x9b_\xdc\x9e\xa6N\x87\x9c\xd5\
-m&e\xf5'\xb1Y\xbb}\x9cF\xedw\x00\x97\x0f\
-\xa6\x1eGi\xb6-x\xbbt\xf3\x1a\x86\xb67/<\
-\xdc)\xf1a\xdb\xce\xe0m\xae\xdc \xaeI'\xdf$\
-[\xba\x9d\xc1\xdb\x5c\xf3L\xfbf\xadk\xfa\xab\x8bi\
-\xb5m\x9c:}UWS\xa9=\x9cF\xedw\x00W\
-f\xbd\xa2\xb3\xeaS\xed\xf5\xf1\x1cw\x96\x1e\xbc\xbc\xf0\
-\xf9\xf5\x0e|\xba\xe4f\x87\xc5\x8e\xa2<\xc3\xdf\xf2\xbf\
-\xc8\xef\xea\xc3\xc6\xcb+C\xb1\xa8qN\x07\xcb\xdf\x9e\
-A\xde\xee\xe0m.\xb7memlH\x99\xf8/\xeb\
-36\xdb\x932\xfc\x9bN\x0eL\xb7x\xea\xf4U\xab\
-m.\xba\x9b\x91\x00ns\xf2\x14Zi\x1fxj\xe4\
-?\x18\xfc\x9a\xb7\xdb\xa4\x85\xcfo\xbcv].Z]\
-\x0f\xf6\xefu6e\x1c%\xd9\xa6-\xff\x8b\xa4)\xa0\
-\xd2v\xa76\xeb\xe4o\x1ad\x5c\x08\xdef\xf2 \xad\
-\xab\xdd\x827\xd9\x8d\xb7\xe2\x0f\xd1\xa6\xcdg\xf8'\xb1\
-\xb3s\x1c\x5c\xba\xbf\xf16d\x1c\x7f\xfe\x9f\xdfD\x8f\
-\xf47\x80\xdb\xd9)\xaf\xf8\x9eF>{u!\xea\xa8\
-\xe5\xec\xdb\xcf\x85e^\xf3\xa1\xc8\xdb\xb6\xe5\xffvi\
-wjY\xd3m\xbb\xf1(\x16\x95\x84\xb8i\xed\xd1\xa1\
-\xe7\xfa\x8a4H{P\xd8\xe0y\xd4\xf2Y\xbd\x9b\x9e\
-NK\xd9&\xf7\xd8\xcb\xba\xc8\xc2\xfd\xfd\xc7^e\xe1\
-\xfa\x1b\xc0\x956}\x9a\xea}y\x00\xaf\xba\x5c\x88\xda\
-\xe6\xf4\xe9I\x95E)k\xf3\xc2\xa4z\x8a\x04o\xd7\
-\xc9\xd3m\x93(\xc7\xe1\xad\xff6g\x97N_\xfa3\
-\x99\xd5\xeb\xe5b\xde%M\x95\xb7\xbb\x99\xa1\xed\x80p\
-\x11k\xdf\xae7\xdd\xf8\x8e\xd4\xfd\xe8\x91~\x06p\xa5\
-M\xa1\xe5\xb3=\x87]\xefkYW\x17\xa2\xfe\x10\xed\
-\x9dY8\x8dn\x0ak\xde$e]\xb7y\xca\xfc6\
-]\xd6u\xba\xde\xc1\x92\xd3\xa8g2\xab\xb7\xc8'6\
-\x9cF)\xda\xca\x9a\xe5\xf2!\xed\xae\xa9\xbbM\xdb\x1b\
-\xbc\x86d\x14\xcb\x96\xf8Y\xcdt\xc3\x81\xfb\x8a\xfa\x19\
-\xc0\x955\x85\xb6\x9dE\x17\x9b\xc8)\xf0OZ=(\
-\xb8\xa4\x9dB\x16\x1d/\xd6U]\xa7\x9b,>\xf7p\
-\x9em\xbb\xa8\xd7\xb3\xb2H\xdam_\xc6\x00\xa6\xad\xcc\
-\xfc\x1b\x0f6\xbb\x0e\xaa\xfd\x0d^\xc3\x91\xb3\xe2\xc7\xb1\
-9\xe3\xd67\xc4\xacQ?\x03\xb8QQQ\xb2N\xfc\
-6mf&\xf3\xf4i)\x9d\xeaDv\xa6\xb1.\xea\
-:]o\xf1n\xd4I\xa4\xefu\xe4\xb9n$\x1f\xb9\
-UJ\x80\xdeN-\xaf\xcd\xf6/\x17\xa6\xe8\x17\xb8\xbf\
-\xe1\x00\xf7Q\xf4\xa6\x1e\x5c\xff\x02\xb8\xee\xaac_g\
-\xa2\xe8\xe2\x06M\x8bz\xb0\x8e\x82f\xf2\x14\xf3Q\x94\
-a\x7f\xe1\x08\xdb\x92\x88e\xa5\xcfj\x12%hg\x0a\
-ls\xeb\xa0F\xb2o\x0b-\x7fR\xcajF\x85\x9e\
-\xect\x8d\xfe\x05p\x0f\x1e\x94\xd3\x89\xa7\xf5OlN\
-9\xd3\xa7\xa7\x02\xf7%\xe5\xd2\x22\xa7\xd1\xbd\xb4\x1b\xf5\
-\x9d[\xdf\xf1Xfu)9@/cCC\x1b\xd9\
-\xb3\xe9\x06\x03\xb8iAk\x08K\xb6\xd9@\xb77\x1b\
-\x19\xfa8\x85ZF'n\xe1\xe9\xe6\x952u\xfep\
-\xe70X\xde\xfdB\xb2p==\xb8\xbahi\x1a\xb0\
-\x8c\x00\xfd`\xa55L'\xf5\xdf\xdd\xdc\x1a\xa86\x8f\
-\x17\x1c\xb2\x17\xcf\xdb\xdb\x08\xb7\xc8T\x00\xb7\x1e\xe9\xe1\
-*e\x97\x88\x8d\x0b\x9b\xd5Ee\xf4\xeb\xa9\xd7tW\
-]\xd4u\xbaNYkh\x87\xa3\x94\x00\xfd\xd1\x0a;\
-\xd5\x7f\xfey\x1c\x9b3\xd1\x964t\xef\xfeil\x8e\
-M\x0ckq\x7f\xc1\xd4\xc7\xa6\xc8\xbem\xde\xc3\x9d2\
-\xae\xfds5\xdfVRFq\xdf\xfd>\xed4\xeb\x8d\
-M\xafU\xba\xc9*\x19\x94\x9d\x07\x8fbSF\x85\x1d\
-IV\xb2\xbc\xb9hS\xf7\xd68z\xa2_\x01\xdc\xf3\
-BF\xce\xbf\x84\xf5O\x9bVF\xd6d\x12\xff\xb2w\
-\x1a\xdc\xdd\xa8.\xd3\xd1}'\xff\xa8\x90\xc1\xe0\xd0\x94\
-\xb0#u\x95\xb6\xe2\xe7\xe7o\xc7\xe6\x08\xe0\x963\x89\
-M\xe9\xc9\x91Z}[\x03w\x10\xdd;\xd3\x89w\xa0\
-\x8c\xa9\xf3\xa3`5\xb9\xaeS\x09\x9d|o\xd6\xb9\xf4\
-L\x09\xbbw\xef\x9ea\xbdw\x7fs\x1d\xf7T\x00\xb7\
-\x94Mf,\xff\xfe\xe3^\xf4@\xbf\x02\xb82\x16\x17\
-\x96S\x94t\xbbt\x7f\xed-8n\xc7\xfdB\x16\xbb\
-\xd3\xbe\xeb\x8e#\xeb\xc2n\x0f\xa6\xc1\x9e\xc7\x0f\xc12\
-&\xb1)\xbf\xf4c\x1d\x5c\x7f\x02\xb8M\x1for\x13\
-\x9d\xf8\xe6\xe5k\xdf5\x9b\x17\xda\x92\xd7JM\xa2K\
-=\xdai\xd6;/\x9e\x97\xb0\xc4\xe4\xae\xe5\xa6\xc6\xb1\
-)\xffk\xe7\xfb\xa0\xb9\x17\xcf7\xd7\xfe\xde\x0fS\xa8\
-\xad\xda\xf4\xf1&\xd7I\xb5ht\xe2\x9bW\xc2\xb5\x8f\
-\x22\x16\xdf\x0fG\xf7\x05L{udN\xaf\xdc\xbb\xdf\
-}q\xda\x17=\xc8\xc0\xfd\xedG\x198V\xd2\x9f\x00\
-\xae\x845+\xce\xac\xebF\x09\xd7^\xe6\xb5]\xf7\x0b\
-x\x96\xfa0\xcd\xd6G%L\xa3\xde\xeb\xc1\xb5m\xf3\
-\x8c\xe8m0\xba\x7f\x1e\xbc\xa4Ok\xe0\xc6\xd15\x9d\
-x7^t\x1e\xc0\x9d\xc9\xbc\xb6\xecy|\x17]\x9b\
-\xda\x89\xbaF\xdd.\xd07E><o\x14\xb0{\xbd\
-0\x02\xb8\xe6t\xe2]\xb9\xd7\xf1\xdaG\xf5\x9a\xda\x97\
-\x8f_\xea\xf6s\x1d\xf5\xa7`g\xeft\x7fD\xd48\
-`\xe0\xfa\x13\xc0M;~ \x9dY\xd7\x1d\xd7~\x98\
-\xba\xdf\xad(K\xb3.\xa3\xd8\xdc\xd1G7)\xbd\x96\
-\x975\x98\xcb\xd9l\x8d\xbe^\x90\x81k\xaa\x8cs\xfe\
-\xb6\xd58\xba4*`\xbao\x98&\xd1-\x1d\xe8\xba\
-\xe4\x0c\xeb$\xba\xf4\x7f\x7f,\xbb\xc3\xff\xa7\x9d\xcd\x9d\
-\xfa\xc0 \xf5#\x80;9\x1fG\xd7Fa\xfa\xb4\x0b\
-'\x05\x8cR\x1f\xef\x99B]\x87i\xe7\xa5D\x04p\
-\xeb\xd4u\xa1\xda\xbb\x95\x82\xd8\xdc:\xab\x9e\x14\x8b-\
-\xc6&\x8b,?\xefG\x7f\xdf\x8f\x00\xee\xe7\x9fu\xe2\
-\xdbj\xb3\x87K_g\x12\xacG\xf7\x99\xcdq\xb0>\
-\xf7z\xb9\xe8|s\xdf\xf3\xb4\x1f\xb5\xc6\x0ab\xc0\xf5\
-\x8a~\x04p\x9b<`\xf8z\x93\xa0\x1b\xae\xfdp\xe5\
-\x03\xaa\x19\xaeItiTx\x80^\xfa\xf7W\x9e\xcd\
-\xadY\xedI\x91\xe5\xbe\x9d\x85\xda\x95I\xb0\x9dF\xb6\
-\xae\xafY\x97\x9f\xef8X\x9fMV\xce\xef'\x9bh\
-\x96\xb1\xc9\xd20=)\xb2\xdc\x93)\xd4\x8ew\x9f\xe8\
-\xc4\xb7\x99k\xbf^>_\xb6\x93Zu\xcd\xfd\xeb\x7f\
-\x8dcsS\xa8\x17})\xb2,\x03\xd7\x8cN\xa6+\
-\xddo\x1d\x9f\x04\xb0\xbc\xee+\xe7\x8f\xa3l\xfbJ\x89\
-4\xf4pg\x93E\xb7'\xd1\x13\x028\x00\xda\xa7r\
-\xfeb\x8f\x9c\x06\xd2\xc8(\x0ebSF\x028\x00\xe0\
-6\xd3\xf8 Xl\xba\xc1\x00\xae\xeb\x13b\x96 \x80\
-\x03\xba\xd3\xf5h\xd7\x14\xd6\xfa\xa8\x9c\xbf\xd8H\x00\xb7\
-P^\xff\xb6\xb9\xf5\x82]\xd7/\x5c\x82\x00\x8e\xb2=\
-\xb8\xdf\xf5v\xeeq0\x5c\xaa\xe1\x0f\xd9$\xca7\x8e\
-\xa7\xe7\xbf\x0dn\xb6\xb3\xf3~lR\x8f\x8a\xf6\x0b\xe0\
-\x9a\xe8\xfa,N\xba$C3d\xaa\xe1\xaf\xcf&+\
-\xe7\xf7\x99i\xd4\xdbM\xe3\x93\xd8\x9c\x8b>\x15\xed\xef\
-G\x00g7\xd3\xf6\xfa\xf1\xe7n\xeb\xf1\x08\xde\xd7m\
-\x12]R\x0d\x7f\x9d\x0c~\x9a\x18\xc5\xa1\xa9\xfc\x1b\xfc\
-{\x9d\x9d\x1c\xc7\xe6\xf4\xea\xc4\xa5~\x04p\xdd\xeff\
-\xf2pu\xe5\xc1\x83\xae\xaf\xfd8\x182\xcf\xf6\xba\xbc\
-\xe8\xf8\xd9\xe9\xfa\xac\xdd\xe6v\xab\xff}\x1c\xbc\xee\xe7\
-*\xb8\xdd\xa4Q<\x8b\x1e\xe9G\x00\xd7\xfd\xc1\xb2\xbb\
-\xf1\xe7\xff1R\xefB\xf7\xc7-\xed\x1a\x1d\xaf\xd5$\
-\xba\xa4\x98\xea\xfat\x7fTT\x7f\xca\x98lv\x9a\xb0\
-\x1f\xd2\xe6\x85\xd1\x86\x03\xb8_:?\x9fy)}Y\
-\x03\xd7\xfd\x83\xf8\xd3\x8f\x1a\xfa\xeet{\xfd\x1f\x85E\
-\xc6\xeb\xd3\xed\xb5\xbd'\xc3\xbaF\xdd\xb6\x99\xcf\xa3\x17\
-\xc7!\xcd\xa4\xcd\x0c\xb2pW\xbd\xb9\xf3\xc7\xd8\xacI\
-\xfc\xcb\xdei\xf4H?\x02\xb8\xc7\xf5\xb1\x16\xdd6\xf4\
-\x0e\x1e\xeeR\xb7\xd7^\x96f}\xba\x9e\xe6\xdal}\
-\xa9\xed\xf1o\x7f\xeb\xfe\x99\xe9\xc9\x81\xe4W\x1c\xc9\xf6\
-\xcft\x91}\x1b\xc5i\xf4L\x9fv\xa1v\x9d\x85;\
-\x08\xba\xd1u]\x9e\x91k\xbf6\xbf\xfcly\xc4\x10\
-\xbd\xf1\xa0\xfb\x13\x06\xfe\xf9\x1fzS\x0ebf\x1co\
-\xc5\x1f\x82tt\xd6Il\xda\xb4_\xeb\xdf\x92\xfe\x04\
-p]w\xe2F\xea\xdd\xb9\xd7\xf9bdg\x16\xae\xcb\
-\x83\x07\x93\xe8\xdaO?\x1e\x04\xed\xea\xbe\xbd\x9cD\x1f\
-\x8d\xe2\x93\xf8\xfa|\xbb\x07\x14y*y\xf3\x19\xdc\x1f\
-\xe2\xdb\xe8\x99\xfe\x04p\xf7\x0a\xd8\x89zrn*\xad\
-\x1b\x93\xe8\xd6\xae3\x0b\xd7\xa4\x8c\xe5\x11\x07A\xbb\xba\
-\xffL'\xd1O\xbb\xd5gw\x1c\xdb*\x9f\xbap\x14\
-\x9b\x96>\xf3'{\xbd;\xbb\xb7OS\xa8\xdd\xd7g\
-y\x11\x9b\xad\x08Mv\xbf\x80k\xaf\xd8\xe6\xfa\x8c:\
-\xcf\xae\xbb\xb6m\xca\xeb\xdf\xc6\xd1\xa5\x1e\x1d\x87t\x8d\
-\x83*Y\xb0\x9dS\xa9y\xeat\x1c\x9b\xd6\xc3\xe9\xd3\
-\xa4OS\xa8\x93\xe8\x9a\x91z7\x9e\x17\xb0\xb5{\xd3\
-\x0bj\xb7K\xd7\x9d\xed\xae\xe3\x8cZ\xf4\xe0A\xf7\xbb\
-)\xbb_v\xb1\x9ai|\xbeu\xf7\xe4\xc9y\xdau\
-\xda\xc5,\xd7$>\xdc\xfb&z\xa8?\x01\xdc\xa8\x88\
-\xf9\xe9\x03k\xa1:\x90\xa7\xd9&\xd1-\x9d\xfc\xba\xbc\
-x\xde}\x80.\x0b\xd7\x9e\x12>\xcb\x9e\xd5\xf3\xba\xc1\
-\xb3\xadY\x0f\x972\x8e\xd3\x0e\xa6N\x93\x1e\xee>\x9d\
-\xebO\x00WF'\x1ev\x09u\xa4\x8c)\x91\xa3\xa0\
-}\xf7\xee\x9fF\xd7\x1cg\xd4\x8e\xcd\x1f}t\xbd\xff\
-\xd3\xeb)\xd4\xb9\xdd:\xb8\x18z\x10\xf7\xf4\xfc\x9d:\
-\xe3\xd8\x957w\x8e\xa2\xa7\xfau\x98}\x09\x9d\xf8H\
-\xc5\xecN\xdc+b\x94t\xb0\xf5;\xc4\xd6!\x9f\xb6\
-\xd1\xfd&\xa5G\xd6\xb8\xae\xec\xe7\x22\x96\x1a\x9c\xf5q\
-A\xfa\x0d\xc6\xf5\xf1NC\x1d\x5c\xa4\xe0-:l\xdb\
-\xd3\xe6\x85\xfe\x95\x9b\xf9U\xbf\x02\xb82:qSi\
-](a#C&\x80_\x87\xae72d\x87\xc1\xdd\
-uQ|\xf5:e\xdcKm\xda\xaf\x06\x17\x7f\x19\xdc\
-\xe0\xf12x\xeb.8\xedq\xf6-\xe9W\x00WN\
-'~\x14l\xd6\xef\xf7\xd2\x1a\xc8\xeeG\xd5\xa6\xda\xd6\
-\xa5\x84]`\x07\x06g+\xd8\xfc\xd1G\xd7\xeb\xe9\x8e\
-\xc2\x05\xf6\x075\x9d\x9a\x9f\xb3\xd3\xe82xK\xff\xfd\
-\x1eg\xdf\x92~\x05p\xa5t\xe2\x1a\xfan\x941\xb2\
-\xde\xb5\x0er\x0d\x0c\xce\xfa-g\xdf\x0e\xa2\x04\x0fw\
-\x86\x96\x81\x9b\x1b\xd7A\x5c\xce\x5c\xf5W.\x91r\x1a\
-\xdd\x06o\xe9>9\x8c\x9e\xebW\x00\x97\x94\x93\x1e?\
-\x0a6\xad\x8c\x91\xf5\xa8\xba\xf6\xd6\xc2\xb5\xcb\xe0\xac\xdf\
-\xde\xdcI\x9d\xf28\xbaw\xd6\xf7\xac\xca\x02\xe3H?\
-\xe3\xd7\xe7ed;\x97\xf1\xe5\xf7\xbb\xd5\xf7\xfd\xa7N\
-7,\xcc\xf5|\xed\xdb\x5c\xff\x02\xb8R:\xf1\xdc\xd0\
-[\xf4\xdcT;\xa3\xc6rj\xf5ls\xb5\xf4e\xe5\
-\xa3q\x16\x1b\x15\xf3l\x1f\x05\xcd\xe5\xec[\x19kC\
-\xa7\xfd-\x09\xb1\x94<\x88\xfc\xb27\x03\xc94(z\
-\xb4\xfb\xd7b\xee\x93\x9e\xaf}\x9b\xebc\x00WR\xc1\
-\xbd\xcf\xad\x87j 5\xf0m\xd4\xf8\xc9\xbb\x15K\xc9\
-\xc0\xca\xd44\x91\x8f\xc6i\xf6\x9c\x94\xb3vi{+\
-\xe1\xdfE)k\xdf\x92\x17E\xf5\x0f\xeb\x95\xd6\xe3\xe6\
-)\xd5\xee\x0b'\xdfd\x9eu\xcbS\xa6\xe3(\xc1@\
-\xb2oI\xff\x02\xb8\xd4\x89\x97Sxo\x1coE\xff\
-R\xd9\x9b\x96\x1a\xf8Q|\xd0J\xb0[N\x96&9\
-\x16\xc0/\xf0p\xe7\xcbhz\x96l.\xd6]F\xf9\
-\x87\xa9i\xf2FR\xf0P\xce)%\x93\xf8\x97\xbd\xd3\
-\xd8.\xe3H\xed\xd0\xd3\xf3\xef\x8b\x1bP\xa6A\xd0\xa3\
-\xdd\xef\x0b+\xbd5\x19J\xf6-\xe9c\x06.9\x8d\
-R\xa4\x9bS&\xe6fi\x9ay\xde\xc0\xef\xc6\xea#\
-\xc5\xfbEM\x91\x08\xe0o\x93\xb3X\x07\xf5\xef\x9bT\
-\xe7O\xc5\xba\xcbY\xe3\xba\xdd\x87\x8a7\xd1\xd5\xc1\xe3\
-7\xe9qE\xfd\x16\x8c#\xeal\xdc_:\xed\x8fR\
-\xc6-=\xf7)\xa0\xcck\xddJ\x1b\xe0\x1e\x0di\x8d\
-d_\x03\xb8\xaf\xa2,21\xd7\x99O\x9f\xcd\xb5q\
-\xc4NZ\xec^RC\x9d\x03\xf8r\xa70\xba\xf2\xea\
-\xb4y\xd3,\xcd\xfd\xa2\xd6\x9f\x99J\xbd\xcd\x9b;i\
-jl\x1c\xa5\xf8e\xed\xfdB\x1a`|^?\xf3\xe5\
-\x06\xf7\x07\x91\x03\xb9\xef\xebviSY\xe4\xff8\x7f\
-\xa7\xdeX\x912n9p\x1bGi\xd25\xfbp\xaf\
-\xb4\xd8a%\xa3\xe8\xab\x93j\xa41-\xe8p\xf9i\
-us|\xb4\xf7$\xb8\x94\x16\xd9\xbe\xdcq_\xc4\x0f\
-\xf1\xf6\xcaU\xd2\xf3\xb9y\xdd\xefd\xbatQ}?\
-\xfb\xd5\xf5\x1f\xf2\xee\xb7\xe5\xa4\x0e\xe4\xf5F\xfc\xa0j\
-@\x17\x9fi\xfc\xf4\xfc<\xca\x1a\xb9\xefW\xdf\xf7\x10\
-\xce\xd6lO:x|ZT\xb0\x9d\x0e$\x7f;V\
-u\xdb\xcf\xf5pg\xfcR\xf6&\x0f\xdc\x8e\xa3|\xa7\
-\x91\xbe\xcf\xb4\xc1\xa3\xcd6*e\xfaR\x1f\x9c\xcb\xc7\
-\x1cD\xd9&\xd5\xf5;\x18\xda\x0e\xe57\xa2\xbf\xd2Z\
-\xa8\x83(E\x0aTN\xce\xcf\xaai\xa0/\x82yC\
-x\xf8\xca\x9f\xce\x8f+Zu\x14\x94\xfe\xfeQ\x94\xd3\
-\xc9\xe73\x0b\xbf<\x7fw@G\xf8\xdc]\xbe\xf6\xe3\
-\xd7\xfe<g`\x17\x07p)\xcbQVp\x90\x0e\x15\
-?\x10\xa0\xcf\xa4e\x11e]\x9f<\x80^\xa7\xeb\x16\
-\xbe\xa7l\xce\xd3\xf3\xb4\xbek?\xcavP\xbfR\xba\
-\xe6\xe9\xf9\xa4>\x922\x9dj\x94\x8f\xa6\xbcX88\
-I\xd3\xa2\x8fvS&/\x15\x13\x1e\xc7\x8b\xfa\xd7\xf4\
-5w{\x94\x02\x1a\xd4\xd4\xe9\x5c\x9f3p\xbb\xd5\x0d\
-\x98F\xf9\xa5M]~P=\x10\xdb\xb3\x13\xea:\x97\
-U\xb6\xafsZ}>\xef\xc5\xaaN\xceOZ\x99\x92\
-mW;?[\x9f\xdd\x9e\x99i\x96\x81=9\xdf\xaf\
-\xbe\xc6_\xa3,g\xd5\xf7\xfe\xde\xd6\x07\xe8ij\xfc\
-\xe1N\xba6e\xb5\xbb\xaff\xc7\xee\xea\xa6\xfb7\x95\
-\xedx\xbc\xf7\xd95\xef/k&\xe8\xee.\xe2\xfa\x0d\
-D\xe3\xe8\xbb\x14|?\x1e\xe6\xecX_\xd7\xc0\xcd\x17\
-<\x1fGy\x8e{_){\x15y\xdd\xdbm;E\
-\x0fZY/x\xbf\xa8)\xd4\xb9\x83z\xdax[-\
-\xce\xcc4\xdb\x8d\xfax\xef\xac\xc0\x05\xe9\xfb\xf1Vl\
-\xef\xb5Mr\xf0\xf6\x97(-x\x1bPY\x88\x0e\xa5\
-k:\xbe\xe6\xd5w\x93\xea\xf5i\x0cT\x7f\x03\xb8\xe4\
-~\x91g\xde\xa5\x07a8g\xd6-\xa3i\x03\xdf\xc6\
-QT\xa5mf\x98KS\xe9}\xac\x92\xbe\xaa<h\
-9n\xf0\xce\xa3h\xa2\xac\xcd\x0cY*\x85\xb3\xad\x01\
-\xfa\xe5\xb3=\x8e\xd2\xfcR\xdc\xa66\xcapQ\xaf{\
-{<\xdc\xacy\xbf\x03\xb8R;\xf1\xf9\x9a\xa8m\xca\
-\xc4-\xd3\xc0\xb7U\x17\xa8\xc4N>\xc9U\xd2\xb7'\
-\x88\xcb\xf7\xf9i4\xcb\xcc4\xcb\xc0\x96\x1d\xa0oW\
-\x10Wr\xf0\xb6\x9d\xb5\xdfh\xe6p\xe8\x99\xd9~\x07\
-pI\xa9\x9d\xf8e]\x9e\xe1\x07q\xe9g\x5c\xae\x81\
-\xdfm\xa5VQ>?s\x12%\x9a\x1fu3t\x97\
-\xeb\x1d\x9bO\xab5\xcd\xc0N\x0b\xdd\xe1\x97\x82\xb8\xa7\
-\xe7\x7f\xdd\x8a,\xfb\xf2\xcf\xf6\xa6\x1d\x05\xbc*-\xe5\
-\xd8\x82\xb5\xe8\xfd\x0f\xe0\xca\xcd\xc2%\xa9S;\x1bt\
--\xa9|\x1e\xeci,\xdf\xc0\x1fE;\x8e\xa2TC\
-\xef\xe8\xf3}}\x1a\xcb\xae\x89J\x19\xd8&Y\xb8\x5c\
-\xb3i\x12e\xda\xaf\xdb\x9d!\x07q\xb9L\xc6i\x94\
-\x1b\xbcM\x86V\xd7\x8b\x16\xa4\xe0\xed\xa3k6\x9c\x0c\
-P\xff\x03\xb8\xa4\xdc,\x5c\x96j\x96\x0dqJ\xed\xa4\
-\xfe\x99\xd2:\xc4\xbb,jn\xe7,\xd1\xb2;\xf9d\
-\x98\x1d}:\xdf\xf0\xee\xb5\xf8v\x97X\x07y\x14\xe5\
-\x1a\x17\x7f\x16\xe5]\xe5\xf3+\x8f\xa3\xbc]\xfeW\x1d\
-\x05\x5c\x95\xda\xa4-\x09\xde\x92a\x04peg\xe1\xb2\
-4\xa5\x96\x8a\x9b\x0e\xa1#Ou\x81\x9e\xd6\xdb\xe7\x8f\
-b\x15\xd3\x96\xceP|\xa3\x98\xb3\x18o\x92:\xfa\xc9\
- 2\xb1i=T\xba\xf6\xab\xaecl\xfa\xf7S\x80\
-^\xf6\xb3=\x8e\x14\xe8\xe4\x80\xa7\xff\xda\xba\xbe\xeb'\
-\xfb\xc6\xcbr1\xfd\xc1\xee8\xbd\xce0\x02\xb8\xa4\xf4\
-,\x5c6\xae\xcfz\xecsG\x9e\xa6L\xd3q)m\
-\x14Q\xce\x0b\xc2W\x0fh\xfb\x10\xc0'9\x13\xfbe\
-o\x83\xf8t\xdf\xe6\x1a`\x07\xb1\xba\xdd\xc6\x99\xab>\
-<\xdb\xf9H\xb5\xf2\x0e\x14_F\xbb\xd7w\xcd\xee\x97\
-\x1e`\xb2I[z\x12\xd2p\x02\xb8\xbet\xe2\xa9\xe3\
-J\x1dy\xdf\xb2q\xf3\x91\xf9\xdd\xa7Lor\x14m\
-\xe8G\x00\x9f\x83\xd6\xbeM\xbb\xcd\xaf}\xfb\x87S\x1f\
-5zW\x7f\x9e\xedq\xe4\x12B\xfd\x0a\xd2S\xd0\xb9\
-\x9e\xeb\xbb\x1e\xf5\x99\x96omw\xb1t.\xe5i\xd3\
-\xad\x0b\xde\x92\xe1\x04pY\x9f.b\x9eV+\xbd\xb1\
-O\xd3\xa5i\xfd\xde\xbaF\xe6\xedf\xe1J,\xee{\
-\x9dq\xe4\x82\xcfegl\xd6}\xed\xd3\xe7\xd0<\x1b\
-\xdd\x9fg;\x07\xe9\x93\xfa\xb3+\xf9\xd9\xbe\x1c\x94\x9d\
-F/\xb2n3o\xee\x1c\x05$y\xc3\xc2VM\x9b\
-^5\xac\x00\xee\xf1\xde\xa4^k\xd6'\x97\x8d}Y\
-\x81\xdc\xbc\xf3N\xd3\xa5\xa3\xb5\x9f;z\x14\xedH\x8b\
-W\xfbT\xb4q\x1c\xf3\x8cMI\x81\xdc&\xaf}j\
-\x80\x9b\xecH\xed\xe7\xb3}4\xdb\xc0R\xd6\xb3=\xcf\
-\xb8=\xdcig)\xc4&M\x87y\xa6%w\x90\x96\
--l\xd1\x86\x85\xeb\x0c-\x03\x97\xa4\xc3\xe4'\xd17\
-\x97\x81\xdc\xc9\xac4G7R\xe3\x9e\x16do&p\
-\xcbr\xb9\x8d\xd5\x03\x98|\xbc\xdaQ\xf4\xcd\xa8\xde\x84\
-qZw\xaa]N\xadn6h\x9f[fGj\x1f\
-\x9f\xed\xf1K\x83\xb4\xae\x02\xf5tmS\xb6\xb3\x8f\x19\
-\xb7K\x93m\xef\xb0\xa9\xa5v\xfe\xbd\xaa\xbd\xff\x22\xb6\
-\x5c\x7f\x0f\xb3\xbf\xcd\xbfW\x8d\xe4/\xbdX3s\x9b\
-I5\xda<\xcd\xeb=\xea\x82\xb5\xeb\x93\x1a\xf7\xdd\xdd\
-\x8fg\x87\xc3\x1fD7\xda;\x08\xbe\xff\x07L\xcf\xaf\
-\xfd\xe7\xd5g\xf2]\xacS\x19\xd7\xbe\xd9!\xf7\x89g\
-\xbb\xb9tm\x1f\xed\xa6\xc1\xe0a\xa4r6}X\xdf\
-v\x9b\xdci\x9f\xc6:m\xefa\xf6}qVe\x8e\
-?\x90\x85\xcd\x86\x19\xc0%'u\x9d\xaa\xa1\xecT\xba\
-\xa8\x1b\xfc{\xd5kZ\x07:\xabu\xea\xb9a\x7f\xa7\
-\xee\xb4Gu\xc3~\x10e8h\xa5C;9\x1fW\
-?[Z\xb7\xd5\xef\x0e+\x9bw\xf6\xcf\xaa_\xcf\xaa\
-\x0c\xc4\xea\x0dW\xaa\xae?\xaa>\xebn\x83\xb6\x97-\
-\xb3\x8blX\xcfvrZO\xb5\xa6\xeb\x9b\xcbc,\
-\xff|\xe7g:M\xd3\xeeW_g\xbf\xbe\xbe9h\
-\x1b\x86\xbcP}\xfdk\x9d\x04p\xe5\xda\xd4=\xd0#\
-C\x0e\xe0vg\x9d\xf88\x86\xe9\xac\xfa\xf9&\x91\x1a\
-\xfc{u'\x9f\xb2\x17\xf3\xd7\xdcn\xe4sYw\xe3\
-E\xf59\xdc\xabw\xc0\xa6F\xbd\xd4\x86}Reb\
-\xdem\x94\x89Y$OE\x1e\xc7\xf0\xe4\xeb~\xef\xca\
-\xf5\xaf\x0fm\xae^\x7f\xbb\xf8!\x9e\xbc\x9d?\xbb?\
-\xcf\xd6\x5c\xfdT\xdf\x03\xe3\xc8\xf7\xc2a\x94\x9d\x89i\
-\x16\xc0\x0f\xff\xd9NR0wQO\xbdf\x93_\xff\
-\xcd\x8b\xea\xfa\xdd\x9b]\xc3i\xfd\x19\xcc_C\x95\x82\
-\xda\xb7c\x13\x04p%J\xeb_\x9f\xac=\xfb\xdaC\
-\xc3\x0d\xe0\x92aL\xb7l\x976GY\xc3\xcb\xd4\x0c\
-]\xf3\x00~XYVn\xf3pg\xbc\xb1)3\x01\
-\x5cYR\x7fp/>\xab\xd77\xf3\x9a!nb\xb8\
-\xd4\xaf\xd2\x12$\xb9 \xea;\xd1\x8e\xd4\xe0N\x82\xbe\
-\x18\xc7[\xd1\xec\xc8\xb9>\xeeJey\xa9=\xd8\x96\
-\xf5N\xd3\xba\xc6\xe6$H&\xf5\x9a\xc74\x98\x17\xbc\
-\xddh\xd8\x01\x5c\xf2\xb8\xba\x01\xfaQ\x04\x94K\xc7\xd1\
-\x86\xbc+5m\x8c\xd0\x00\xf4E\x0e\xe0\x9b\xed\xd4L\
-\xbb\xd0\x0c\xd0\x86+e_\xb6i\xa7aZ\xe7\x9a\xda\
-\xab\xd1 \x97~4\x95+\x09\xa4)sS\xa6\x0b\x0d\
-?\x80\xcb\xd2\xe2\xe8I\xd0\x17\xfb\xad\x9d-\x9925\
-Q\xfcY\xa9\xbc\xec\xb8Qm\xb8\xe4q=\xdd~\x16\
-\x0c\xcd\xa4\x9e:\xdb6\xa9\xbdz\xbc\xf7\xa4\x0ab\xde\
-\xde\xb2@\xeebV7\xf1\xedk\xa7\xaa\xb9\xd6v\x04\
-p\xe9\xa1xP\xef\xb8\x93\x89\xe9\x8be21\x8b|\
-\xb8\xf7\x8d\xe9\xb6^i>\x95\x9a\x8c\xe2q\x18\xa0\x0d\
-\xc9$\x1e\xee\x1cl\xf5\xd4\xd9\xf6\x04r/\x07n\xa6\
-K\x97\xb2-\x19\xb8\x88\xdf\xd5[\xf3-h\xef\x97\xe6\
-\x99\x98ER\xe3`\xba\xad?r\x00\xdf\xac\xa0u^\
-\x0fg\xaa|\x18.\xea\xe0M\x9d\xafl\xb8\x81\x9c\xc0\
-\xad\x05\xdb\x13\xc0%\x1f\xee}%\x13\xd3+)\x13\xf3\
-e\xb4%M\xb7M\xb7z}I\xdf\x1c7>\x82*\
-g\xd9\x0f\x82~K\xd9T\xc1\xdb\xeb\xae\x06rQ\x9f\
-\xec\xd1\xcfe\x03\xa3\xba\xe6\xe1{U_\xbc'p[\
-\xddv\x05pI\xce\xc4\x1c\x05\xfd0\xaa\xa6\xbe\x9b\x1f\
-x\xbe\xd8\xbd\xb0f\xaa?v\xeb\x85\xddM\xb3\xb09\
-\xcb~\x18\xf4\xd5\xa1\x85\xeb\x0b\xa4@.%\x22\x1e\xef\
-\xbd[=\x1b\xef\xcef\x15&Q\xb2\x1c\xb4}R\xbd\
-R\xd0\xf6\x9ek\xdc\x9e\xed\x0b\xe0\x92\x14\xc4\xc9\xc4\xf4\
-G\xda\x8d\xd6\xd6z\xb8\xcb\x9d\xa9\x82\xb8~\xd8\xaf\xc2\
-\xb8\xe6\x01|\xea\xdc\x04q\xfd\x93:\xf8|\xedh\xea\
-\xf1\xdeY=\xab\x90vl\xe6`\xee\x93B*.\x5c\
-\xccv\xd4^\x0d\xda\xbe\x90mk\xdf\x1b\xb1\xad\xd2\xb1\
-=_\x9f\xcf\x0f\x12\xa7|\xed\x15lM\x0d\xc9\xc9\xf9\
-{U`\x98\x0e\xf6\x1e\xceqC\xc3\x94\x02\xed\xe5J\
-I\xa4@\xe0\xe9y\xfa\xddqP\xbei]6b\xeb\
-\x0f&_I\x0a\xe6\xae>+'\xe7\x07\xd5\xff\xa7A\
-\xef\xfe\xec\xf4\x9dq\xac\xcfd\x168\xa6\xff\xfe\xb7\xb3\
-\xef\x85\x0d\xd8\xde\x00.\x11\xc4\xf5\xc5a\xbd\x93\xb4M\
-\x82\xb8>8\x9b\x1d`\xbe\xfc\xc8]\x10\xd7\x17\x87U\
-;,\xf3\xd6\xb6<My\xfa\xeb?\x9f\xd4\xcb\x10\xe6\
-\xc7\xe8\xa5B\xe9\xe3\x98\x07u\xd3_\x83\xbb\xf1+_\
-\xe5\xf2h\xc6\xd1\xec\xc8\xbe\xfc:\x8b\x17\xf1C}\x9c\
-_\x0a\xded\xd6:\xb3\xdd\x01\x5c\x92\x82\xb8\x93\xf3\x0b\
-G.\x15\xe9\xa2^\xd4\xbc\xae5\x13\xb9\xe1y\xb7\x0a\
-\xe2\xbf\x14\xc4\x17&\x8f\xe8\x1f\xaf\xd49\xe4 .\xfd\
-\xfd\xe3p\xe4Vi\xd2u1m\xba)\xf99:\x9d\
-\xfd\xd3\xb3`\x10\xb6s\x0d\xdc\xab\xf2i\x0dGAI\
-.\xe2\xc1\x83\x83\x8d,x\xfd\xa8\xde\xddu\x14\x94!\
-\xadO\xcd\xebfV\x1f\xd9\xa7\xccm\xde\x9d:\x09J\
-\x91\x9fm\xc1\x1b\xacD\x007gwjIR!\xcf\
-\xfd\xf8\xdd?~\x17\x9b\x92\xaf\xbf,l\xd7\xd2z\xa8\
-\x14P\xb7)\xedN\xcd\x1bW&A\xd76\xffl\xc3\
-@\x09\xe0\xae\xcaGx|\x10\x0a\x82v\xe9\xac\xb3B\
-\x9ei\xa7\xd4\x83z\x9d\xc8$\xd8\xbc\x14@\x7f\xb4\xa6\
-ctr\xb1\xdfw\xeb\xddqt#\x97\x93xW\x9d\
-7h\x87\x00\xeeU\xf9\xd8\xa5wC'\xbeyi\xea\
-,eJ\xbal\xe0\xe7\xd9\x9a2\xb6\xe3o\x8bI5\
-\xa5\xb6\xbf\xf6\x83\xcb\xd3\x94\xec\xe3\xbd\xc72\xed\x1dH\
-\x99\xd5\xb6\xa6\xc5\x81\x9a\x00\xee:\xf3\xa3y\x8c\xd67\
-'g_\x9e\x14\xd1\xc0\xe7\xaa\xe7\xef\xe9\xe87 \x05\
-\xca)\xe3\xba\xe9\xe9\xf2\x9ci\x9f\x04\xeb\x96\xeb.~\
-\xe4\x80rh\x9b\x00\xee&\xb9\x137Z_\xbf\xc9\xac\
-TDyu\xa0\xf2\xba\xb8tt\xcd$h_\x0a\xda\
-S\xa0\xdcE\xc65g\xda\xdf\x1b\xf8A\xe1\xdd\xca\xc1\
-\xf9\xbe\xca\xfb\x8dM\x02\x96 \x80[D'\xbe>\xb9\
-Z\xf7\xbbE7\xf0\xf9\xe8\x9a\xb7\x05\xf2\xad*#h\
-\xbf<_2m^1\xb5\xd7\x9e\x8bN\x83\xf3\xbe\xc9\
-\x81\xee\xb8jg\xbe\x0dX\x82\x00\xae\x89\xcb\x05\xd0\x9f\
-\x07m\x987\xf0\xab\xd5\xf9\xda$\x81|;\xd2\xb1h\
-\xa5\x05\xed)\x90\xcc\xcf\xf7q\xb0\x9a\xcb\xac\x9b\x93\x15\
-\x16\x9bD\x9a\xca\x17\xe8rG\x02\xb8\xa6\xf2\x02\xe8O\
-mpXQ\xce\xba\xbd\xdd\xcb\x06~\x9e\x8d\xcbgm\
-N\x82\xe6\xf2\x0e\xc4\xb4\x16\xea\xd3\x22\x83\xf6y6\xce\
-\xb5\xbd\xabI\x08F\x9aK\x19\xfd\xd4\x97\xb4}\xc2\x0c\
-[E\x00\xb7\xact\xce\xdb\xe5\x94\x9ai\x97\xe6\xe6\xd3\
-f\xfd\xc9\xba\xdd$\x15 \xb5~\xaa\xa9\xcb\xe9\xb4>\
-\xac\x85J\xd7\xd6\x94\xf92.\x04#K\x98O\x97\xa6\
-\x8c\xbe\x1d\xb9\xacH\x00wWyJ\xcd\xb4\xcbb\x97\
-\x0d\xfc\x90\x163_\xae\x9fz\xdb=p\xad\xf9u\xef\
-k\xb6\xf53\xd7v\x81<\x1d\xfe\xb6`\xa4\x91I\xc8\
-P\xd22\x01\xdc*t\xe2\xb7\xdb\x86\x06\xde=\xf0\xba\
-\xf49\xe4uP\xfd\xbe\xee\xae\xed\xf5\xf2\xf5\x1d\x17;\
-\x1d^\x9ay\x01c\x19JZ&\x80k\xc3eC\xaf\
-v\x5c\xb2\x8d\x0d\xbc\xce\xfe\xa2\xde\xe4\x93\xa7\x87\x9e\x0c\
-*\xcb\xf0\xfa\xb5\xdd\xc6\xa0e\x9eQ\xdd\x1b\xdc\xf5]\
-\xbf\x89@\x97u\x10\xc0\xb5)M\x11\xe6\xdaq\xdb\xd8\
-\x89k\xe0\x93\xd7;\xfbI\x0c\xdb\xd5\xa9\xd2O\x07}\
-\xdd/\xafm\xda\xc8t\x18\xdb\xb0\xd9!g\x8f>1\
-U\x0a\xe5y#h_j\xe8#\x9e\xc4\xc9y\xaa>\
-\xfe\x87j*1U}\x1f\xc70]\xcc\xca\xab|\xa1\
-q\xbfb~\x0f$O\xcf?\xae>\xa3\xc3\xea>8\
-\x88\xa1H\x1d\xfb\xf4~5E\xfe\xfc\xdb\xad\xbb\xee\xf9\
-\xda\xa6\xd7W\xd53~P\xfd\xfa\xf1\xec\x19\xdf\x8da\
-\xb8\x98\x0d>\xbe\x19\xd4\xbaU\x18\x18\x01\xdc:\xe5\x86\
-\xfe\xd3\xfaur\x9e\x1a\xf8yC\xdfw\x17\xb3\xb3B\
-\xbf\xd0\xc07\x90v6\xe6\xce~\x1c\xfd\x0e\xe8'\xb3\
-\x8e]\xb0>\x97\xef\xff\xf4z2\x0b\xd4?\x98\x05\xea\
-}\x0b\xe6.f\xcb?\xd2\xbdz\xe6\xfaB\xf9\x04p\
-\x9b\xf2x/5\x8e\xcf\xeaN|\x1a\xbf\x9d5\xf4}\
-\x0a\xe6R\x03\x7f\x16/\xaa\x06\xfe^\xf5sh\xe0\x97\
-\xf7r@\x7fP\xfd\xfa~\xf1\xc1\x5c\x0e\xd4\xd3\xeb[\
-\xc1\xfa\x02\xf3@=\x99g\xe6\x22\xf6\xabk\xbc\x1f%\
-J\xcfs\xbe\xb62m\xd0C\x02\xb8M{y\xfa%\
-\x8d\xd2\x0f\x22u\xe4e6\xf4\xf3Qy\xda=u*\
-hk\xd1e\xe6\xe6\xd3W\x82\xfa\x83\xe86{3\xa9\
-\xaf\xf9\x8b\xf8N\xa0\xbe\x82\xcb\xeb\x1b\xb3\xcckz\xb6\
-\x7f\x1b\xf99?\x88\xcd\xbb\x98\x05l\xe9\xf5mx\x9e\
-7\xe7\xc5`\xa6\xd6)\xcc((\xc7\xeb\x0d}\xfa\xfd\
-&\x1f\xfe\xc9,\xe3\x92\x1a\xf9of\xc1&\x9bvr\
->\xbf\x07\x0e\x22e\xe7\xd6\x17\xd8_\xbd\xdei\xf3\x81\
-N}S\xf25\x1eW\xafw\x22f\xcf\xf9\xb4\xfe\xe7\
-q\xac&]\xd3I\xe4A\xe2\xfc\xba\x9ey\x96\x1b:\
-9\xffcu\x1d\x8e^\xfb\xf3\xb4Q'm\xe2x\xfd\
-\xfd\x7fi\x14\x90O\xeb\xa5\x07G\xf1\xd1\x9e\xdd\xbb\xb4\
-F\x00W\xba\x97\x1b\xfa\xf1\xec5o\xec\xef\x1a\xdcM\
-f\xa3\xf1\xc9\xec\xf5]X\xf7R\xb6\x97\xef\x83t\xdd\
-sPwy\x1f\x5cw/\x5cD\xce\xbc\xa4_'\xf5\
-kZ]\xe7Q=\x1d:\x09\xca\x943\xf3\xe3\xb8\xbc\
-\xa6\xbb\xafeq\xee\xcd\xae\xed\xd5\x97\xe7wu\xeb\x0a\
-\xe0\xb2I\xa4b\xbe\x1f\xee}\x17\xd0\x02S\xa8\xa5K\
-Gw\xe5\x91\xf4\xb3k\xff}\xce\xda%\xe3[\xbe\xca\
-d\xf6\xabF\xbe\xaf\x16\xdd\x07\x0cG~F\xcf\x82\xa1\
-\x19G\xba\xae_\x9f\xa7L\xdcg\x01+\x12\xc0\xf5\xdd\
-e&e\x12\x00\x94-e\xf3\xd2\xc0;\xd5\x14\x84\x15\
-(\xe4\x0b\x00\xd03\x028\x00\x80\x9e\x11\xc0\x01\x00\xf4\
-\x8c\x00\x0e\x00\xa0g\x04p\x00\x00=#\x80\x03\x00\xe8\
-\x19\x01\x1c\x00@\xcf\xa8\x03\xc7j\xfe|\xfe\x9b\x85\xef\
-\xf9g\xc7\xc7\xdc\xc9\xd3\xf3t>j:qa\xbf\xae\
-\xc4?\xaaO\xe0\xc8\xa7*\xdc\x9b\x9d\xaa\xf0\xe1\xde\xb7\
-\x01\xf4\xc9$\xdex\xf0y\xc0\x8a\x04p\xac\xe6\xa7F\
-\x05\x84\x1d\xd9\xd6\xd4\x97\xdf\xef\xc6[\xbb\x7f\xa8>\xb1\
-O\x22\x1f\x99\x96\x8d^\xf95\xff\xf9\xa4z\xbd\x1dP\
-\x9at\x1f?\xda}\xbf>\xc7\xf7^}\x0c\xd8\xa4\x1a\
-\x84\x1c;\x0b\xb4\xfa\x1c\x1e\xee\x1c\xc4?\xff\x83A-\
-+\xebw\x007\xcf\xfe\xfct\xe3Y\x90\x97\x1eV\x0f\
-\x8eL\x10%K\x19\xb7|TV\xd33n'\xb1I\
-\xb9SNY\xc1q\xd5\x19\x8fg\x1ds\xf6\xa2\xca\x0c\
-\xe6\xac`\xce\x0c\xea\xa8\xb7\xd7\xbf\xfe\xd7\xb8\x0aR\xfe\
-\x12\xe9\xe8\xa84\xe0\xb8\x1c\x84\x1cm\xf91R\x827\
-Z\xd5\x9f\x00\xee\xeb\xf3?F\x9aJ\xcaSJ9`\
-\xfbi\x89\xbf\x9f\xde\xfb\xf4<\xfd\xee\xac\xeedFU\
-G9\x8dS\x1d\x0dExz\xfeq\xf5\xff\xc7Q\x9a\
-\xcb\x8c\xe0A\xf5O\x07\xf5\x9f\xa5\x0e\xf9j\xc7\x1c\xaf\
-\xfcs\xfa\xfd\xd3\xf3\xb3\xfa\xf9\x8a\xf8\xdc3\xb6e\xe6\
-\xc1\xdbu\xf21R\xe9L\xe6/b\xbb\x08\xdeh]\
-\x7f61\x8c\xe2\xb0z}\x10\xb9ah\x9a\xa1\xb8\xce\
-\xfe\xec\xeb\x1cW\xbfN\xaa\xc0\xf0\xcb\xea\xb5x\x1d\x17\
-\xac\xcb\xd3\xf3w\xa2\xb4\xe0-eQ\xd2\xb3\xf1h\xf7\
-\xbc\xeet\xe7\xc1[s\xfb\xf54\xb0gl\xbb<=\
-\x7f?n\x0a\xde\xe6\xa6\xf5\xf2\x80ms!x\xa3m\
-v\xa1\xe6\xc00w2_\x9e\xaf\x12\x18\xc2]=\x8b\
-\xbb\x18\xadi\x0a5e\xbb\x1f\xee\xfc\xb5~6\xdap\
-\xf9\x8c\xfd1\x18\xb6<C\xb2\xc88\xb6\x8f\xbe\x85\xd6\
-\x09\xe0\xe6R'\xf3(\xfe*S\xc0F\xe5\xa9\xd3q\
-\x94 e\xdd\x9e\x9e\xffe\x96qk\xbf\xc3I_\xf7\
-\xe9\xf9\xf7\x9e\xb1A\xbb\x08`#\xecB}\xd9\xb8^\
-\x1b\x17\xf1n\xc0f4\x9bN\x1a\xd5\xeb\xc9\xd2\xba\xa1\
-y\x07\x99v\xa8\x9eG[\xae.<_\xafq\xfd\xb3\
-|}~`m\xdc\x00\xdd\x8f\xb3\xf8e\xe1\xbbN\x03\
-X\x99\x00\xeeu\xfb\xf5T\xcf\xf6\xee\x94bSR\xd0\
-\x14\x0d\xa6\x9c\xa6U\xe6\xea\xc35\xde\x8f\x9b\x0b\xde\xe6\
-r\x10\xf7\xe5\xf9\xbb\xf1dO\xc6fH~\xbf\xf7m\
-\x9c\x9c\x7f~\xcb:\xb7\x8b\xea^;\x0c`e\xc3\x0a\
-\xe0\xa6\xf1\xa4\x9a\x14>\x8b\x97\xd3\xf8i*h\x5c\xbd\
-RM\xa2\xc3F_'\xd7\xe0\x12\xc0\xb1^\x0fw\xde\
-i\xf0\xae\xc9\xda\x07\x13\x0fwNb\x99\xe0-g\x03\
-\x9f\xc5\x8b\xf8\xa1\xfe\xe7{\xf1(R :\xad7:\
-\x8c\x1b~\x95q\xf5\xb7\xd2\x7f\xf7\xbd`X\x1e\xef}\
-Z\xef4\xcd\xed\xed\xf8\xd7?O\xf7\xcd\x9bU\xf0\xb6\
-\x9d\x8b\xf9\xc7\x01-\x1bV\x00\xb7Se\x11\xaeo\x1c\
-RP\xf7\xacjT>\xab\x1a\x95&\x99\x86\xdd\xba&\
-\x97*\xf7\xac\xd3\xa8\x0ez\x16\xbd\xe74\xd6\xe9\xa4\xca\
-6O\x1b-<\x9f\x7f/\x9fV\x1d\xf4\xd9\x8d\xef\xc9\
-k\xfaR\x95\xf9&k\xe8\x0e\xaa\xff\xfe\x1f\xb6\xb0\xa4\
-\xc4\xf0=\xae\x07\x1d\x9fU\xd7w<\xfb\x93T:D\
-\xb6\x15Z\xb4]\x9b\x18\x1e\xef\xa5\xfaoMG\xfc\xe3\
-\x80\xf5\x1a7x\xcf$\xd6%M\x9dN\xeb\x0d\x0b\x8b\
-\xa5\xf7=\xde{\xef\xd6\xe0-\xf9p\xef\xab\xea\x19K\
-kH'\xd1\xf4\xeb\xda\xfd=\x5c\xa9\xcd\xcd/\xc1\x1b\
-\xb4l\xfbv\xa1\xe6 \xeet\xe1\xfbF\x028\x0a0\
-]c\x00\xf7\xe6N\xb3\xb2\x1e\xd3\xba\x18o\xf3i\xdc\
-\xcb\x81R\x93N{7\xde\x8a?\x04\x00K\xd9\xd6M\
-\x0c\x93\x85\xefX\xb6\xe3\xbcz\xf0\xf8\xf4\xcai\x11/\
-O%M\xeaW:j(\x05\x91\x1f\xee}\x13w\x91\
-\xa7\xa9nr\xf1\xda\xd7M\xd5\xf4ww?\x8e\x17\xd5\
-\x94U\xfe\x1e\xc7W\xfe\xed\xd9\xec\xfb9\xeel\xca\xf8\
-\xf6\x9f\xe7\xaa\xc9\xda\xbf\xc7t\x1d\xa7\xb3\x82\xd1\xa3\x97\
-\xaec\x92\x0f\x92\x9f\xd6\x87\xc9\x9fV\x9f\xe7\xb3\xa5v\
-R\xe6\xcd\x02\xbf\xfd\xf5\x9f\xa7\x0d\x06\x09i]\xd9\xd3\
-k6\x9b\xfe\x10\xdf\xac\xb4\x01 }/\xcd\xea\xbc\xa5\
-5x\x9f\xc6\xb2R\x10\xf7\xf4<\xad%=^\xf8\xde\
-\xb4\xe6\xf4\xcb\xf3/n\xfcyrq\xd8\x9b\xb2t\xd7\
-\xdf\xef\xf9\xf4\x88\x97\x0b\x7f?\xdc\x19/\xb5\xfe*\x1d\
-\xd5\xf7\xf7\xfak\xcc\x9f\xe9q\xdc\xfc<?\xbb\xf3\xbd\
-\x99\x0b9\xdf<\x8d\xfd\xea\xb5\x9e\x9f3\x9aN\xc7x\
-y\xdd\xe1\xfc\xfe<\x8d&'`\xcc\xef\xf5\xd1\xaf_\
-c\xfe\xb3]\x9eV\x932\xaa\xcbx\xf5\x1e\xbf\xder\
-\xcf\xf1\xd5\xeb\xf0\xa2\xfa\x1e_\x7f.\x93\x8b+\xdf\xf7\
-i\x91\xa7\xec\xa4\x12:QoHZ\xee3\x85\x1bl\
-k\x007^\xf8\x8eQ|\xb7\xf0=\x97\x0d\xe0a\x5c\
-=x\xfc\xf6\xff\xeex\xd6`~R\xfd\xfd\xd4\xd8\x1e\
-G,}\xc8\xf3\xf1-\xffnR\xbd.;\xb4\xb4\xc6\
-(MSM\xeb\x86\xef:\xf3\xe3\xc9\x0eg\xdf\xcff\
-\xcb;\xe45XG\x0d\xde\x99v\xaf5[\xab\xb5\xac\
-W\x0f\x90\x1f\xdd\xf8\xce\xd4a\xec\xcf\xd6\xae\xa5\xeb\xfe\
-y\xf5\x99\x9dF\xd4\xc1\xef\xe2F\xf9\xcd\x07\x07\xe9\xbf\
-\x16\xcb\xc8\xf7\xd6\xe1k\x7f\xfe\x8fu\x86\xeb4\xeej\
-g\xe7\x0f\x0d\xee\xd7\xe4(\xee*}&'\xe7\x87\xb3\
- \xe36U@\x12)\x88\xb9\xa9SOk\xea\xc67\
-\xfc\xbbI\x5cw\xbf\xafR\xc7.\x9fI{\x14?-\
-\xfc\xbe\xc7\xf1\xea\xf3|\x97\x0e:\x05\x9a\xb7=\x03\xff\
-T\x05\x9e\xf3l\xe6\xd5\x9f\xef\xf5\xebwy\x7f\xa6\xef\
-\xe7\xeb\xf3\xe3\xf8\xef\xf8\xf4\xb5\xc08\x07\x8c\xe93=\
-X\xd0&|P\xbd\xf7\xa8\xfe\xf5\xc3\xbd\xc5\xeda\xf2\
-\xff\xed\xfc&~Y\x18\xb4\x9f\xc6\xa2\xcd+W\xdb\xd6\
-\x9f\xae\x5c\xcb\xdb\x9f\xcd\xf9\xcfsX\xff\x9a~\xfet\
-=\xca\x09\xe4\xc6\x91\xda\x8a\xfc\x99~r\xe7\x01<\xcc\
-l\xdf\x14j^\xf7s\xb0\xe0]\x93\x85k}N\xce\
-\xd3\x0e\xba\xd3_;\xfd\xbb\x19\xd7\xc5M\xd3\x8817\
-\xaaM]\xdc\xfa5\x93\x14\x94\xa4\xa2\xac\xd3\xc6\x0b\xca\
-\xe7\xdf\xcfd\x89\x8c\xd8jr#}\xd4\xe8\xbd\x0f\x1e\
-\xac\xe7\x1c\xc1\xd4!>\xda\xfd>\xee^\xbc\xf6 R\
-\xa3\xdc\xb7\xe3\xa2r\x96q\x91\xc9\xca\xd9\x82\xfb\x0d\xaf\
-\xef\xddO}\x18\xff\xfa\xbb<\x18X\xe6~\x7fYz\
-\x06\xd33\x93\x03\x8c\x83X\xde8r\x07\xfd\xfd,k\
-\xd8\xd4\xed\x99\xd4\x9f~\xcc\x03\x97t\x8f-\xf3\xf3\xcd\
-\x8b\x93_]c\x98\xee\xf7\xe5~\xbeq\xa4\xcc\xd6\xa6\
-\xda\x84\xa4\x9d\xb6u~\x02\xc8\xe9\x92\xd7b\x13\xc6\xb3\
-\xec0\xacd\xbb\x02\xb8\x14\xd4\xe4\x92\x09\x8b\x1c5x\
-\xcf\xdd\x1b\x96\xd7\x8d#\x96\x0a\xe2no\xf0\xd3\xd7y\
-\xb4\xfb\xd7\xb8['\x94\x1c\xcf\xb2\x10\xeb\x93k\xa0\x1d\
-7|\xf7a\xfc\xee\x1f\x9be\x00\x96\xb1l\x87x\x9b\
-\xcb\xceb\x99@\xbc\x1b\xff\xf6\xb7W\xa7\xd1\xaf7\xaa\
-?\x9b\xd5\xfc\xbe\x9e*\xbbX\xf8\xbe\xdb\x02\xca&G\
-\x86]f\xa6\xee&\x07(\xa7q\xf7g\xe6\xaaq\xa4\
-]\xefM\x8f\x0e{\xf1\xfc\x87\x05\xef\xd8\xad\xbe\xd6\x9f\
-\xee\x18\xe4\xce\xcb\xb5\xac\x1a\xe0\x1eo\xf0\xde\x9eD{\
-\xc6\x91\xae\xc5&\x03P\xd8\x90\xed\x08\xe0R\xe0\x963\
--)\xa8\xb9}\x1a\xae\xf9\xba\x8fg\xd1\xae\xdd\xfak\
-\xb6\xb3#\xef8\x9at\xd0\x8b\xbe\xc6:w\x07\xe6\x05\
-\xf4\xe3\x85\xef\x9b\xaei\xcdH\x0a\xde\xda:\xeb\xf3\xd2\
-8\xa2\x07A\xdc\x1b\x0f\x9a~\x7f\xed\xac7\x1c5z\
-Vv\xe3\xcf\xffs\xb7\x0cf\xce\xe4~\x12wuR\
-\x07Z\xc7\xd1\xf6\xf1a)\xab\xdb\xce\xf9\xafG\xb3l\
-\xd4]\x1d\xd4\x01\xe0*\x01n\xd6v\x9bw\xbd\xfbk\
-\xf9\xef|\xde\x8b\xc1\x15,aX\x01\xdc\x8f?~^\
-5\xc6_\xfe\xfa\xfa\xbaJ\xc5\xa7\xe9\x8cG\xbb\xe7\xb3\
-\x91\xe7\xf8\xd6\xbf\x9fw\xa7>\x89f\xd6\xb1\x10u\x1c\
-oE\x1b\x0d\xfe~\xacn\xbc\xb6\xdd\x81i4\xdc$\
-x\x9a\xd6\xebW\x9a\xef~l\xea\xee\xd9\x8c&r \
-^\xf2t\xea\xa8\xe1\xfd\xb1h\x19As\xcd\xbe\xce|\
-\xaapY9x\x1b\xc7],3\x8d\x7f\x17\xf9\xfc\xd7\
-U\xb3?\xe3X\xd5j\x01`\xfc\xfa}lb:\xb2\
-i\xd6v9\xe9\xb9\x5c=\xa3\x0c\x05\x19V\x00\x97\x17\
-\x03\x1f\xfe\xfa\xba\xdc\x85\xb6\xc8E\xdd\xc0\xe5:W\xcd\
-\x1a\x8e\xf4\xbe\x97\xcb\x91L\xea)\xa7Q<\xae^o\
-WY\xa3\xd1\xaf\xaf\x5c\x17\xeb0\x9aL\x0d\xa4\xc0\xa2\
-\x94\xbaX\xeb\x08r\xf2\xd4\xe9\xd1\xc2\xf7\xad+x\xcb\
-\xc1c\xb3\xce,\xeff{R\x97\xc4\xc8\xaf\xe3h6\
-\xbd3\x9e\xbd\xb7TM\x02\xa5\xb6\x82\xb7evt\xdf\
-\xed\xbe\xbf\xebz\xa2\x94\x99o:\x8d?\x9a\xad\xc9\x9a\
-\xdf\x0bM\x9f\xe7\xec\xf3\x01\xd5\xbak#\x10\x5c\xec\xe5\
-\xac\xedE\xdd\xb6\xe6g\xf1\xed\xea\xb5w\xa5m\xdd\xab\
-\xdb\xdcf\xf7\xeb\xc1\xda\x97\x86\xc0\x069\x0b5/^\
-\xff\xe2\x8e\x85&Og\xebs\xbe\xaa\xfe\xfe\xe9\x8d\xef\
-\xca\x99\x8c\xb3\xfa}'\xf5\xc6\x82\x83\x9b\xbfd\xd5\x89\
-\xed\xc6\xc7\x91\x0f.oC\xdaZ\xffE]\xf6\x22\x1b\
-W\xaf\x8f\x1b\x1e+6\xae\xbe\xdf\xfd\x1631\xcd\xa6\
-N\xa7\xf5\xae\xdc\xf6\x83\xb7\xec\xa8\xe1\xfb>\xa8~\xee\
-Ww\x89\x9d\xd6\x95\xe5\x9b\x9d\xe6q\xf0\xdai\x1e\xf7\
-\xee?\x8b\x97w\x8e\xfei\xe1f\x82Q]@\xb7\xdd\
-\xcfb\xda(Pj/\x03\x92vtO\x1b\xbdo|\
-\xc3\xbf\x99\xc4:\xec\xee\xfe\xa1a)\x97\xcf\xab\xebx\
-])\x95\xaf\x1aN\xc5\xcfk\xdd]\x7f\x1d\x1f\xdc\xff\
-\xbe\xc1\x01\xf0s\x93j\x8e\xb1\x0a$\x9f\xcf\xef\xab\xb4\
-#:\xedl\x1e\xc72r\xbb\xf7U]\xee%=\xe3\
-\xf9\xa8\xc1\xa3\x06\x7fs\xbf\x0eF\xd7}\x86\xed\x8b\xea\
-\xe7\xbbw\x7f\x1c\xe93\xbb\xbdmM\xdf\xc7\xb3\xc8'\
-\xed\xfci\xe1Tz~\xde\xdaY\x1a\xb0\x8a_\xd62\
-\x83\xc3\x96\x11\xc0\xe5l\xdd\xb8j\x88\xef\xb2\xdd|\xf9\
-\xc0/\xed\xca\xfbea\xf9\x87E\xeb\xf4&\x8d:\x9e\
-<\x8a}Ru>W\xbf\xc7I\xe4@\xe4\xa2\xe1\xba\
-\xa14bm'\x80\xcb\x0b\xcd\x0f\x17\xbc\xeb\xac\xba\x0e\
-M\xa7\xb1\x97\x93\xa7\xb2\xc6\x0b\xdf\x97\xb3\xb1\xd7o\xf1\
-\xcf\x1d\xde{\xd5\xcf\x91\xd6S.\x0a\x84\x8e\xe2j\xb9\
-\x84|\xaf\x5c^\x8bt\x0d\xba\xb18\x80\x1b\xad)h\
-\xda\x84\xf9Y\xad\xb9\xa3\x9e\x7f\xc6\xe3\xf8\xdb\x8f/o\
-\x16h2\x88\xc9\xf5\x11o\xae\x83\x97\xee\xd5\x1c\xd4\x1f\
-\xc4\xed_\xe7\xf6Zw\xcdL\xe2\xe1\xce\xab\xbb\xb1\xd3\
-\xb3\xfc\xee\xec~\x1c7\xfc:\x87\xd5\xbdx\x19@\xcc\
-\x07\x98\xb9MX4\xcd\x98\x06\x98\xe3h3C{\x9d\
-\x8f\xfe\xf7q\xc4\xd2Y\xec\x14 \xdf\xde\xa6\x8dZ\xd9\
-\xa4\xb2\xaaI\xfc\xcb-A)4\xb4}eD^7\
-\x9e\xed \x9c,\xbd\xe0\xf8.Y\xbb\xdf7(`9\
-m\xa5\x91\x99T\xd9\xaeOn\xf9\x1eSc\xb7\xf8\xfb\
-\x7f\xd1\xc2\xfa\x9b\xa4\xd9\xb1M\xcb\x1cu\xb6\xbc\xa6\xa5\
-3\x16\x9d\xcd\x99O\x1aX\xd4\xd1%\x07\x85N\x9d\x8d\
-c\xb36\x19\xa8\x1e\xce\x96B|Q\x07&\x97G9\
-\x9d\xbe\x14<5\x0d\xe6\xdf\xdc9Z\xf8\x9e\xfb\x0dw\
-\xad\xe7\xcc\xfa\xdd\xbd\x1e\xbce\xe9\x19\x9f>o\x96\xa5\
-\x1d\xddR\xb30\xdf\xf7Mv\x0c\x97\xb9\x19 \xb7u\
-\x93\x05\xef\xda\x8f\xee\x1d\x05\xb4@\x06\xee\xaa\xbc\xe0\xf8\
-\x83\xf8\xa1\x0a\x22\xee:R\xceU\xd2\xdf\x89\xc5\xa72\
-\xdcf\x1c\xabJ\xd3\x90\xb7\xd5MK\x8d\xdd\xc9\xf9\xf1\
-\xc2,\xdc\xbd\x96v\xe6\xe5\xa9\xd3\xdb\xbe\xd6<\xbb\xb0\
-\xbe\xce\xbe\xd9Z\xa9\xa3h\xe6\xabF\xef}\x14\xefG\
-\x147]2\x89\xcd\x06q\x9b\x09bs\xe6\xb4\xd9g\
-\x9d\x8b\xc4.r\xda\xa8\xf6`\x1a\x94\xe5\x22\xbe\xe3\x05\
-\xef<\x88\xbb/\x8d\xb8\xfd{I\xd3\xf3\xd3\x06E\xa2\
-\x17M\xdd\xa5\x00o\xba0\x8b5\x8e\xae\xbc|\xe2\xcd\
-8\xe2\xd7\x13$\x9a\xdfci\xb7\xf3:jJ6\xf5\
-p\xe74\xa0\x05\xc3\x0a\xe0\xf2\x94\xe1\xd5\x00`\x1c\xb9\
-b\xf92\xa3\xae\xfdY\xdd\xa4\xe52A\xf3\xea\xed1\
-\x0b\xd8\x9aU\xb9_\x9f\x17\x8d\xd6yL\x16\xbec\xda\
-Bc\x9d\xb3\x1d\x87q\xdb\xf7qSv\xa1-\xff^\
-]\x9f&\xeb\x8c\x9a6\xae\xf9\xa8\xa8I,^\xcf\x97\
-\xee\x87>\xaewi/\xe8\xfa\xf9\xe7\xddx\xe3\xc1\xe2\
-\xf7\xadv\xee\xeb\xe2\xcc\xe9UM\x82\x90\xd1\x12\xe5,\
-\xd2{\x17\xaf\xbf\xba{\xf6g\xba`\xca2\x0d\xc8\x9a\
-\xdc\x8f\xffg\xc1\xd7y\xf1\xfc\xbb\x18\xdd\x8f\xa2\xe4\xa0\
-\xedp\x96A\xef\xbem]\xc5h\xc1\xc0\x1a\x960\xac\
-\x00.M\x19\xde\xf4p\x9c\x9c\x1fD\xf3\xc5\xfb\x07\xf5\
-tj\x93\x85\xf49p;\x8e\xcdOK\xad.\x15\x10\
-\xddLc}\xb4\xe0\xdf_\xac\xbdQ\xfb\xf9\xf9\xdb\x0d\
-~\xd6\xe5\xbe\x8f|\x06\xe6\xf8\xd6\xf7\xdc+\xf2\xbeh\
-2M6\x8e\xb6\xec<x\xd4(x~\x1ew\xbf\x07\
-\x96\xdf\xf5\xbb8\x98\xfa\xa5\xc1qzs\xcd\x02\x9fq\
-\xdc\xd5\xbd\x06\xd7\xac\xc9\xda\xd8E3\x0b\xcbm\xa8X\
-\xaf\xcbA\xf1A\xaf\x83\xb6\xab\x9aL\xc9CC\xdb\xb3\
-\x06.\xad\x81y\x5c/\x8e?\x8ch\xd4\x18~\xb2p\
-\xfdR\xaa'\x96w\x15\x8e\xa3\x8fRc\xbd\x19\xe3\x05\
-\xff~\x7f\xf6Y\xae\xcf\xbd\xfbM\xea\xb2Mb\x19\xf7\
-\x1a\x05B\xe5\xad\x81\x1b5Z\x80>\x8e\xb6<o\x98\
-yzc\x85\xb5r\xcbd\xef\xd2\xa6\x83&\xfe\xd7N\
-\xf3\xe7\xa3\xe9\xb3t\xd7b\xc5\xdb&\x17W>\x8d(\
-b\xd3A[.\xe2\xa7\x1fK\x5c\x13KOm\xdf&\
-\x86\xb4\x80w\xd4\xc2\xa2\xe3\x5c>\xe0\xf6)\x13\x9a\x1b\
-\xd5\x87\x81w]\xa3i\xd9\x00b\x12\xfd\xd4$\x80\xdb\
-m\xedz\xbch\xd4\x09_\xacT\xaef\x99\xec]\x9a\
-\xd2\xa5\x5c\xf9\xc8\xaf\xa3\x18\x9et\xdfm\xf6\x5cY\x06\
-m;w\xa16\xddmu\xd34Kj`\x9a\x17\xb9\
-\xbd\x98\x15\x01=\x8e|p\xfdQ\xf4\xb7\xe3_\xb7\xe3\
-\x8ewm.\xfb\xdf\xeeg p\xbfa\x09\x88iK\
-\xd9\x8ff\xa5\x1b\xee\x1e\xbc-\xeb\xc1\x83\xf5m\x94a\
-5)\xb8i\x1e\xbc]\xd4\xd9\xe4\x97\xdb\xd6\xcd\xddG\
-ww\xdc\xd2\x11kl\xb9\xed\xdd\x85:\xaa\x0b\xdc\x1e\
-\xdc\xfa\x9e\xeb\x16\x1d7+\x87\x91\xa4\x86\xe5\xd3\xfa\xd7\
-WKy\xa4\xf5x\xd3\x9eN\xbb\xaeW:\xbe+\xed\
-\xa4{\x1c\xedk\xd2i/\x17\x90\xbd\xa8K\xd0\xdcn\
-\x14\xe5\x05\x0b\xcf\xeb\xb5]\xe9\xfb\xba\xfd\xe7\xcd\x19\xe6\
-f\xe5)n\x92\xb3\x0dM>\xd7\xe3(\xcd\xdf\x7f\xdc\
-\xab\xfe\xbfYf\xef\x97\x86\xf7\x8e\x05\xec\x8b\x1c5x\
-\xcf\xbc\x8c\xcfW\xd7\xb4\xad\xe3\x956\x8blJ>'\
-7\xd6X\xb0\x9c-\xa0\x0e\xdc\xed^o\x94wv\x16\
-\x9f\x0f\x9av\xa4\xa5zfy\xdd\x9d\xd1~6i\xb4\
-\xd0<\x95\xfaH\x05\x7f\xdb\x966l,6^*\x03\
-\xd8\xa4\xc4\xca\x8b\x02\xb3\xad\xf9\x18\xb8g\x0d\xde\xb9\xdb\
-\xc2t\xcfQ\xa3wm\xb2\xb4B\xdaA\xdc\xc42\xf5\
-\xceF\x1b>\x9el\x88\x9a\xd5\xe6\x9b\xd4G\x13\xe6:\
-\x7f\xfdn[s\x10\xb7\xde\xb5\xbf\x0c\xda\xf6\x06p\xcd\
-\x16\x97O\xae\xf9{\x07\xb1\xc8\xed\x05t\xb7\xd3(\xd2\
-\x06\x92\x94\x91\x9c,|\xef\xb4n\xd8\xda]\xec}\xef\
-\xfei\xa3\xf7=j\xd8i\x9f\x9c\xef6\xba\x17F\x0b\
-O\xdd\xe8\xc6\xfd\xc6\x19\xaf\xbb\x9f\xe3\x99\x03\xf1\xf1\xc2\
-\xf7\xa5`r\xf3\x99\xa9\xc5\xc1\xd4r\x99\x9c\x83\x85\xef\
-\xe8\xf3\xe9\x16\x9b\xd0\xa4\xd0\xf6\xf3\xaa\x1d\x19R\xdbz\
-\xd7s|!\xb65\x80\xfb\xb7\xbf\xe5B\x90\x8b\x5c?\
-\xfd\xb5\xe8\xefML\x93\xbcbZ\x9f\xe7\x99\xb3\x91o\
-4Z;\xb8\x1bm\x1f\x06\x9f\xb3.Mv\x8d~\x12\
-ML\xeb\x02\xbd\x8b=\xdc)3\xeb\x92\x8a\xcf6\x0b\
-.wgu\x11\x97\xf3\xf4\xfc\x9d\x06\xc72e\xbf\xb4\
-v\xeeosM~\xf6\xb4\xce\xb5I\xf0\x9a\x97U\x1c\
-,|\xdft\x89\xbar\xdb\xa8Im\xbeEGP\xbd\
-\xe8\xe9\xbaT\xb8\x83\xed\x0b\xe0\xd2I\x09o<h\xd6\
-!\xad\xa3\xc1m\xda\xd8\x0f\xc9\xd5u\x1e\xcd\x03\x87\x83\
-\xd6\xa7\x17\x9aN\xe1\xa6\xe0c\xb1\xa3\x06\xef9-:\
-\x98\xbf\xdfx\xb1x\xba\x16'\x8d\xb3\xa2y\xf7\xeai\
-\xa3\xf7\xa6k\xd2\xc5\xb9\x90\xf7\x1bN!\xe7C\xe8o\
-\x97O\x19YL\x05\xfeE\x16\x07_\xb7\x05\xd4\xa9m\
-\x1f\xf5`\xfd\x1b\xb4d\xbb\x02\xb8\xd4\xb1<\xdamz\
-\xe8\xf3$~\x88oby\xe3[\xcb/\xbc\xb9c\xcd\
-C\xd4\xd3\xa9\xcdj\xf1\xb5YZ\xe4~\xe3\x80\xfc\xd9\
-\xad\xc1J\x0e,\xc7\xb1\xd8q\x94,\x07\xd3\xcd>\x93\
-Q}\xf4\xd4\xe9\xadk\xe2R\x07zY\x1b\xb1I&\
-\xe4\xa2\xb3\xc2\xa6M\x07\x12\xf9x\xbd\x9b\x03\xfa\xf4y\
-4\xd9\x91\xae\x02\x7f;n[\xe2\xf0\xd6n\x0a\xa4\xc7\
-\x01[bX\xbbP\xff\xfec\xca\x9e\x5c=\xd08\xed\
-\x12\xdc\x9d\xed\x16<\x8cev\x19\xa6\xb3D\xaf\xafZ\
->\x89\xc5\x8dD\xda&~Pe\x9e.\x1b\xec\xabU\
-\xc5\xb7]\x9a\xce<9\xff\xbc\xe1n\xdeTZ\xe4\xdd\
-;\x9fM{U\xea\xb4O\xce\x9f5Xk3\x9e\x05\
-+G/\x1d\xfc\xbd\xdc5<\xbb\xf1\xd0\xf0\xb2\xa4`\
-:e-\xc6\x0d\xde\x9b\xdes\x5c}\x0eij\xf4\xac\
->\x89\x22\x173\x9e\xef\xfc[.\xfb\x91\x82\xa3.\x83\
-\x9a\x94\x81\xfc\xa5Q\xa6\xf0\xacz\x9e\x8f\x22\xfd\xec\xf3\
-g:\x05\xabo\xed\xa6\xec\xdcQ4\xa1\x02\xffbM\
-N6\xc9\xf7\xdf'\xd5\xb3u9\xb8\xfe\x8f*\xc0\xfe\
-\xb9\x9e\xae?\x88&\x96\xd9]\x0c\x05\x1bV\x00w\xdd\
-\x9a\x9bt\x04\xcb\xa2R\x0f\xaf\x9b\xdc\xb8\xbd\xbb\xc9\x99\
-\x879\x00Hge\xa6\xf5O\xb9\x8332|UZ\
-\xf7t\x18\x8b?\x97TZ$\x8d\xac?\x8dv\xa4\xaf\
-s\x10\x8b\x83\xf9q\x5c\x06+\xf3\x92\x1bM\x07\x00\x17\
-\xd5tY?\x16'\xa7u\x89\xffq\xfeA\xd5\x01\x9e\
-F\xf3\x9f/\xbd\xef\xa0\xae\xefv\xd7#\x8eR\xf0\xfe\
-\xe1\xde\xe6\xd7\xbe]\xd5<\xa0\x8fY\x8d\xb1\xa3\xd9y\
-\xa3\xc98\x9a\x9av\x1c\xa8\xf6\xc5\xbd\xea\x1el2\xb8\
-J\x19\xf2|\x1d&\xf5?\xff\xbcd\xdb\xfaKQ\xeb\
-\xe4&\x01w\xa4\x8c\xc8\xeb\xf2\xc1\xea7\xb9\xbf\xd4\xba\
-\xb8\x94\x918\x88\xbb\x04oC?r\xa7\xf9\x86\x86\xf9\
-Tj;\xd5\xcbS\xf6\xef\x8d\xa5v~\xa5\xc6~\x1c\
-\xcb\xd5\x88\xfb\xa4W\x1d\xf6\xef\xf6\xbe\x8b\x07\xf5}\xba\
-z\x96\xb3\x89\x14\xd0\x94S\xff*e 'K\xbc\x7f\
-\x1c\xcb\x05o\x9f\xab\xf5\xd5X\xcaX7\xbd\x07\xc7q\
-\xd7\xb6\xb5\x1c\xa9\xaf9\x0c\xb8#\x01\xdc\xcb\xce\xea\xe0\
-\xed\xb6\xce7\xaf\x9di\xb6\xbb\x8e\xdb5\xdf\xd0\x90|\
-\xdeZi\x91\xf4\xdf\x8d\xc6'i,\xeb\xb0'S\xa7\
-/KA\x5c\xaa\xaf\xb5\xde\x8c\xc0E\x1d\x8c\x97\x14\xd0\
-\xe4\x9ax\xef\xc5:~\xeei=\xe5\xdaV\xe6x\xf8\
-\xf2\xb58\x8a\xedp\xb1\xb0\xaf\x81\x05\x04p\xd9\xc5\xec\
-(\x96\xf7\x1a>P\xa9\x03\xbaky\x88*\xf3\xf4\xc6\
-A0\xd7lCC\xdb\xa5E\xf2\x99\xb8oG{\x1d\
-\xf7\xa4\xbe\x7f\xfa\x18\xbc\xcd\xa5\xecd\xfa\x19Fk\xd8\
-|\x91\x02\xf5\x87;\xfb\xb3c\xec\xca\x92\x7f\xeew[\
-\xfd\xb9s\xa0\xfa$XN\xba?\xa6+]\x87\xc3X\
-\xd4\x9e\xdc\x8f\x12f7\x0e\x05o\xacj\xbb\x03\xb8|\
-F\xe9Q\xdd\x91?\xae\xb2\x02M\x0bD\xceG\xed\xcb\
-6\xf8\xf3N\xec\xf7\xff\x7f\xca\x00Mn}\xef\xff\xfd\
-\xf1\xed\xd8\x06\xb9\xf3l\x9a\xd1<h\xf5\x94\x86\xcb\x8e\
-\xfb(\xee\x1e\xc8\xcd\x83\xffw\xebZw}\x97>\x93\
-\xc7U\xe0\x91\x9e\x896\x02\x9a\xfc\x8c\xa5SI\xde+\
-\xba\xc3J\xcf\xf4\xe3:\xe0:\x8cU\x82\xfa\xfc\x8c\x8f\
-\x8b\x0cT\xfb\xe2\xa3\xfa\xfe;\x8a\xe5L\xe2\xc1\x83\xfd\
-\xd9\xc0\xec\xae\x83\xeb\xcd\xc8\xeb?\xefR\xe1\x00^\xd2\
-\x9fM\x0cy\xaam\x7fv\x82\xc28\x967\x99=\xd8\
-\x93x\x11\xdfU\xa1\xeb\xb3\x95*z\xe7\xbf\xfb$\x9e\
-\x9e\x9f\xd6;\x5co\xab\xed\x96\xbf\xf7\xcf^\xea\xe0s\
-\xf9\x86\x9bw\xed\xdd\xbfuy\xf8\xd9\xc2\x8d\x19o4\
-\xc8j\xfd\xf8\xf3\x0fU\xa3w\xba\xe0]\x8b\x1a\xc3I\
-\xac\xee\x8b\xbaLE\x93\xd31\xd2\x06\x92?\xffO{\
-\x95\xfb\xf3u\xfc\xac\x0a\x0c\xbf\xaa\xbe\xf6o\x17^\xcb\
-\xecbv/\xa5k\xf8\xd5\x0a\xf7\xd1d\xe1\x14\xf2\xb4\
-\xa3E\xce\xb9\xf0\xf1\x93\xeasI\xd9\xe6T\xb4\xf8\x83\
-\x86\xf5\x0b\xe7\x9f\xcdi\xe4\xcff\x12\xab[\xfc9\xbd\
-\xd1\xd2\xfa\xbd\x9cA\xfd\xaa>\xaf8\xe2\xe3\xd9\xcf<\
-\xbe\xf5\xef\x5c\xde\x0b\xdfT?\xef\xf2\xc1C\x93\xe7\xb0\
-\xd9}\xb0\xb8]X\xf7\xf7\xd2N\x9b\x12\xf5\x80:=\
-\x93\x11\x7f\xac\xfe{\x877\xbe/\xdf\x17\xf99\xfc\xdd\
-?\xce\xef\x81g\xb7~\x0e\xb7o\xbcY\xef:Pk\
-\x22i\xd1\xaa\x8f{wN\xce\xaf\xee\x0a\xbcn\x87\xe0\
-d\xf6\xeb\xc5F\x8e^\xc9\xdf\xcf~]\xb2d\xee\xde\
-,`t\xacV\xff\x9c\x9c\xe7\xd2\x1aW+\xbb\xe7\x92\
-\x19g-\x05%\xfd\x94?\x97\xdd\x97\xee\xf3d\xc8\x9f\
-\xcd\xcd?\xb3\xe7{\x13\xaeo[\xd3g\xbe\x9e\xb3\xa6\
-O\xce\xff\xf8Z\x89\xa3Q}\x9a\xccg\xd7\xbc\xf7/\
-K\x14fO\xa5\x85\xde\x0dhI\x7f\x038\x00X\x87\
-W\x83\xb8\xd5\x03\xb8\x89M\x0b\xb4\xcd&\x06\x00\xb8*\
-\x05k\xed\xed\x88\xb5\xe3\x94\xb5\x10\xc0\x01\xc0\xabr\xc6\
-\xed0Vg\xc7)k!\x80\x03\x80\xeb\xa4M-\x0f\
-\xea\xcdfw[kg\xc7)k4\xac\xa3\xb4\x00\xa0\
-M\xa9\xc8u\xc4w\xb1,;NY3\x198\x00h\
-\xd7\x99S8X7\x01\x1c\x00\xb4\xe7lv<\x1b\xac\
-\x95\x00\x0e\x00\xdaq6;yDm@\xd6N\x00\x07\
-\x00\xab\xba<6N\xf0\xc6F\xd8\xc4\x00\x00\xab\x98\xc6\
-q|X\x9f\xa5\x0b\x1b#\x03\x07\x00w\x95\x82\xb7\x8f\
-\x04o\x00\x00\xfd\xf0\xf4\xfc\xfd\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00X\xda\xff\x03\
-I\x09k4\xdd\x88\xa6`\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00Y\x00\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02p\x00\x00\x02p\x08\x06\x00\x00\x00\x09\x13\x5c\xa3\
-\x00\x00\x00\x09pHYs\x00\x00,K\x00\x00,K\
-\x01\xa5=\x96\xa9\x00\x00\x00\x01sRGB\x00\xae\xce\
-\x1c\xe9\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfc\
-a\x05\x00\x00X\x95IDATx\x01\xed\xdd{p\
-\x5cgz\xe7\xf7\xe7t\xa3q\x07\x08P\xa2\xc4\xb9\x90\
-\x02wd\xef\xe82\x16\xb4\xbem$y\x07\xd4X7\
-o\xadE\xd9[\xf1d\xa7\xd6\x02\x93\xddI\xf2\x8fE\
-U\xc6I\xa5j\xc6\xa2j\x5cNbOj\xa8\xf1\xfe\
-\x91\xb5S%0\xbb.[\xa9rH\xc5\x1bK\xa4j\
-D\xc8\x96\x94x\xc6cQ3\xd2hcKQ\x93\x9a\
-\xb1x'\x00\xe2\xda\xb7\x93\xf7y\x0f\x0ep\xfa\xf49\
-\xdd}\x1a\x0d\xa0\xbb\xf1\xfd\xa8Z\x00\x1a\xa7Ow\xe3\
-\xc2\xfe\xe1y\xdf\xf7yE\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9d\
-\xcd\x91\x160\xf2G?\xbc\xad\xbb\x94\x1e)\xb9\xa5\x11\
-\xfd\xd85oS\x92\x1a\x89:6%\xee\x88k.\xb2\
-\x09\x5c\xd7\x1d\x13`\x139\x8e\x93\x95M\xe2J*\x1b\
-u}IJ3\x8e\x93\x9a\xd1\xf7S\xe6m.U\x9c\
-\x99\xf9\xd2\x9d\xe7\x04\x00\xd0\xb6\xb6-\xc0\xdd\xf2\xef\xfe\
-\xdf{\xdcb\xfe\x98y\x00\x13\x02`\xcb\xb9\x22g\xf3\
-\x99\xd4!\xc2\x1c\x00\xb4\x9f\x94l\x83\x9b\x8e\xbf\xfb\xb8\
-\x14\xf3g\x09ohu\xfb\x062\xd2\xa9\xcc\xef\xdfx\
-&_:\xbb\xe7\xf8;O\x0a\x00\xa0\xadly\x05n\
-\xe4\xf9\xb7\xc6\xba\x9d\xcc[\xfa\xae\x00-\xe8\xd7>\xb3\
-K~\xed\xf6Q\xb9{w\xaf\xec\xeaN\xdb\xeb\xde\xb8\
-\xb0 /\xbc\x7f]^\xf8`vC\xc7\xdfwk\xbf\
-9vD\x1e\xdb?\xbcv\xec;\xd7\x96\xcdeI\xbe\
-q\xf6\xb2|\xb4\x90\x8f}\x5cz\xdb\xaf\x8c\xdf\xb2v\
-?\xb3\xb9\xa2\xbct~\xae\xe6\xedj1\x95\xb8\x19'\
-\x9d\x99\xb8\xf4/\xff\xe1\xdb\x02\x00h\x0b[\x1e\xe0\xf6\
-L\xbd\xf3\xbc\xb9\xd3\xc9\xe0u%\xc7{!+\xa6\xd2\
-\xab\x1f;\xe2:\xd1\xc5\xc1\x92\xb9>\xees\x1bUr\
-\xba\x04;\xd7m\x03\x8e\xfc\xaf?3,\xf7\xef\x1d\x88\
-=\xe6\xf5\x8bK\xf2\xaf\xbe3#\xe7\x17]{\xfc\xff\
-~\xdf\x88|nw_\xec\xf1\xe7\xe7s\xf2\xf0\x99\xab\
-\xf6\xf8\xff\xf9\x9e\x01\xf9\xaf?\xbb+\xf6X\x0dd\xff\
-\xe3\xf7\xaf\xca\xef\xbf\xbf\x5cv\xfdH\xc6\x91\xdf\x1d\x1f\
-\x96\x7f\xf1\x99\xf8\xdb\xea\xed\xfe\x87wf#?\xe7\xb8\
-%I\xb9n\xd9\xfb)\xb7\xb8\xf6y\xd7\xfc\xbe9\xae\
-\x9b\xbd4y\xf7\x01\x01\x00\xb4\x85-\x0dp\xab\xd5\xb7\
-\x0f\x83\xd7-t\x0f\xc9B\xef\xb0\x00\xdbi\xac?%\
-g~a\xd0\xbe\x0d\xca.\x96l\x80\xd2\x8b\xfdx\xa1\
-$\x13\xaf\xcf\xdb_\x9c\xb8\xe3+\xae3\xb79\xf4W\
-\x0br\xf2\x1f\x0f\x94}.|n\xdf\xe4\xf7\x16\xe5\xf8\
-\xf9\xdc\xda\xc7\xdf\xfc\x5c\x9f\x1c\xb9\xbd\xc7\xbe?\x93w\
-e\xea\x5c\xce\xdev|WZ&o\xeb^;\xee\xc8\
-\xf7\x97\xe4\xb9\x0fV\xa4\x1e\x03\xcbs2\x90\xbbQv\
-])\x95\x9e\xb8\xf2\xebw\xbc&\x00\x80\x96\xb7\xa5s\
-\xe0zR=\x8f\x07?\xce\xa7\xbb\x09oh\x09\xcf|\
-\xb6w-\x5ciH:\xfa\xde\xb2\x8c\xfe\x87Y9p\
-j\xce\xbe\xd5p\xa4\x8e\xfe\xc7e9g\xc2S\xad\xe3\
-5\x84\xe9\xf5jl %\xc7L\x08\xd3c\xd4\xc9\xbf\
-\xcf\x97\x1d{\xf0/\xe7m \xf3\x1d\xfb\xa9>\xb9m\
-\xf5\xdc\x9f\xbf\xb9k-\xbc\x9d\x9d)\xda\xdb<\xfd\x03\
-/\xa8\x1d\xfe\x9bE\xfb\xb1\x7f\xdb\xa3w\xf4V\x84\xc1\
-8\xfa{\xb7\xd2\xd5Sv\x9d\xe3\x16\xc7\x04\x00\xd0\x16\
-\xb64\xc0\x95\xdc\xd2X\xf0\xe3\xe5L\x9f\x00\xdbM\x83\
-X\xb0\x92\xa5\xe1\xebY\x13\xd4\xfc\x00\xa640\x1d\xfa\
-\x7f\x16le,|\xfc\x13\xe6\xfa\xe0\xf1\xfaV\x8f\x9b\
-0\xc1\xcc\xbfnbO\x97\x0dZ\x1a\x04\x9f0\xd5\xb8\
-\xe0\xb9\xa7\xaf\x14\xe4\xdeWo\xd8\x80\xa64\x84M\xee\
-\xf7\xce\xef\xbfU\x87B\xb7SzN}\xbc\xfe\xed\x1e\
-\xffD\xfd\x8b.\x0a\xe9\xee\xb2\x8f\xcd@\xea\x98\x00\x00\
-\xda\xc2\x96\x068\xf3\x02Q\xb6pa\xb3\xe6\xb2\x01I\
-<\x19\x08IZ\x1d{\xf1\xe3\xe8\x05\x01\xfe\xf5\xc1\xe3\
-u8S\x03X\x94\xb7g\x8b\xf6\xf3\xbeC&\x5c\xc5\
-\x0dqj0;\xf2\x83\xa5\xb5\x8f\xfd\x80\xe8W\xf9\xf4\
->\xce\x05\xaat\xe1\xfb\xf1\x85\x87o\xab\xd1\xb9oe\
-\x1f\xbb.\x0b\x8b\x00\xa0Mli\x82r\xa5\xbcQ\xae\
-\xbfx\x01\xd8N\xc1\xd0\x13\x17\xc6\xe2\x8e?\x1b\x08O\
-Q\x82\xe1\xaa\xd6\xf0f\xb5 6\xd2\xd5\xfc\xe9\xaa%\
-)\xff\xfdsX\x19\x0e\x00m\x83\x12\x18\xb0\x89\xae\x07\
-\x86<u\xd1A\xa3\xc6G\xd2k\xf3\xe2\xc2\x82\xc3\xa6\
-\xb5\x02%\x00\xa03\x10\xe0\xb0\xe3\x05C\xcf\xa1:\xe6\
-\x90%9\xbe\xac\xaa6\x90\xaaZ\x85+\x0bb3\x95\
-A\xec\xe4\xcf\x0fT\x84\xb8{L(\xd4\xc5\x0bJW\
-\xbb\xc6\x0d\xff\x02\x00:\xcb\x16\xcf\x81+\x1f\xa2)1\
-\x07\x0e- \x18\xc8t\xb1Ap\x8e[\xd0S\x9f\xe9\
-\xb1\xabB\x83->\xf4x]\x91\x1aw\xbc\x06\xae\xe9\
-\xcb\xde\xb0\xac\x867m\x09\x12E\x87L\xfd \xa6N\
-\xae\x061]\xa4\xe0\xbf\xafU\xb8\xe9\x07\x06\xe5\xf9\x7f\
-\xd4o\xef\xf3\x84\x09tg\x1f\x1cZ\x1bn\xd5\x15\xb2\
-I\x14\xd3\x15C\xa8c\x02\x00h\x0b[\x9c\xa0B\x8b\
-\x18R\xdb\xb6\x15+\xb0\xe6\xb5+\x05\xbbx\xc17\xf5\
-\xd3\xfd6$\xdd\xb3:\xe4\xa9!L\x83\x97\xb6\xf78\
-j\x82\x93.88\xf6\xfe\xfab\x04\x0d^\xd5\x8e\x0f\
-\x06+]\x9c\xf0\xd6\xc1!\x1b\x04\xf58\xbdh\xd0\x0b\
-\xf6\x94\xd3J\xda\xd4jH\xd4\x007\x93[\x1f\x86\xd5\
-*\x9e\x9eC\xef\xf3\xd0'\xd7+v\xba\xba5\x18,\
-\x01\x00\x9dmK\x13\xd4-S\xef~(\x81\x85\x0cW\
-\x87n\x95b\xc2\xdd\x0f2\xc5\x15\xe9\xcd/JW1\
-o;\xca\xa7K\xb5'\x9do\x85b\xaak\xf5\xad\xf7\
-\x22^Hed\xb1{P\x9b\xa3\x0aZ\x9fV\xc7\xde\
-\x0aT\xb3\xaa\xd1v\x22\x1a\xfa\xce\x98j\x98V\xc5j\
-\xd16\x1f\xe1\x0a[5\xda\x17\xce_L\xe1\xf7\x9b\xb3\
-\xa1\xed\xbde[\xf1\xd3\xb9t\xfaxmu\xce\x04O\
-\x0d{o70\xf7M\x7f\x97F\x17\xae\xac}l\xfe\
-1\x98\xbe8y\xf7A\x01\x00\xb4\xbc\xb6\xd9;*U\
-*\xca\xae\xc5\xab\x92)\xb5\xe6\x1c\x1f?H\xfao\xbb\
-eE\xfas\xf32\xdf3$\x8b=4+nuZ\
-U\xd3\xe0\xa4\x954\x0dIq4Xix\xb3\xc7\xbf\
->o+m\xc1\x9epa~[\x12\xbf\x7f[\xb5\x10\
-\xa7\x957m\xce\x1b\xb5\x12Vo\xaf-H\x9eM8\
-L\x0a\x00\xe8LmQ\x81\xd3\xf06\xbapY\xd2n\
-{\xae\xb0\xd3J\x5c!]\x7f\x83Ul\xaf\xc9\xfd\x19\
-;\xc4\x19v\xfc|>2\x5c\x8d\xf5;v\x184\xb8\
-@A\x03\xd7\x8b\x1f\x17*\x8e\xd7cu\xb1BxE\
-\xaa\xce\xc3\xd3!\xd0\x99\xd0\xdf'\x8f\x7f\xa2KF\xcd\
-y\xcf\xce\x96\xeaZa\xea\xed\x15\x5c\xdf\xafu\xc6T\
-\xb1\x07\x97\x83\xfb\xa7:gs\x19\xe7\x90}7\xb72\
-;s\xf8\xde\x19\x01\x00\xb4\xa4\xb6\x08p7\xdd\xb8\xd0\
-\xb6\xe1\x0dh\x7fN\xd6\x157k\xfe\xb5\x98\xba\xfc\xe4\
-\xdd\xc7\x05\x00\xb0\xedZ~\x19hOa\x89\xf0\x06l\
-+w\xcc\xfc\xa57\xe1\xb82u\xf3\xf1w\x9f\x11\x00\
-\xc0\xb6k\xf99p\xddy\xe6\xfc\xa0\xb5=\xb6oH\
-\xfe\xd3\xdbG\xe4s\xbb\xbd\x16!\xe7\xe7s\xf2\xc2\xfb\
-\xd7\xe5\x85\x0ff+\x8e\x1d\xce\xa4\xe4\x8b\xe6\xd8\xffd\
-\xef\x80=~6W\xb4\x17=\xfe\xcd\x0b\x8b\xf2\xd1B\
-\xf9\x18\xea}\xb7\xf6\xcb\xa3\xfb\x87\xe4\xfe\xbd\x83\xb2\xab\
-;m\xcf\xfd\xce\xb5%\xf9\xc3\x1f^\xab86\xeaq\
-\xf9\xb7\xd5\xdb}d\x1f\xd7\x8c\xbcyqQ\x1a\x95r\
-\xdd\xa3&\xc4\xc9\x95'\xefzV\x00\x00\xdb\xa6\xa5\x87\
-Pu\xee\xdbM\x0b\x17\xc5q\xdd\xc8\xcf\xeb\x5c\x1f7\
-\xa2\x88XL\xb8\xf2\xb3\xc8JQ4\xe0\x9e]]\xf2\
-\xef?\xbfW\xf6\x0fF/b\xd0\xd0\xf4\xa5\xbf\xb8(\
-\xdf_\x9d\xd8\xa6\xf3\xea\xfe\xcd}\xd5\x8f\xff\xbd\xb7\xaf\
-\xc8\xffvnYFL\xd0\xfb_~~\xb7<\xb6?\
-~\x01\xcc\xffd\x8e\xfd\x9dw\xe7\xca\xaes\xdc\x92\x8c\
-\xf5\xa7\xe5\xdf\x99\xc7\xe5\x07\xca\xb0?1a\xf1\xbf\xff\
-\xdeU\x99]]X\xa1\xb7I\x85~\xc7\x1c)\xc5\xfe\
-\xde\xa9R*=q\xe5\xd7\xefxM\x00\x00\xdb\xa2\xa5\
-+p\x03+se/\x22\x1a\xd8f\xfbn\x92|:\
-c\xde\xa7\x090\xb6\x8f.D8\xf9\x8f\x07\xaa\x1e\xa3\
-A\xed\xbf\xb8\xebV\xbb\xb2\xb4\xde\xe3\x7f\xff\xfeOJ\
-zh\xc9.\x88xl\x7f\xf5\xb6#\xff\xdd=7\xcb\
-\xad#\xc3\xf6\xfc>m9r2\xd0SN\x17S\xe8\
-J\xd8\x91nG&L\x80\xd4\xf3~\xf1\xf6Q\xd9\xbb\
-k\xc8\xae\xa2\xadE\xc3\x9d\xae\xac\xde\xb5x\xadl*\
-\x83S*\x1e5oh9\x02\x00\xdbd\x8b\x03\x9c[\
-\xbe\x13\x83T\xaf|eJ\xe5\x8dIo\xf4\xee\x92\x5c\
-W\x8f\x00\xdbI\xc3\x916\xe9\xf5\xf9\x8d}\xfdF\xba\
-Zi\xb3\xedB\x5cow\x84j\xc7k\xa0\xf2\xb7\xc3\
-\xf2C\x97\x1e\xab\xbd\xe6\xf48\xfd\xbc\x1e\xab-D\xfc\
-\xfb\xd6\x9d\x22\xfc\xd6%\xfaV\xfb\xc1\xf9\xedE\xfc\xbe\
-q\xf6<\xe6vO\xff`\xa9\xecqk\xdb\x13m\x00\
-\xac\xadRt\xe5\xac\x7f\xde8\xfa\x87R!\xdd-s\
-}\xa32\xbax%\xf8\xa9q\x01\x00l\x9b-\x1eB\
-}\xa7lL\xe6\xd2\xf0\xa7\xaa\x1f?\xf7\xe3\xb2\x8f/\
-\x0f}\xb2\xee\x16\x09\xc0f\xd1^q~\x80\xd2\xdem\
-\x13\xa6\x92u\xce\x84\xa8 ?hi\xb0\xaa\xe7x\x0d\
-j\xc1\xc6\xc0\xba\xfd\x96\xb6 \xd1p\x16\xb5\xc3\x82\x06\
-5\xbf\xa7\x9c\x06\xbd\x03\xa7\xe6\xec[\xf7\x09\xefo$\
-\xad\xba=\xf1W\x0b\x15\xb7\xd3\xfb\xf9\xf0\x91a\xfbV\
-\xef\xa3\x9e*\x9c/\xfc\xfbxi\xf2n~\x19\x01`\
-\x9b\xb4\xec8dx\x87\x85$\xfd\xad\x80\xcd\x14l\xf4\
-\xab\x15\xb6p\x18S\xc1\xaaX=\xc7k\xf8\x0a\x06.\
-\xbd\x8dV\xc7\xe2\xb6\xc7\xd2s\x07\xf7X\xd5!\xda`\
-\xef\xba\xa9\x98\xdb\xe9\xfdL\x9d\xcbU<\xaez\x14\x9d\
-\xf2\x8a\xf9'\xfe\xe8\x87\xb7\x09\x00`[\xb4\xcdD2\
-\xc2\x1bZ\x81\x86\xa5\xe0v[\xb5\xf6\x1fMr\xbc\x86\
-\xbe\xb33\xeb\xf3\xccjm\xeb\x15l\xec[\xcf\x16`\
->\x7fW\x08\xff\xf1\x01\x00\xdaO\xcb\x06\xb8T\xa8\xf7\
-[\xc9a\xa5(\xb6_x\xb7\x85$\xea9>x\xcc\
-m5BY\xb5\xf3\x85wz\x08\x9aX\xad\xd4\xe9p\
-n\x92\xe7\xe0\xa6\xca\xc3^!W\x1a\x15\x00\xc0\xb6`\
-)'\x90\x80V\xc9\xfc\xd0\xa3a.j\xcb\xad =\
-6\xc9\xf1\xd9\xc0\xf0j\xb5\x10\xa6&\x02\xe7\x0a\x07\xb1\
-#\xb7\xf7\xd8\xc5\x11a\xbap\xc1\x1f:\x8d\xda\x16\xac\
-\x9a\xf0\x1fQ\xe9\xd0\xa2$\x00\xc0\xd6!\xc0\x01\x09\x05\
-\x879\x8f~6\xbe\xd5\x87.bP\xba\xa0\xa0\xde\xe3\
-O~\xbc~\xac\x86\xb0\xb8*\x9c\xcey\x0b\xcea\xf3\
-o\x17\x9c\x17w\xf6\xc1!\xbb\x80BC\xa3\x1e\xaf\xef\
-\xfb\xaba\xb5\xfav\xf4?\xd2$\x1b\x00\xda\x15\x01\x0e\
-H(\x18|4D\x9d\xf8\xf9\x81\xb2\xa0\xa5\xe1I\xaf\
-\x9b\xfa\xe9~{}pA\x81\x1e\xaf\xabM\xc3\xc7k\
-\xb8\xd2\xe3u^\x9b_\x85\xb3+E\xcd\xb1~\x10\xf4\
-\xaf\xd3\x15\xa8z\xacO\x17%\xf8\x0b#\xc2U5]\
-\xfd:\xfd\x0b\x83\xb6\x07\x9d\xbf\x12V\xabu\x87\xfej\
-!r1\x05\x00\xa0=\xb4l#\xdf\x94[\xfe\xe2R\
-j\xb0qo\xa6\xb8\x22\xdd\x85\x15;\xa7.]\xf2*\
-'Q\x9d\xe77[Iw\x8d\x08=\x07\xdd\x01Bw\
-\x92(\x99\xb7\xda\x9c8\x9f\xa6\xc7];x\xcd\x84\xa4\
-\xa3\xef-\xaf\xb5\xf1\xd0\xbejz\xf1\x83WpA\xc1\
-\x94\x09f\xda\xaa#x\xbc\x86\xb8\xec#\xc3\xb1\xc7k\
-\x0f8\x0d]v\x01\xc4@\xca\x865\xad\x9c\xf9}\xe1\
-\x82\xf3\xf0\xe2*i\x1a\x04\xf5\xf8\xf00\xabV\x03\xe3\
-V\xc2\x02\x00\xdaG\xcb\x068\xa7T\x1e\xb0\xdcT\xb2\
-\x00\xa7\xc1mx\xf1zY\xf7\xf8\xedT\xcf\x12\x8c\x95\
-\xae>\xdb\xac\xb8\xc4\xd6^-\xcfo\x11\xe2\x872\x15\
-\xb5\x12\xd4_)Z\xef\xf1ZA{\xdb\xdcf\xe2/\
-\xe7m\xd5\xcc?&\x1c\xdc\xec\xb9\xcdPn\x5c%M\
-\xc3\xdaAs\x0e\x7f\x15\xac?\x17/\xe9\xc2\x0b\x00@\
-kj\xf9\xcd\xec\x1b\xd1\x93_\x90]K3\xd2nz\
-\x0aK\xd2\xb5\x98\x93\xd9\xfe\x9bl\xc5n\xb3\xf8\x95H\
-l\xcc\xef\xbc\xbb\x22\x7f\xfe\xa3y;\xafM\x83\x92n\
-6?\xdc\xed\x85\xef\xecb\xd1V\xba4\x90\xf91\xed\
-\xeb\xef\xcd\xcb\xbf?\xb7d\x87@\xc7w\xa5\xec~\xa7\
-\xbe\xf0\xf1?\x98)\xc8/\xfeEA\x1e\xdf\x9b1C\
-\x9f\x99\x8ac\xa7\xce\xe5e\xea#o\x17\x05\xff3\xf3\
-\xe6\xc3\x1b\xe6\xf2\x97\x97\x96\xe5\x9f\xff\xd5\xa2\xadb\xcf\
-\x99\xd1\xdb\xef\x07:\x97$\xadc\xbb\xbaTa\xf5g\
-\xd1\x0d\xf5\xfdvS\x99]\x02\x00\xd8\x16-\xbb\x13C\
-onQ\x86\x97\xaf\xaf}\xbc\xdc\xdd/s\xbd\xb5\xbb\
-\x16\xa4L8\xb9y\xfe\x82\x00\xd8*N\xd6\x7f\xcf\x15\
-W\xffr\x9aq\xc4\x991\xefg\xddT\xfa$\x9b\xde\
-\x03@\xf3u\x5c\x05n`eN\x00l%w\xcc\x7f\
-o\xfd/B\xaf^\xe7\x94\x8aGn>\xfe\xee\xd1+\
-O\xde\xf5\xac\x00\x00\x9a\xa6\xe3\x02\x5c_~Q\x80V\
-7l\x86D\xbfx\xfb\x88\xdc\xb5\xdb\x9b\x137\x9b+\
-\xca\xcb\xe7o\xc8\x9b\x17\x17\xeb>\xfe\xcd\x0b\x8b\xf2\xf2\
-G7\x22\x8f\xbf\xef\xd6~yt\xff\x90\x1d\xd6\xd5c\
-\xdf\xbd\xb6l\x8f\xffh!/I\x1e\x97\xde\xee%\xf3\
-\xb8j\xdd\xae\x9a\x94\xeb\x1e5!N\x08q\x00\xd0<\
-\x1d5\x84\xdaU\xcc\xcb\xee\x85K\xd2L\x9d\xb8\x03D\
-\x91E\x12\x9b\xa6\xd6\xfc\xc2]\xdd\x8e\xfc\x97\x9f\x1d\x95\
-/\xdfy\x93\x0dWa\xe7\xe7s\xf2\xc4\xa9\xf3r~\
-\xa1\xb0v\xfc\x7f\xfbS7\xdb\xe3\xa3\xe8\xf1\xdf8{\
-I\xfe\xf8\xff\xf36\xa5\xff\xa5O\xf7\xc9\xb7\x1e\xf8t\
-\xec\xb9_x\x7fF~\xf7\xfb\xd7\x22\xcf\xf5_}v\
-\x97|e\xfc\x96\xc8\xdb\xfe\xc9\xfb\xd7\xe5k\xdf\xbd \
-s\xb9\xc6W\xaf\x16\x1d\xe7\xd0\xd5'\xefzQ\x00\x00\
-\x1b\xd6Q\x01NW\x9e\x8e.\x5c\xa9\xb8~\xb1{P\
-\xf2\xe9n\xdb\xc6#\x18^\xb45\x89\xeb\xd0\x0a\x0f[\
-C\x17:h\x0f\xb8\xf1\x91\xea\x01ZW\x97\xde{\xe6\
-\x86]=z\xe6\x17\x06\xeb\xda\xe7T\xdb\x94\xe8\x8aW\
-]\xb9Z\x8b\xf6\x8d;\xfc7\xe5\x95>]X\x11\x5c\
-!\x1b\xd5\xe2\xc4\x7f\x5ca\xe9\xd2z\xef9\xbfE\x8f\
-\xbe\x1d\x5c\x9e\x0d\xaf\x02\xcf^\x9a\xbc\xfb\x80\x00\x006\
-\xac\xa3\xd2K\xbaXY\xfdX\xce\xf4\xc9|\xef.Y\
-1os]=&\xc0u\xad]\x08o\xd8J\xdf\xfc\
-\x5c_Yx\xd3\x15\xa7\x87\xbf\xb7h\xdb}\x1c\xf9\xfe\
-\xd2Zh:\xf6\x81\xb7\xbaTCU0@\xe9\xf1z\
-\x9c\xde\xe6\xd8\xfb+e\xdbni\xf8\xd2\x16!\xfe.\
-\x11\xda\x1fN\x8f\xd5sO\x9a\xe3\x83\x0d~\xb5\xa1\xaf\
->\x16\x9f6\x0a\xf6\xc3\x9b\xdeNos\xe0\xd4\xdc\xda\
-\xc5\xdfIB\x1f\xfb3\x11;I\x04\x7f\xa7\x0a\xe6\x0f\
-%\xfd=\xd3\xdf\xb7\x99\x81\x9b\xd7V\xb0\xae\x1a\xfb\xc4\
-\x1f\xfd\xf06\x01\x00lXGU\xe0\xc2\xb7Q3\xfd\
-7\xdb\x17\x14`;\xe9vV\xda\x9c\xd7\xa7\x15\xb3g\
-C\x0dx5\xac=\xff\xd3\xfd6@\xd5{\xbc\xee\xf8\
-\xe0\x87B\xddF\xeb\xf8\xf9\x9c\xbd\xed\xd3?X\xaa\xe8\
-\xf9\x16\xae\xb2\x8d\xfe\x87Y{\x8cV\x05msa\x13\
-\xde&^\x9f\x8f\xec+\xf7\xd6\xc1!{?z\xbc\xde\
-\xae^\xbb\x17.JWq=<\x9a\xe2\xdc\xbd\x97\x0f\
-\xdf}V\x00\x00\x1b\xd2Y\x158\xb7rs\xeeb\x9a\
-\xf9^\xd8~\x93\x81\xed\xb0t\x08\xf3\xd9\x88\xdd\x13\xb4\
-\xa2\xa6\xe1-\xd1\xf1&p\xf9A\xcd\x860s\x9d\x0e\
-\x8fF5\xec\xd5s\xf8{\xa5*\xdd\xd8\xde\xbf\x9d\xd2\
-*]\xdc\x0e\x0d\xcf\xadV\x05u\x18x|W\xfd\xbf\
-S\xe19\xa4iqG\x04\xe8\x14'\xcc\xcf\xf3\xcb\xee\
-=\xf6-\xb0\xc5:~\x0c\xb1$\x048l\xbf`\xe8\
-9\x1e\xd8\x1bu\xa3\xc7\xfb\xdbc\xf9n\xab1_.\
-x\xaep\x10\xcbV\xd9^\xeb\xc3\xc0\xe7\xc2;BT\
-\x13\x0ep\xc5\x94\xc3\x10*:\xc3)\xf7\x9b2 \xd7\
-\xcd\xab\xe8Y\xfb\xf6\x94\xfb\x8cl\x16\x0d\x88\xdfvo\
-+\xbb`\xc7\xeb\xc8\x9d\x18\x82\x5cgKG\x89\x81H\
-#\xdd\xeb?\x87\x1f\xd6\xb1\x0fi\xd2\xe3\xd7nW#\
-\x5c\x95\x05\xb1\xee\xf2c\xabU\xd6\x82\x9fc;.t\
-\xa4`(*\xca\xd8\xda\xfb\x0b\xf2\xb6<\xe1\x94o\xed\
-\xa3\xe1\xcd\x91#e\xd79r\xd4T\xe3f\xe4Q\xe7\
-9i\x96\xd3\xee\xa4\xf9\xff\xf3\xab\x8f)(k.,\
-\x08\xda\xe1:>\xc0\x01\xad`&gBO\xbf\xf7\xbe\
-\xce]\xab\xb5\x99|\xf0x\x0dO\xd5\x8e\xf7\xf7[\xf5\
-\xcf]MY\x10\xcb\x95\x07\xb1C\x9f\xcc\xc8=\xe6\xf3\
-o\xcf\x96\xbfR\xe89\x8f\xdc\xee\x0d\xb7\xea<\xb9\xb3\
-\xb3l\xc5\x86\x0e\xf3\x92;f\x02\xd2\x87\x91\x9f\xeb\x95\
-\x83\xe6\xff\xd3e\xd792\x19yl\xca^\xdf\xbc\x00\
-\xd7\x8a^5C\xc6\x059f\xde\x1bY\xbd\xac{\xd8\
-!Tn\xa1\x8e\x1eB-\xb1\xca\x14-\x22\xb8\x0a\xf4\
-h\xc4JN\xdf=\xab\x01\xeb\xe4\xc7\xf9\xba\x8e\xd7\x05\
-\x0b\xc1@\xa5+L\xe3\x86Q\x83A,x\x1f\xc1\x8a\
-\x9a.\x9c\xd0U\xa9\xfa8\xf4<\x8f\x7f\x22S\xd6\xca\
-\xe4h\xc4\x5c\xbcj*\xf7\xf4M1W\x08\xad\xe7\xb1\
-\xf5\xed\xe06\xa8\xfd6\xe1NN\x7f\x87'\xcce\xdc\
-\x5c\xc6B\x17l\xa1\x8eN8\x0c\x9f\xa2U\xf8\x8b\x00\
-\x94.\x1a\xd0\xd5\xa3\xe1\xa0\xa5aI\x03\x94\x862=\
-\xde\x0fV\xba\xfa3\xeex\xbf\xef\x9b\xbf8A\x87P\
-\xa7\x1f\x18\xac8\xd6_\xb1\xea\x071\xad\xa4\xbd\xb8\x1a\
-\xe0\x82-I\xf4\xf6S?\xdd/g\x1f\x1c\x92\xec#\
-\xc3\xf6\xfck\xe1\xed\xbd\xe5\xba\xe6\xef\x05\x85[\xf58\
-\xed\xb8\x88\xe1\xb4\xfbysy\xca\x5c\x9e7\x973k\
-\x97S\xee\x09y\xc5}\xc6~\x1e;\x8bc+P\x95\
-R2%\xc0\x16a\x085\x82\xe3\xba\xd2U\xcaI\xa6\
-\x98\xb7\x0dI\xf5cG\x1a\xef@\xdf\x0c\xfedp}\
-A,\xad6$.\xa4\xba\x09\xa9mB\x03\x92\x06 \
-\xbf\x8d\x87\x0eWj\x90\xd3\xbem\xfa9\x1d\xda\xf4\xdb\
-\x81h\xc5MW\x97\xea\xf1\xc7~\xaao\xedx\xbd\xe8\
-\x82\x05\x0dv\xc1\xe3\x8f}\xaeO&\xfff\xd1\x86?\
-\x0d`c\x03)\x1b\xbe4\xd4\xe9\xb95\x80\xf9+M\
-}ZI\x0b\xcfe\xd3\x8f\xf5\x12\x1e\x86\xd5\xeb\xf4\xb1\
-\x04Ch\xc7\xd3I\xe3\xfd\xf2\xd4\xea<\xa7\xe8\xd0\xa9\
-\xbfz\xae\x1c\xb2\xef\x9fr\xb3\xe6\xe3iI\xcbQ\xf9\
-\x82sN\xd0\xd9\x1er\x9e5\xe1}\xc4|\xff\xbdy\
-p\x8e\xa9\xbc\x99_\x13\xf9E\xe7\xb8l\x8d1iE\
-:\x8f\x90\x9f\xff-C\x80\x0b\xd0\xa0\xd6\x97\xbb!\x03\
-\xb9y\xfb~;X\xca\xf4\xcbB\xcf\xb0\x94\xd8\x1e\xab\
-\xe5\xf9\xad@\xfc\x10\xa7a+\x1c\xac\x94\x06(\xfd\x9c\
-\x06&}\x1b\xec\xdd\xa6!.L\x8f\xd1\x905\xf1\x97\
-\xf3e\x15\xb3\xa8s+m\xf0\x1bUI\xd3sh\xe3\
-^\x1b\x0eW\x87r5\x00\x06\x87\x7fw\x04\xad\xb6\x99\
-o\x93\xc4\x05\xb7(\x8e}A\x9d\x94\xa2\xb9\x9cr\x8f\
-\xca#\x0e\xfb\xbev\x8a\x8cD\xaf\xf8|\xc8y\xda\x04\
-\xfdg\xa5\xd7\xfc\x9c\x98\xbf\x87*\x16:4\x83#\xd7\
-e'\xad\x19\xd2?\x9c\x86e\xd7\xda\x22\x92\xb4d\x13\
-\x07B=\xc7\x80\xdcc\xbev#\xf6\xe23\x7f\x9f\x9a\
-\xef\xd9\x8bk\xc7x\x7f\xa0M\x88\x17\x865\x80\x1f3\
-\xbf\xb7[\x15\xc0\x9b\x82\x00\xb7*U*\xca\xe8\xc2\xe5\
-\xf0\xd6?-\xaf/\xbf(\xdd\xc5\x15\xb96p+\xd5\
-\xb86\xa0!\xceV\xe3\xee\xe8\x8d\xact\xe9pfp\
-\xf8T\x8f\xd7\xb0\xa5\x0d~'n\xee\xaaz\xbc\xfe+\
-\xa7}\xe4\xb4a\xaf\x06\xbd\xf0\x8aT\x7f'\x87\xb7c\
-\x16!\xe8\x0e\x0fJ\xe7\xd4\xed\xc8\x85\x0a\xde?\xfc'\
-\xc4\x9b\xdf\xd38]\x8dx\xca\x9c\xeb\x11\xf3\x02\x8f\xce\
-\xe6\x85\xb6\xcd\x9b\xf7\x966\xe7n\xd6\xdfO\xe1pT\
-2\xe7^2\xffl\xd4\x13<\xfdP\xa4\x0av\xee[\
-4\xf3O\x8c\xa9L\xae\x9f\xcf5U\xe9\x87\x9d\xd7\xa4\
-\xd6\xb9\xbd0\xa5\xd5\xec\xf1\xb2\xd5\xb6\xfa\xfeiw\xc6\
-\x9eG\xe4d]\x01k\x97\xe8\x22\x8bi\x1b|\xcb\xc3\
-o\xd6\x5c^\xb4\x0bVRrf\xf5\x8f\xaeu\xa9\xf6\
-\x9b\xc3\xd7Q;1\x0c\xac\xcc\x99\xcb\xfa^\x8d:\xcc\
-xup\xaf\xd4\xe3\xa6\x1b\x17\xda.\xbc\x01[E\xff\
-8\x08\xf7t\xabG\xca\xfcN\x85\xaa\xd93\xe6\xa3\xc8\
-\x9d\x18\x1cq\xcc\xe7\xbc\x7f\xfc\x1d\xc7\xc9\xea\xc7E\xc7\
-9{\xe5\xd7\xefxM6\x9b\xf7\x22\xa2\xff\xa8\x8fK\
-\xf3L\x99\x17\xaf\xc3\x82\xf6p\xda\xd5U\xa8c\x15\xd7\
-\xeb\xca\xd2\xcd\x18\x1a\xd5\xe1\xc6\xa2\x09-\xae\xb9O\xaf\
-Z\x94\x15\xfd\xdd\xf0\xabD\xeaU\xf7\xf36\x8cDy\
-\xb8\x8e\xbf\xd8\xcb+M\x13\x91\xc7\xb8R{\xf8\xbf\xda\
-\xe3\xa8\xa6\xda\xd7n\xfd\xb1\x1d\x95z\xe9c\xed2\xcf\
-\xa3ZU.\xfe\xb1feA\xee5\xf7\xf9VEx\
-\xf3\xce}\xac\xdd\xfe\xe8\xa2\x02'^X\x0c\x87\xb7\xe1\
-L\xca\xc6\xdb\xb9\xdc\xf6\xce}\x03Z\x81\x86\xb0\xa8\x9d\
-N\x1a0\xe2\xc4V\xb8\xdc\xf5\xbf(\xcd\xfd\xe9\x7f)\
-\x93\xf6\xf6L\xbd3\x9d\xcf\xa4&g\xbet\xe7\xe6\xcd\
-\xad\x19\x90o\x8a\xd4\x11\xde\xbc\xb9N3\xf6\x05\xd7\xad\
-9\xc4:)/\xbbg\x9b\xda\x17\x0c\xe5\xfc\xca\x90V\
-O\xdc\xd5\x17e\xef\xfb\x93\xb5\x0dv7k>\x96\xd7\
-\x07\xeeP\xe8\xda1\x11[q:X\xf5\xb6~\x1b\x8e\
-\xe2\xea\xef\x81\xffC\xef\xae\x9d[\x1f\xfb\x91\xb2 \xd7\
-\x88z\xa7\x02\x04\x87\xffO\xbbS&\xe4<\xdd\xb4\xe1\
-\xe0R\xcc}{U\xb0\x13\x89\xff`\xd2\xc7Z4\xdf\
-\xdb\x97\xdd#\xb1\xbfW\x05\x89\xdf\xeb\xaf_\x1e\x8f\x0c\
-o\xde\xb9\xdbn\x81\x15\x01\xce\xe8-,\x96}\xfc\xe8\
-\xbeA\xb9{w\x9f|\xe3\xed\xcb\x02\xb4*\xfd#\xe3\
-\xb1\xfd\xc3\xb2o0c\xfe\xd0(\xca;\xd7\x96\xe5\xcd\
-\x8b\x8b5\x8f\xdf\xd5\x9d\x92Y\xf3\x87\xc9G\xf3\xb9\xaa\
-\xc7\xdfwk\xbf9w\xb7=^\xcf\xad\x97\xb9|\xed\
-?h\xfc\xfbQ\xb3\xe6q\xbdkn\xf7\xd1B^\x1a\
-\xa5\x81\xaf;_\x9a\x1ey\xfe\xad{g\x0e\xdf\xdb\xfc\
-\xe1\xaaS\xee\x93\x221}\xbd\xbc\x07\xa0\xf7y\xcc\xbc\
-0\x1c/k7\xa1/B]\xf2\xa4y\xe1\xd5\xdb\x8e\
-E\xde6e^@O\xb8\xc77e~T\xb3iE\
-\xc8\x0d\x84\xeb\x92y\xa1\xac5\xfc\x15G\x83\xd5\x90y\
-\xb1,\x9a\x17h\xaf\xfa\x13|q\xf4\x86\x1d\xb5\xea\xa3\
-\xab6\x1b\x09Y\xde\xca\xdf\xa3\xe2\x85\xee\x91\x8a5f\
-\x1a\x86\xbc\xe17\x1dJ\x9bj\xfa\xdc\xa6\x94\x0d\xf2c\
-\x92\x94\x86\xaaB\xcc\x0aV\x9fc\xc3\xe8I\xf3s9\
-)\xde\xb0_\xb4j\x0b\x06t\xc5t\xb5\x9f\xe9x\x93\
-&\x10\x8f\x9b\xef\xdf\xc1\xa6\xfc\xcc\xc6\x85\xa2\xa8!\xcc\
-$R\xe6k\xf8\x8a\x09\xbaQ!\xb7h\xbe7\xd1\x83\
-\x05\xfaX\x8eJ\x07\xe9\xe8\x00\xe7\xd6\xd9\x07.S,\
-\x9f\xd0\xfd\xe5;o\x96_9\x95\x15\xa0\x15\xed\x1b\xc8\
-\xc8W\xc6\xf7\xc8\x17o\xaf\x9cRp\xde\x84\xb2o\x9c\
-\xbd$/|0[v\xfcs\x0f|J\xee\xdf;P\
-\xd7\xf1_\xb9g\x8f\xf9\x1d\xb8\xc9\x04\xb7\xca\x7f\x05\xff\
-\xe4\xfd\xeb\xe6\xf8\xcb\x91\x81L\x83\xdbo\x8e\xdfbo\
-\x9b\xe4vu\x1a\xcb8\x19\x9d\x9fvP\x9a\xefh\x95\
-\xcf\x9d5/\x16\x87\x22_(\xbd0\xf7\xac\x09r\xc7\
-\xcd\x0b\xc6\x19\x89\x0eq\xde0\x91\x1eW/\xdd[3\
-\xb5\xdag\xcb\x0dL\xc4v\xed\xd0\xf3Y\xf3\xaf\xf6t\
-\xdd\xa1\xc7\xab\xc2\x1c\xa9\xb8\xde\x09Tx^v\x1f\xb7\
-A\xb3\x18Q\x0d\xd1j\x90\xd8\x00T\xdf\xe3\x0f\xae\xde\
--\xd9\xc7\x1eO\xc3b\xd1\xce\x17<i\x9e\xd3\x91\xba\
-\x9e\x93w\xfeg\x22\x9fS\xb4\x09\x1b O\xb9\x87\xea\
-\xbe\x8f\xb0R\x93*3\xfau\x96\x1a\xe1-\xc8\xb1U\
-\xbaIIJ[\xdb\xb8\x0d\x857\xdf\xf8\xea\xd7x}\
-8\xb1ZU+)\xafz9\x16\xfby\xc7\xce_\xcb\
-\xaeV\xb9\xfd^s\x954\x98\x9fp\x0f$\x08\x9a#\
-\xa1@\x99\x15\xbfA\xb3w}V\xdaLG\xcf\x81\xcb\
-\xa7\xbb\xe5\xfa\xc0\x9e\xaa\xb7\xd16!{n|\xbc\xf6\
-\xb1\xbeh=\xbao\xc8\xbc\xa0\x05\xe6a:\x8e]\xed\
-\xa9+=\xdd\xd5h\xaf\x0dJ\xa3\x02b\xb1\x89\xabA\
-\xb5]\x88K3b\x04h\x83]\xbf]H5\x93\xdf\
-[\xb4\x8b\x1f\xea=~\xea\x5cN\x0e\xff\xcd\xa2\x9cy\
-`0v\xf5\xaa\xef\xdcBA\x1e\xfc\x8b\x1brn1\
-\xb8\x03DZ\xbe\xfdO\x86\xe4\xb6\x81\xae\x9a\xb7\xfb\xd1\
-|t/9\xfd]L\xad\xce\x97K\x99\xe1\xda\x9e\xfc\
-\x92t\x95\xca\x87m\xcd\xef\xe0DS\xe7\xc4i\xf5\xcd\
-\x89\xed\xdd\xe5\xcd\x99\xa9\xe7\x05B\xabqiyK\xa2\
-\x87\xabfL%k\xb4\xe69\xd6\xabJ\x13R\xdbT\
-]-K\xe2*1\xfe\xdc$\xef\xc5\xfe\xa8\xd4R\xcf\
-\xdc\xa3\xb8\xc9\xe1\xf5\xd0\xf3kK\x96G\x9d\xb7c\x8f\
-\xd9\xe8<\xc5Z\xcf!n\x0e\x9c\xce\xd1z(\x14`\
-\xe3\xbfn\xd1C\xa8\x8d\x7fm\xf4g/:@\xa6\xcd\
-\xb9\xc2\xcf\xc5\xfb9\x8c\xdeQB+\xc9%\xf3s\xe3\
-\x88\xff5\xd6\x9f\xb7I\x89\xb3 \xa3k?\xfbg\xcc\
-\xd7\xbe`\x83\xb9\x9eC\xc3\xdc\xf3\x91\xb7\xd1\xa1_\xd7\
-\x9c_\x87\xb1\xb5\x12\x16^\x9d[\xed\xf1\x89\x0dm\x87\
-\xcd\xd7zz\xed\x1a\xbd\xdf\xbc\x9d\xde0\x19y\x8b\xa8\
-yk\xd5\xef#\xfa~\xda\xd4\x8e\x1fBM\x97*\xe7\
-\xbe\x05\xc3\x9b\x9a\xef\x1e\x96\xa5\x9eA\x01\xb6\x93\xaeZ\
-\xd56!\xc10\xa6+K\xb5\xdf\x9b^\xa7+O\xf5\
-\x18m\xd2\xab\xd7\xeb\xfb\xe1\xf0\xa6\xd7k\xef9\xbf\x85\
-\x89\xbf\x12Vwp\xd0\x95\xac\xfay?\xc0\xf9\xc7\xda\
-\x16%\xe6:\x7f\x15\xac\x86\xb4o\xff\x93]r\xef\x99\
-\x1bk\xabe\xbfzg\xffZx\xd3\xdb=\xfb\xde\xb2\
-}\xab\xedH\x9e\xfaL\x8f\xb7C\xc4\xea\xed\x0e\x9c\x9e\
-\xab\xe7\xe9\xcab\xf7\xa0]\x19\x1e\x0cqN\xa9\xa8\xf3\
-\x8e\x9a\x17\xe04\xc8\xc4\xb5iH\x9b\x17\xfbz\xff\xba\
-\xd7j\xdc+\xee\xb1\x98\x17\xf5\x11\xf9\xbf\xdcq\xf9\xa7\
-N\xe4\xe2\x8d\xd5y\x5c\xf1/R\xd16\xde\xb2\xa4\xde\
-\xf0\xa6\xbc\xb9G'\xcd{\xf7\xc6\x1e\xb3\x91a1\xc7\
-N\xe4\x9f6\xc3\x82\xe3\xb1\x01k\xd0\x84\x06w\x03\x8b\
-L\xf4>tr\xfb\x097.\x947c\x98{,\xf2\
-\xda\xb4\xadh\x8dI\xfcc\x9b6\x97\x936\x1c9r\
-[`X>Y\xf5\xcf\xbb\x9f(ge^\xc2\xc3\xa2\
-S\xf2\xaa;\x15\xbb8a@tj\x817\xcf\xec\xa0\
-\xbd\xdd\xfa\xcf\x99\xf7\x87A\xa5\xbc\x09o\x8fU\x09F\
-\xf1\x8f\xcf\xfb}\x0b\x7f\xef\xbd\xfb=l~V\xc7\xca\
-\x86\xf7}\xba\xa5\x99\xb6rI2\xdc\x9b\xae\xf1\x87H\
-\x1b\xd9\xe2\xf2N\xf9v%M\x9a\x14\xbd!\xe1\x06\xbd\
-\xe1!\x1e\xad\xa8\x11\xde\xd0\x0a\xb4=Hp'\x05m\
-\x19\xa2\x17m5\xf2\xf4\x0f\x96l\x0f7\xad\xa4i\x93\
-^\xdd;U\x8f\xf7\xc3[\xf0x=V\xabmz\xbc\
-6\xe8\xf5\xe96[\xda>\xc4o\xdc\xeb\x1f\xab\xe7\xd7\
-\xf7\xb5\xaa\xe7\x076m\x16\xac\xc1\xcc\xbeo\x1e\x93\x06\
-4\xa5\xf7\xaf\xc7\xfa\xbd\xe3\xf4|z_\xda\xee\xc4\xbf\
-\x9dn\xd5U\x0f\xad>/v\x0f\x95]\xe7\x883&\
-\xcdr\xc66b\x9d\x88\xfc\x9c\xceAJ\xfa\x8f\xbc\xce\
-\x91\x8b\xd3\xb3\xda\x82!\xcc\xaf*I\x83C^^\xcb\
-\x92g\xaa|>\xfa\x85\xadh\x87g\x8fJ2\xe3f\
-\x18\xf0\xa9\xc8\xcfx\x95\xcc1\x89{\x0c\x1aN\xb4Z\
-\xe2\xda!\xc4\xacD\x1b\xb1C\xaaq\xe7w+\x16\x0d\
-\xac\x9f\xdf;\xefa\xf3\x8a\xf6\x84\x88\xad\xa8fc\x8e\
-\x1d[\x1d\xd2\x8e>\xcff8cw\x1f\x99\x8c\xfd\xbc\
-k+|\x07ME\xf49S\xbd\x9b\xb2\xd5\xbe\x8c\x0d\
-\xcaS\xd2\x08\xc7\x06\xb2l\xd9\xf3I\x9b\xaf]T\xc8\
-y\xd0\xceq<\x1b\xf3\xb8\xc6\xa4\xd9\xdc\xd8\xear\xf5\
-\xb9\x90\xe9\xd8\x9fUo\xaee\xfd\xa6:%\xbc)\xc6\
-\xe7j(\xa42\x02l\xb7`HR\x1a\x8a\xa2\x1a\xec\
-j\xe0\xf2\xabo\xc1\xe3'^\x9f\x8f<^\xc3\x99\xee\
-\xee\xb0v\x9c\xa9\xb2M\xac\x86\xc20\x1d\x92\x9d\xfc\xde\
-\xfa\xa2\x07\x7f_U\xdd\xd2\xcb\x17\xb7W\xea\xb3\x81\x9d\
-\x1f\xc2\xfd\xec\xaa)\xa6\xcb\xa7$4u+.7&\
-T\xa9\xb4\xad6%\xa3U\xb8\xa2\x1c\xb0CO\xda\xe2\
-!x\x89k\xa5\xa0s\x8d6\xda\xbaDC\xdc+n\
-\xdc\x8b\xd8L\xccm\x8e\x84>\xd6\xe3\xb2RK*f\
-\xee\x99\x13;'M+?\x07L(y\xc2\x0eu\xe9\
-E7<\x8fo\x1dq\xc8\x86\xdaJq\xc7\xeb\x8a\xcd\
-\xf1\xd5\xf3N\x99\xaf\xf3I\xdb\xba\xa5h\xe7Jf%\
-\xfa\xb1\x1e\x8d\xb9\x8f\xfaym\x17\xebS\x90j[\xad\
-E\xcf/\xd4\xcaS\xc6\xceA\x8b\x0f\x95\xcbR9,\
-\xaf\xcf]\xc3\xa0~\x8d\x1fr\xd6\x7f\x0e\xab\x85\x16'\
-\xf6\xeb\x94\xfck\xd4%\xbbb?w\xda\x1d\xaf\x12\xf2\
-\xab\xff\xbeyA3\xfakQ\x0a\x85\xc2j\xfb\xda:\
-\x0d\xfc^\xb70\x02\x5c\x0d\xc5\x14\x0bu\xb1\xfd\xfcM\
-\xee\x95\x1d6\x8d\xd9\x1d\xc16\xf45\xd5\xb7\xf0\xf1\xe7\
-\x16\xe3W\x8f\x1e\x0bl\x91\xa5\xc3\xb0oWi\xe2\xab\
-\xfb\xa7\xfaAL\xab{\xb7\xad\xee\x1a\xe1\x8b\xbb\x1f\xbd\
-\x8dV\x01\x95V\xe1\xea\x15\xee=\xe7J\x13\xab\x02\xd5\
-\x1a\x92:\x0d\xf4\xbcR\xfa\xe2Q\xefp\x8e\x86.'\
-6\x10\xcd\xd8\xa0\xa1\x81P/\x8e\x0d$S\xb1\xe7\xf2\
-&t'\x7f\xc1\xf5\x86\xee\x0e\xae\xbe\xd8\xfb\xf7u\xb4\
-\xca-\xc6\xec\xea\xc7J\xd1_\xcbbLK\x0a\xad2\
-9k\x13\xc8\xbd\xf0\xe8\xac6k\x1d\x0e\x85\x80j\xd5\
-\xbdT\xcc<@\xfd>tU\xa9z\xc5U\xe16\xc7\
-D\xecg\xd2U\xbe\xd6\x1a\xe2\x9c*\x8b\x1eR\x1b\x5c\
-\x5c\xa1?/\xa7\xec0\xfa!i\x96j\xa1\xafZ\xb8\
-K\xc5T\x01\xcb\xc5\x85\xaf\xfa\xff\x00j\xe6b\x8c\x16\
-@:\xa9\x81\xdd\x0d\xd0\x0aF\x03!\xc9\x0fB\xcd:\
-\xbeZ\xb8\x8b\xa2\xf3\xe2\xfcyr\x07B\xbbI\xf8\xdb\
-zE\x19\xe9\xf6\x1e\xd3L\xaeE\xf6\x06\xf2\xda5D\
-\x99\xd9\xa2a\x96#\xb1\x9f\xd1y:\x0f\x96M\xe8\xcf\
-\x8aN\x90\xd7\xd6\x09q\xf3\xec\x92\xaev\xd5\xc0\xf4P\
-h\xc2\xbd\xbf\xb26\xb8\xcfg\x987\x0c\x16?\x5c\x1c\
-\x94\xb6U\xce\xe9\xc8\xcf\xcd\x9b\xe1\xcez\xc2\xae\x13\x1b\
-\x80\xb2U\x1b\xecj\xd5\xe6\x15\xdbFd\x22\xe6\x9c\xf5\
-}\xad6>\x94\x18\x170j\xf7\xa9\xd3a\xf9\xf4\x06\
-[_\xf8\xeda\xdc\xb5^y^\xeb\x95\x8d\xfd1\x14\
-\xbf\xb8\x22N\xc1\xfcq\x10\xa7\x9e\xdf7\xc7.t\x89\
-\xd2\xbc\xaa|\x9b\xd9\xf1\x15\xb8\x94K\xa3^\xb4\x97\xf0\
-\x16\x5c\x1b=>\x1b\x08pc\xa1\x8aZ\x94\xf1\x91\xf5\
-\xaaX8\xac\xe9\xbc\xbb(:\xef\xcd\x7f\x1c'?n\
-\xbc'\x5cS\xc57\xe2\xdd\x9c\xb9PA/\xc5L\xca\
-V\x1a\xd0\x1e\x8cY\x8d\xe9\xad\x86\xccF~\xceI8\
-\x8f.'\xf1]\xe7\xbb\xaa\x84\x9b\xe8\xb6\x1a\xd9\x98\xa3\
-\x8f\xda\x0aZT\xd5\xae\xfe\x89\xe7q\x01hZjq\
-c\xab6\x13\x11\x15\xcbf|\xdf\xeb\x0f\x13n\x1dC\
-\xd6^\xa0N\xfe\xb8\xfc\xea\x9a\xae\xac\xd5\xc6\xb7\xba\xfa\
-\xd4\x0b\xfe\x93\x22UZs\x94?\xbej\xcfe\xf3\x7f\
-G6C\xdc\xbe\xb6mj\xc7\x078\xa7T\xbd\x1aP\
-\xa2\x8d\x07Z@p\xc8T\xab_\xb7U\x09e\x1a\xc0\
-\x82!I\x8f\xff|\x95ygz\xbc\xaed\xf5\xf9\x8b\
-\x13\xa2h\x10\x0b.\x8c\xf0\xf7L\xf5\x83\x9c\xce\x8b\xd3\
-\x10\xe7?>=V\xcfw\xec\xa7\xfa\xd6n\x137\xfc\
-\xbb\xa3\xa4\xabL\xbc\xee\xaa9y=nX\xadrx\
-\xd3\x8d}\xa1\x9d\x89]\x15\xab\xbc\xd5\x7f\xd9\xc8\xcfE\
-\x0d\x93\xc5\xcf-\x1a\xb1mZ4D\x9cv\xdf2\xa1\
-\xe2\x84]\xfd\xaa\xc3\xc7\xda\xef\xae>\xf1\x15\xacZ\x9c\
-*!)<T\xebnR\x80s\xab,\xee\xa8O\xb2\
-\xc7\xa5\xedh\x06\xe4\xc3\xd5\xa1\xf01i\xd4V\xeeL\
-p\xc2\xdd\xba\xfb\xea \xa4\x93\x1a\xe8\xc3\x86V\xa0U\
-\xb2`\xc8\x9a~`02\xc4ix\xd2\x8bm\x09\x12\
-8~\xea\x1f\xf5\xc7\x1e\xff\xbc\xf9\xdc\xd4\xf9\xf5\xdel\
-G\xef\xe8\x8d\x0cq\x1a\x02\xf5sk\x8f!\x10\xc4\x9e\
-\xfe\xfeR\xd9\xed\xb3\x8f\x0c\xcb\x87\xab\x17\x0do~\xe8\
-;\xf2\x83\xa5DC\xb6\x11sP\xc7\xa434>\xac\
-V\x94\xf8-\x96*\xabzqs~\xea\x19\xba\xccJ\
-\xbd\x0a\xb6\xddD\xads\x8e\xdb\xed\xa7\xb4\x12\xa4\x951\
-\x9d\xf7t\xda\xbdn[Rx=\xf0\x92I\xd5\xf1\x1c\
-\x0a\x12\xdfW.WeH\xaf\x16G\xae'8zs\
-\xaaUQs\xca\xbc\xaf\xe3\xb4\xd4W\x09\xcc\xae\xae\xde\
-\x9d\x92\xadP\xedk6\x5ce~\xdc\xba$\x15\xf3\xac\
-\xec\x00\xcc\x81\xdbD\xda\x8cT\xfb\xcc\x85{\xcd\xf9\xd2\
-\xa5\xcd\xabDD-\xbe\xf0\x1a\x03;\xab\x9fO\x9b\x8f\
-\xf9\xf6\xb7\x13\x0d?g\x1f\xf4\xdaj\xe8B\x00\x0dI\
-\xda\xb6C\xab`:<\xa9=\xd7\xfc\xb9i\xba0A\
-W\xaa\xbee\x8e\xd7\xf0\x14>^\x1d\xfaDf\xedx\
-]=\xaa\x81o\xed\xf6&t\xe9\xe7\xfd\x90fW\xa7\
-\x06\x1a\xfcj%-n\xc5\xa9/8t\xab\xc7\xc7\xad\
-\x9cmA\x9b_\x0d\x88\x9b\x7fW\xef\xb0\xdai7z\
-\x0eRI\xb6\xa7\x92\xa1\x8f\xe9\x94{D\x9c\xc4a\xc0\
-o\xb1\xe1\xed\xc3\x19nN\xec5rm=i\x13\x1a\
-\xea\xfdQ\xf6\xda\x9cTr\xeb\xfe^\x8d\xc4\x9c7\xaa\
-\xda7\x15\xdb\x9e\x7f\xbd\xd7\xdck\xb2 \xeb\x8bm\xbc\
-~\x80\xcdQm\xbe\xa0\x86\xe9\xb8>\xf7E\xbb\x90\xe2\
-\xb9\x1a\xe7\x9e\x88\xb9>+;\x14\xaf\xe0M\x962a\
-\xad?7/}\xf9\x05\xbb\x01x\xab\xd3\x1d&\x16z\
-\x86\xed.\x13hm\xba:T\xdbxL\xfdt\xff\xda\
-u\xc1V!A\x93f\xa8S[whK\x90`3\
-\xdf\xb8\xe35\xac\xd9\x9d\x18\xcc\xb1~\xf0\xb2\xcd{#\
-ve\xd00\xa6mI\xa2*i\xfa\xf8\xf4z\xad\xd6\
-\xe9y\xb4\x12\xa8+W[4\xb8\xc5\x0d\xc1\x8d\xd8!\
-\x9d\xed\xd8\xbf4\xd9\xb0Z\xd4P\xe6\xf6\x0dE\xe9~\
-\xa3/\xb9\xaf\x99W\x95\xe7\xab\xf4\xfb\xaaf\xd2\xbc\xc8\
-O\x945\xda\xd5\xa1\xdc\xd31\xff\x8e\xd6\x13V\xd3M\
-\xf8z\xb8\x1b<\x87\x1b;\x14=!\xb5\xe8\x5c\xc9z\
-\xff\xa0x\xd5T\xdf\x0a\xb1\xc3\xb5\x07\xb7}\xe7\x01\xef\
-\x0f\x8f\xacDW\xd1\xab\x078\xef\xeb\x10]\xb5Nw\
-Vk\x90$\x18\x1fl\xa2\xee\xfc\xb2\xdc\xb4p\xd1\x06\
-\xb8v\x08o\xaa/\xbf(\xbb\x17.IW\xb1\x15\xff\
-\xccE\x98\xf6b\xd3\x06\xbc\xd9*\xed:\x8e|\x7fi\
-\xad\x8f\x9b\x86\xbe{_\xbda+o\xb5\x8e\xd7s\xea\
-\xb1~\xd3\xdd(z\x9e\xb8\xf0\xa6\xabS\xfd\x16'z\
->\x0d\x84~_\xba\x16\x15\xdfR`@\xea\x9d\x9f\xd5\
-\xae\xc6\xa4Q\xd5\xaa,\xfa\x22\xad+[\xb5\x1d\x89\xf6\
-\x8c\xd3\x8a\x8fSW\x8b\x08Ot\xa3\xdd\xac$}\x1c\
-\xeb\xe7\x8b\x9f\xb4^\xaa3,'\x0d\xc5\x95\xf3\xb9\xe2\
-\xffP\xa85t\x9c\x92\xfa\x87\x96\xe3\xdb\xe2L\xd5\x08\
-o#\x09\xafO6\xbc^~\xbb\xa9\x98\xcfLT\xe9\
-eX}\x07\x87$-\x7fJ\xdb\xf8\x07\xce&\xa0\x02\
-\xd7$Zy\x1bY\xba*\xedHW\xe2\x8e,^\x91\
-\xab\x83{i\x9b\xd2\x064hi\x88\xd3aM\xed\xf7\
-\xe6W\xba4T\x9d\x0c\xf4i\x0b\x1e\xafaJC\x95\
-_\x19S\xaf\xe9VY\xab;/\xf8\xf4}\x7f\xf7\x05\
-\xff\xfc*\xee\xdc\xe1\xfbI\xda\x92d[\x99\xbc\x19;\
-\xa4\xe3\xf5\xc6zM\x92\xf26\xea\x1e\x09\x9dK?>\
-\x1bj\xd8:\x13s\xbf\x1b\x1bVk\xae\xc6+\x90\xde\
-\xea\xc9\xe7$XU\xd1F\xae)\x13\xbaJv\x01\xc7\
-\x84Hl\xb5hR\x82->4\x00\xba\x91{\x94\xea\
-\xf7(~%\xad\x8a\xefqV\xb9\x88#\xbeME2\
-\xde|\xae\xf5\xaf]\x97y\xfc\xf1\x7f\xc3\x1c5\x97\x83\
-\x22U?_\x1fo\xf3\xf7J\xb5\x16g\x94\xcc\xd7(\
-\xfa\x9f\xfd\xe4?cn\x8d\xf6,]\xe6\xe7!\x1f\xf3\
-\x9ct\xf8W\x87\xe1\x1f\x09\xb4\x86\xf1v*\xd1\xf06\
-\x19s\xc6d;+8\x048D\xd0=\x1b\xc3t_\
-\xd5\xbbw\xf7\xca\xbe\xc1\xe8a\xab}\x83\xf5\xef\xf2\xf0\
-\xd2\xf99\xd9\xd5\x9d\x96\xfb\xf6\x0e\xd4u\xfcG\xf3\x95\
-\x15\xb5\xd9\x5cQ\xe6r\xde\xfc\xa7w\xae-\xcb\x5c~\
-\xfd\xc5VC\xdc\xc0\xca\x9c\xcc\xf7\xd63\x97\x14[M\
-C\x97\x86/\x7fHRE5\xf4\xd5U\xa2/\xc6\x04\
--\x0dXO\xea~\xaa\xe6\xf3Z\x99\xd3\xf3=\xbe:\
-\xcf-\x1c\xbc\xf4\xf6z\x5cT\xcb\x0f\xbd\x8f\xe3\xe7s\
-\x91\x8f\xb1\xadT\x1b\xd2id\x8fE\x1d\xe6\x89j\xcc\
-\xeb\x88DT\xa1\xb2\x91\xe7\xa8gX\xcd\x9b\x17\x16\xf7\
-BT~?]\xf2\xa14Z\x00u\x9b<\xf9\xfea\
-\x1b\x98\xf4rru\xc3\xf1\x13\x12=,6&\xe5\x8f\
-cZ$2\x88\x8d\xd9\x0a\xd6\xc3N|\xd0\xd6@\xe1\
-D^?-\x1b\x91\xa4!\xac\xf6\xa3\x8b\x9b\xb3\xa8A\
-V\xdb}D\xed\xc6\xe0\xcdM\x1b\x93z\xb9\xb1\xbbn\
-\x8c\xc7\xde\xc6\xdb\xd3tL\x92\x8a\x9fw6aW\x1b\
-\x8b\x0d\xdd#\xb6\x11q\xf0\xfb\xa3C\xe2\xaf\xb8Gc\
-{\x19:6\xc4\x1d\x15\xff\xe7\xd8\xfb}\x88\x9b\x038\
-c\x1b9Gk\xee\xcfn\x8b\x22\xc05\x81\x0e?\xa6\
-\xdd\xf2\x85\x0a_\xb9g\x8f\xfc\xe6\xf8-\xd2,\x1a\xc8\
-4\xf05\xf3\x9c\xbfw\xf6\x92|\xe3\xed\xf5\xe0\xd9k\
-\x86S\x09p\xadI\xaba\x1a\xb8t.\x9b\xbf\xd3\x82\
-\x1f\xe64\x84\xd9V &\x88\xe9\xdc7\x7fxU+\
-lz\xbd~^+m\xba\xc8A\xe7\xba=\xf7\xc1\x8a\
-\x0d[\xba2\xd5.,x`P\x0e\xfd\xd5\x82\xbdN\
-o\xab\xb7\xd1\x8b\x9e\xdb\xaf\xd8\xf9\xd7\xebu\xfaV\xef\
-_\xcf\x17\x0c\x90\xd9v\xaa\xbe\xf9\x9c\xb5\xfeXa\xfe\
-_\xfeOK\xbd\xba\xe4\xc9\xd8\x0aN!T\xcdsc\
-WG\x8e\xd4\x0c%9y<v\xa2z.\xc1\x16O\
-\xcd\xa2U\x12\x7f?J\xd7V\xd8F\xd6*\x1d\xba\xb5\
-S\x14/<ku\xee\xf9\x9a\xe7\xcf\xc8q\x13X\x8f\
-E~\xce\xdb\x81\x22zs\xfaj\x01h\xa3\xf3\xa6L\
-\xe1Z\x92L\x1bv\xec>\xb0Gc>\xa7\xbd\xf24\
-d\x9d\xb4+k\xbd\xc7|\xa8\xe6<\xc2\xf0s\x8b\xaf\
-\xf4y\xa1\xca\xdb\xd9#k\xafI\xd9\xc6\xbe\x93\x92d\
-\x17\x83r\xd5\x86\xc5\xc7\xc5[q\xec\x07\xbd\xd7B\x8f\
-S\xabp\x87$\xee\xbe\xbd]7\xc6\xa4\x167f\x17\
-\x0e\xef\x1c3\xd2\x1e\xb3\x986\x849p5\x84\xb7\xf2\
-\x89\xd2],_\x8d\xf7\xd8\xbe\xa1\xa6\x06\xad\xcd\xa2\x8f\
-q\xb8{\xfdG@\xabp\xcc\x85k]\x1a\xa4\xf4r\
-\xdd\x047}\xab+E5D\xe9\xa2\x06\xddy\xe1\xc8\
-j\xeb\x8f\xa3\x9f\xed]\x0bS\xdf\xfc\x9c\xd7\x7fM\xc3\
-\x9a\xbfK\x82^4\x10j\xeb\x10\x0d`g\xe7\x8a6\
-\xd8\x1d3\xc7\xea\xf5z{}\xab-F\xf4\xdcz_\
-z\x9d.\x80\xb0!\xf0\x93^`\xd4\xb7\xc7V\xcf\xaf\
-\x82\x0d~\xdbFW\x95\x89\xd3ZM\xd3&\xb4\xf5x\
-\xd5\xbdG\xdc*\xfbu>\x16\x9a\x83\x94\xa9\x1a &\
-\xa5\xba\xa3\x12w?\xd5z\xbbm\x96]r\x8fm\x14\
-\xeb7\x8b\xf5\xaa\x90\x93\xf6R\xfd\xeb\x177\xbf\xab\xfc\
-9T\xdbR\xca\x9b3\xf7V\xd9\x5c2\xed\x85\xa7C\
-\xd9\xd5\xbe\x1f\xd5vp\xa84&\x1b\xd5U\xa3\xcd\x8a\
-c\x871\xa7V\x1b\x0f\xebs\x9d\x08|\xb6\xbejR\
-\xb5\xfdB5,\xf9\xad[\xbcm\xab\x8e\xadU\xe6\x9c\
-\x06\xaaU\x19\xbb\x13G=\xadh*C\x9a~?\x8b\
-\xf2\x84l\xac\xd5\xc7\x11\xf3\xc7\xc1s\xb2\xc3\x11\xe0\x9a\
- \x15j\x13R\xef0g+\xb8\xff\xd6\xf2\xc7\xdaU\
-\x22\xc0%\xa5_\xb3Lq\xc5^\xeaY\xbc\xa2\xc7\xe8\
-m\xc2_k\xbd\xde?\x8f^\xc2\xec~\xa2&\x98i\
-\x95M\x03\x97.\x1a\xd8\xddU\xb2C\xe3\xef^[\x5c\
-o\xb0k\x8e\xd10\xa7\xe7\xf8\xd1\xfc\xca\xda\xd0\xa6^\
-\xef\x07;\x0dnz\x0e\xdb\x98\xb7\xcb\xab\xde\xfd\xc5\x95\
-\xbc\xbcyq\xa1\xec<\xea//\xad\xc8\xf9\xc5\xa2\xdc\
-X)\xac\xf7s\xbb\xbd\xc7\xb6\x1d\xf1\xb7\xc7Rz?\
-\xdak.\xee\xf9\xb5\xa4Z\xfbMzC:\xcfT=\
-\xc7i\xf7)S\xf9\x98\x8e\xfd|\xd40\x8fw\xbfq\
-\xb7\x99\x94\x97\xdd\xe8\xbd:\xb5\xaa\x14\xb7/\xa8\x9b\xb0\
-\x85G\xa3\xcdS\xc3\xf3\xf4\xaa\x05\x07\xef\xeb\xf7\xcd\xb5\
-\xa6\xbdz\x9f\x1a\xb6^qu\xf8tR\xa2MU\x5c\
-\xe3\xed\x0c\x91\x8d\xb9\x8f1\xd1\xdeg\xa7\xcd\x0f\x9e^\
-\x8av_\xd5#\x12\xc7\x91\xc3\xb2\xd5\xbc\xef\xf7\xa4$\
-\xe5\x05\xe2$\x8b@&%\x09o\x182y\x15\xae\xfe\
-\xe73\x11\xf9s\xa6\x15X\xdd{\xb7\xda\xef^\xb4\xac\
-]QKx\xb3\x18Bm\x82p\x9f\xb7\xe1\xee\xf6\xa9\
-D|:4\x0fo3{\xd3u\x9a\xbe\xdc\x0d\x19\x5c\
-\xb9Q\x11\xda\xe2Z\xb3h\xd0\x1f^\xbe.\xdd\x85\xf5\
-p\xa6\xfd\xf8r\xe9\x1e;\x04\x1f\xbc\xde\xff\xdcb\xf7\
-\xa0,\x99\x8b\x06,?\x80\xe9E\x83Vn\xe1\x86\xfc\
-xnI\xfe\xf3\xd9n;\xc4\xfeo\xae^\x95\xfe\xde\
-^\xf9\xc1L\xceV\xd0F\x17\x16\xe4\xf7\xff\xda\xfb\x83\
-\xe2\xf8\xf7\x8b2\xd77\xba\xb6Q\xbd\x9e\xe3\x093l\
-\xfa\x0fz]\xf9\xf5\xe9\x8b\xa6\x8a\x9c\x93o]r\xec\
-y\xfe\xd5\xb7\xaf\xc9POF\xbe\xb3\x90\x91\x99\xabE\
-\xf9\xe8\xea\x92|\xebJ\xca\xfe\x5c\x9f[(\xc9W\xe7\
-\xfb\xe5\xef\x9d\x01;'S\x87i\xf5\xd9\xdfk*s\
-\xbf\xf3\xce\xac\xcc^\xb9,{\x02\xcfC\x17\xc5,w\
-\xf5\xb5v\xab\x1a\x0d\x07\xde\x90\xceX\xe4\xe7\xbd!\xae\
-\xc9\xd5\xc0uv\xad\x81l\xd1\x0e\x13MJ\xf5\xc9\xde\
-\xf1\xd5\x1e\xedy\x16\x17\xfcL\x81\xd5N\xfa\x17[\xd9\
-\xd2\xe1\xba1\xbb7\xa9[e_\xd0\xae\x84\x01.<\
-\xd9\xbe^\xd1\x13\xc1\x8f\x8a\xc4V\xc9\x8e\xd8K\xb0\x1d\
-H\x95\xb50\xb2\x10\xb1\xcf\xaa\x06\x86W\xddC\xab_\
-\xaf\xc6\x82\xa7\xd2@\xf4p\xcc\x8a\xccf\xcd\xf9\xf3\x1a\
-\x04W\x0e\xed=\xe4\xbcXe\xfeW\x14o\xe1\xcb+\
-n\xfd\x01+\xc9}x\x95\xb7I;\x0c\x19\xdd\xaae\
-Lj\xdd\xd7K\xee\x01\xf3sw\xc2\xdc_\xfcc\xec\
-\xb6\xe79\x1bs\x8e\xa7\xcd9\x9e\xb3\xabL\x1d[%\
-\x1c\x8fy\x9c^\xd5P\xef\xb3\x1e\xde\xef\xd6\x81\xd0y\
-\xb2\xe6\xba\xact\x90\x8e\x0ap\xdb\xb5\x82\xd2\x09\xfdk\
-\xb4?\xc1\xe2\x84\xed\x16^`\xd1.\xedO\xb6\xdb\xe0\
-\xf2\x8c\xf4\xe7\x16\x22?\xa7\xadY\xbaM\xf5\xebz\xff\
-\x9e\xb5\xd0\xd2\x93_0\xe1m\xb6\xe2\xeb\xab\xe1\xbf\xaf\
-\xb4\x18y\x1e\xfd\xdc\x90\xb9\x8d\x06\xbbs\xee\xee\xb5\x8a\
-\x98\xde\xf7\xdb\xe7\xd6\xef[\x17\xa4(\xad\xc4\x89\x09`\
-\xfa\x1d}\xf3\xc2z\x88z\xf3\x82wl\xd7\xf2\xc7r\
-\xa9g\xc8<\x98a\xfb\xf1\x8fn\xac\xc8\xc2\xc5\xcb\xf6\
-1\xe9\xd17Vob\x17\xc0\x98\xcb\xa0y\xff\xff\xfe\
-X\xd6\xcf\xbd\xdaQ\xf5\xef.\xe5L\xb8\xbc!\xe7\x02\
-\xcf\xef\xf2\xf5\x19\xf9\xf3\xf99\x09/\xd7\xd1sG}\
-=Z\x8a\x17\x0e&\xabV\xd1\xbc*\xcf\xa4}\xbf\xb4\
-v]u^uc\x22\xf6\xf3\xdef\xeb\xc7\xc4\x8d\xad\
-\x16M\xda\x8b\x16Pk\xfdZ\xa6b\xe6\x03\x99\x1f\x1d\
-i\xf4K\x9edU\xa6VD\xbc\xc09)\x8d\xf2\xbf\
-^q\x0bGt\x7f\xd8W\xdd\x09\xf3}\xd2a\xc61\
-INW8V\xab\xdc\xd4\xbf0\xa1Q\xba\x97\xed\xab\
-\xee\xb4y\x0eSR\xfd9L\x99 \xeb\xcd\xbfL\x1a\
-,\xf5>^r\x8f\xaf\x86\xa2C\x15\x15S\xfd:\xeb\
-pw\xda\x04\xa2\xf5\x9f\x99\xa9\xd01Y\xa9\x87\xb7\xda\
-\xf8\xde\xb5\x15\xc6\xeej\xfb\x1d/t\x9d\x93\x1b\xe6w\
-\xaa\xd6B \xef\x1c^UT\xabu\x03\xe6<\xde\x8a\
-\xda\x19;\xd7\xd0\xfb|2^U\xf85\xe9p\x1d\x15\
-\xe0J\xd2>\x95\xafV\xb1\xab\xbb|\x14=%m8\
-\x11}\x8b\xf5\xe6\x16c\xc3\x9bO\xc3\xd7\xe8\xe2e\x1b\
-Z2\xc5e\xd9\xb5\xd4\xf8\x1f\xf7=\x85e\x19Y\xb8\
-,3\x03{lx\xd3@\xd4(\xad\x18\xaa\xe5\xcc\x80\
-}|\x8d\x06\xf6\xe0\xf3\xeb5\xe1\xb4\xb0z\xdej\xc7\
-\x0f/]\xb3\xcf\xa1%\xe9?\xf8^\x95mJ\x9ag\
-\xb2f\x8b\x03\xad@\x9cv\xfd\xdd\x08\x1a\xa3\xd5\x96d\
-s\xba6\x87.Xx\xc5\xcd&\xa80\xad\xd3\xeaf\
-\xaa\x8e\xaf\x97\x86\xb8\x97\xdc\x83\xab}\xc1&\xa5\xdes\
-\xa7Mx\xd3\xdb6\xcb\xfa\x0a\xe6\xca\xb0\x93\xae\x11\xb8\
-\xbcpq\xc0|\xad&lK\x95\xf5!L\x0dVY\
-\xf3\xf1\x8b\xa1\xbem\xcf\x99\xfb8^Q=Z\xaer\
-?\xeb\xa1\xe8\xb0\x0dW~\xd5\xb4`\xe7cf+\x8e\
-\x8f[lR\xaf\xe0\x0a\xe3\x8d\xf0\xc2\xde\xd6\xcf\xe3l\
-S\x0c\xa1\x02\x09\xf5\x16\xca\x03\x94\xdf.F+W\x1f\
--\xac\xcf\xfb\xf2CN\xd4Vjw\x8d\xf6\xd8\xe3\x83\
-\xad\x5c\xfc\xebuh2|\xaeL)/\xbb\x17.F\
-\x9e\xeb\xbe[\xfb\xbdyp\xd7W\x22\xcf\xf5\xe6\xc5\xf2\
-\xc7\xab!n \xa2\xd9\xb4>\x0f]\xe9\x1c>\x8f\x7f\
-\xae\xb9\x5c)\xd1\xf3\x0b\x1f\xaf\xc3\xb4\x19SM\xccw\
-U\xee\xb3ZM\xd1I\x97\xad\xf2\xfe\xc4\x1f\xfd\xf0\xb6\
-\x8f\xbftg\xf3W[j\xff\xa9W\xdc\x99\xd5\xfd!\
-\xc7\xa4q:\x9cy\xa8\xee\xc0\xe0\x05\x9f\x99*\x95\xb8\
-h\xdeJ\xbb\xa35\xaaJ[+X\xfd\xa9'`y\
-\xc3\xd2\xcf&\xda%\xc0\x0f'/\xb9\xcfJ\xc6\x04 \
-\xaf\xd7\xdbHY\xa5\xc9\x9b7\xa6\x97\xd7\xea>\xf7\x82\
-\x09\x1f\xbd\xabUX\x0dG\xb5*G:\x87k#\xbc\
-\xc75]\xf3\xb8\x877\xb80e\xa3\xb7G\xcb\xea\xa8\
-\x00WLS\x81K*<\x84\x9a.2\x07\xae\x96\xf0\
-\xd7\xe8\xc4\xa3\x07l\x80S\xe1\xd6,Q\xe1\xe6\xb9\xfb\
-?%_\xbc}\xc4\x86\xae\x9f\xf9\xd3\xbf\xb5AG\xe9\
-\xea\xe5\xa9\x07\xf7\xdb\xf7\xcf\xcf\xe7d\xf2\xd5\xf3ea\
-*|\xae}\x03\x19y\xfe\xc1}\xf2\xb9\xdd\xdeJ\xd0\
-\x9f\xf8\xe3\xf7\xd6\xce\xf5k\x9f\xd9%\xdfz\xe0\xd3\xf6\
-\xfd?y\xff\xba|\xed\xbb\x17\xd6>\xa7\xc2\xe1-\xd8\
-\xf6\xe6\x0d3\xe4\xfa+\xa7\xb2\x91\x9f\xfb\xeaw>\x96\
-?|\xefZ\xecc\xd2\x10\xa8\xcf\xe1\xfe\xd5\x85<\xfa\
-\x1c^\xfah\xbd:\xa7\x0b\x1b\xf2\x92,\xc0m)o\
-^\xcf\xdb\x89*<A\x1a\xfe\x16\xe5\xd9\xc4\xdbpi\
-%N\x87\xd6\x8aU\xe7\xb9\xads\xec\x8a\xc2#u6\
-1\xcd\x06n\xa7\x8f\xcb{ls5\x86\x0c]\xbbw\
-\xe6\xd1\xd0u\xe7\xa4\xd6F\xee\xc1\xea\x8fV\x99\x5c;\
-$v[\xe8\x1cY\x997\x01k#\xdb\x95E5\x0b\
-\xde\x08\xef\xb14g\x1e\x1c\xb0\x05\xa8\xc05A\xf8\x05\
-=\xaeq/:\x93\xdf\x1cYi\xd0\xd1`\x16\x0c9\
-A~xSZ\x1d\xd3\xe0\xf7\xe6\x05\xafB\xf6\xce\xf5\
-\xf5v4\xfb\xcd\xcf\x90\x06\xc3/\xfc\x9f\x1f\x94U\xb1\
-|\x1a\xde\xfe\x8fG\xc7\xecq\xbe\xe0\xb9\x1e\xdb?\xbc\
-v\xfd\x17o\x1f5\x9f\xeb\x93'N}X\x16\xe2|\
-\xe1\x9e\x85\xbbB\x8bp\x82\x1f\xff\xf6\xcf}\xc2~\x1c\
-\x0c\xa9A\xfa\x98\xfc@\xa9\xdaiA\xcf\x9a`\x85'\
-%O\xad\xf6\xcc\x8a\x9f\xa4\xed\xac\x0e\x1d\xcd\x9b \xb1\
-\x91@\xf2\xa0\x9d\xa0\xfd\xa2mr\xab\x95\xa5\xa2\x09>\
-\xa9\xd5J\xa0k\xabm\xba\xf2\xefm[)\xaa\xf7~\
-\xbc\xe7\xd2X\xa5\xe8\xe1&\xcc#\xda\xee\xfd7\x81\x0e\
-F\x80\xdb$\xc1]\x0f\xe2\x9c\xd7a\xb2\xf9\x5c\x8ds\
-x/\xb8\xba\xeap\xdf|\xc6Vx|\xda\xc3-\xfc\
-b\x1b\x17\x1e\xc3\x0b+\xf4\x85uW;\xbe\xb8\xb6\x00\
-\x1d\x02L\x07\xe6\xa1\xfd\xde\xd9\xcb&l\xad\xb7c\xd1\
-\x90\xf3\xee\xb5\xe5\x8a\xa1K\x0dJ~xS:L\xea\
-\x07.\xffc\xddq\xc3\x0f_\xfa\xfd\xd1@\xf4\x85?\
-\xfb\xa0,xi\x95+\x1c\xde\xc2\xe7\xfa\x86yL\xba\
-\xfa\xd4\xff\x1ek\xb8\xfb\xfa\xcf\xee\x95\xa7\xde\xf8\xfb\xb2\
-\xc7t\xf7hoE\xcf\xc2?\xf8a\xf9\x96p/\x9d\
-\xbf!_\xbe\xf3\xa6\xb5\x8f\xf5x\xfd\xb9}\xe1\x83\xd9\
-\x8a\xe7\x17\x0co\xf61],\x9f+XL\xb5\xcf\x02\
-\x9f\xd5\xf0\xe3M$\xd7\xc9\xd5\x83\xab!\xce\xab(e\
-m\xa0Z0o\x9b\xbd\xe9\xfdze\x09\x00b\x11\xe0\
-6\xc9\xae:\x02\x92\x17\xb6\xea\xdf\x1a\xab\xd9;1\xa0\
-1\xda&\xa47\x10\xe04\xa4\xe8J\xcf`\xff?\x1d\
-F\x0cV\xcf\xbe|\xc7\xee\x8a\xef\xddo\xbc\xf1\xe3\x8a\
-sk\xc0\xd2j\x99\xbf\xcd\x9a\x86\xb4\xa9\x83\xfb\xcb\x86\
-4\xbf\xfes{+\xc2\x9bV\xd7\x82\xb4\x9a\xa7\xc1\xf2\
-\xb7\xcd\xb1>\xad\xc4\xe9\xb1~\xf5\xcc\x1f\x82\x0d\xfa\x93\
-\xf7gL0+\xcf#\xfa\xfc4\xd4\x05C\xdc\xd7M\
-H\xd5\xd5\xaf\xfe\x10o\xd4\xf3\xd3?6\x82[\xba\xd9\
-\x96)]-<|Z\x8d\x17\xd2\xa6\x05\x00Z\x04\x8d\
-|\x81\x84\xb4\x02\x97K\x97W:'\xcf|T\x16V\
-4\xbck\x88\xd3*\xa9V\xb94\xf0\x04i\xb8\xf1\xdb\
-{\x04i\xd5\xf57^/\x0fv:\x9f\xec\xb9\xfb?\
-i\xdf\xf7\xaax\xa3\xa1\xfb>\x1f\xb9\xf7\xed\x1f\xbew\
-\xb5\xacb\xab4d\xe9\xfc8\xf5\xdc\x03\x9f\xaa\x08\x82\
-_\xfb\xee\xc7\x12EC_\xf8\xf9\xe9\x10\xaf.V\x88\
-z~\xff\xd6\x04\xbep\x10\x5c\xd0\x16&\x00\x80\xa6 \
-\xc0\x01\x0d\x08\xef\x19\xab\xc1K'\xec\xcf\x06\x86\xcd\xfd\
-a\xcbp\x95K\x87$\xe3\xe6\x90)\xadx}\xf5;\
-\x17\xca\xae\xd3\xd0\xf6\xed\x7f\xf6\x0f*\xaa\x5c\xba\xa8\xc0\
-\xef\x03\x17E\xefG\x87e\x834l\xe9\xe3\xba?P\
-1\xf4\xabxQs\xe4\xfc\xe7\xa7\x9f\x0f>?\x0dq\
-\xaf\xfe\xf2\xed\xf2\xed_\xfeL\xd9\xb1\xfax~\xeb\xbb\
-\xe5\x8f_\xabo\xda\xba\x04\x00\xd0\x1c\x048\xa0\x01\x05\
-S\x81\xbb\xd13\x5cv\x9d?l\x19\xa4\xc1+\x5c\xe5\
-\xfa\x8d7~Tv\x8c\x86\x9bB\xaa|6\x83V\xcf\
-t83\xe8\xee\xc0\xfc2\xa5\xd5\xb5\xf0b\x89\xbcy\
-\x5c\xe1\x86\xd6:,\x1b\xae\x9e\x05\x87C5\xb4EU\
-\xf1\xf2\xa1*\xa3~\xfe\xa9\xd7+\x87}\xc3\xc7\xe8\xb9\
-\x82\xf4\xf1\xcc\xf4\xdf,\x00\x80\xe6!\xc0\x01\x0dZ2\
-C\x82\xe1\xa1T\x0d^\xe1\x8aWPT\x95\xebF\xef\
-\xa8\xcc\xf6\xdfd\xfb\x9d\x05i\x15+jhTEU\
-\xf14\x08\xeavY3}7\x95]\x1f5,\x1b\xf4\
-\xd5\xef\xfc}E\x15O\xb7\xf0\xba>\xb0\xc7\xbc-\xaf\
-\x9aiK\x90\xf0\x22\x07\x9f_\xc5\x0b?\xe6Y\xf3\xfc\
-\x8a)\xa6\xdb\x02@3\x11\xe0v\xb8\xf0B\x0bG\xd8\
-J+\x09\x0d^Q\x15\xaf(ZQ\x0b\x87\x1b\x0dH\
-:\xb1_\x03\xce\x5c\x7f\xf9\xdc6\x0d^\x7f\xf0\xc3+\
-\x91\xe7\x8a\x9a\xab6\xb7\x1a\x94t\x8e^x\xbe\x99\xbf\
-\xd0\x22\xec\xcfM\xd8\x0c\xaf&\xd5 \xe8\x0f\x11\xcf\xf7\
-\x8eT\x04K\x0d\x8e\xb3\x11+\xacu87\xfc\xfcV\
-\xbaz%\x97\xe9\x13\x00@s\x11\xe0v\xb8\xf0VZ\
-\x8e\xcbVZI\xf4\xc5\xech\x10\xe5\xbe\xbd\xfdvQ\
-CPo~\xc9nro\xdf\xcfUn\x91u\xd7j\
-\x83\xe00\xed'\x176\xb0\xe2U\xfe\xf4\xf1D\x9d\xeb\
-\xd3\x11{\xf4\xfe\xd2\xfea\xbb\x93C\x906\xe7\xed_\
-=Ww~\xb9l\x17\x04\xa5\xcf/j\x85\xb5\xae\x8e\
-\x0d?\xbfL1\xb7\xf6\xfc\x00\x00\xcdC\x80\x03\x1a\xa4\
-\xe1f0\xb4\x07\xa8\xdf`7\x8a\xdf\x12$(e\x02\
-\xb3nG\x15\xb5\xc7\xa9\xb6\xe6\x08\xaf8\xf5\xe9\x02\x04\
-]\x91Z\xf6xLX\x1a\x5c\x9e\xb5{\x8e\x86C\x97\
-\x1e\xbb?\xa6G\xa0\xae\x96\xd5\xc7\x1d\xa4\xcf\xab\xdf\x84\
-\xd3]\xcb\xd7\x9a\xf2\xfc\x1a\xdds\x15\x00\x10m\xc7\x07\
-8\xb6\xdfB#\xb4\xaa4\xb4\x5c\xbe\xc8 \xaa\xc1n\
-XT\xf0\xb2\x15\xaf\x5c\xf9\xf0\xa6\x06\xa5\xaf\x84V\x9c\
-\x86\x87-uEj\xb8z\xa6\xa1K7\xbf\x0f\x8a\xea\
-\xd1\x16\x9c\x87\xe77\x0c\xae\x08q&\x0c\x86\x83\x97\xae\
-\xa8\x0d>\xbf\xf0|>}~_\xff\xd9[%\xfc\xfc\
-4T\x02\x00\x9a\x87\x0a\x1c\xd0\x00\x1d\xae\x0cW\xb9\xbe\
-\x15\xea\xab\xa6t\xa5hx\x81\x80\x86\xa9\x7fmBU\
-\x1c\xbf\xca\x15\x1c\xa6\xd4\xb9e\xbaoj\xf8\x5cQ\xd5\
-\xb3\xf0\xb9\xa2z\xd0=\xf1ryK\x10[={p\
-\xbfT\xa3\xadG\x82;-hx{\xf0\xcf\xde\xafX\
--\xfb\xe5;o\xaex~\x1a*\xb5b\x09\x00h\x0e\
-\x02\x1c\x90\x90V\xdf\xc2\xc3\x9dZU\x0b\xee?\xaa\xfc\
-\x8d\xedu\x17\x85\xf0\xe4~\x0dqq\xc1+\x5c\xe5\x0a\
-\xf6h\x0b\xb7\xfb\xd0\x90\xa7\x0dy\xa3D\x0dwj\xd8\
-\xd2\xc7\x14\xd5\xf2\xc4\xeb[wk\xe4\xb9\xb4\xf9o\xb0\
-\xf5\x88\xf2\x17-<\xf5\xc6\x8f+\x16H\xe8vb\xda\
-\xe47h0\x17\xbf:\x17\x00\x90\x0ck\xfb7Q\xb5\
-\xfdP\xcf\xaf\xbe\x08\xc7\xed\x85\x1a\xdc\x07U\xbdsm\
-\xc9\x1e\x1b\xee\xac\xaf\xfc=Q\xf7U\x19\xbaS\xfe~\
-\xa8\xb5\x8eCu}\xf9\xca\xe1\xce\xf0\x10\xa5\xeeD\xe0\
-\xb7\xf9\xf0\x9b\xe0~\xfb\x9f}f\xad\xaa\xe6\x07\xaf\xe0\
-\x16Y*\xbc\x9f\xa8\x0a\x866\xdbG\xee\xf5\x1f\xcb\x89\
-@0\xd3aK\xadx\x85{\xc2}e|O\xd5\x9d\
-\x16\xb4\xe5\x89\xfeL\x04\x83\x99V\xcf\xb4EIp\x1f\
-\xd7\xa8\xe1\x5c\xfd9\x0c\xee\xb4\xa0;Q\xe8\xf3\xdb\x17\
-X(\xa1\x15\xbd\x9f\xfd\xd3\xbf[\xfb\xb8\xab\x98\xb7\x97\
-B\xba\x8d\xf6CEs}\xdb\xbdm\xed\xfd/8\xe7\
-\x04@\xc3v|\x80+9\x9b7\x07\xae\xda~\xa8\xeb\
-!\x8a\xbdP\xdb\x8d\xae\xac\x0c\xd2\xa0\x14\xa4U\xae\xf0\
-N\x04\xfa\xfd\xfb\x95\x97\xb3eC\xa3\x1a\xbc\xf4{\xea\
-\x873\xbd\xbeb\xbf\xd4\xd7\x7fT1l\xea\xef\xd4\x10\
-\xdc\xe7To\x17\x0cp\xf7\xdd:P\xb6\x00B\xff\x18\
-\x88\xeaA\xf75\xf38\xb5\xf2\x16\xdc\xc7U\xc3Z0\
-X\xea\xea\xd9`\x10\xd4\xc7\x13\xeeA\xe7\x87\xd4\x13\x8f\
-\x1c(\xdb\xc7\xf5\xb1}C\xb6w\x9c\xaf\xabD\x80\xeb\
-\x18\xa7\xdc\x13\xe2\xc8\x88y\xcf\xbf\x84\x8dU\x5c\xb3\xfe\
-\xf7\xec\x8c\x9cp\x0f\xac\xee1\x0b\xa0\x01\x0c\xa1\x02\x1b\
-\x14\x0c\xe9\x1a\xde\x9ez#\xbai\xae\x0e[j\x88\x0b\
-\xce=\xdb\x17j\xed\x11\xfc\x9cW\xe5\x9a\x8d<Wx\
-\x9f\xd3\xb8-\xb0\xfc\xcfE5\xd8\xf5i\xf5,\x18\x12\
-\xc3\x7ft\x04w\x80\x88\xdai!\xf8\xb9j\xf7\x83\x0e\
-\xf2\x92;f\xc2\xdb!\xf3\xde\x84\xb9\x8c\x8b\x17\xd6\xc2\
-\x97jF\xcc\xdf\xaeO\x0a\x80\x86\xed\xf8\x0a\x9c6>\
-\xd5F\xac\xb49@\xbd\xc2U\xdbo\x9c\xbdlC\x8f\
-6\xc5\x0d\x0fc\x86i\x88\xfb\xc2\x9f}`\x86Jo\
-\xb1C\xe2o^X\x1f\xaa\xd4\xf0\xe6}n\x8f\x0dT\
-\xb5\xce\xe5o0\xff\xd8\xfe\xa1\x8a\xdd\x1f\xb4J\xa7;\
-&h@\xb4s\xde\xaa\xec\x97\xaa\xf7\xab\x157\x1d\x86\
-\xd5j\xdc\xd7B\xd5\xc3?0aq\xd8<?}\xbc\
-\xfa~\xb5\xb0\xe8\x87\xb8\x7f}\xc7M\xf2\xae\xb9\xcf`\
-\xf5Mmf\xc5\x1b[(-\x8f\xcb\xc6i\x00|N\
-\x004\x849pF>\x95\xb1=\xb4\x80z\xe8\xee\x02\
-\xbd\x81E\x0c\x1a\xca\x9e\x08\xcde\xf3-t\x0fIO\
-a\xc9\x0c\x1d\x16\xd6\xae\xf3'\xfeG\xf1>W\xb9\x93\
-\x83\xee\x8e\xa0[n\xedZ\xbaZ\xf6\xc7\x86\xceC\x0b\
-\xceE\x0b\x0a\x071\x9f\xfe\xbc\xe7\xccs\x18\xc8\xad\x87\
-+\x0dq\xe1a\xd1z\x1e\xaf>?\xbb\xa8\xa3\xb0X\
-v\xfcoE\xdc\xb7>\x07\xddu\x02\x1d@\xabo\x1b\
-\xff\x9bw\xc2\x0c\xa3\x8e0\x8c\x0a4\x86!T#\x97\
-\xe9\x15\xa0^+\x99\xbe\x8a=P\xa3\xdc\xe8\xd9%\x0b\
-\xbd\xc3vO\xd1\xc2\x06\xf6\x02\xd5\xe0\xa3\x9b\xc1k\xf8\
-\xb9n\xde\x167P\xc5\xd2\xf06\xd7\xbf\xdb>.\x0d\
-_\x1b\xa1\xb7\xd7\xf3\xdc\xe8\x1f\x95\xa5\xae\xfe\xaa\xc7\xb2\
-\xa1}\x07\xd1\xe1S\xd7\x0e\x9dn\x5c\xbf<%\x00\x1a\
-\xd2Q\x01.<<\x93r\xeb\xdb\xc2g)3\xb0\xa1\
-\x17E\xec<s}\xbb\xab\xfe\xcc\xe4M\xc0KI\xc9\
-\xf6\x8b\xd3\xe6\xbaZ\xf1\x0a\xef\x99Z/\xbd\x9f~S\
--\x1bZ\xbenW\xc0n\xa4\xf9t)\xbd~\xae\x94\
-\x14\x1b~L%'\xa5U\x18\xfb\xfc\xf4\xa2\xe7\x8d\xfb\
-z\xe8\xb1\xf6\xeb\xc5\x86\xf6\x9d!%\x9f\x97fqd\
-R\x004\x84\x7fQE\xab\x03)\x995U\x89\xd1\xc5\
-+\xcc\x85CU\xba\xc7h\xaf\x19.\xec.\xacT=\
-NW\xaaf\x9a4,o\x87\xf7\x9bt\xae\x9e&5\
-\xd3\xd5-\xb2\x06B\xdb\x88U;v\xd7\xe2U\xfb\xbe\
-V\x11\xe7\xccPp)\xc5\x1fLm+eBW\xf3\
-\xfe\x99\x1c\x93\xd3\xee\xe7\xe5a\xe75\x01\x90\x08C\xa8\
-\xab\x0a\xa6b2\xbf\xc1!\xa5v4\x1b\x9a\x90\xaea\
-\x16\xd1t\x83\xf7aS\xb9\xaa\x15\xde\x10O\xbfv7\
-\xcf_\x90\xdeP/=\xb4\x893\xeeH\xd3\x86O}\
-\xae]\xcc\x00 \xa1\x96|\xb5\xb6\x93\xa2\xcd\xb0\xd3V\
-[\xea\x192Ang\x15%\xc3\xfbk\xba\xd2\xd8\x90\
-Z\xa7\xd3\xca\xdb`\x9d\x15'\xd46\xb8<G\xb5\xbb\
-\x1d\x15\x9a8|\xeac\x18\x15hH\xcb\xa5\x15\x0do\
-\xa3\x0b\x97+\xf6\x99\xdc*\xde<\xba\x82\x00A\xfd\xf9\
-\xca\xf0\xa6;\x14\xdc\xb5\xbb7\xb0\xbbB\xca\xb6\xdb\x88\
-\xe2\xef\x96\xd1I\xaa\xf5{\xf3?\xe7\xefF\xa2o\xdf\
-\xbd\xbe^\xb9\xd4aU\x9d\x8b\xb7\xd03,h#\x9b\
-S-\x1ba\x18u\x83^v\xef1\xaf\xe6\xe3\xe6\xfb\
-3\xb6v\x9d+\xba\xba\xf7,_\xd7\xce\xd5r\x01n\
-;\xc3[\xb3\xe8\x0b\xd6\xbb\xd7\x8a\xf2\x83kK\xf6c\
-\x1d\xa6\x8c\xdbR\xab^\xd5\xb6\xd2Jb\xd8\xee\x0e\x91\
-\xaa\xbaK\x04*u\x15\xcbC\xfdw\x7f\xf5'*6\
-\xaeGu\xbawj\xb0\xb7\x9dn\xab\x85\xb6\xb3Y\xc3\
-\x9dG\xcd\xe5\xa0\xb4\x12mq2h*\x8e\x1a\x8a\x9c\
-\xd5\x9d&4\x149\x925cWg7\xbc\x15\xd8)\
-\xf7Is\xae\x89\x8a\xeb]s_Nhg\x0bW\xa6\
-\xe5\x11\xe7\xd9\x8a\xc7\xa7\xabx\x1d9\x22\x1a\x82\xe3\xda\
-3\x9ev5\xc8\x9d\x94\xb4\xf9\x1a\xb3}YG\xd9\xe2\
-\x00\xe7V\xed\xf7\xa3\xc3T\xed\x1e\xde\x94\x86\xa4\xf3\x81\
-=N7\x1a\xde\x9aI\x1f\x8b\x068\xad\x88\xe8v^\
-\xe7\xe7\xe9\x7f\xd7\x08\x87\xa1\xe6\xc4\xc2{\xf0j\x15\x0e\
-m\xe4US%+Dn\x99\xd5\x0c\xe3M\xe9\x09\xf7\
-\xaa\xa9D\xe5\xcd\x90\xac\x13\xf18\xa3\x82Q\xda\x1c\x1b\
-\x0e5Z\x0d\xf4\x02\xe5\xc4\xdab\x0d\xb7\xec<\xde\x96\
-`\xa7\xddi\xf3\xfe\x94\x09V\xc7\xa5\x11\xdeb\x90\x89\
-\x8a\xeb\xa3\xfei\xd1\xd0\x18~\x8cz\xdfN\xcd\x1d/\
-\x94>\xe7I\xf3\x98'\xcd\xed\xa6\x08r\x9dcK\x03\
-\x9c\xf9\xb9\x9f\x09\xfel\xa6\x8bE)v\xad?\x04m\
-x\xda\x8e\xdc\x94\x13\xdc\xe3\xcf\x86\xa3\xfb\xed\xde\x92\xf5\
-\xedsZ\x8f\xcd\xda\x0bu\xb6\x85\xc2e+\xd3\xbeo\
-\xc1f\xcf?\xf3\xa7\x7fk\xf7\x0f\xd5*\xa6\x1d\x1e\xcd\
-xo\xc3\xfc\x8ag'\x8b\xab0\x7f\xb4\xe0U\xd8t\
-\xe7\x06\xaf\x82\x5c^q\xcb\xa7\xa9`\xb6\x95B\xe2\xb9\
-jS\x22u\xdf\xc6\xdfZkc;3\x14\xe4\xde\xd5\
-\x8aT\xa5Z\x7fsi\x80\x1c\x90oJ\xfd\x8fy\xc2\
-V\xd0N\xb9GE\x03_\xa3A.)\xad\xdc\x89\x0d\
-o\x8d\x984_\xa3\x093\xe4zH\x1eu\xde\x16\xb4\
-\xb5\x96\x1aBM\xbb\xed9\xf7,<o\xae\x95*n\
-h\x8e\xe5L\x7f\xc5n\x1do^`%e\xa3\xb4\xff\
-\xdcRw\xf3\xfe\xc0\xc1\x16pm`\xa9\xd7\xb4d\xe4\
-i[\x0d\xab\xdf\xf6m\xad\xa5\xcd\x89SrF\xa4\xae\
-\x8aV9\xaf\x0a6e\x82\xd5X\xc50g\xf3\x8c\xd9\
-\xff{{\xd0N\xc9F8vHx\xda\x84\xb8\x09B\
-\x5c{k\xa9\xd2@x\x9e\x11\xd0*\x96M\xd8X\xd8\
-\x81mf6\x8b\xeeRAc\xdf6r\xda\x1d\xafs\
-\xb8\xcewR\x0e:36(\xd4\xcf\xdbZk#\xba\
-\xe4CiDZ\x9eO\xf8\xfc*9\xa6\x0aw\xca}\
-F6\x93\x172\x9ba\xc4\x9ckZ\xbe\xed\xde&h\
-[-\x15\xe0\xaau\x85wJ\xcc\x97\xc1\xf6\xd2m\xa3\
-\xe6zG\xd8\xb5c\x03t\xd8T\xb7\xd4Z\xa6\xfa\xd6\
-^\x1c;\xbcY\xbf\xbcx+\x1f]\x13\xe4\x92\xd8\x8e\
-\xad\xb5^\xb1\xa1kB\x9a!Y\x88K6\xdf\xcf[\
-\xf40&\xcdc\xfe1\xdb`5\x0f\xdb\xaa\xa5\xfe\x04\
-\xae\xb6\xa9|+Ox\x0e\xf7N;?\x9f\x97\xfb\xa4\
-=|\x14Z\xc4P\xdca}\xf0\x92\xd2\xe0\xa1\x17\xc7\
-\xfc<f\x8ay\xfb6\xe5\xeaO@1\xb2\xafY\xba\
-\xd4\xf9Ue\xdd*+\xaa\x01t\xc9\xe9Z}\xeb\xd8\
-\xfd\x5c\xb5\xe2F\xa3\xe86\x95\xacyoV\xfe\xa9s\
-\xd6\xbe\x97\x91\xe3&\xcc\x1d\xab\xfb\x96^O\xb8\xcd\x1a\
-\x86\xacT\x92qs\x99l\xea\x9a$\x0dq\xba\xc0\xa1\
-V\xfb\x0e7Q\x80\x1b\x17oaE\xb3\xe9|\xb8\xa7\
-\xccP\xea\xf6\x0c]cCZ\xea\xd5Z7\x95\xef.\
-\xb6\xdf\xaa\xc8\xadxQ\xd2\x05\x0c\x9b!\xbc\x13C\x89\
-\xcd9\xea\xa2\xdfs\xdd\x16\x0a\xe8x:\xef\xca\x0b\x10\
-\xf5\x9a^{O\x87Q_\xb1\xab5'\xea\xbb\xe9\x16\
-o\xadU2\xa1\xa8\xb9U-\x8fk+[\x07\xa4y\
-F\x22W\xd66C\xca|\x0dN\xb8\xc77\xbc\x02\x18\
-[\xae\xa5^\xad\xdbuS\xf9bh_\xc7w\xaf\xb5\
-\xcfj\xdaw\xaf\x95\xef\x8dYd\x8fJ\x00Aiy\
-<\xd1\xf1Nh\xd84\xe90\xeaVn\xad\xe5$\x0a\
-\xa6I\xce;\xb6\xbaZt\xf38\xb6\x827%\xde\x8a\
-T\xfd\x1ag\xa51\xfe\x0a`\xb4\x99\x16\x9b\x03\xe7m\
-*_m.\x5c+*\xa4\xcb\xabc/|0\xdb\xf4\
-\xf6\x1c\xda\x8eb_\x93\x1b\xc7j[\x877/\x96\xaf\
-\xa4,\xa66\xa7\xd2\x07\xa0M9\x09\x03\xd5\xbc\x94W\
-\xcft\x185\xd9\xfdMJ\xa3Vd\xe3\xfd\xcd\xbc\x85\
-\x17S\xe2\x05\xa3iiT\x5c;\x93\x8d\xd2\xe0\xa6=\
-\xe4\x1erFM\xa5\xf2\xb0\xbd<\xe4<a\xde\x1e\xb0\
-\xd77\x16\xe4\xd8\x8f\xb6\x0d\xb5\xdcx\x99n*\x7fm\
-\xe0\x16)\xb4\xd1\x0a\xb5\x5c\xba\xa7,tjx{\xea\
-\xf5\x1fK3\xdd\xbd\xbbW\xf67y\x18U;\xe3\x07\
-{si\xf5\x8daA\x00kt\xf84\xd9\xfc\xb7\xe9\
-\x8a\xa1\xb8\xe4\xabQGV\x9b\xe9n\xb5)Y\x90Q\
-\x13\x86\x0e\x06\x82\xd1A)\x9a\xa1P'a\x15\xd13\
-\xde\xf4\xe7\xe1\x85\xb7q\xf9\xc5\x98\x9esz}\xd1\xee\
-h\x91t8t\x82\x15\xa9\xed\xa7%S\x92Nv\xbe\
-\xd17\x22\xa3\x0bW\xa4\x1dh\xe5p\xb1{P\x06\x02\
-\x9b\x9d\xbf\xf4\xd1\x0d\xdb\xec\xb5\x95\x85\x1b\xab.w\xf5\
-\x0b\x00\xacI%\xde\xbc>:\xe8\xb8\xb6\x0a7!\xf5\
-;*[\xb9\xb5\x96k\x1b\xf1F/\x9ex\xcc\xc9\x9a\
-\xff?a\xc2\xd8\xf3\x22\x09\xab\x83\xdepp\xf4|>\
-\xdd]\xc1\x95d\xb4\xaaWk\x17\x05}\xbc\xaf\xb8\x93\
-\x0d\x0c]O\x98\xffoM3b4\x05K\x0e\x9bD\
-\x03\x5cO~I\xba\x02\xab\x0e\xabm\xf6\xddjt\x05\
-\xb0\xb6\xc9\x00\x805)\x13@\x92\x84\x8c|LX\xc9\
-\x980\x91\xb7\xbb\x1c\xd4;\x11\xbf9[k\xd5'[\
-W\x03^\xaf1\xf1\x84$i\xf6\xeb4\xa9=\x89'\
-\x1b[y\x0b{\xc8y1\xe1\xe2\x11\xddMH\xe7\x03\
-\x12\xe0\xdaHG-9\x8cj\xe3\xb0U\xbc\xf9{7\
-\xb5\xdd\xfc=\xa5C\xa7s\xfd\xbb\x05\x00\xd6\x9c1\x01\
-*\xd9\x82\x82\xf5\xf6!a\xde0\xeaY\xa9\xdf\xd6M\
-\xacO\xd5\xd9\x9e\xe3\xa0\x0d\x93\xf5\xb7D\xf1\x8co\xb8\
-9\xb1/\xe9\x0e\x0cI+p\xcd\x0d\x9b\xd8\x02\x1d\x11\
-\xe0\xba\x8ay\x19Y\xbc\x22\xbb\x17.\xc9v\xd2\xa1\xdf\
-\x99\xbe\x9b\xa4\xdd\xcc\xf6\xed\xa6+>\x80r\x85\xc4\xc3\
-\xa7\xd3U?\xeb&\xae\xee$\x9fX\xdf\x9bx\xee\xd7\
-L\xddU-\xe5-\xc8Hv\x1f\xddMjSR\x90\
-d\xadU\x8a\xf2\xa2$\xb39mJ\xb0i\xda\xfeU\
-\xbb'\xbf \xc3\xcb\xb3M\xab\xbe\x85\x9b\xf2:\x92\xac\
-\x81p\xbe\xabG.\x0f}\xa2\xa5\x1b\x0f\x87\x11\xde\x00\
-TH\xda\xce\xa3\xd6D\xff\xe4\xc3\xa8\x13\x89\x87Q\xb5\
-Jv:\xc1k\x81\x9bp\x95\xa9\xd7\xd7\xeel\xa2\xa1\
-\xc9\x1e\xb9\xc7\xfc?I\xf51\xdar\xc2s\xe8\x5c\xb8\
-\xd3\xae~\xed\xea\xfdz\x8f\x09\xdaJKV\xe0\xfar\
-7LE\xedj\xcd\xe3R\xa5bS\xc3\x9b\x0a7\xe5\
-m\xe4\xdcz\x0e\x0dE\xedr\x01\x80\x0an\xc2!\xb5\
-\xf9\x1a\x15\xa2\xe4\xc3\xa8\x9b\xbf\xb5V\xaa\xa1`\x95\xec\
-6\xa5\x98\x00\xe5&ly\xd2\xd8|\xc0d\xb7a%\
-j[i\xb9\x00\xd7\xbf2'C\xcbsu\x05\xa7\x81\
-\x95\xb9m\x9d\xf7\x06\x00\x1d\xe9U\xf7\xf3\x09w(\x98\
-\xae+`\xa4\x13n\x07\xb5\x91\x9ep\xf5p%y(\
-r\xe5\xedD\xc77g\x07\x85\xc6\x16s8\x0d7\xf7\
-E\x1bh\xa9\x00\xd7\x9b[\x94\xc1@+\x8ejt\x0f\
-\xca\xbe\xfcb\xd9uw\x8d\xf6\x0a\x00`\x83\x0a\x09\x83\
-S\xaa\xce\x09\xf6\x8e\x0d?I\xc2\xc8\xd8\xa6\xf6\x84K\
-5\x18\x8c\x92(1\xb7\x0c\x9bcK\xc7\xcf\x1c\xd1~\
-:n\xe0\xe3\xf2yb\xbd\x85E\xa9Wwq\xa5\xec\
-\xe3}\x03\x199\xfe\xe0>\xf9\x99?\xfd;\x01\x00l\
-\x80\x0e\x9f&YP_2\xc7\xbfb\xf7L\xf5?\x8e\
-\xde\xbb3\xdf\xc0<\xabj\xbd\xd4\xb6C\x97|(\x85\
-\x04\xc77\xa7\x02G\x08D\x85m\x9d\x00\x15\x1e\xfe\xec\
-.\xacH\xbd\x9cR\xf9m\xef\xdb; \x00\x80\x0d:\
-\xedj?\xb01If\xb2\xac_\x5c3\xbb)\xe90\
-\xea\x09\xf7\xd9\x04s\xc0\xb2R\xef\xe3o\xa4:VL\
-x\x1b\xb7IU>\x9d\x9fV\xab\x89o\xe5}\x13\xfc\
-:XG\xf5\x81\x03\x00l\x90\x93p\xf3\xfa\xcd\xa7=\
-\xe1\xee\x91\xcd\xe06T\x11\x1cMt|\xdc0\xad#\
-\xd7%\x89\x92m\xb4\x9bT\xb2\xdb$\x0d\x88\xd8Vm\
-\x1b\xe0\xb4\xf9l\xd0\xcb\x1f\xddh\xfa\x06\xf2\x00\xb0\xe3\
-\xb8-\xb9\xb1\xf9Q\xd9\x0cN\x03\xa1\xc8I\x18&\xe3\
-*p\xe9\x84\x95\xb9R\xc2U\xc1^%5\x89\xcd\x9f\
-\x0f\x88\xa6j\xdb\x00WHg*6\x90\x7f\xe2TV\
-\x00\x00\x0dz\xc9\xceck\xa4\xd2\xb3\xd9\x9a\xb7\xa3A\
-\xf8\xbc\x9b}\x9bf\xad\x04M\xba\x22\xd7I\xbc\x93\xc5\
-\xc6{\xd5aK\xb5T\x80K\xb2\x0d\x95\xbf\x81|\xd0\
-\x5c\xae}\x9a\xe7\x02@\xcbI\xbey\xfdV\xd9\xac\xad\
-\xb5F\x12\xadr\xd5\x80\x9b\xb4?^Af\xa59F\
-\xe4\x15\xb7\xfe\xe1\xedR\xc2J\xaaK\x80k7-\x15\
-\xe0V\xba\xfa\x12\x1d\xaf\x01\xae@#Z\x00h\x8e\xd4\
-&\xf7]\xdb\x98z\x03I\xd2\xa1\xc0\xa3u\x1f\xd9\xd5\
-@\x88|\xcc\x99\x96f)\xc9\xb1\xba\x9a\xed\xbe\xe2>\
-\x93\xb0\x8f\x9f~\xef\xa7\x05meK\x03\x9c+n\xd9\
-/\x96\x13\xdanj\xa1g(q\x15\xee\xfa\xc0\x1eY\
-\xce$\x0b~\x00\x80\x90F\xaaK[k\xa2\xae\xf0\xe2\
-$\x0ep\x13\xf2\xb2[{\xc7\x07\xef\xebsT\x92\x99\
-\x8e\xfdL#\x959\x0de\x05s\xcej_\x07\x0do\
-n\x03s\x06\xe7[\xa8U\x0b\xea\xb2\xb5}\xe0\x1cg\
-F\x02\xadC\xc2\xfb\x85\xea\xb6Ns\xbd\xa32\xbc|\
-\xbd\xee\x1d\x164\xc4\xcd\xf5\xed6\xe1\xaf \xbd\xf9E\
-\x19\xa8\xb3\x110\x00 \xa0u\x87O\xd7y\x0d\x86\x9f\
-\x95fK\x99\xca\xd6\xcb\xe65\xe7Q\xe7\xb9\xc8\xcfk\
-xK\xc9\x19I\xeed\xecg\x8a&h\xa6%9?\
-\xc4\x9dv\xa7\xcdGS\xe6\x1cY\xc9\x9b\xe1\xd5\x94\x0d\
-\xdf\x87\x1a\x0c\xe1S\x0dn\xd5\x85m\xd4r\xe3\x8f+\
-\xa6\x9av-\x9d\x91\xc1\xe5\x19\xe9I\xd0\x17N\xc3\xdf\
-r\xa6\x9f\x00\x07\x00\x8dH\xd9\x17\xff$\xa6M\x98\x98\
-\xb6\x15\xafRD5)j\xf2~!t]Z\x9e\x11\
-I0l\xeblR\x80S\x1a\xe2N\xbb\xfa5\x98\xb2\
-\xf3\xc12\xf6y\x8d\xdb\xd5\x9f\xde\xfd&_D\x91\xae\
-\x12\xe06\xc2\x1b\x1e\x9d\xb4\x17m\xbe\xb0\xd1\xb1\xb4\xa2\
-\x1c\x17\xb4\x9d\xad\xde\x89a\xc6\x0d\xee\xc4\x10Se\xd3\
-0\xb6h\x86S\x93\x04\xb8\x8dJ\xb9\x05sq%U\
-\xa2\x15\x09\x80\x1d(i\xe5\xa6h\x82\xd4F\xe7w\xbd\
-\xeaN%\xdc\xb6\xcb\xdbZ\xebag\xb3\x86\xfb4\xac\
-y\xbbP\xf8/\x05\x8d7%\x9ej\x93\xbej\xd3M\
-\x9d\xa7\x87-\xb3\xa5\x01\xaeT*\xcd\x06\xa7\xb8\xa5d\
-{W\x8d\xf6\xe7\xe6\xa5\xbb\xb0,\x99b\xae\xee![\
-\x00\xe88\xba\xba1Y\xd7\xfe\x99\xa6\xbc\xe8?h\x82\
-\xd8i;7\xba\xfe\xfb\xae\xb5\xb5\x96\xdb\x22\x1b\xb8\xa7\
-\x9b\xde\xbb.+\xc9w\xc8\xa8-\xdd\xd2\x0bWP\xc5\
-\x96.bH\xa5\x9c\xb2\xce\xd3N)>\xc0\x95\x9c\xf2\
-\xc9\x01)\xb7ve\xac\x9ec\xecq\xa6\xca6:\x7f\
-\xc9\x0c\xd3\xce\xda\xed\xbb\x08o\x00v47q\xcb\x89\
-ii\x16\xc7T\xaa\x92\x1d?\xd9\xc4\x9ep3\xb29\
-\x0dl\x9b_}\xd3\xaf\x93\xd3\xe4\x95\xa2\xba\xd8\x81\xdd\
-\x17\xda\xd6\x96\x06\xb8R)W\xf6\x83\xd2c\xaa_\xbd\
-\xf9\x05\xd9\xa8\xfe\x959\xd9s\xe3\xefet\xe1J]\
-\xc7\xefZ\xbc*\x99R^\x00\x00\x92|\xf8\xb4\x99s\
-\xbb\x92\x9f\xab\x99[kix;*\xcd\x95\x95\x05y\
-\xba\xe6Q\x8f9YI*-G\xa4Y\x81\xd3\x95c\
-\xf2\x88\xb39\xf3\x09\xb1%\xb64\xc0]>|\xaf6\
-\x0a,\xfb\xe1\x1b^\x9a\x91\xa1\xa5\xeb\x0d\xcd=\xd3\xca\
-\x99\xad\xa4\xad\xdc\xa8\xbb\x8a\xd6\x9b[\x8c\x0co\xfb\x06\
-2r\xd7h\x8f}\x0b\x00;\xc6\xab\xee\xe7\x13\xf7\x0c\
-kf%\xe8A;\x9fm\xf3z\xb7U7&\x0f;\
-\xcf5\xf1\xf9dM\xc8\x9a\xd8\xb4\x15\x9d\x0f:o\x9b\
-\xe0uD6\xca\x0bo\xb5C&Z\xda\x967\xf2u\
-\x1cg2|]_~Qn\x9e\xbf \xb7\xcc\xfdx\
-\xedr\xd3\xfc\xc5\x9a\xe7\xd2\x95\xaaI+i\xfd\xf9\xca\
-U\xaa\x7f\xfb\x9f}V\xfe\xfa\x9f\xff\xa4\xbc\xfa\xcb\xb7\
-\xcb}{\x07\x04\x00v\x8cb\xe2\xbdO\xcfn\xca\xf0\
-`2\xcd\xddZ\xabK\x9e\x10\xd9\xf0\xdc9/\xbcm\
-\xd6\x90diu\x9e\xe0#\xceq\xf3\xf5:$\x8d<\
-^\xafG\xde\x11\xc2[g\xd8\xf2\x00w\xf1\xc9\xbb^\
-t\x9d\xf4\xa4l\x90V\xec4\xf8\x05\x0dg\xaa?\x1d\
-m\x1c\xdcU,\x94]\xf7\xdd_\xfd\x09\xd9\xd5\xddH\
-3\x1e\x00\xe8\x00\xa5m\x9c\xff\xe6kl\x18\xb5y[\
-k\x1d4\x15\xb3\xa2\x1cl\xb8\x12\xe7\x98\xc7\xbf \xf7\
-n\xea|2'\xb0\xd0\xe3!\xe7E\xfbx\xa5\xce\xe0\
-\xab\xc1\xcd1U\xcby9`+\x8e\xe8\x08\xdb\xb2\x95\
-\xd6\xe5'\xef8^J\xa5'\xccOUV\x1a\xd4[\
-X\xac\xb8\xee\xee\xdd\xe5;2\xa4C\xc3\xb2]\xa1j\
-\xdd]\xa3\xbd\xb2\x7f\xb0[\x00`G:\xed\x8e'\x1e\
->-\xc9\x8b\xd2l\xde0jV\x92\x89\x0e\x9e\x8dn\
-\x1e\xafs\xd2\x1er\x0e\xaen'\x96\xad\xeb6^\x1f\
-\xbc\x83\xe6vOly#\x5c}\xbc\x0f;\x87M\x90\
-;`\x1f\xb3\x0e\x8b:k\xbd\xf9\xa6E\xc3]\xcaT\
-\xdb\xbc\xc77j.\xcf\xd2\xac\xb7\xb3l[#\xdf+\
-\xbf~\x87\xfe\xc2\x1e\xd8s\xfc\x87O9\xaek\xc6\xf4\
-\xdd\xb1$\xb7od\xe5\xa8\xdbZ[\xbf\x02\xc0vK\
-\xba\xfb\xc2\xcc\xa6\xf5\x0csl\x03\xdd\xa3u\x1e\x9d\x15\
-\x9d\xbf\xa6[J5\xbb\xea\xf5\x8b\x8e6\xb5=.\xaf\
-\xb8\x13\xe2}}\xc6e\xbd\xcd\x896\xf7\xcd\x9a\xc7\xfa\
-\xb6\xa9\xb8\x9dlB \xca\xcaF[\x83x\x8b!\xf4\
-B3\xde\x1df\xdbwb\xb8\xfc\xe4\x9dZ\xce\xad(\
-\xe9\xee}\xfe\xbd\xb1\x92S\xfcP\xea\xf4\x95{\xf6\xc8\
-o\x8e\xdf\x22\xb7\x1e\x7f7\xf6\x98\xf0>\xab?Z\xc8\
-\xcbl\xae\xc8\x10*\x80\x9d\xc9\x09\xec\xbe\xa0\xc3ln\
-\xc4b\x82\xf2\x8a\xd6\xb4l\x96y\xf3:\xd0\x1b\x0a!\
-\xcb\xe6\xf1lv\xd5H\xe7\xd2E\xdd\xc7C6\xa8N\
-\x0b\xd0\xa2Zn+\xad\xcd\xa4;<\x14\x9d\xb4\xa4W\
-\xfb\xc5ix\xfb\x95\x97\xb3\xf2\xf5\x9f\xdb+\xfb\xccP\
-\xea\xbeAV\xa0\x02\xd8At\xc8\xb0Ux!j\xeb\
-\x87\xf8\x86e\xd7\xb6\xdc/\xb0Am\x1b\xe0\xc2\xd5\xb4\
-7/,\xd6u\xbb\xe5\xee\xf2\xfdR\xdf\xb9\xbe,O\
-\x9c\xca\x0a\x00\x00-lL\x80\x80\x96\x9d\x14v\xe1\xf0\
-\x1d\xd9\xe0\xc7\xe1\x05\x09\xb9to\xd9\xc7o^\x5c\x90\
-\x9f\xfc\xe3\xf7j\xfe\x15\xb5\xd03,\x85\xd4\x8e*<\
-\x02\xc0\xce\xe1\x0a;\x0b`Gh\xdbY\xfd\x85t\xc6\
-\x84\xb8\xf2\x15\xa4\xb3\xb9R]}\x81f\xfbo\xaa\xb8\
--\x00\x00@\xbbh\xebe\x997\xfaF\xed\x9c\xb6\xa4\
-t.\xdc\xcc\xc0\x1e\x99\xed\xdb-\xcb\x99>\xc9\x9b0\
-\x17\x1e\x92\x05\x00`S5\xda\xf2\x04\x906_\xc4\xa0\
-A\xec\xda\xe0-\xd2\xbf2/\xbd\xf9\xc5\xb5\xc5\x09\xf5\
-Z1\xe1M/A\xc3K\xd7\xed\xb9\x00\x00;@N\
-\x0e\x98\xff3\xec\x8a\xb6\xd3\xe2\x01N\xfb\xdb\xac\xf7\x87\
-K\xbb\x05Sq+\x7f\xc8\xae\x93\x92\x85\xdea{\xe9\
-.\xac\xc8\xc8b}\x1b\xdao&\xedQ\xe7H\xf2\xbd\
-]\x9b\xa5\xe4l\xdd\xb7u\xab\x9e\xebV>\xa7\x94[\
-\x90\xed\xb2\x99\xcfs;\x9f\x97\xda\xca\xef!\xd0\x81\xc6\
-\x04\x08\xe8\xa8\x7fQs]=\xb2\x954\xbc\xf4\xe5\x17\
-$S\xccIW1o^ \x8b\x0d5\x18\xdeLZ\
-\xa5,\x99\xe1a\x0d\xba:T\xbc\x94\x19\x90R\xaa\xf6\
-\xb0\xb3nU\xd6\x9f\x9b7\xcfm\xc5</\xef9\xa5\
-K\xdb\x1b\x00\xc2t\xd8\xbbd\x86\xd0\xf5\xf9\x95\xcc\xf3\
-\x5c\xe9\xea5C\xe2\xfdu\xddV\x9fWO~\xd9V\
-m[\xf1{\xa7\xcfM\x17\xdb$\xfd\xbe)}nZ\
-E\xd6\xe7\xd5e\xbeg\xad\xf63\xa9lK\x1f\xf3|\
-\x0a\xa9\x8c,v\x0f\xd6\xfd\xdc\x80\x9a\x1c\xb9.\xad\xf7\
-#\x0f4]\x8b\x078\xb7lUi\xbaX\x94bW\
-\xf3\x1f\xb2V&t\x8f\xd4\x94\xdd+5W\xd7m\xf4\
-\xc5q\xd7\xe2\xd5\xc4\xc3\xb6[MC\x97\xff\xd2\xa8\x15\
-Jm\xa1\xa2/\x98\xf3\xbd\xbbbo\xd3cB\xe9\xf0\
-\xf2lK\xbe\xf0\x07\xe9\xe3\xd3\xaa\xac}~\xe6\xfb\xd1\
-\x93_\xb2\x17]\xa4\x12G\xc3\xcd\xf0\xe2\xf5\x96\xff\xbe\
-\xe9s\xcb\x14\xbd\xad\xdf\xfc\xef\xdb|\xcf\x90,\xf6\x0c\
-\xc7\xdeFC\xf7\xf0\xf2u{|\xab\xb3?\x97\xe6\xd2\
--+\xf6\x0f\x85%\x13\xbc\xe7{G\x98\x8b\x8a\x8dK\
-\xcb\x8c\xb4\xd6\xdf\x9a\xd5\xd0\x7f\x0e\x0dk\xf5!\xd4\xb3\
-&\xc4\x8d\xfb\x1fu\x17\x96\x9bVe\xd3\x00\xa6U\x0a\
-\xad\xa0%\x0d*\xfaB9\xbax\xb9\xe5\x03N\x1c}\
-\xc1TQ!N\x03\xce\xae\xa5\xf6\xfd7\xa5\xc7\xfc\x8c\
-\x0c\x9a\xf0\x19\xf5\xdc\xbaM\xc5md\xe9\xaa\xb4\xabA\
-\x13\xe2\xb4\x1a\x1a\xf5\xdc\xec\xcf\xe4\xc2\xe5\x96\x0f\xa6q\
-\xfat\x0e\xab\x09t\xba\xb8\x08\xd81\x5c\x02\x1c\x1a\xd7\
-\xd2\x01\xceq\x9c\xb3n $i\xf0\xd0\x7f\xe4o\x98\
-\xbf\xd472\xe4\xd2\x97\xbb!C\xcbs\xd2(}\xa1\
-\xac\x16\xde\x863\xa9m\xdd\x9e\xeb\xa3\x85|\xcdc\xf4\
-k\xa9C\x8e\xf9P \xd6\xeaT\x12[\xf5\x5c\xeby\
-N\xbe\xb8\xe76\xb4\x5c\xdf\xbf\x95\xfb\x06\xb6oG\x8e\
-Z\xcf\xb3\xdas\xab\x15\xde\xb6\xf3y\xa9Z\xcf\xad\xdb\
-T\xbf\xfb\xb4\x1ag*\xc4\xc0\x96\xc9\xc8m\x02\xb4\xa1\
-\x96\x0ep+\xa5\x95\xe3\xddNw\xd9F\xf7Za\xe9\
-\x99\xbf`\xe7\xd04\xa27\xb7\xb8\xa1\xf0\xa6\x15\xaa\xf0\
-\x0b\xe5\x97\xef\xd8-\xbfv\xfb\xa8\xdd\x8a\xab\xd5\xf6U\
-\xfdh\xde\xdb\xef\xf5\x9dkK\xf2\x8d\xb3\x97\xcb^D\
-\xfb\x0a\x8beA@\xbf6\xe1\xe7\xa6{\xcc~\xd1<\
-7\xd5j[\x8d\xe9\xf3\x9a\xcb\x95\xe4\xfc|N\x9ez\
-\xfd\xc7\x89\x9f\xdb\xaf}f\x97\xdc\xb7w@\xee\xdf;\
-(\xc3\xdd\xa9\x96\xfa\xde\xe9s\xd3\xef]\xd4\xf7m`\
-eNf\xba\xd6+Uv>\x9f\xf9\xbd\x08zt\xdf\
-\xa0|\xf9\xce\x9be\x7f\x0bn\x11\xe7?7\xfd\xbe\xfd\
-\xd6w.\x94\x7f\xdfL%\x8e\x00\x87\x1d\xa3K\xa6\xcc\
-p\xefk\xf6\xfdpK\x11\xad\xce\x15\xa9\xd0!^\xcb\
-O8\xf16\xb5/\x9d\x09\x86\xb8$.\x0d\x7f\xaa\xec\
-\xe3\x9bn\x5c\xa8x!\xd7*\x92\xbe\xc8\xdd\xbd\xbbO\
-\xde\xbc\xb0P\xf6\x822\xd77Z61~\xd0T:\
-\xfas\x0bk\x1fk\x08\xf8\xd6\x03\x9f\x96v\xf0\x86y\
-n\xbf\x12\xd86\xac\xe4\xa4\xe4\xca\xd0'\xd6>\xd69\
-}\xc1 \xd0I\xcf\xad\x93\xbfoCK\xd7m\xf0\xf1\
-\xddwk\xbf\x9cx\xf4\x80\xb4\x03\x0dq_\xf8\xb3\x0f\
-l\x10\xf7]\x1d\xba\xb5l\xb5y\xf8w6\x9dI\x8d\
-}\xfc\xa5;i\xfb\x80hg\xdc\x11\xc9\xcb!\xfb~\
-\xca\x04\xa0\xf00e8\x18-\x9b\xf7\xa36\xb3\x07Z\
-\x5c\xcb\xafB\xd5-\xb5L\x88;Xr\x8a'\xcc\x87\
-\xe3Io\xafC\x9d\xfe\xc4h\x9d\xf7\x165\xcc\xf4w\
-\xff\xe2\x8e\xb5\xf7\x7f\xc3Tr^\xf8 \xfew\xb9+\
-\xb4\x12\xf3\xb1\xfd\xf1\x93\xca[\xcd\xfd\xa6\xda\x14\xa4\x8b\
-6\x82_\x1f'\xb4t\xcb\xaf\xbc\xb5\x03}nZE\
-\xf3\x83\x80>\xb7`\xdb\x99Th\xc8\xfb\xbe\xbd\xedS\
-\xe5\xd1\xe7\xa6\x7f`h\xd5J\x85\x9f[\xf8g\xfa7\
-\xc7o\x91v\xa1\x15\xc2\xbbG{\xe5\xcd\x8b\xeb\x01T\
-\x7fO7c\xb1\x12v\x88\x836\x8cM\x09\xd0\xe1\xda\
-b'\x06\x0dq\x97&\xef\xbe\xd7u\xd2\x93^o\xb8\
-\xfa\xa5\x02=\xca\x1c)\xc9N\xa7!'N\xbaX\x1e\
-N\xf7\x0d\xb6\xd7vc\xad6|\xbd]t\x88\xb2\x9d\
-\xf0}\x03\x80\xe4\xdaj+\xad\xcbO\xdeq\xfc\xd2\xe4\
-]\x07Rn>\xf2\xf2o?\xff\xa9\xc3I\xe6\xfb\xdc\
-w\xeb\x80\xfc\xf5\xaf\xfed\xd9u\xe1\xdb\x87{\x9f\x95\
-B[w\xbdsmY\xda\x85Vp\x82CU*\xd8\
-\xb6A\xf7\x97\x0dz\xe9|\xe3s\x05\xb7C\x92\xe02\
-\xd7F!G\xbfo~\xf5\xcdW\x92\xf5\x9f\xc3\xf0\xcf\
-\xe4K\xe7oH;y\xe7z\xf9\xef\x90\xdb\xde;\xfc\
-\x01\xc0\x96h\xcbq\x8a\x0b\x87\xef\xcdF]\x7f\xc8u\
-?\xfc\xed\xef]\x92$\x92N\xf0.\xa4\xcd\x97,\xf0\
-Z\xfa\x87\xef]\x93_2\xc3\xa8w\xed\xee\x95V\xa6\
-\xc1\xed\xab\xdf\xf9\xb8\xec:m\x10[\xf6qWw\xd9\
-\x1c\xb8?x\xef\xaa|\xf9\xce\x9b\xa4\xd5\xe9s\xfb\xdd\
-\xb3\x17\xcb\xc2\xa96\x89\x0d\xce\xa3\x0a\x7f\xdf\xf4\xb9\x0d\
-\x9b\xca\x8f~\xef\xaaU%\xb7\x9b>\xa7\xdf3\xcf-\
-H\x9f[0x\xeb\xaa\xd4\xe0\xf6o:\x05\xe0\x8b\xb7\
-\x8f\xd8\x05\x1a\xad\xcc\xff\xbe\x85\xc3i\xf8\xe7\x12\x00P\
-iGM4\x09\xffe\xdf\xc8P\x93v\xc4\xd7\xa6\xaa\
-~\x1b\x11=\xc7\x83\x7f\xf6\xc1\xda*\xc6\xe0\xb0\xa3~\
-\xbc\x1d\xe1@_\x18\xfd\xe7\xa6\x95&\x7f\xd5_\xd8R\
-w\xf9\xae\x05\xe1\xe7\xa6\xb7\xf9\x99?\xfd\xdb\xd8\xfbi\
-\xd6\x10k\xdc\xd7)\xea1\x87\xe9\xf3\xd3\x89\xf0\xe1\xca\
-\xe2JW\xf9\x1e\xb7\xfa\xdc\x06\x03\xab\x8f\xf5\xdcO\xbd\
-\xf1c{\xd1\x10\x1f|.\xdb\xb5j3\xf8}\xfbh\
->\xb7\xf68\xc3\x163\xe5\xf3\xf7t?\xdf\xe2r\xba\
-l.\xdco\x98\xe7\xd5J\x01\xae\xde\x9f\xc9e\xf3\x5c\
-h\xe6\x0b\x00\xb5uT\x80s\x1c\xe7\xb5[\xa6\xde\xcd\
-J\xcc\x9eq\xc5P\xef\xb8w\xcd\xd0\xcdO\xfe\xf1{\
-3\xff\xcd=\xb7\x8c|\xceT\xd04H\x84\x83@\x98\
-nm4\xdf=$C+\xe5\xc3\x8bz;\xbd\xd4\x13\
-:Z\x81~-\x963\xe5/\xf0\xfa\xdct\x97\x06\x0d\
-q\xbej\xcf\xa7U\x9f\xab>\xb7\xa5\xee\xca\xe7\xb6`\
-\xbeo\x03\xb9\xca\xe1\xc5\xa8!\xcaVe\x9f[O\xe5\
-\x02\x0c]-=\x1a\xd8\x07X\x9f\xcf\x0b\xef\xb7\xd7\xc2\
-:}n\x0b=\xed\xb3(\x08\x00\xb6\xd3\xce\xaa\xc0\x99\
-\x17q\xfd\x0b\xbf7\xbf\xb4v\xddl\xae4\xf2[\xdf\
-\xbd I,\xf5\x0c\xd9U\x8dQa\xa0\x1d\xe8\x0b\xe5\
-L\xff\xcd\x91\x9f\xd3\x96)\xc1\x00\xd7n\xfc\xe7\x16\xd5\
-'p\xa1\xd7\x0b\x07\x9d\xf8}\xd3\x9ew\x8b&\xb4\x06\
-[\xa5\xb4\x13\xad\xba\xcd\xf6\xedn\xb8\xbf#\x00\xec4\
-\x1d\xf8\xafe\xf9\xfe\xa9N\xc9\x95\xc0|o\xbb\x8bC\
-\xa6\x90\xdb\xf0\x96C\x1a\x06\xf4ESwu\xd0\x0e\xf2\
-\xed\xb0\xadV\xc1n\xf8\xde'\x8b\xa6\x82\xa3a6\x8a\
-\xbe\x80\x86Cn;\xd0\x00\xa0C\x8b\xd5\x9e\x9b\xd2\xef\
-\xdbrw\xbfm\x86\xebo\xf6\xde\xeatNX.\xdd\
-S\xfb\xb9\x99\xeaUO~\xb9\xad\xb6\xd3\xd2\x05\x18\xba\
-\x0fj\xad\xe7\x06\x00(\xd7q\x01\xce\xc4\xa8\x99\xe0\x0c\
-\x1a\xed\x99U\xf6y\xf3\x2213p\xb3}\x01\xdfh\
-H\xd1}Y\xfd\xbdY\x1d\xed\xcde\xc2@\xb0\xdf\x98\
-^\x97\xda\x86`W2a\xc6\x7f1\xf4\xdfOR\xd9\
-\xd0\x90[\xcfPV\xba\xd4\x9c\xa0\x10\xf7u*\xd6\xb1\
-]Z#\xcfO\x8f\x9d3\xd5\x1e\x9f\xb7\xb1z\xa0Q\
-li{\x02\xd0F\xbfo\xfe\xcfvw!'\xadf\
-\xa3\xcf\x0d\x00PnG\xfe\x0b\xea\xbf\x80/\xf4\x14L\
-5n\xc5Ta\xf2\x92\xd1&\xbf\xe6\x85[{\xc55\
-RM\xd3\x17\xa4B\x87\xac\x9e\xb3/\xaeuTC:\
-\xe5\x05X\x9fG'=\x97\xa5n\x82\x11\x00t\xba\x8e\
-\xfb\x97\xde\xb1\x8d~\xd7\x03X\xaa\xcap\x92}\xe1\x0e\
-\xbd\xd8ie\xae\x9d\xe7\x80\x01\x00\x80\xce\xc7\x9f\xeaM\
-\x94r\xbd\xa18\xad\xe0\xf9C\xb7\xdevU\x95+[\
-\xf5\x18v\x86\xf0Z\xbb\xc4\xb5\x8d\xd0J`i\xf5\xa2\
-\xc7\x14R\xdd\xb4\x98\x00\x00@:1\xc09\x92\x0dn\
-\xe9\xd9\x93_*\xdb\x8c\xbe\x992\xc5\x15;i\x5c\x9b\
-\xdf\xa6\xdb`2|'\xb0m4\xcc\xf7s\xa9{\x88\
-0\x07\x00\xd8\xb1:.\xc0\x99j\xcdtp\xd8T\xc3\
-\xd5\xd0\xd2u;)\xbf\x94j\xce\x9e\x8bZ=\x1b\x5c\
-\x9e\x91\xbe@\xf7{l\x0d\xadp\x0e\x9a!n\xfd\xda\
-_\xef\xdf\xd3\xb4\xef)\x00\x00\xed\xa4\xe3\x02\x5c\xa1\xb8\
-\xfcv\xb7\xd3\x9d5\x03pc\xfeu\xfab\xdfm\xaa\
-e\xba\xc8\xa0T\xa3j\xd3U\xa8\xdd\xd0\x95\xf0\xb6\xfd\
-4\xc8\x0d/]\x93\x99\x81=\x02\x00\xc0N\xd3q\x01\
-n\xe6\xf0\xbd3{\x9f\x7f\xef`\xc9)\x9d\x09\x868\
-}\xc1O\x976\xde\xdb\xac\xa7\xb0\x14\x1b\xde\xf6\x0dd\
-\xec\x96P\xba-\x93\xee\xea\xa0v\x99\x8f\x87\xbb+\xab\
-D\xfe\xd6[;\x9dn\xa9\x14\xb7\xfb\x85\xb7\xe5Ri\
-\xf5\x98\xa2\xbcsmY\xe6\xf2\xeb\xc7j\xff=\xdd\x03\
-t\xb3\x86\xc8\x01\x00hU\x1d\xb9\x88\xe1\xc2\xe1;\xb2\
-Q!\xae\x19\xba\xf3\xcbe\x1fkh{\xee\x81O\xc9\
-\xdd\xab[qa\xf3h\x90\x9b|\xf5\xbc\xbcyq=\
-@\xf7\xe6\x16\x08p\x00\x80\x1d\xa7c[\x9fk\x88\xbb\
-4y\xd7\x01\xd7IO\x8am-\xd2\x98pO\xb8p\
-\x97\xfbo\x99\xf0v\xff\xde\x01\xc2\xdb\x16\xd0\xaf\xb1\x86\
-\xe5\xa0v\xd9\x05\x03\x00\x80f\xea\xf86\x22\x97\x9f\xbc\
-\xe3\xb8\xa9\xc6\xbdV\x92\xfcxJR#Q\xc7|\xf3\
-\x81O>\xef\xbf\xff\xe6\x85\x05y\xe1\x83\xd9\xb5\xcf\xa5\
-h\xf5\xd1R\xf6\x9b\xe1\xe9}\x83\x99\xb2\xcd\xe7SR\
-4\xff\xd1\x11\x07\x00\xb0s\xec\x88W=\xad\xc6\x997\
-\xd9\xb8\xcf\x7f\xd1u\x9f\x0f~\x1c\x0cph=:\x94\
-\x0a\x00\xc0N\xc6\xee\xd1\x1bD\x98\xd8Zo\x98\x0ai\
-x\xd1C\xd1\xa1\xfa\x06\x00\xd8Yx\xe5\xf3\x1c\xf6\xdf\
-\xf9\xeb+K\x9f7o&\xe3\x0e,\xa4\xba\xa4[V\
-\xd6>\xfe\xdaw/\xd8\x95\x92\x9f\xdb\xdd+w\x99\x0b\
-6\x8f\x0eo?\xf5\xc6\x8f\xcb\xae[\xe9\xe2k\x0e\x00\
-\xd8y\x08p\x86\xe38S\xfe\xfb{\x9e\x7f\xc7|\x1c\
-\x1f\xe0V\xba\xfa\xa4?\xb7\xb0\xf6\xb1\xce\xc5\x0a\x86\x0a\
-m\x0f\xa2\xf3\xb4\x86\xd7\xda\x88\xa4\xedua\xbazu\
-\xa7\xfbh!\xbe\xe7\xde\xdcj\xfb\x10{\xdc|.\xb6\
-\xdd\xc8R\xf7\xa0\x00\x00\xb0\xd3\x10\xe0\x12\xcaw\xf5\xc8\
-b\xf7@Y\x88\x0b\xd2\x90\xa1\xfd\xca\xb0\xf9\x16\xba\x87\
-$g\xbe\x1f\x00\x00\xec4\xcc\x81\x0bq\xd3\xe9\x0f\x83\
-\x1f\xa7\x8b\x95{\x9c\xce\xf7\x8e\xd8\xf0\x80\xed\xb3h*\
-o\x0b\xbd\xc3\x02\x00\xc0ND\x05\xaeA\x1a\x1e\x96\xbb\
-\xfb\xed\xce\x0c\xba\xa1\xbd\xee\xf4\x90rY\xd0\xb0\x99t\
-\xf3\xfa\x5c\xba\xdbndO\xe5\x0d\x00\xb0\x93\x11\xe0B\
-\x9c\xe2\xf2\xac8\xeb\xf3\xd3\x1c\x89o\x12[Lu\x99\
-J\xd0\x90\xbd\xf8\xd2\xa5\x828n\xc9\x849\xefv\xc1\
-\xf7\x83RnAv\xbaR\x95\xd5\xa3\xbag\xad\xebx\
-\x05\xe2b*m>N\xad}\x0c\x00\xc0NG\x80\x0b\
-IK\xefLI\xd6+i\x1a\xc0\x92\xd0P\x07\xa0y\
-h\xa6\x0d\x00\x95(i\x84,\xcb\xf2L\xf0c;4\
-Zbh\x14\xd8\x0e\xfd+sl\x95\x06\x00\x11\x08p\
-!3\x87\xef\x9d\x09\xef\x9d:\xbax\x99\x10\x07l1\
-\x0do\x83+7\xca\xaesD\xa6?\xfe\xd2\x9d\xe7\x04\
-\x00v8\xc6\xfb\xa282%\xae\x1c\xf5?\xd4*\xdc\
-\xcd\xf3\x17\xec\xca\xc7B\x9a\xfem\xc0f\xeb\xcd/J\
-wa%t\xad\x93Me\xfa&\x05\x00\xa0\x7f\xd0\x22\
-\xca\x9e\xa9w\xce\x98/\xce\x84\x00h\x053\x92\xceL\
-\x5c\xfa\x97\xff\xf0m\x01\x000\x84\x1a\xe7\xf2\xe4\xdd\x07\
-]\x91c\x02`\x9b9\xd9t\xa6\x7f\x9c\xf0\x06\x00\xeb\
-\x08pU\x98\x10\xf7\xb4\xeb\xa4'\xc3s\xe2\x00l\x0d\
-\x9d\xf3\x96\xce\xf4M|\xfc\xa5\x7f\xc0\xbc7\x00\x08`\
-\x08\xb5N\xb7\x1e\xff\xe1S\xae[\x1a\x17\x00[\xc2u\
-Rg/?y\xe7s\x02\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00@\x13\xfd\xff/\xac\xbdbf\
-7\xc2\xa9\x00\x00\x00\x00IEND\xaeB`\x82\
-"
 
-qt_resource_name = b"\
-\x00\x08\
-\x0aaB\x7f\
-\x00i\
-\x00c\x00o\x00n\x00.\x00i\x00c\x00o\
-\x00\x06\
-\x07\x03}\xc3\
-\x00i\
-\x00m\x00a\x00g\x00e\x00s\
-\x00\x0f\
-\x0d3N\xa7\
-\x00c\
-\x00o\x00m\x00p\x00a\x00n\x00y\x00l\x00o\x00g\x00o\x00.\x00p\x00n\x00g\
-\x00\x0b\
-\x052\xb9'\
-\x00a\
-\x00p\x00p\x00l\x00o\x00g\x00o\x00.\x00p\x00n\x00g\
-"
+RESOURCE_FILE = 'resource.rcc'
+registered = False
+
+
+def resource_path():
+    # PyInstaller unpacks data files under sys._MEIPASS.
+    return os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__))), RESOURCE_FILE)
 
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x16\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x8f\xb3\xdbn+\
-\x00\x00\x00\x16\x00\x02\x00\x00\x00\x02\x00\x00\x00\x04\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00L\x00\x00\x00\x00\x00\x01\x00\x00\x9fo\
-\x00\x00\x01\x8f\xb0k9\x0c\
-\x00\x00\x00(\x00\x00\x00\x00\x00\x01\x00\x00^\x96\
-\x00\x00\x01\x8f\xb0k&M\
-"
 
 def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+    global registered
+    if not registered:
+        path = resource_path()
+        registered = QResource.registerResource(path)
+        if not registered:
+            print(f"Error: Unable to load resources from {path}.")
+    return registered
+
 
 def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+    global registered
+    if registered:
+        QResource.unregisterResource(resource_path())
+        registered = False
+
 
 qInitResources()
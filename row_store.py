@@ -0,0 +1,140 @@
+import csv
+import mmap
+import os
+import struct
+from array import array
+from collections import OrderedDict
+
+from parsers import TEXT_ENCODING
+
+
+MAGIC = b'CONSROW1'
+HEADER = struct.Struct('<8sQQQ')
+ROWS_SUFFIX = '.rows'
+FETCH_ROWS = 10000
+CACHED_ROWS = 1024
+
+
+def rows_path(csv_path):
+    return csv_path + ROWS_SUFFIX
+
+
+class CsvRowStore:
+    """Rows of a CSV file read on demand through a memory map and a row offset index.
+
+    The offsets are found fetch_rows at a time as the viewer asks for more
+    rows, so opening is immediate whatever the file size. Once the whole file
+    has been indexed the offsets are saved next to it and reused while the
+    CSV's size and mtime are unchanged. Rows are parsed when first read and
+    projected to columns; the most recently read rows are kept parsed.
+    """
+
+    def __init__(self, csv_path, columns, fetch_rows=FETCH_ROWS):
+        self.csv_path = csv_path
+        self.columns = columns
+        self.fetch_rows = fetch_rows
+        self.cache = OrderedDict()
+        stat = os.stat(csv_path)
+        self.csv_size = stat.st_size
+        self.csv_mtime_ns = stat.st_mtime_ns
+        self.buffer = None
+        if self.csv_size:
+            with open(csv_path, 'rb') as file:
+                self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.offsets = self.load_offsets()
+        if self.offsets is None:
+            self.offsets = array('Q', [0])
+            self.fetch_more()
+
+    @property
+    def rows(self):
+        return len(self.offsets) - 1
+
+    @property
+    def column_count(self):
+        return len(self.columns)
+
+    @property
+    def complete(self):
+        return self.offsets[-1] >= self.csv_size
+
+    def load_offsets(self):
+        try:
+            with open(rows_path(self.csv_path), 'rb') as file:
+                magic, csv_size, csv_mtime_ns, rows = HEADER.unpack(file.read(HEADER.size))
+                if magic != MAGIC or csv_size != self.csv_size or csv_mtime_ns != self.csv_mtime_ns:
+                    return None
+                offsets = array('Q')
+                offsets.fromfile(file, rows + 1)
+        except (OSError, EOFError, struct.error):
+            return None
+        return offsets
+
+    def save_offsets(self):
+        path = rows_path(self.csv_path)
+        temp_path = path + '.tmp'
+        try:
+            with open(temp_path, 'wb') as file:
+                file.write(HEADER.pack(MAGIC, self.csv_size, self.csv_mtime_ns, self.rows))
+                self.offsets.tofile(file)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Error: Unable to save the row index '{path}'. {e}")
+
+    def find_rows(self, count=None):
+        """End offsets of up to count more rows (fetch_rows by default), without adding them yet."""
+        found = array('Q')
+        if self.complete:
+            return found
+        count = count or self.fetch_rows
+        position = self.offsets[-1]
+        while len(found) < count and position < self.csv_size:
+            end = self.buffer.find(b'\n', position)
+            position = self.csv_size if end == -1 else end + 1
+            found.append(position)
+        return found
+
+    def add_rows(self, found):
+        self.offsets.extend(found)
+        if found and self.complete:
+            self.save_offsets()
+
+    def fetch_more(self, count=None):
+        found = self.find_rows(count)
+        self.add_rows(found)
+        return len(found)
+
+    def row(self, row):
+        cached = self.cache.get(row)
+        if cached is not None:
+            self.cache.move_to_end(row)
+            return cached
+        # output.csv is written in the locale encoding, as the input files are read.
+        line = str(self.buffer[self.offsets[row]:self.offsets[row + 1]], TEXT_ENCODING)
+        fields = next(csv.reader([line]), [])
+        cached = self.cache[row] = [fields[column] if column < len(fields) else '' for column in self.columns]
+        if len(self.cache) > CACHED_ROWS:
+            self.cache.popitem(last=False)
+        return cached
+
+    def reopen(self):
+        """A separate store over the same file, for reading it from another thread."""
+        return CsvRowStore(self.csv_path, self.columns, self.fetch_rows)
+
+    def read_rows(self, rows):
+        return [self.row(row) for row in rows]
+
+    def value(self, row, column):
+        return self.row(row)[column]
+
+    def close(self):
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
+        self.cache.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
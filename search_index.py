@@ -0,0 +1,134 @@
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+
+
+SCAN_BLOCK_SIZE = 1024 * 1024
+ASCII_LOWERCASE = bytes(range(ord('a'), ord('z') + 1))
+ASCII_UPPERCASE = bytes(range(ord('A'), ord('Z') + 1))
+CELL_SEPARATOR = '\0'
+# Keep narrowing within the previous hits while they are at most this share of the rows.
+NARROW_FRACTION = 16
+CACHED_QUERIES = 32
+
+
+class SearchIndex:
+    """Case-insensitive substring search over every column of a ColumnStore.
+
+    Plain columns that are pure ASCII and hold only one letter case are
+    searched in place in the memory map with bytes.find, using the query in
+    that case. Other plain columns get one lower-cased copy joined with a
+    separator. Dictionary columns are searched through their distinct values,
+    whose row masks come from the FilterEngine. search() returns a FilterEngine
+    mask; a query that extends the previous one only rechecks its hits.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.store = engine.store
+        self.rows = engine.rows
+        self.raw_cases = {}
+        self.lowered = {}
+        self.results = OrderedDict()
+        self.last_query = None
+        self.last_mask = None
+        for column in range(self.store.column_count):
+            if self.store.is_dictionary(column):
+                continue
+            case = self.ascii_case(column)
+            if case is not None:
+                self.raw_cases[column] = case
+            else:
+                values = [value.lower() for value in self.store.column(column)]
+                starts = array('Q', accumulate((len(value) + 1 for value in values), initial=0))
+                self.lowered[column] = (CELL_SEPARATOR.join(values), starts)
+
+    def ascii_case(self, column):
+        # 'upper' or 'lower' if the column is ASCII without letters of the other case, else None.
+        data = self.store.data[column]
+        has_lower = has_upper = False
+        for start in range(0, len(data), SCAN_BLOCK_SIZE):
+            block = bytes(data[start:start + SCAN_BLOCK_SIZE])
+            if not block.isascii():
+                return None
+            has_lower = has_lower or len(block.translate(None, ASCII_LOWERCASE)) != len(block)
+            has_upper = has_upper or len(block.translate(None, ASCII_UPPERCASE)) != len(block)
+            if has_lower and has_upper:
+                return None
+        return 'lower' if has_lower else 'upper'
+
+    def search(self, query):
+        """Return the mask of rows with a cell containing query, ignoring case, or None for an empty query."""
+        query = query.lower()
+        if not query:
+            return None
+
+        mask = self.results.get(query)
+        if mask is not None:
+            self.results.move_to_end(query)
+        elif self.last_query and self.last_query in query \
+                and self.engine.count(self.last_mask) <= self.rows // NARROW_FRACTION:
+            mask = self.engine.rows_mask(self.narrow(query, self.engine.mask_rows(self.last_mask)))
+        else:
+            mask = self.scan(query)
+
+        self.results[query] = mask
+        if len(self.results) > CACHED_QUERIES:
+            self.results.popitem(last=False)
+        self.last_query = query
+        self.last_mask = mask
+        return mask
+
+    def scan(self, query):
+        selected = bytearray(self.rows)
+        for column, case in self.raw_cases.items():
+            self.scan_raw(column, case, query, selected)
+        for column, (text, starts) in self.lowered.items():
+            position = text.find(query)
+            while position != -1:
+                row = bisect_right(starts, position) - 1
+                selected[row] = 1
+                position = text.find(query, starts[row + 1])
+        mask = int.from_bytes(selected, 'little')
+        for column, values in self.dictionary_matches(query).items():
+            mask |= self.engine.column_mask(column, values)
+        return mask
+
+    def scan_raw(self, column, case, query, selected):
+        if not query.isascii():
+            return
+        needle = (query.upper() if case == 'upper' else query).encode('ascii')
+        offsets = self.store.offsets[column]
+        start = self.store.data_start(column)
+        buffer = self.store.buffer
+        end = start + offsets[self.rows]
+        position = buffer.find(needle, start, end)
+        while position != -1:
+            # Cells are stored back to back, so a hit may run across a cell boundary.
+            relative = position - start
+            row = bisect_right(offsets, relative) - 1
+            if relative + len(needle) <= offsets[row + 1]:
+                selected[row] = 1
+                position = buffer.find(needle, start + offsets[row + 1], end)
+            else:
+                position = buffer.find(needle, position + 1, end)
+
+    def dictionary_matches(self, query):
+        matches = {}
+        for column in range(self.store.column_count):
+            if self.store.is_dictionary(column):
+                values = [value for value in self.store.dictionary(column) if query in value.lower()]
+                if values:
+                    matches[column] = values
+        return matches
+
+    def narrow(self, query, rows):
+        codes = {column: set(self.engine.code_lookup(column)[value] for value in values)
+                 for column, values in self.dictionary_matches(query).items()}
+        plain_columns = list(self.raw_cases) + list(self.lowered)
+        store = self.store
+        for row in rows:
+            if any(store.code_array(column)[row] in matched for column, matched in codes.items()) \
+                    or any(query in store.value(row, column).lower() for column in plain_columns):
+                yield row
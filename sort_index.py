@@ -0,0 +1,148 @@
+from array import array
+from datetime import date
+
+
+def text_key(value):
+    return (0, value)
+
+
+def integer_key(value):
+    try:
+        return (0, int(value))
+    except ValueError:
+        return (1, value)
+
+
+def date_key(value):
+    # 'YYYY/MM/DD' as a day ordinal.
+    try:
+        year, month, day = value.split('/')
+        return (0, date(int(year), int(month), int(day)).toordinal())
+    except ValueError:
+        return (1, value)
+
+
+def expiry_key(value):
+    # Card expiry 'MM/YY' as (year, month).
+    try:
+        month, year = value.split('/')
+        return (0, int(year), int(month))
+    except ValueError:
+        return (1, value)
+
+
+SORT_KEYS = {
+    'text': text_key,
+    'integer': integer_key,
+    'date': date_key,
+    'expiry': expiry_key,
+}
+
+
+class SortIndex:
+    """Stable multi-column sort orders for the rows of a ColumnStore.
+
+    Every column is turned once into an array of dense ranks using its typed
+    key; equal values share a rank. A sort is a list of (column, descending)
+    pairs, most significant first, and its permutation of row ids is built
+    from the ranks and cached until the store changes. Ties keep row order.
+    column_types maps a store source column to a SORT_KEYS name.
+    """
+
+    def __init__(self, store, column_types=None):
+        self.store = store
+        self.rows = store.rows
+        self.column_types = column_types or {}
+        self.rank_arrays = {}
+        self.rank_counts = {}
+        self.permutations = {}
+        self.positions = {}
+
+    def sort_key(self, column):
+        return SORT_KEYS[self.column_types.get(self.store.sources[column], 'text')]
+
+    def ranks(self, column):
+        ranks = self.rank_arrays.get(column)
+        if ranks is not None:
+            return ranks
+
+        key = self.sort_key(column)
+        rank = -1
+        previous = None
+        if self.store.is_dictionary(column):
+            # Rank the distinct values; different strings with equal typed keys share a rank.
+            values = self.store.dictionary(column)
+            rank_of = {}
+            for value in sorted(values, key=key):
+                current = key(value)
+                if rank < 0 or current != previous:
+                    rank += 1
+                    previous = current
+                rank_of[value] = rank
+            if len(values) <= 256:
+                # One-byte codes map straight to one-byte ranks.
+                table = bytes(rank_of[value] for value in values).ljust(256, b'\0')
+                ranks = array('B', bytes(self.store.code_array(column)).translate(table))
+            else:
+                code_ranks = [rank_of[value] for value in values]
+                ranks = array('I', map(code_ranks.__getitem__, self.store.code_array(column)))
+        else:
+            # Mostly distinct values: sort the rows themselves, which also gives the ascending order.
+            values = list(self.store.column(column))
+            keys = values if key is text_key else list(map(key, values))
+            order = array('I', sorted(range(self.rows), key=keys.__getitem__))
+            ranks = array('I', bytes(4 * self.rows))
+            for row in order:
+                current = keys[row]
+                if rank < 0 or current != previous:
+                    rank += 1
+                    previous = current
+                ranks[row] = rank
+            self.permutations[((column, False),)] = order
+        self.rank_arrays[column] = ranks
+        self.rank_counts[column] = rank + 1
+        return ranks
+
+    def permutation(self, sort_keys):
+        """Row ids ordered by sort_keys, a sequence of (column, descending) pairs."""
+        sort_keys = tuple(sort_keys)
+        permutation = self.permutations.get(sort_keys)
+        if permutation is not None:
+            return permutation
+
+        # Fold the ranks into one integer per row, most significant column first.
+        composite = None
+        for column, descending in sort_keys:
+            ranks = self.ranks(column)
+            count = self.rank_counts[column]
+            if descending:
+                ranks = [count - 1 - rank for rank in ranks]
+            if composite is None:
+                composite = ranks
+            else:
+                composite = [high * count + low for high, low in zip(composite, ranks)]
+        if composite is None:
+            permutation = array('I', range(self.rows))
+        else:
+            permutation = array('I', sorted(range(self.rows), key=composite.__getitem__))
+        self.permutations[sort_keys] = permutation
+        return permutation
+
+    def position_array(self, sort_keys):
+        # Inverse of the permutation: each row's place in the sorted order.
+        sort_keys = tuple(sort_keys)
+        positions = self.positions.get(sort_keys)
+        if positions is None:
+            positions = array('I', bytes(4 * self.rows))
+            for position, row in enumerate(self.permutation(sort_keys)):
+                positions[row] = position
+            self.positions[sort_keys] = positions
+        return positions
+
+    def order(self, sort_keys, rows=None, selected=None):
+        """Sort rows (all rows if None); selected, a byte per row, lets large selections filter the permutation."""
+        if rows is None:
+            return self.permutation(sort_keys)
+        if selected is not None and len(rows) * 16 > self.rows:
+            return array('I', [row for row in self.permutation(sort_keys) if selected[row]])
+        return array('I', sorted(rows, key=self.position_array(sort_keys).__getitem__))
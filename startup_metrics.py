@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from PySide6.QtCore import QEvent, QObject
+
+
+# Set to a file path to append each launch's startup record to it, one JSON object per line.
+STARTUP_LOG_VARIABLE = 'CONSOLIDATOR_STARTUP_LOG'
+# Set to make the app print its startup record and quit once interactive (used by the benchmarks).
+EXIT_AFTER_STARTUP_VARIABLE = 'CONSOLIDATOR_EXIT_AFTER_STARTUP'
+
+
+class StartupTimer(QObject):
+    """Milestones of one launch, in seconds since started.
+
+    mark() records a named milestone once. The window's first paint is
+    marked by watching its events. finish() appends the record to the
+    startup log named by CONSOLIDATOR_STARTUP_LOG, if set, so launch times
+    can be tracked; nothing is written otherwise.
+    """
+
+    def __init__(self, started=None, parent=None):
+        super().__init__(parent)
+        self.started = started if started is not None else time.perf_counter()
+        self.marks = {}
+
+    def mark(self, name):
+        if name not in self.marks:
+            self.marks[name] = round(time.perf_counter() - self.started, 6)
+
+    def watch_first_paint(self, window):
+        window.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint:
+            self.mark('first_paint')
+            watched.removeEventFilter(self)
+        return False
+
+    def record(self):
+        return {
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'frozen': bool(getattr(sys, 'frozen', False)),
+            **self.marks,
+        }
+
+    def finish(self):
+        record = self.record()
+        log_path = os.environ.get(STARTUP_LOG_VARIABLE)
+        if log_path:
+            try:
+                with open(log_path, 'a') as log_file:
+                    log_file.write(json.dumps(record) + '\n')
+            except OSError as e:
+                print(f"Error: Unable to record startup times. {e}")
+        if os.environ.get(EXIT_AFTER_STARTUP_VARIABLE):
+            print(json.dumps(record), flush=True)
+            return True
+        return False
@@ -0,0 +1,164 @@
+from PySide6.QtCore import QAbstractProxyModel, QAbstractTableModel, QModelIndex, Qt
+
+
+class CardTableModel(QAbstractTableModel):
+    """Table model over a ColumnStore or CsvRowStore; cells are decoded only when the view asks for them.
+
+    A CsvRowStore that has not indexed the whole file yet grows through
+    canFetchMore/fetchMore as the view scrolls towards its end.
+    """
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self.headers = headers
+        self.store = None
+
+    def set_store(self, store):
+        self.beginResetModel()
+        if self.store is not None:
+            self.store.close()
+        self.store = store
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.store is None:
+            return 0
+        return self.store.rows
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.headers)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.store is None:
+            return False
+        return not getattr(self.store, 'complete', True)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        # Find the rows first so that exactly those are announced before the store grows.
+        found = self.store.find_rows()
+        if not found:
+            return
+        first = self.store.rows
+        self.beginInsertRows(QModelIndex(), first, first + len(found) - 1)
+        self.store.add_rows(found)
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid() or self.store is None:
+            return None
+        return self.store.value(index.row(), index.column())
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+
+
+class RowSelectionProxyModel(QAbstractProxyModel):
+    """Shows the source rows listed in rows, in that order; rows=None shows every source row."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = None
+        self.positions = None
+        self.inserting = False
+
+    def setSourceModel(self, source_model):
+        self.beginResetModel()
+        previous = self.sourceModel()
+        if previous is not None:
+            previous.modelReset.disconnect(self.source_reset)
+            previous.rowsAboutToBeInserted.disconnect(self.source_rows_about_to_be_inserted)
+            previous.rowsInserted.disconnect(self.source_rows_inserted)
+        super().setSourceModel(source_model)
+        self.rows = None
+        self.positions = None
+        source_model.modelReset.connect(self.source_reset)
+        source_model.rowsAboutToBeInserted.connect(self.source_rows_about_to_be_inserted)
+        source_model.rowsInserted.connect(self.source_rows_inserted)
+        self.endResetModel()
+
+    def source_reset(self):
+        self.set_rows(None)
+
+    def source_rows_about_to_be_inserted(self, parent, first, last):
+        # Rows fetched into the source only show up here while every source row is shown.
+        self.inserting = self.rows is None
+        if self.inserting:
+            self.beginInsertRows(QModelIndex(), first, last)
+
+    def source_rows_inserted(self, parent, first, last):
+        if self.inserting:
+            self.inserting = False
+            self.endInsertRows()
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = rows
+        self.positions = None
+        self.endResetModel()
+
+    def source_rows(self):
+        # None when every source row is shown, including rows the source has not fetched yet.
+        return self.rows
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        if self.rows is None:
+            return self.sourceModel().rowCount()
+        return len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return self.sourceModel().columnCount()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.rows is not None or self.sourceModel() is None:
+            return False
+        return self.sourceModel().canFetchMore(QModelIndex())
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            self.sourceModel().fetchMore(QModelIndex())
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        row = proxy_index.row() if self.rows is None else self.rows[proxy_index.row()]
+        return self.sourceModel().index(row, proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        if self.rows is None:
+            return self.index(source_index.row(), source_index.column())
+        if self.positions is None:
+            # Only needed for selections, so the reverse map is built on first use.
+            self.positions = {row: position for position, row in enumerate(self.rows)}
+        position = self.positions.get(source_index.row())
+        if position is None:
+            return QModelIndex()
+        return self.index(position, source_index.column())
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            return self.sourceModel().headerData(section, orientation, role)
+        if role != Qt.DisplayRole:
+            return None
+        return str(section + 1)